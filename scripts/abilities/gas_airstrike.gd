@@ -32,11 +32,15 @@ var _next_drop_progress: float = 0.0
 var _drop_interval: float = 0.0
 var _tile_map: TileMapLayer
 var _line_damaged: Dictionary = {}  ## Track enemies already hit by flyover
+var _hits: Array[Node2D] = []  # SpatialGrid query buffer
+var _line_batch := DamageBatch.new()
 
 
 func init(world_pos: Vector2, tile_map: TileMapLayer) -> void:
 	_target_pos = world_pos
 	_tile_map = tile_map
+	_line_batch.base_damage = LINE_DAMAGE
+	_line_batch.damage_type = Enums.DamageType.CHEMICAL
 
 	# Flight path: NW→SE diagonal through target
 	var flight_dir := Vector2(1, 0.5).normalized()
@@ -50,8 +54,8 @@ func init(world_pos: Vector2, tile_map: TileMapLayer) -> void:
 		var t := drop_start_ratio + DROP_ZONE_RATIO * (float(i) + 0.5) / float(CANISTER_COUNT)
 		var line_pos := _flight_start.lerp(_flight_end, t)
 		var offset := Vector2(
-			randf_range(-CANISTER_SPREAD, CANISTER_SPREAD),
-			randf_range(-CANISTER_SPREAD * 0.5, CANISTER_SPREAD * 0.5)
+			RngService.range_float(-CANISTER_SPREAD, CANISTER_SPREAD),
+			RngService.range_float(-CANISTER_SPREAD * 0.5, CANISTER_SPREAD * 0.5)
 		)
 		_canister_positions.append(line_pos + offset)
 
@@ -184,25 +188,20 @@ func _process(delta: float) -> void:
 
 func _apply_line_damage() -> void:
 	## Deal damage to enemies close to the current plane position (flyover damage)
-	var nearby := SpatialGrid.get_enemies_in_radius(global_position, LINE_DAMAGE_WIDTH)
-	for node in nearby:
-		if not node is BaseEnemy:
-			continue
-		var enemy: BaseEnemy = node as BaseEnemy
-		if enemy.health.is_dead:
+	var count := SpatialGrid.query_radius(global_position, LINE_DAMAGE_WIDTH, _hits)
+	var fresh := 0  # Not yet hit, compacted to the front of _hits
+	for i in count:
+		var enemy := _hits[i] as BaseEnemy
+		if not enemy or enemy.health.is_dead:
 			continue
 		# Only hit each enemy once during flyover
 		var eid := enemy.get_instance_id()
 		if _line_damaged.has(eid):
 			continue
 		_line_damaged[eid] = true
-
-		var resists: Dictionary = enemy.resistances.get_all() if enemy.resistances else {}
-		var vuln_mod := enemy.get_vulnerability_modifier()
-		if enemy.status_effects:
-			vuln_mod *= DamageCalculator.get_status_synergy_mult(Enums.DamageType.CHEMICAL, enemy.status_effects)
-		var armor_shred := enemy.get_armor_shred()
-		enemy.health.take_damage(LINE_DAMAGE, Enums.DamageType.CHEMICAL, resists, vuln_mod, 0.0, 1.0, armor_shred)
+		_hits[fresh] = enemy
+		fresh += 1
+	DamageCalculator.apply_batch(_line_batch, _hits, fresh)
 
 
 func _drop_canister(target_pos: Vector2) -> void:
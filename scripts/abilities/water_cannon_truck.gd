@@ -29,9 +29,20 @@ var _drive_timer: float = 0.0
 var _facing_dir: Vector2 = Vector2(0, 1)  # Default facing down
 var _cone_draw: Node2D
 var _current_dir: String = "s"
+var _hits: Array[Node2D] = []  # SpatialGrid query buffer
+var _batch := DamageBatch.new()  # Per-tick spray damage + slow
 
 
 func init(world_pos: Vector2, _tile_map: TileMapLayer) -> void:
+	var slow := StatusEffectData.new()
+	slow.effect_type = Enums.StatusEffectType.SLOW
+	slow.duration = SLOW_DURATION
+	slow.potency = SLOW_POTENCY
+	slow.apply_chance = 1.0
+	_batch.base_damage = DAMAGE_PER_HIT
+	_batch.damage_type = Enums.DamageType.HYDRAULIC
+	_batch.on_hit_effects.append(slow)
+
 	var result := AbilityManager.find_nearest_path_and_exit(world_pos)
 	if result.is_empty():
 		queue_free()
@@ -167,45 +178,29 @@ func _process(delta: float) -> void:
 
 
 func _apply_spray() -> void:
-	var enemies := SpatialGrid.get_enemies_in_radius(global_position, CONE_RANGE)
-	for node in enemies:
-		if not node is BaseEnemy:
-			continue
-		var enemy: BaseEnemy = node as BaseEnemy
-		if enemy.health.is_dead:
+	var count := SpatialGrid.query_cone(global_position, _facing_dir, CONE_ANGLE / 2.0, CONE_RANGE, _hits)
+	var grounded := 0  # Compacted to the front of _hits for the damage batch
+	for i in count:
+		var enemy := _hits[i] as BaseEnemy
+		if not enemy or enemy.health.is_dead:
 			continue
 		# Skip flying enemies
 		if enemy.is_flying():
 			continue
 
-		# Check if enemy is within the cone angle
 		var to_enemy := (enemy.global_position - global_position).normalized()
-		var angle_diff: float = absf(_facing_dir.angle_to(to_enemy))
-		if angle_diff > CONE_ANGLE / 2.0:
-			continue
 
 		# Apply knockback: push enemy away from truck
 		var push_dir := to_enemy
 		if push_dir.is_zero_approx():
 			push_dir = _facing_dir
-		enemy.global_position += push_dir * KNOCKBACK_DIST * 0.3  # Per-tick push
-
-		# Apply damage
-		var resists: Dictionary = enemy.resistances.get_all() if enemy.resistances else {}
-		var vuln_mod := enemy.get_vulnerability_modifier()
-		if enemy.status_effects:
-			vuln_mod *= DamageCalculator.get_status_synergy_mult(Enums.DamageType.HYDRAULIC, enemy.status_effects)
-		var armor_shred := enemy.get_armor_shred()
-		enemy.health.take_damage(DAMAGE_PER_HIT, Enums.DamageType.HYDRAULIC, resists, vuln_mod, 0.0, 1.0, armor_shred)
-
-		# Apply slow
-		if enemy.status_effects:
-			var slow := StatusEffectData.new()
-			slow.effect_type = Enums.StatusEffectType.SLOW
-			slow.duration = SLOW_DURATION
-			slow.potency = SLOW_POTENCY
-			slow.apply_chance = 1.0
-			enemy.status_effects.apply_effect(slow)
+		enemy.displace(push_dir * KNOCKBACK_DIST * 0.3)  # Per-tick push
+
+		_hits[grounded] = enemy
+		grounded += 1
+
+	# Damage + slow in one pass
+	DamageCalculator.apply_batch(_batch, _hits, grounded)
 
 
 func _finish() -> void:
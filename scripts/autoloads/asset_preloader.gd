@@ -0,0 +1,130 @@
+extends Node
+## Streams the resources listed in data/resource_manifest.json (written by
+## tools/gen_resource_manifest.py) into the resource cache on loader
+## threads. The start screen requests the "game" group so the game scene's
+## load() calls and ThemeManager's skin building hit the cache; the game
+## scene requests "late" (tier 5 skins, portraits, banners) once it is up.
+##
+## Loaded resources are held here for the session so the cache entries
+## survive scene changes (the start screen and HUD share a font, etc).
+
+signal group_loaded(group: String)
+
+const MANIFEST_PATH = "res://data/resource_manifest.json"
+const MANIFEST_VERSION = 1
+const THEME_PATH = "res://data/themes/riot_control/theme.tres"
+const MAX_IN_FLIGHT = 16  # Threaded requests outstanding at once
+
+var _groups: Dictionary = {}  # group -> PackedStringArray of paths
+var _group_queue: PackedStringArray = PackedStringArray()  # Requested, not started
+var _loaded_groups: PackedStringArray = PackedStringArray()
+var _active_group: String = ""
+
+var _pending: PackedStringArray = PackedStringArray()  # Active group, not yet requested
+var _in_flight: PackedStringArray = PackedStringArray()
+var _cache: Dictionary = {}  # path -> Resource
+
+
+func _ready() -> void:
+	set_process(false)
+	_load_manifest()
+
+
+func _load_manifest() -> void:
+	if not FileAccess.file_exists(MANIFEST_PATH):
+		return
+	var manifest = JSON.parse_string(FileAccess.get_file_as_string(MANIFEST_PATH))
+	if not manifest is Dictionary or int(manifest.get("version", 0)) != MANIFEST_VERSION:
+		push_warning("AssetPreloader: unreadable manifest, loading on demand")
+		return
+	for group in manifest["groups"]:
+		_groups[group] = PackedStringArray(manifest["groups"][group])
+
+
+func start(group: String) -> void:
+	## Queue a manifest group for background loading. Groups load one after
+	## another in request order; group_loaded fires as each one finishes.
+	if not _groups.has(group) or group == _active_group \
+			or group in _group_queue or group in _loaded_groups:
+		return
+	_group_queue.append(group)
+	if _active_group.is_empty():
+		_next_group()
+
+
+func is_group_loaded(group: String) -> bool:
+	return group in _loaded_groups
+
+
+func get_progress() -> float:
+	## Fraction of the active group loaded (1.0 when idle).
+	if _active_group.is_empty():
+		return 1.0
+	var total: int = _groups[_active_group].size()
+	var left := _pending.size() + _in_flight.size()
+	return 1.0 - float(left) / total if total > 0 else 1.0
+
+
+func _next_group() -> void:
+	if _group_queue.is_empty():
+		_active_group = ""
+		set_process(false)
+		return
+	_active_group = _group_queue[0]
+	_group_queue.remove_at(0)
+	_pending.clear()
+	for path in _groups[_active_group]:
+		if not _cache.has(path):
+			_pending.append(path)
+	set_process(true)
+
+
+# -- Polling --
+
+func _process(_delta: float) -> void:
+	# Keep the loader threads fed
+	while _in_flight.size() < MAX_IN_FLIGHT and not _pending.is_empty():
+		var path := _pending[_pending.size() - 1]
+		_pending.remove_at(_pending.size() - 1)
+		if ResourceLoader.load_threaded_request(path) == OK:
+			_in_flight.append(path)
+		else:
+			push_warning("AssetPreloader: can't request %s" % path)
+
+	var i := _in_flight.size() - 1
+	while i >= 0:
+		var path := _in_flight[i]
+		match ResourceLoader.load_threaded_get_status(path):
+			ResourceLoader.THREAD_LOAD_LOADED:
+				_cache[path] = ResourceLoader.load_threaded_get(path)
+				_in_flight.remove_at(i)
+			ResourceLoader.THREAD_LOAD_FAILED, ResourceLoader.THREAD_LOAD_INVALID_RESOURCE:
+				push_warning("AssetPreloader: failed to load %s" % path)
+				_in_flight.remove_at(i)
+		i -= 1
+
+	if _pending.is_empty() and _in_flight.is_empty():
+		_finish_group()
+
+
+func _finish_group() -> void:
+	var group := _active_group
+	_loaded_groups.append(group)
+	if group == "game":
+		_warm_theme()
+	group_loaded.emit(group)
+	_next_group()
+
+
+func _warm_theme() -> void:
+	# Build tower/enemy skins now, from cached textures, so game.gd's
+	# populate_*() calls find them done (they skip existing entries)
+	var theme := _cache.get(THEME_PATH) as ThemeData
+	if not theme:
+		return
+	var towers: Array[TowerData] = []
+	for res in _cache.values():
+		if res is TowerData:
+			towers.append(res)
+	ThemeManager.populate_tower_skins_from_assets(theme, towers)
+	ThemeManager.populate_enemy_skins_from_assets(theme)
@@ -18,6 +18,28 @@ var ARMOR_MATRIX := {
 	Enums.DamageType.PSYCHOLOGICAL:   [1.25, 1.0, 1.0,  0.5,  0.5,  0.75],
 }
 
+## Status synergies: [StatusEffectType, DamageType, multiplier]
+const STATUS_SYNERGIES = [
+	[Enums.StatusEffectType.SLOW, Enums.DamageType.ELECTRIC, 1.30],         # Wet + Electric
+	[Enums.StatusEffectType.MARK, Enums.DamageType.SONIC, 1.25],            # Marked + Sonic
+	[Enums.StatusEffectType.BURN, Enums.DamageType.CHEMICAL, 1.20],         # Burning + Chemical
+	[Enums.StatusEffectType.ARMOR_SHRED, Enums.DamageType.KINETIC, 1.25],   # Shredded + Kinetic
+	[Enums.StatusEffectType.POISON, Enums.DamageType.DIRECTED_ENERGY, 1.20],  # Poisoned + Energy
+]
+
+## damage_type * _synergy_mask_size + status effect bitmask -> multiplier
+var _synergy_table: PackedFloat32Array = PackedFloat32Array()
+var _synergy_mask_size: int = 0
+
+## damage_type * _armor_type_count + armor_type -> ARMOR_MATRIX entry
+var _armor_table: PackedFloat32Array = PackedFloat32Array()
+var _armor_type_count: int = 0
+
+
+func _ready() -> void:
+	_build_synergy_table()
+	_build_armor_table()
+
 
 func calculate_damage(
 	base_damage: float,
@@ -43,7 +65,7 @@ func calculate_damage(
 	var armor_reduction: float = armor_value / (armor_value + ARMOR_CONSTANT)
 
 	# Crit roll
-	var is_crit := randf() < crit_chance
+	var is_crit := RngService.chance(crit_chance)
 	var crit_mult: float = crit_multiplier if is_crit else 1.0
 
 	var final_damage: float = (
@@ -58,17 +80,82 @@ func calculate_damage(
 	return {"damage": max(final_damage, 0.0), "is_crit": is_crit}
 
 
+## Resolve one damage spec against targets[0..count) in a single pass:
+## armor-type, resistance, armor, vulnerability and synergy factors come
+## from packed tables and each enemy's cached resistance vector. Enemies
+## still get health_changed/died and a light hit cue; the damage itself is
+## reported once through SignalBus.enemies_damaged. Returns the total dealt.
+func apply_batch(batch: DamageBatch, targets: Array[Node2D], count: int) -> float:
+	var damage_type := batch.damage_type
+	var armor_row := damage_type * _armor_type_count
+	var synergy_row := damage_type * _synergy_mask_size
+	var scaled := batch.damage_scale.size() >= count
+	var rolls_crits := batch.crit_chance > 0.0
+	var attribute := is_instance_valid(batch.source_tower)
+	var total := 0.0
+	var hit_count := 0
+
+	for i in count:
+		var enemy := targets[i] as BaseEnemy
+		if not enemy or not enemy.health or enemy.health.is_dead:
+			continue
+		var health := enemy.health
+		var status := enemy.status_effects
+
+		var dmg := batch.base_damage * _armor_table[armor_row + health.armor_type]
+		if enemy.resistances:
+			dmg *= enemy.resistances.get_vector()[damage_type]
+		var armor := health.armor
+		if status:
+			armor *= 1.0 - status.get_armor_shred()
+			dmg *= status.get_vulnerability_modifier() * _synergy_table[synergy_row + status.effect_mask]
+		dmg *= 1.0 - armor / (armor + ARMOR_CONSTANT)
+		var is_crit := rolls_crits and RngService.chance(batch.crit_chance)
+		if is_crit:
+			dmg *= batch.crit_multiplier
+		if scaled:
+			dmg *= batch.damage_scale[i]
+
+		if attribute:
+			enemy.last_hit_by = batch.source_tower
+		var dealt := health.apply_raw_damage(maxf(dmg, 0.0))
+		enemy.show_hit(dealt, damage_type, is_crit)
+		health.resolve_death()
+		total += dealt
+		hit_count += 1
+
+		if status and not health.is_dead:
+			for effect in batch.on_hit_effects:
+				status.apply_effect(effect)
+
+	if hit_count > 0:
+		SignalBus.enemies_damaged.emit(total, hit_count, damage_type)
+	return total
+
+
 ## Status-reactive damage bonuses — rewards combining tower types.
+## One table lookup per hit: damage type x status effect bitmask.
 func get_status_synergy_mult(damage_type: Enums.DamageType, status_mgr) -> float:
-	var mult := 1.0
-	if status_mgr.has_effect(Enums.StatusEffectType.SLOW) and damage_type == Enums.DamageType.ELECTRIC:
-		mult *= 1.30  # Wet + Electric
-	if status_mgr.has_effect(Enums.StatusEffectType.MARK) and damage_type == Enums.DamageType.SONIC:
-		mult *= 1.25  # Marked + Sonic
-	if status_mgr.has_effect(Enums.StatusEffectType.BURN) and damage_type == Enums.DamageType.CHEMICAL:
-		mult *= 1.20  # Burning + Chemical
-	if status_mgr.has_effect(Enums.StatusEffectType.ARMOR_SHRED) and damage_type == Enums.DamageType.KINETIC:
-		mult *= 1.25  # Shredded + Kinetic
-	if status_mgr.has_effect(Enums.StatusEffectType.POISON) and damage_type == Enums.DamageType.DIRECTED_ENERGY:
-		mult *= 1.20  # Poisoned + Energy
-	return mult
+	return _synergy_table[damage_type * _synergy_mask_size + status_mgr.effect_mask]
+
+
+func _build_synergy_table() -> void:
+	_synergy_mask_size = 1 << Enums.StatusEffectType.size()
+	_synergy_table.resize(Enums.DamageType.size() * _synergy_mask_size)
+	for damage_type in Enums.DamageType.size():
+		for mask in _synergy_mask_size:
+			var mult := 1.0
+			for rule in STATUS_SYNERGIES:
+				if rule[1] == damage_type and mask & (1 << rule[0]):
+					mult *= rule[2]
+			_synergy_table[damage_type * _synergy_mask_size + mask] = mult
+
+
+func _build_armor_table() -> void:
+	_armor_type_count = Enums.ArmorType.size()
+	_armor_table.resize(Enums.DamageType.size() * _armor_type_count)
+	_armor_table.fill(1.0)
+	for damage_type in ARMOR_MATRIX:
+		var row: Array = ARMOR_MATRIX[damage_type]
+		for armor_type in mini(row.size(), _armor_type_count):
+			_armor_table[damage_type * _armor_type_count + armor_type] = row[armor_type]
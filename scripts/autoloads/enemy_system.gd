@@ -0,0 +1,337 @@
+extends Node
+## Advances every enemy's movement and DoT in one loop.
+## Per-enemy state lives in dense packed arrays (swap-remove on unregister);
+## the loop writes positions back to the nodes once per frame. BaseEnemy
+## nodes only keep _process for visuals (rotors, camera beam).
+## Status effect expiry runs on a shared timer wheel: only enemies with a
+## stack running out this frame are visited.
+
+const DOT_REFRESH_INTERVAL = 0.1  # health_changed for DoT ticks, batched
+const DIR_SECTOR = TAU / 8.0
+
+# -- Enemy slots (index-aligned) --
+var _enemies: Array[BaseEnemy] = []
+var _slot_of: Dictionary = {}  # instance_id -> slot
+var _positions: PackedVector2Array = PackedVector2Array()  # on-path position (no zig-zag)
+var _waypoints: Array[PackedVector2Array] = []
+var _waypoint_index: PackedInt32Array = PackedInt32Array()
+var _distance: PackedFloat32Array = PackedFloat32Array()
+var _path_length: PackedFloat32Array = PackedFloat32Array()
+var _speed: PackedFloat32Array = PackedFloat32Array()  # tiles/s before slows
+var _slow: PackedFloat32Array = PackedFloat32Array()
+var _dot_dps: PackedFloat32Array = PackedFloat32Array()
+var _velocity: PackedVector2Array = PackedVector2Array()
+var _dir_idx: PackedInt32Array = PackedInt32Array()
+var _zigzag_perp: PackedVector2Array = PackedVector2Array()  # ZERO when off
+var _zigzag_time: PackedFloat32Array = PackedFloat32Array()
+
+var _dot_timer: float = 0.0
+
+var status_wheel := TimerWheel.new()
+
+# Scratch: enemies that finished or died this frame (handled after the loop,
+# since their callbacks unregister and would reshuffle slots mid-iteration)
+var _arrived: Array[BaseEnemy] = []
+var _killed: Array[BaseEnemy] = []
+
+
+func _ready() -> void:
+	PathfindingManager.field_repaired.connect(_on_field_repaired)
+
+
+func register(enemy: BaseEnemy, waypoints: PackedVector2Array) -> void:
+	var eid := enemy.get_instance_id()
+	if _slot_of.has(eid):
+		return
+	_slot_of[eid] = _enemies.size()
+	_enemies.append(enemy)
+	_positions.append(waypoints[0] if not waypoints.is_empty() else enemy.global_position)
+	_waypoints.append(waypoints)
+	_waypoint_index.append(1)
+	_distance.append(0.0)
+	_path_length.append(_calculate_path_length(waypoints))
+	_speed.append(enemy.base_speed)
+	_slow.append(1.0)
+	_dot_dps.append(0.0)
+	_velocity.append(Vector2.ZERO)
+	_dir_idx.append(-1)
+	_zigzag_perp.append(Vector2.ZERO)
+	_zigzag_time.append(0.0)
+	enemy.global_position = _positions[_positions.size() - 1]
+
+
+func unregister(enemy: BaseEnemy) -> void:
+	var eid := enemy.get_instance_id()
+	if not _slot_of.has(eid):
+		return
+	var slot: int = _slot_of[eid]
+	var last := _enemies.size() - 1
+	# Swap-remove: move the last slot into the hole
+	if slot != last:
+		var moved := _enemies[last]
+		_enemies[slot] = moved
+		_slot_of[moved.get_instance_id()] = slot
+		_positions[slot] = _positions[last]
+		_waypoints[slot] = _waypoints[last]
+		_waypoint_index[slot] = _waypoint_index[last]
+		_distance[slot] = _distance[last]
+		_path_length[slot] = _path_length[last]
+		_speed[slot] = _speed[last]
+		_slow[slot] = _slow[last]
+		_dot_dps[slot] = _dot_dps[last]
+		_velocity[slot] = _velocity[last]
+		_dir_idx[slot] = _dir_idx[last]
+		_zigzag_perp[slot] = _zigzag_perp[last]
+		_zigzag_time[slot] = _zigzag_time[last]
+	_enemies.resize(last)
+	_positions.resize(last)
+	_waypoints.resize(last)
+	_waypoint_index.resize(last)
+	_distance.resize(last)
+	_path_length.resize(last)
+	_speed.resize(last)
+	_slow.resize(last)
+	_dot_dps.resize(last)
+	_velocity.resize(last)
+	_dir_idx.resize(last)
+	_zigzag_perp.resize(last)
+	_zigzag_time.resize(last)
+	_slot_of.erase(eid)
+
+
+func clear() -> void:
+	for enemy in _enemies.duplicate():
+		unregister(enemy)
+	_dot_timer = 0.0
+	status_wheel.clear()
+
+
+## Number of enemies currently ticked.
+func get_count() -> int:
+	return _enemies.size()
+
+
+# -- Per-enemy setters / getters --
+
+func set_speed(enemy: BaseEnemy, speed: float) -> void:
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot >= 0:
+		_speed[slot] = speed
+
+
+func set_status(enemy: BaseEnemy, slow: float, dot_dps: float) -> void:
+	## Pushed by StatusEffectManager whenever its effect set changes.
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot >= 0:
+		_slow[slot] = slow
+		_dot_dps[slot] = dot_dps
+
+
+func set_zigzag(enemy: BaseEnemy, perpendicular: Vector2) -> void:
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot >= 0:
+		_zigzag_perp[slot] = perpendicular
+		_zigzag_time[slot] = 0.0
+
+
+func get_progress(enemy: BaseEnemy) -> float:
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot < 0 or _path_length[slot] <= 0.0:
+		return 0.0
+	return _distance[slot] / _path_length[slot]
+
+
+func get_velocity(enemy: BaseEnemy) -> Vector2:
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	return _velocity[slot] if slot >= 0 else Vector2.ZERO
+
+
+func get_next_waypoint(enemy: BaseEnemy) -> Vector2:
+	## Waypoint the enemy is walking towards (its position if none).
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot < 0:
+		return enemy.global_position
+	var wps := _waypoints[slot]
+	var idx := _waypoint_index[slot]
+	return wps[idx] if idx < wps.size() else _positions[slot]
+
+
+func displace(enemy: BaseEnemy, offset: Vector2) -> void:
+	## Shove an enemy off its line (knockback); it walks back on next frame.
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot < 0:
+		enemy.global_position += offset
+		return
+	_positions[slot] += offset
+	enemy.global_position += offset
+	SpatialGrid.update_position(enemy)
+
+
+func push_back(enemy: BaseEnemy, distance: float) -> void:
+	## Move an enemy backward along the waypoints it already walked.
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot < 0:
+		return
+	var wps := _waypoints[slot]
+	var idx := _waypoint_index[slot]
+	var pos := _positions[slot]
+	var traveled := _distance[slot]
+	var remaining := distance
+	while remaining > 0.0 and idx > 0:
+		var prev_wp := wps[idx - 1]
+		var to_prev := prev_wp - pos
+		var dist := to_prev.length()
+		if dist <= remaining:
+			pos = prev_wp
+			remaining -= dist
+			traveled -= dist
+			idx -= 1
+		else:
+			pos += to_prev.normalized() * remaining
+			traveled -= remaining
+			remaining = 0.0
+	_positions[slot] = pos
+	_waypoint_index[slot] = idx
+	_distance[slot] = maxf(traveled, 0.0)
+	enemy.global_position = pos + _zigzag_perp[slot] * _zigzag_offset(slot)
+	SpatialGrid.update_position(enemy)
+
+
+# -- Tick --
+
+func _process(delta: float) -> void:
+	var t0 := Time.get_ticks_usec()
+	for mgr in status_wheel.advance(delta):
+		mgr.expire()
+
+	var count := _enemies.size()
+	if count == 0:
+		return
+
+	_dot_timer += delta
+	var refresh_health := _dot_timer >= DOT_REFRESH_INTERVAL
+	if refresh_health:
+		_dot_timer = 0.0
+
+	for slot in count:
+		var enemy := _enemies[slot]
+
+		# Movement along waypoints
+		var wps := _waypoints[slot]
+		var idx := _waypoint_index[slot]
+		var pos := _positions[slot]
+		var prev := pos
+		var move_budget := _speed[slot] * _slow[slot] * 32.0 * delta
+		var traveled := _distance[slot]
+		while move_budget > 0.0 and idx < wps.size():
+			var to_target := wps[idx] - pos
+			var dist_to_target := to_target.length()
+			if dist_to_target <= move_budget:
+				pos = wps[idx]
+				move_budget -= dist_to_target
+				traveled += dist_to_target
+				idx += 1
+			else:
+				pos += to_target / dist_to_target * move_budget
+				traveled += move_budget
+				move_budget = 0.0
+		_positions[slot] = pos
+		_waypoint_index[slot] = idx
+		_distance[slot] = traveled
+
+		# Zig-zag is a sideways offset on top of the path position
+		var draw_pos := pos
+		var perp := _zigzag_perp[slot]
+		var move_dir := pos - prev
+		if perp != Vector2.ZERO:
+			var old_offset := _zigzag_offset(slot)
+			_zigzag_time[slot] += delta
+			var new_offset := _zigzag_offset(slot)
+			draw_pos += perp * new_offset
+			move_dir += perp * (new_offset - old_offset)
+		_velocity[slot] = move_dir
+
+		enemy.global_position = draw_pos
+		SpatialGrid.update_position(enemy)
+
+		# Walk animation: only call into the node when the 8-way sector changes
+		if not move_dir.is_zero_approx():
+			var dir_idx := wrapi(roundi(move_dir.angle() / DIR_SECTOR), 0, 8)
+			if dir_idx != _dir_idx[slot]:
+				_dir_idx[slot] = dir_idx
+				enemy.set_walk_direction(dir_idx)
+
+		# DoT: raw damage (bypasses armor); health_changed is batched
+		var dot := _dot_dps[slot]
+		var health := enemy.health
+		if dot > 0.0 and not health.is_dead:
+			health.current_hp = maxf(health.current_hp - dot * delta, 0.0)
+			if health.current_hp <= 0.0:
+				_killed.append(enemy)
+			elif refresh_health:
+				health.health_changed.emit(health.current_hp, health.max_hp)
+
+		if idx >= wps.size():
+			_arrived.append(enemy)
+
+	for enemy in _killed:
+		if is_instance_valid(enemy) and not enemy.health.is_dead:
+			enemy.health.health_changed.emit(0.0, enemy.health.max_hp)
+			enemy.health.is_dead = true
+			enemy.health.died.emit()
+	_killed.clear()
+	for enemy in _arrived:
+		if is_instance_valid(enemy) and not enemy.health.is_dead:
+			enemy._reached_end()
+	_arrived.clear()
+	PerfMonitor.add_time(PerfMonitor.Section.ENEMY_TICK, Time.get_ticks_usec() - t0)
+
+
+func _zigzag_offset(slot: int) -> float:
+	return sin(_zigzag_time[slot] * BaseEnemy.ZIGZAG_FREQUENCY * TAU) * BaseEnemy.ZIGZAG_AMPLITUDE
+
+
+# -- Re-routing --
+
+func _on_field_repaired() -> void:
+	# Only routes through the repaired tiles can have changed; the tile just
+	# passed counts too, since _reroute may anchor back to it
+	for slot in _enemies.size():
+		if _enemies[slot].is_flying():
+			continue
+		if PathfindingManager.crosses_repair(_waypoints[slot], _waypoint_index[slot] - 1):
+			_reroute(slot)
+
+
+func _reroute(slot: int) -> void:
+	var wps := _waypoints[slot]
+	var idx := _waypoint_index[slot]
+	if idx >= wps.size():
+		return
+
+	# Re-trace from the tile we are heading to, or back from the one just
+	# passed if that tile is now blocked. Waypoints already walked are kept
+	# so progress and push-back still see the route behind us.
+	var anchor := idx
+	var tail := PathfindingManager.get_path_from(PathfindingManager.world_to_tile(wps[anchor]))
+	if tail.is_empty() and anchor > 0:
+		anchor -= 1
+		tail = PathfindingManager.get_path_from(PathfindingManager.world_to_tile(wps[anchor]))
+	if tail.is_empty():
+		return
+
+	if anchor < idx:
+		# Walking back to the previous tile centre re-adds this distance
+		_distance[slot] = maxf(_distance[slot] - _positions[slot].distance_to(wps[anchor]), 0.0)
+	var new_waypoints := wps.slice(0, anchor)
+	new_waypoints.append_array(tail)
+	_waypoints[slot] = new_waypoints
+	_waypoint_index[slot] = anchor
+	_path_length[slot] = _calculate_path_length(new_waypoints)
+
+
+func _calculate_path_length(path: PackedVector2Array) -> float:
+	var length := 0.0
+	for i in range(1, path.size()):
+		length += path[i - 1].distance_to(path[i])
+	return length
@@ -6,6 +6,10 @@ var lives: int = 20
 var is_game_over: bool = false
 var is_last_stand: bool = false
 
+## Set by the headless sim driver before the game scene loads: no fog,
+## music or VFX, and waves run back to back without briefings.
+var is_headless_sim: bool = false
+
 var _speed_scales := {
 	Enums.GameSpeed.PAUSED: 0.0,
 	Enums.GameSpeed.NORMAL: 1.0,
@@ -19,6 +23,13 @@ func _ready() -> void:
 	SignalBus.all_waves_completed.connect(_on_all_waves_completed)
 
 
+## False when nothing is drawn: the headless sim, or any run under
+## --headless (e.g. a replay benchmark). Purely visual systems skip their
+## per-frame work then, so it doesn't skew timings.
+func is_rendering() -> bool:
+	return not is_headless_sim and DisplayServer.get_name() != "headless"
+
+
 func start_game() -> void:
 	lives = 20
 	is_game_over = false
@@ -1,84 +1,156 @@
 extends Node
-## Manages enemy pathfinding on the isometric grid using AStarGrid2D.
-## All ground enemies sharing a spawn point use the same cached path,
-## recalculated only when towers are placed or sold.
+## Manages enemy pathfinding on the isometric grid with a shared flow field.
+## One multi-source BFS from every goal tile gives each walkable tile its
+## step distance to the nearest goal; enemies descend that field from any
+## tile. Placing or selling a tower repairs only the tiles whose distance
+## actually changes and marks them dirty; spawn paths are re-traced from the
+## field, and live enemies re-route only when their route crosses the repair.
+##
+## Placement validity is precomputed too: the cut vertices separating any
+## spawn from a virtual sink joined to every goal are found in one Tarjan
+## pass per placement, so hover checks are a single array lookup.
 
 signal path_updated(spawn_index: int)
+signal field_repaired  ## Check routes with crosses_repair()
+signal placement_changed
+
+## get_placeable_mask() values
+const PLACE_BLOCKED = 0    # Wall, tower, or outside the grid
+const PLACE_OK = 1         # Every spawn still reaches a goal
+const PLACE_CUTS_PATH = 2  # Walkable, but a tower here would seal a spawn off
+
+const UNREACHABLE = 1 << 30
+const NEIGHBORS: Array[Vector2i] = [Vector2i(1, 0), Vector2i(0, 1), Vector2i(-1, 0), Vector2i(0, -1)]
 
-var _astar: AStarGrid2D
 var _tile_map: TileMapLayer
 var _spawn_tiles: Array[Vector2i] = []
 var _goal_tiles: Array[Vector2i] = []
 var _cached_paths: Dictionary = {}  # spawn_index -> PackedVector2Array (world coords)
-var _cached_tile_paths: Dictionary = {}  # spawn_index -> Array[Vector2i] (tile coords)
+
+# -- Flow field (index = (y - rect.y) * width + (x - rect.x)) --
+var _rect: Rect2i = Rect2i()
+var _solid: PackedByteArray = PackedByteArray()  # 1 = wall or tower
+var _dist: PackedInt32Array = PackedInt32Array()  # steps to nearest goal
+var _queue: PackedInt32Array = PackedInt32Array()  # BFS scratch
+# Tiles whose distance changed in the last repair, plus their neighbours
+# (a path can turn onto a neighbour that became downhill)
+var _dirty: PackedByteArray = PackedByteArray()
+var _dirty_tiles: PackedInt32Array = PackedInt32Array()
+
+# -- Placement (index as above; the goal sink is index _solid.size()) --
+var _is_spawn: PackedByteArray = PackedByteArray()
+var _is_goal: PackedByteArray = PackedByteArray()
+var _goal_indices: PackedInt32Array = PackedInt32Array()
+var _cuts_path: PackedByteArray = PackedByteArray()  # 1 = blocking here strands a spawn
+var _spawns_connected: bool = false
+# Tarjan scratch
+var _disc: PackedInt32Array = PackedInt32Array()
+var _low: PackedInt32Array = PackedInt32Array()
+var _parent: PackedInt32Array = PackedInt32Array()
+var _edge_pos: PackedInt32Array = PackedInt32Array()
+var _spawns_below: PackedInt32Array = PackedInt32Array()
 
 
 func initialize(tile_map: TileMapLayer, spawn_tiles: Array[Vector2i], goal_tiles: Array[Vector2i]) -> void:
+	var t0 := Time.get_ticks_usec()
 	_tile_map = tile_map
 	_spawn_tiles = spawn_tiles
 	_goal_tiles = goal_tiles
+	_cached_paths.clear()
 
-	_astar = AStarGrid2D.new()
-	_astar.cell_shape = AStarGrid2D.CELL_SHAPE_ISOMETRIC_DOWN
-	_astar.diagonal_mode = AStarGrid2D.DIAGONAL_MODE_NEVER
-
-	var rect := tile_map.get_used_rect()
-	_astar.region = rect
-	_astar.cell_size = Vector2(tile_map.tile_set.tile_size)
-	_astar.update()
+	_rect = tile_map.get_used_rect()
+	var cell_count := _rect.size.x * _rect.size.y
+	_solid.resize(cell_count)
+	_solid.fill(0)
 
 	# Mark unwalkable tiles as solid
-	for x in range(rect.position.x, rect.end.x):
-		for y in range(rect.position.y, rect.end.y):
+	for x in range(_rect.position.x, _rect.end.x):
+		for y in range(_rect.position.y, _rect.end.y):
 			var pos := Vector2i(x, y)
 			var tile_data := tile_map.get_cell_tile_data(pos)
 			if not tile_data:
-				_astar.set_point_solid(pos, true)
+				_solid[_index(pos)] = 1
 				continue
 			var walkable = tile_data.get_custom_data("walkable") if tile_data.get_custom_data("walkable") != null else true
 			if not walkable:
-				_astar.set_point_solid(pos, true)
-
+				_solid[_index(pos)] = 1
+
+	_is_spawn.resize(cell_count)
+	_is_spawn.fill(0)
+	for spawn in _spawn_tiles:
+		if _rect.has_point(spawn):
+			_is_spawn[_index(spawn)] = 1
+	_is_goal.resize(cell_count)
+	_is_goal.fill(0)
+	_goal_indices.clear()
+	for goal in _goal_tiles:
+		if _rect.has_point(goal) and not _is_goal[_index(goal)]:
+			_is_goal[_index(goal)] = 1
+			_goal_indices.append(_index(goal))
+
+	_dirty.resize(cell_count)
+	_dirty.fill(0)
+	_dirty_tiles.clear()
+	_build_field()
+	_refresh_placement()
 	_recalculate_all_paths()
+	PerfMonitor.add_time(PerfMonitor.Section.PATHFINDING, Time.get_ticks_usec() - t0)
 
 
 func can_place_tower(tile_pos: Vector2i) -> bool:
-	if not _astar or _astar.is_point_solid(tile_pos):
+	## True when a tower on tile_pos leaves every spawn connected to a goal.
+	if _dist.is_empty() or not _spawns_connected or not _rect.has_point(tile_pos):
 		return false
+	var idx := _index(tile_pos)
+	return not _solid[idx] and not _cuts_path[idx]
 
-	# Temporarily block this tile
-	_astar.set_point_solid(tile_pos, true)
 
-	# Check that all spawn-to-goal paths still exist
-	var all_valid := true
-	for i in _spawn_tiles.size():
-		var found := false
-		for goal in _goal_tiles:
-			var path := _astar.get_id_path(_spawn_tiles[i], goal)
-			if not path.is_empty():
-				found = true
-				break
-		if not found:
-			all_valid = false
-			break
+func get_placeable_mask() -> PackedByteArray:
+	## PLACE_* value per tile of get_grid_rect(), row-major.
+	var mask := PackedByteArray()
+	mask.resize(_solid.size())
+	for i in _solid.size():
+		if _solid[i]:
+			mask[i] = PLACE_BLOCKED
+		elif _cuts_path[i] or not _spawns_connected:
+			mask[i] = PLACE_CUTS_PATH
+		else:
+			mask[i] = PLACE_OK
+	return mask
 
-	# Restore the tile
-	_astar.set_point_solid(tile_pos, false)
-	return all_valid
+
+func get_grid_rect() -> Rect2i:
+	return _rect
 
 
 func place_tower(tile_pos: Vector2i) -> void:
-	if not _astar:
+	if _dist.is_empty() or not _rect.has_point(tile_pos):
+		return
+	var idx := _index(tile_pos)
+	if _solid[idx]:
 		return
-	_astar.set_point_solid(tile_pos, true)
-	_recalculate_affected_paths(tile_pos)
+	var t0 := Time.get_ticks_usec()
+	_solid[idx] = 1
+	_refresh_placement()
+	if _repair_after_block(idx):
+		_recalculate_all_paths()
+		field_repaired.emit()
+	PerfMonitor.add_time(PerfMonitor.Section.PATHFINDING, Time.get_ticks_usec() - t0)
 
 
 func remove_tower(tile_pos: Vector2i) -> void:
-	if not _astar:
+	if _dist.is_empty() or not _rect.has_point(tile_pos):
 		return
-	_astar.set_point_solid(tile_pos, false)
-	_recalculate_affected_paths(tile_pos)
+	var idx := _index(tile_pos)
+	if not _solid[idx]:
+		return
+	var t0 := Time.get_ticks_usec()
+	_solid[idx] = 0
+	_refresh_placement()
+	if _repair_after_unblock(idx):
+		_recalculate_all_paths()
+		field_repaired.emit()
+	PerfMonitor.add_time(PerfMonitor.Section.PATHFINDING, Time.get_ticks_usec() - t0)
 
 
 func get_path_for_spawn(index: int) -> PackedVector2Array:
@@ -87,6 +159,53 @@ func get_path_for_spawn(index: int) -> PackedVector2Array:
 	return PackedVector2Array()
 
 
+func get_path_from(tile_pos: Vector2i) -> PackedVector2Array:
+	## World-space path from tile_pos down the flow field to the nearest goal.
+	## Empty when the tile is blocked or cut off from every goal.
+	var path := PackedVector2Array()
+	if not _tile_map or not is_reachable(tile_pos):
+		return path
+
+	var pos := tile_pos
+	var dir := Vector2i.ZERO
+	path.append(_tile_map.map_to_local(pos))
+	var d := _dist[_index(pos)]
+	while d > 0:
+		# Keep heading the same way when that is also downhill (straighter paths)
+		var next_dir := dir
+		if next_dir == Vector2i.ZERO or _dist_at(pos + next_dir) != d - 1:
+			for offset in NEIGHBORS:
+				if _dist_at(pos + offset) == d - 1:
+					next_dir = offset
+					break
+		dir = next_dir
+		pos += dir
+		d -= 1
+		path.append(_tile_map.map_to_local(pos))
+	return path
+
+
+func is_reachable(tile_pos: Vector2i) -> bool:
+	## True when tile_pos is walkable and connected to a goal.
+	return _dist_at(tile_pos) < UNREACHABLE
+
+
+func crosses_repair(waypoints: PackedVector2Array, from: int) -> bool:
+	## True when waypoints[from..] pass a tile the last repair touched, i.e.
+	## a route traced before the repair may no longer follow the field.
+	if _dirty_tiles.is_empty() or not _tile_map:
+		return false
+	for i in range(maxi(from, 0), waypoints.size()):
+		var tile := _tile_map.local_to_map(waypoints[i])
+		if _rect.has_point(tile) and _dirty[_index(tile)]:
+			return true
+	return false
+
+
+func world_to_tile(world_pos: Vector2) -> Vector2i:
+	return _tile_map.local_to_map(world_pos) if _tile_map else Vector2i.ZERO
+
+
 func get_flying_path(index: int) -> PackedVector2Array:
 	if not _tile_map or _spawn_tiles.is_empty() or _goal_tiles.is_empty():
 		return PackedVector2Array()
@@ -98,57 +217,287 @@ func get_flying_path(index: int) -> PackedVector2Array:
 
 func _recalculate_all_paths() -> void:
 	for i in _spawn_tiles.size():
-		_recalculate_path(i)
+		var path := get_path_from(_spawn_tiles[i])
+		if _cached_paths.has(i) and _cached_paths[i] == path:
+			continue
+		_cached_paths[i] = path
+		path_updated.emit(i)
 
 
-func _recalculate_affected_paths(changed_tile: Vector2i) -> void:
-	for i in _spawn_tiles.size():
-		# Check if changed tile is on or adjacent to any tile in the cached path
-		if _cached_tile_paths.has(i):
-			var tile_path: Array = _cached_tile_paths[i]
-			var affected := false
-			for tp in tile_path:
-				var dx := absi(changed_tile.x - tp.x)
-				var dy := absi(changed_tile.y - tp.y)
-				if maxi(dx, dy) <= 1:  # Chebyshev distance
-					affected = true
-					break
-			if not affected:
-				continue
-		# No cached path or path is affected — recalculate
-		_recalculate_path(i)
+# -- Field helpers --
 
+func _index(tile_pos: Vector2i) -> int:
+	return (tile_pos.y - _rect.position.y) * _rect.size.x + (tile_pos.x - _rect.position.x)
 
-func _recalculate_path(spawn_index: int) -> void:
-	if not _astar or not _tile_map:
-		return
 
-	var spawn := _spawn_tiles[spawn_index]
-	var best_path: PackedVector2Array = PackedVector2Array()
-	var best_tile_path: Array[Vector2i] = []
+func _tile(idx: int) -> Vector2i:
+	return Vector2i(idx % _rect.size.x + _rect.position.x, idx / _rect.size.x + _rect.position.y)
+
+
+func _dist_at(tile_pos: Vector2i) -> int:
+	if _dist.is_empty() or not _rect.has_point(tile_pos):
+		return UNREACHABLE
+	return _dist[_index(tile_pos)]
+
+
+func _clear_dirty() -> void:
+	for i in _dirty_tiles:
+		_dirty[i] = 0
+	_dirty_tiles.clear()
+
 
-	# Find shortest path to any goal tile
+func _mark_dirty(idx: int) -> void:
+	if not _dirty[idx]:
+		_dirty[idx] = 1
+		_dirty_tiles.append(idx)
+	var pos := _tile(idx)
+	for offset in NEIGHBORS:
+		var n := pos + offset
+		if not _rect.has_point(n):
+			continue
+		var ni := _index(n)
+		if not _dirty[ni]:
+			_dirty[ni] = 1
+			_dirty_tiles.append(ni)
+
+
+func _build_field() -> void:
+	## Multi-source BFS from every goal tile.
+	_dist.resize(_solid.size())
+	_dist.fill(UNREACHABLE)
+	_queue.resize(_solid.size())
+	var head := 0
+	var tail := 0
 	for goal in _goal_tiles:
-		var tile_path := _astar.get_id_path(spawn, goal)
-		if not tile_path.is_empty():
-			if best_path.is_empty() or tile_path.size() < best_path.size():
-				# Convert tile coords to world coords
-				var world_path := PackedVector2Array()
-				best_tile_path = []
-				for tile_pos in tile_path:
-					world_path.append(_tile_map.map_to_local(tile_pos))
-					best_tile_path.append(Vector2i(tile_pos))
-				best_path = world_path
-
-	# Only emit if path actually changed
-	var prev_tile_path: Array = _cached_tile_paths.get(spawn_index, [])
-	_cached_tile_paths[spawn_index] = best_tile_path
-	_cached_paths[spawn_index] = best_path
-
-	if best_tile_path.size() != prev_tile_path.size():
-		path_updated.emit(spawn_index)
-		return
-	for j in best_tile_path.size():
-		if best_tile_path[j] != prev_tile_path[j]:
-			path_updated.emit(spawn_index)
-			return
+		if not _rect.has_point(goal):
+			continue
+		var g := _index(goal)
+		if _solid[g] or _dist[g] == 0:
+			continue
+		_dist[g] = 0
+		_queue[tail] = g
+		tail += 1
+	while head < tail:
+		var idx := _queue[head]
+		head += 1
+		var pos := _tile(idx)
+		var nd := _dist[idx] + 1
+		for offset in NEIGHBORS:
+			var n := pos + offset
+			if not _rect.has_point(n):
+				continue
+			var ni := _index(n)
+			if _solid[ni] or _dist[ni] <= nd:
+				continue
+			_dist[ni] = nd
+			_queue[tail] = ni
+			tail += 1
+
+
+func _repair_after_unblock(idx: int) -> bool:
+	## A tile opened: settle it from its neighbours, then push any shorter
+	## distances outward. Only tiles that improve are visited (and marked).
+	_clear_dirty()
+	var pos := _tile(idx)
+	var best := UNREACHABLE
+	if pos in _goal_tiles:
+		best = 0
+	else:
+		for offset in NEIGHBORS:
+			best = mini(best, _dist_at(pos + offset) + 1)
+	best = mini(best, UNREACHABLE)
+	_dist[idx] = best
+	if best >= UNREACHABLE:
+		return false
+	_mark_dirty(idx)
+
+	var head := 0
+	var tail := 1
+	_queue[0] = idx
+	while head < tail:
+		var cur := _queue[head]
+		head += 1
+		var cur_pos := _tile(cur)
+		var nd := _dist[cur] + 1
+		for offset in NEIGHBORS:
+			var n := cur_pos + offset
+			if not _rect.has_point(n):
+				continue
+			var ni := _index(n)
+			if _solid[ni] or _dist[ni] <= nd:
+				continue
+			_dist[ni] = nd
+			_mark_dirty(ni)
+			_queue[tail] = ni
+			tail += 1
+	return true
+
+
+func _repair_after_block(idx: int) -> bool:
+	## A tile closed: invalidate every tile whose only shortest routes ran
+	## through it, then re-settle just that region from its intact border.
+	## The tile and every orphan are marked dirty.
+	_clear_dirty()
+	var old := _dist[idx]
+	_dist[idx] = UNREACHABLE
+	if old >= UNREACHABLE:
+		return false
+	_mark_dirty(idx)
+
+	# Phase 1 — find orphaned tiles in non-decreasing distance order.
+	# A tile survives if another neighbour still sits one step closer.
+	# (Candidates can be queued once per orphaned parent, hence append.)
+	var orphans: PackedInt32Array = PackedInt32Array()
+	var candidates: PackedInt32Array = PackedInt32Array()
+	var origin := _tile(idx)
+	for offset in NEIGHBORS:
+		var n := origin + offset
+		if _dist_at(n) == old + 1:
+			candidates.append(_index(n))
+	var head := 0
+	while head < candidates.size():
+		var cur := candidates[head]
+		head += 1
+		var d := _dist[cur]
+		if d >= UNREACHABLE:
+			continue  # Already orphaned via another parent
+		var cur_pos := _tile(cur)
+		var supported := false
+		for offset in NEIGHBORS:
+			if _dist_at(cur_pos + offset) == d - 1:
+				supported = true
+				break
+		if supported:
+			continue
+		_dist[cur] = UNREACHABLE
+		_mark_dirty(cur)
+		orphans.append(cur)
+		for offset in NEIGHBORS:
+			var n := cur_pos + offset
+			if _dist_at(n) == d + 1:
+				candidates.append(_index(n))
+
+	# Phase 2 — re-settle orphans with a bucketed BFS seeded from the border
+	var buckets: Dictionary = {}  # distance -> PackedInt32Array
+	var min_bucket := UNREACHABLE
+	for o in orphans:
+		var o_pos := _tile(o)
+		var best := UNREACHABLE
+		for offset in NEIGHBORS:
+			best = mini(best, _dist_at(o_pos + offset) + 1)
+		if best >= UNREACHABLE:
+			continue
+		_dist[o] = best
+		if not buckets.has(best):
+			buckets[best] = PackedInt32Array()
+		buckets[best].append(o)
+		min_bucket = mini(min_bucket, best)
+
+	var d := min_bucket
+	while not buckets.is_empty():
+		if not buckets.has(d):
+			d += 1
+			continue
+		var bucket: PackedInt32Array = buckets[d]
+		buckets.erase(d)
+		for cur in bucket:
+			if _dist[cur] != d:
+				continue  # Settled closer after it was queued
+			var cur_pos := _tile(cur)
+			for offset in NEIGHBORS:
+				var n := cur_pos + offset
+				if not _rect.has_point(n):
+					continue
+				var ni := _index(n)
+				if _solid[ni] or _dist[ni] <= d + 1:
+					continue
+				_dist[ni] = d + 1
+				if not buckets.has(d + 1):
+					buckets[d + 1] = PackedInt32Array()
+				buckets[d + 1].append(ni)
+		d += 1
+	return true
+
+
+# -- Placement helpers --
+
+func _refresh_placement() -> void:
+	## Iterative Tarjan DFS rooted at the goal sink. A tile cuts the path
+	## when one of its DFS children can only reach the sink through it
+	## (low >= disc) and that child's subtree holds a spawn. Spawn tiles
+	## themselves always cut.
+	var n := _solid.size()
+	var sink := n
+	_disc.resize(n + 1)
+	_disc.fill(-1)
+	_low.resize(n + 1)
+	_parent.resize(n + 1)
+	_edge_pos.resize(n + 1)
+	_spawns_below.resize(n + 1)
+	_cuts_path.resize(n)
+	_cuts_path.fill(0)
+
+	var stack := PackedInt32Array([sink])
+	_disc[sink] = 0
+	_low[sink] = 0
+	_parent[sink] = -1
+	_edge_pos[sink] = 0
+	_spawns_below[sink] = 0
+	var timer := 1
+	while not stack.is_empty():
+		var v := stack[stack.size() - 1]
+		var w := _next_neighbor(v)
+		if w >= 0:
+			if _disc[w] < 0:
+				_disc[w] = timer
+				_low[w] = timer
+				timer += 1
+				_parent[w] = v
+				_edge_pos[w] = 0
+				_spawns_below[w] = _is_spawn[w] if w < n else 0
+				stack.append(w)
+			elif w != _parent[v]:
+				_low[v] = mini(_low[v], _disc[w])
+			continue
+
+		# v finished — fold it into its parent
+		stack.resize(stack.size() - 1)
+		var p := _parent[v]
+		if p < 0:
+			continue
+		_low[p] = mini(_low[p], _low[v])
+		_spawns_below[p] += _spawns_below[v]
+		if p != sink and _low[v] >= _disc[p] and _spawns_below[v] > 0:
+			_cuts_path[p] = 1
+
+	_spawns_connected = not _spawn_tiles.is_empty()
+	for spawn in _spawn_tiles:
+		if not _rect.has_point(spawn) or _disc[_index(spawn)] < 0:
+			_spawns_connected = false
+			continue
+		_cuts_path[_index(spawn)] = 1
+	placement_changed.emit()
+
+
+func _next_neighbor(v: int) -> int:
+	## Next unvisited-edge endpoint of v for the DFS, or -1 when exhausted.
+	## Tiles have 4 grid edges plus one to the sink if they are a goal.
+	var sink := _solid.size()
+	var limit := _goal_indices.size() if v == sink else 5
+	var k := _edge_pos[v]
+	while k < limit:
+		k += 1
+		var w := -1
+		if v == sink:
+			w = _goal_indices[k - 1]
+		elif k <= 4:
+			var pos := _tile(v) + NEIGHBORS[k - 1]
+			if _rect.has_point(pos):
+				w = _index(pos)
+		elif _is_goal[v]:
+			w = sink
+		if w == sink or (w >= 0 and not _solid[w]):
+			_edge_pos[v] = k
+			return w
+	_edge_pos[v] = k
+	return -1
@@ -0,0 +1,237 @@
+extends Node
+## Frame-budget profiler. Systems report the time they spend through
+## add_time(); once per frame (after every other node has processed) the
+## section totals are sampled together with pool, grid, fog and renderer
+## counters into a ring buffer of the last HISTORY frames, and folded into
+## whole-run averages/maxima for headless dumps.
+##
+## F2 toggles the overlay, F4 exports the buffer to user:// as CSV. Every
+## metric is also a custom monitor under "goligee/" in the debugger.
+
+enum Section { PATHFINDING, TARGETING, ENEMY_TICK }
+
+enum Metric {
+	FRAME_MS, PROCESS_MS, PHYSICS_MS,
+	PATHFINDING_MS, TARGETING_MS, ENEMY_TICK_MS,
+	ENEMIES, PROJECTILES,
+	VFX_HITS, VFX_MISSES, VFX_OVERFLOW, VFX_DROPPED, PARTICLES,
+	GRID_CELLS, GRID_MAX_PER_CELL, FOG_LIGHTS,
+	DRAW_CALLS, TEXTURE_MEM_MB, NODES,
+}
+
+## Column names, index-aligned with Metric
+const METRIC_NAMES: PackedStringArray = [
+	"frame_ms", "process_ms", "physics_ms",
+	"pathfinding_ms", "targeting_ms", "enemy_tick_ms",
+	"enemies", "projectiles",
+	"vfx_hits", "vfx_misses", "vfx_overflow", "vfx_dropped", "particles",
+	"grid_cells", "grid_max_per_cell", "fog_lights",
+	"draw_calls", "texture_mem_mb", "nodes",
+]
+
+const HISTORY = 600  # Frames kept for export (10 s at 60 fps)
+const OVERLAY_REFRESH = 0.25  # Seconds between overlay text rebuilds
+const SECTION_METRIC = [Metric.PATHFINDING_MS, Metric.TARGETING_MS, Metric.ENEMY_TICK_MS]
+
+var _section_usec: PackedInt64Array = PackedInt64Array()  # This frame, per Section
+var _latest: PackedFloat32Array = PackedFloat32Array()  # Last sampled frame, per Metric
+
+# Ring buffer, HISTORY rows of METRIC_NAMES.size() columns
+var _history: PackedFloat32Array = PackedFloat32Array()
+var _history_head: int = 0  # Next row to write
+var _history_count: int = 0
+
+# Whole-run aggregates
+var _sum: PackedFloat64Array = PackedFloat64Array()
+var _max: PackedFloat32Array = PackedFloat32Array()
+var _frames: int = 0
+
+var _last_frame_usec: int = 0
+var _vfx_seen := Vector4i.ZERO  # VFXPool totals at the previous sample
+
+var _overlay: CanvasLayer
+var _overlay_label: Label
+var _overlay_timer: float = 0.0
+
+
+func _ready() -> void:
+	process_priority = 4096  # Sample after every other node this frame
+	_section_usec.resize(Section.size())
+	_latest.resize(METRIC_NAMES.size())
+	_history.resize(HISTORY * METRIC_NAMES.size())
+	reset()
+	for i in METRIC_NAMES.size():
+		Performance.add_custom_monitor("goligee/" + METRIC_NAMES[i], get_metric.bind(i))
+
+
+func _exit_tree() -> void:
+	for metric_name in METRIC_NAMES:
+		if Performance.has_custom_monitor("goligee/" + metric_name):
+			Performance.remove_custom_monitor("goligee/" + metric_name)
+
+
+func add_time(section: Section, usec: int) -> void:
+	## Charge usec of work to section for the current frame.
+	_section_usec[section] += usec
+
+
+func get_metric(metric: Metric) -> float:
+	## Value of metric in the last sampled frame.
+	return _latest[metric]
+
+
+func reset() -> void:
+	_section_usec.fill(0)
+	_latest.fill(0.0)
+	_history_head = 0
+	_history_count = 0
+	_sum.resize(METRIC_NAMES.size())
+	_sum.fill(0.0)
+	_max.resize(METRIC_NAMES.size())
+	_max.fill(0.0)
+	_frames = 0
+	_last_frame_usec = Time.get_ticks_usec()
+	_vfx_seen = _vfx_totals()
+
+
+# -- Sampling --
+
+func _process(delta: float) -> void:
+	_sample()
+	if _overlay and _overlay.visible:
+		_overlay_timer -= delta
+		if _overlay_timer <= 0.0:
+			_overlay_timer = OVERLAY_REFRESH
+			_refresh_overlay()
+
+
+func _sample() -> void:
+	var now := Time.get_ticks_usec()
+	_latest[Metric.FRAME_MS] = (now - _last_frame_usec) / 1000.0
+	_last_frame_usec = now
+	_latest[Metric.PROCESS_MS] = Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0
+	_latest[Metric.PHYSICS_MS] = Performance.get_monitor(Performance.TIME_PHYSICS_PROCESS) * 1000.0
+
+	for section in Section.size():
+		_latest[SECTION_METRIC[section]] = _section_usec[section] / 1000.0
+	_section_usec.fill(0)
+
+	_latest[Metric.ENEMIES] = EnemySystem.get_count()
+	var projectiles := get_tree().get_first_node_in_group("projectiles")
+	_latest[Metric.PROJECTILES] = projectiles.get_child_count() if projectiles else 0
+
+	var vfx := _vfx_totals()
+	_latest[Metric.VFX_HITS] = vfx.x - _vfx_seen.x
+	_latest[Metric.VFX_MISSES] = vfx.y - _vfx_seen.y
+	_latest[Metric.VFX_OVERFLOW] = vfx.z - _vfx_seen.z
+	_latest[Metric.VFX_DROPPED] = vfx.w - _vfx_seen.w
+	_vfx_seen = vfx
+	_latest[Metric.PARTICLES] = VFXPool.get_particle_count()
+
+	var occupancy := SpatialGrid.get_occupancy()
+	_latest[Metric.GRID_CELLS] = occupancy.x
+	_latest[Metric.GRID_MAX_PER_CELL] = occupancy.y
+
+	var fog := get_tree().get_first_node_in_group("fog_manager") as FogManager
+	_latest[Metric.FOG_LIGHTS] = fog.active_lights if fog else 0
+
+	_latest[Metric.DRAW_CALLS] = Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME)
+	_latest[Metric.TEXTURE_MEM_MB] = Performance.get_monitor(Performance.RENDER_TEXTURE_MEM_USED) / 1048576.0
+	_latest[Metric.NODES] = Performance.get_monitor(Performance.OBJECT_NODE_COUNT)
+
+	# Record
+	var cols := METRIC_NAMES.size()
+	var row := _history_head * cols
+	for i in cols:
+		var v := _latest[i]
+		_history[row + i] = v
+		_sum[i] += v
+		_max[i] = maxf(_max[i], v)
+	_history_head = (_history_head + 1) % HISTORY
+	_history_count = mini(_history_count + 1, HISTORY)
+	_frames += 1
+
+
+func _vfx_totals() -> Vector4i:
+	return Vector4i(VFXPool.stat_hits, VFXPool.stat_misses, VFXPool.stat_overflow, VFXPool.stat_dropped)
+
+
+# -- Export --
+
+func get_summary() -> Dictionary:
+	## Average and peak of every metric since the last reset().
+	var metrics := {}
+	for i in METRIC_NAMES.size():
+		metrics[METRIC_NAMES[i]] = {
+			"avg": _sum[i] / _frames if _frames > 0 else 0.0,
+			"max": _max[i],
+		}
+	return {"frames": _frames, "metrics": metrics}
+
+
+func export_csv(path: String = "") -> String:
+	## Write the buffered frames (oldest first) as CSV. Returns the path
+	## written, or "" on failure.
+	if path.is_empty():
+		path = "user://perf_%s.csv" % Time.get_datetime_string_from_system().replace(":", "-")
+	var file := FileAccess.open(path, FileAccess.WRITE)
+	if not file:
+		push_error("PerfMonitor: can't write %s" % path)
+		return ""
+	file.store_csv_line(METRIC_NAMES)
+	var cols := METRIC_NAMES.size()
+	var first := (_history_head - _history_count + HISTORY) % HISTORY
+	var line := PackedStringArray()
+	line.resize(cols)
+	for n in _history_count:
+		var row := ((first + n) % HISTORY) * cols
+		for i in cols:
+			line[i] = "%.3f" % _history[row + i]
+		file.store_csv_line(line)
+	return path
+
+
+# -- Overlay --
+
+func _unhandled_input(event: InputEvent) -> void:
+	if not (event is InputEventKey and event.pressed and not event.echo):
+		return
+	if event.keycode == KEY_F2:
+		_toggle_overlay()
+	elif event.keycode == KEY_F4:
+		var path := export_csv()
+		if not path.is_empty():
+			print("PerfMonitor: wrote %s" % ProjectSettings.globalize_path(path))
+
+
+func _toggle_overlay() -> void:
+	if not _overlay:
+		_overlay = CanvasLayer.new()
+		_overlay.layer = 100
+		add_child(_overlay)
+		_overlay_label = Label.new()
+		_overlay_label.position = Vector2(4, 40)
+		_overlay_label.add_theme_font_size_override("font_size", 10)
+		_overlay_label.add_theme_color_override("font_outline_color", Color.BLACK)
+		_overlay_label.add_theme_constant_override("outline_size", 3)
+		_overlay_label.mouse_filter = Control.MOUSE_FILTER_IGNORE
+		_overlay.add_child(_overlay_label)
+		_overlay.visible = false
+	_overlay.visible = not _overlay.visible
+	_overlay_timer = 0.0
+
+
+func _refresh_overlay() -> void:
+	# Now / average / peak over the buffered frames
+	var cols := METRIC_NAMES.size()
+	var lines := PackedStringArray(["%-18s %8s %8s %8s" % ["", "now", "avg", "max"]])
+	for i in cols:
+		var total := 0.0
+		var peak := 0.0
+		for n in _history_count:
+			var v := _history[n * cols + i]
+			total += v
+			peak = maxf(peak, v)
+		var avg := total / _history_count if _history_count > 0 else 0.0
+		lines.append("%-18s %8.2f %8.2f %8.2f" % [METRIC_NAMES[i], _latest[i], avg, peak])
+	_overlay_label.text = "\n".join(lines)
@@ -0,0 +1,206 @@
+extends Node
+## Object pool for projectiles, plus the trail lines and textures they share.
+## Towers acquire() a projectile per shot instead of instantiating its scene;
+## the projectile hands itself back through release() when the shot ends.
+
+const PROJECTILE_SCENES = [
+	"res://scenes/projectiles/base_projectile.tscn",
+	"res://scenes/projectiles/chain_lightning_projectile.tscn",
+	"res://scenes/projectiles/sonic_wave_projectile.tscn",
+	"res://scenes/projectiles/microwave_beam_projectile.tscn",
+	"res://scenes/projectiles/pepper_spray_projectile.tscn",
+	"res://scenes/projectiles/tear_gas_projectile.tscn",
+	"res://scenes/projectiles/water_stream_projectile.tscn",
+	"res://scenes/projectiles/surveillance_pulse_projectile.tscn",
+]
+const INITIAL_PER_SCENE = 8
+const INITIAL_BASE = 48  # base_projectile carries the fast-firing bullet towers
+const MAX_POOL_PER_SCENE = 128  # overflow beyond this is queue_free'd
+const INITIAL_LINES = 32
+const MAX_POOL_LINES = 128
+
+## scene path -> Array of idle projectiles (kept outside the tree)
+var _pools: Dictionary = {}
+var _line_pool: Array[Line2D] = []
+var _container: Node
+
+## Enums.DamageType -> Texture2D / Gradient, shared by every projectile
+var _textures: Dictionary = {}
+var _trail_gradients: Dictionary = {}
+
+
+func _ready() -> void:
+	ThemeManager.theme_changed.connect(_on_theme_changed)
+	_init_pool()
+
+
+func _exit_tree() -> void:
+	_free_idle_projectiles()
+
+
+func _init_pool() -> void:
+	_container = Node.new()
+	_container.name = "ProjectilePoolContainer"
+	add_child(_container)
+
+	for path in PROJECTILE_SCENES:
+		var scene: PackedScene = load(path)
+		var pool: Array[Node2D] = []
+		var count := INITIAL_BASE if path.ends_with("base_projectile.tscn") else INITIAL_PER_SCENE
+		for i in count:
+			var proj: Node2D = scene.instantiate()
+			proj.set_meta("pool_key", path)
+			pool.append(proj)
+		_pools[path] = pool
+
+	for i in INITIAL_LINES:
+		var line := Line2D.new()
+		line.visible = false
+		_container.add_child(line)
+		_line_pool.append(line)
+
+
+func reset_pool() -> void:
+	# Discard stale refs (nodes freed with the old scene) and rebuild
+	_free_idle_projectiles()
+	_pools.clear()
+	_line_pool.clear()
+	if is_instance_valid(_container):
+		_container.queue_free()
+	_init_pool()
+
+
+func _free_idle_projectiles() -> void:
+	# Idle projectiles are orphans — nothing else will free them
+	for path in _pools:
+		for proj in _pools[path]:
+			if is_instance_valid(proj):
+				proj.free()
+		_pools[path].clear()
+
+
+# -- Projectiles --
+
+func acquire(scene: PackedScene) -> Node2D:
+	## Ready-to-init projectile for scene. Add it to the tree after init().
+	var path := scene.resource_path
+	var pool: Array = _pools.get(path, [])
+	var proj: Node2D
+	if not pool.is_empty():
+		proj = pool.pop_back()
+	else:
+		proj = scene.instantiate()
+		if path != "":
+			proj.set_meta("pool_key", path)
+
+	proj.visible = true
+	proj.set_process(true)
+	return proj
+
+
+func release(proj: Node2D) -> void:
+	## Return a finished projectile. Safe to call from its own _process/_ready.
+	if not is_instance_valid(proj) or proj.get_meta("pool_released", false):
+		return
+	if not proj.has_meta("pool_key"):
+		proj.queue_free()
+		return
+	proj.set_meta("pool_released", true)
+	proj.visible = false
+	proj.set_process(false)
+	# Detach after the current frame — the parent may be mid add_child()
+	_return_to_pool.call_deferred(proj)
+
+
+func _return_to_pool(proj: Node2D) -> void:
+	if not is_instance_valid(proj):
+		return
+	if proj.get_parent():
+		proj.get_parent().remove_child(proj)
+	proj.set_meta("pool_released", false)
+
+	var path: String = proj.get_meta("pool_key")
+	if not _pools.has(path):
+		_pools[path] = []
+	var pool: Array = _pools[path]
+	if pool.size() < MAX_POOL_PER_SCENE:
+		# _ready (build once, spawn every time) must run on the next add_child
+		proj.request_ready()
+		pool.append(proj)
+	else:
+		proj.queue_free()
+
+
+# -- Lines (fading trails, lightning bolts) --
+
+func acquire_line() -> Line2D:
+	var line: Line2D
+	if not _line_pool.is_empty():
+		line = _line_pool.pop_back()
+		_container.remove_child(line)
+	else:
+		line = Line2D.new()
+
+	# Reset properties
+	line.points = PackedVector2Array()
+	line.width = 2.0
+	line.width_curve = null
+	line.default_color = Color.WHITE
+	line.gradient = null
+	line.modulate = Color.WHITE
+	line.top_level = true
+	line.z_index = 0
+	line.visible = true
+	return line
+
+
+func release_line(line: Line2D) -> void:
+	if not is_instance_valid(line):
+		return
+	line.visible = false
+
+	if line.get_parent():
+		line.get_parent().remove_child(line)
+
+	if _line_pool.size() < MAX_POOL_LINES:
+		_container.add_child(line)
+		_line_pool.append(line)
+	else:
+		line.queue_free()
+
+
+# -- Shared resources --
+
+func get_projectile_texture(damage_type: Enums.DamageType) -> Texture2D:
+	## Themed bullet texture for a damage type, built once per type.
+	if not _textures.has(damage_type):
+		match damage_type:
+			Enums.DamageType.HYDRAULIC:
+				_textures[damage_type] = EntitySprites.create_ice_shard()
+			Enums.DamageType.KINETIC:
+				_textures[damage_type] = EntitySprites.create_cannonball()
+			_:
+				var color := Color("#F0D0D8")
+				if damage_type == Enums.DamageType.CHEMICAL:
+					color = Color("#E08040")
+				elif damage_type == Enums.DamageType.SONIC:
+					color = Color("#80E060")
+				elif damage_type == Enums.DamageType.ELECTRIC:
+					color = Color("#E0E060")
+				_textures[damage_type] = EntitySprites.create_projectile_streak(color)
+	return _textures[damage_type]
+
+
+func get_trail_gradient(damage_type: Enums.DamageType) -> Gradient:
+	## Trail fade (transparent tail -> 40% head) in the damage type colour.
+	if not _trail_gradients.has(damage_type):
+		var tc := ThemeManager.get_damage_type_color(damage_type)
+		var grad := Gradient.new()
+		grad.set_color(0, Color(tc, 0.0))
+		grad.set_color(1, Color(tc, 0.4))
+		_trail_gradients[damage_type] = grad
+	return _trail_gradients[damage_type]
+
+
+func _on_theme_changed() -> void:
+	_trail_gradients.clear()
@@ -0,0 +1,159 @@
+extends Node
+## Records each played session as a replay: the gameplay RNG seed, the wave
+## list and every player command stamped with its game tick (60 per second
+## of game time, so speed changes and pauses stay aligned). Replays are
+## written to user://replays/ when the run ends or is restarted; the
+## newest MAX_REPLAYS are kept. scripts/main/replay_player.gd plays them
+## back at a fixed timestep as a benchmark.
+##
+## Commands (besides "tick" and "cmd"):
+##   place     tower, tile    TowerPlacer.place_tower
+##   upgrade   tile, path     UpgradeComponent.do_upgrade
+##   sell      tile           BaseTower.sell
+##   ability   id, pos        AbilityManager (placed or instant)
+##   speed     speed          GameManager.set_speed
+##   wave                     spawn indicator click (start / next wave)
+##   call_wave                HUD "send wave early"
+
+const REPLAY_VERSION = 1
+const REPLAY_DIR = "user://replays"
+const MAX_REPLAYS = 20
+const TICK_RATE = 60
+
+var _recording: bool = false
+var _playing: bool = false
+var _time: float = 0.0  # Game seconds since the run started
+var _replay: Dictionary = {}
+var _commands: Array = []
+
+
+func _ready() -> void:
+	SignalBus.game_started.connect(_on_game_started)
+	SignalBus.game_over.connect(func(victory: bool): _save("won" if victory else "lost"))
+	SignalBus.all_waves_completed.connect(_save.bind("complete"))
+	SignalBus.restart_requested.connect(_save.bind("restart"))
+	SignalBus.tower_placed.connect(_on_tower_placed)
+	SignalBus.tower_upgraded.connect(_on_tower_upgraded)
+	SignalBus.tower_sold.connect(_on_tower_sold)
+	SignalBus.ability_activated.connect(_on_ability_activated)
+	SignalBus.game_speed_changed.connect(_on_game_speed_changed)
+	set_process(false)
+
+
+func _notification(what: int) -> void:
+	if what == NOTIFICATION_WM_CLOSE_REQUEST:
+		_save("quit")
+
+
+func _process(delta: float) -> void:
+	_time += delta
+
+
+## Current tick of the run being recorded.
+func get_tick() -> int:
+	return int(_time * TICK_RATE)
+
+
+func is_recording() -> bool:
+	return _recording
+
+
+func is_playing() -> bool:
+	return _playing
+
+
+## Called by the replay player: stops recording so replayed commands are
+## not captured again. game.gd leaves wave starts to the replay.
+func begin_playback() -> void:
+	_recording = false
+	_playing = true
+	set_process(false)
+
+
+func record_command(cmd: String, args: Dictionary = {}) -> void:
+	if not _recording:
+		return
+	var entry := {"tick": get_tick(), "cmd": cmd}
+	entry.merge(args)
+	_commands.append(entry)
+
+
+# -- Session --
+
+func _on_game_started() -> void:
+	if _playing or GameManager.is_headless_sim:
+		return
+	# A fresh seed per run, stored so the replay rolls the same crits/spawns
+	var run_seed := randi()
+	RngService.seed_with(run_seed)
+	var wave_paths: Array[String] = []
+	for wave in WaveManager.waves:
+		wave_paths.append(wave.resource_path)
+	_replay = {
+		"version": REPLAY_VERSION,
+		"build": ProjectSettings.get_setting("application/config/version", ""),
+		"recorded": Time.get_datetime_string_from_system(),
+		"seed": run_seed,
+		"tick_rate": TICK_RATE,
+		"waves": wave_paths,
+	}
+	_commands = []
+	_time = 0.0
+	_recording = true
+	set_process(true)
+
+
+func _save(result: String) -> void:
+	if not _recording:
+		return
+	_recording = false
+	set_process(false)
+	if _commands.is_empty():
+		return
+	_replay["result"] = result
+	_replay["end_tick"] = get_tick()
+	_replay["waves_reached"] = WaveManager.current_wave_index + 1
+	_replay["commands"] = _commands
+
+	DirAccess.make_dir_recursive_absolute(REPLAY_DIR)
+	var path := REPLAY_DIR.path_join("replay_%s.json" % _replay["recorded"].replace(":", "-"))
+	var file := FileAccess.open(path, FileAccess.WRITE)
+	if not file:
+		push_error("ReplayRecorder: can't write %s" % path)
+		return
+	file.store_string(JSON.stringify(_replay, "\t"))
+	file.close()
+	_prune()
+
+
+func _prune() -> void:
+	var files := Array(DirAccess.get_files_at(REPLAY_DIR)).filter(
+		func(f: String): return f.begins_with("replay_") and f.ends_with(".json"))
+	files.sort()  # Timestamped names sort oldest first
+	for i in files.size() - MAX_REPLAYS:
+		DirAccess.remove_absolute(REPLAY_DIR.path_join(files[i]))
+
+
+# -- Command capture --
+
+func _on_tower_placed(tower: Node2D, tile_pos: Vector2i) -> void:
+	if tower is BaseTower and tower.tower_data:
+		record_command("place", {"tower": tower.tower_data.tower_id, "tile": [tile_pos.x, tile_pos.y]})
+
+
+func _on_tower_upgraded(tower: Node2D, path_index: int, _tier: int) -> void:
+	if tower is BaseTower:
+		record_command("upgrade", {"tile": [tower._tile_pos.x, tower._tile_pos.y], "path": path_index})
+
+
+func _on_tower_sold(tower: Node2D, _refund: int) -> void:
+	if tower is BaseTower:
+		record_command("sell", {"tile": [tower._tile_pos.x, tower._tile_pos.y]})
+
+
+func _on_ability_activated(ability_id: String, world_pos: Vector2) -> void:
+	record_command("ability", {"id": ability_id, "pos": [world_pos.x, world_pos.y]})
+
+
+func _on_game_speed_changed(speed: Enums.GameSpeed) -> void:
+	record_command("speed", {"speed": speed})
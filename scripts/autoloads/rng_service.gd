@@ -0,0 +1,39 @@
+extends Node
+## Single seeded random stream for gameplay rolls (crits, status apply
+## chance, crowd picks, ability scatter). Seeding it makes a run
+## reproducible; cosmetic jitter (sparks, shake, window flicker) keeps
+## using the global randf() so visuals never shift the gameplay sequence.
+
+var _rng := RandomNumberGenerator.new()
+
+
+func _ready() -> void:
+	_rng.randomize()
+
+
+func seed_with(value: int) -> void:
+	_rng.seed = value
+
+
+func get_seed() -> int:
+	return _rng.seed
+
+
+func chance(probability: float) -> bool:
+	## True with the given probability (always true at >= 1).
+	if probability >= 1.0:
+		return true
+	return _rng.randf() < probability
+
+
+func next_float() -> float:
+	return _rng.randf()
+
+
+func next_index(size: int) -> int:
+	## Uniform index in [0, size).
+	return _rng.randi() % size
+
+
+func range_float(from: float, to: float) -> float:
+	return _rng.randf_range(from, to)
@@ -7,6 +7,9 @@ signal enemy_spawned(enemy: Node2D)
 signal enemy_killed(enemy: Node2D, gold_reward: int)
 signal enemy_reached_end(enemy: Node2D, lives_cost: int)
 signal enemy_damaged(enemy: Node2D, amount: float, damage_type: Enums.DamageType)
+## Batched hits (DamageCalculator.apply_batch) report here once per batch
+## instead of enemy_damaged per enemy
+signal enemies_damaged(total: float, hit_count: int, damage_type: Enums.DamageType)
 
 # -- Towers --
 signal tower_placed(tower: Node2D, tile_pos: Vector2i)
@@ -1,11 +1,36 @@
 extends Node
-## Spatial hash grid for efficient radius queries on enemies.
-## Divides the world into cells and tracks which enemies occupy each cell.
+## Spatial hash grid for efficient shape queries on enemies.
+## Enemies live in dense struct-of-arrays slots (swap-remove on unregister).
+## Once per frame the slots are counting-sorted into cells; moves in between
+## only update the packed positions, and queries widen their cell range by
+## the furthest distance any enemy has drifted since that rebuild.
+##
+## Query functions write into a caller-owned buffer and return the number
+## of hits; entries past that count are stale and must be ignored.
 
 const CELL_SIZE = 64.0  # 2 tiles
 
-var _grid: Dictionary = {}  # Vector2i -> Array[Node2D]
-var _entity_cells: Dictionary = {}  # instance_id -> Vector2i
+# -- Enemy slots (index-aligned) --
+var _nodes: Array[Node2D] = []
+var _positions: PackedVector2Array = PackedVector2Array()
+var _slot_of: Dictionary = {}  # instance_id -> slot
+
+# -- Cell index, rebuilt by counting sort --
+var _origin_cell: Vector2i = Vector2i.ZERO
+var _cols: int = 0
+var _rows: int = 0
+var _cell_start: PackedInt32Array = PackedInt32Array()  # cell -> first entry in _cell_slots
+var _cell_slots: PackedInt32Array = PackedInt32Array()  # slots grouped by cell
+var _slot_cells: PackedInt32Array = PackedInt32Array()  # scratch: cell of each slot
+var _indexed_positions: PackedVector2Array = PackedVector2Array()
+var _drift: float = 0.0
+var _dirty: bool = false
+
+
+func _process(_delta: float) -> void:
+	# Autoloads process before the scene, so each frame starts on a fresh index
+	if _dirty or _drift > 0.0:
+		_rebuild()
 
 
 func _world_to_cell(pos: Vector2) -> Vector2i:
@@ -13,66 +38,243 @@ func _world_to_cell(pos: Vector2) -> Vector2i:
 
 
 func register(enemy: Node2D) -> void:
-	var cell := _world_to_cell(enemy.global_position)
-	if not _grid.has(cell):
-		_grid[cell] = []
-	_grid[cell].append(enemy)
-	_entity_cells[enemy.get_instance_id()] = cell
+	var eid := enemy.get_instance_id()
+	if _slot_of.has(eid):
+		return
+	_slot_of[eid] = _nodes.size()
+	_nodes.append(enemy)
+	_positions.append(enemy.global_position)
+	_dirty = true
 
 
 func unregister(enemy: Node2D) -> void:
 	var eid := enemy.get_instance_id()
-	if _entity_cells.has(eid):
-		var old_cell: Vector2i = _entity_cells[eid]
-		if _grid.has(old_cell):
-			_grid[old_cell].erase(enemy)
-			if _grid[old_cell].is_empty():
-				_grid.erase(old_cell)
-		_entity_cells.erase(eid)
+	if not _slot_of.has(eid):
+		return
+	var slot: int = _slot_of[eid]
+	var last := _nodes.size() - 1
+	# Swap-remove: move the last slot into the hole
+	if slot != last:
+		var moved := _nodes[last]
+		_nodes[slot] = moved
+		_positions[slot] = _positions[last]
+		_slot_of[moved.get_instance_id()] = slot
+	_nodes.resize(last)
+	_positions.resize(last)
+	_slot_of.erase(eid)
+	_dirty = true
 
 
 func update_position(enemy: Node2D) -> void:
 	var eid := enemy.get_instance_id()
-	var new_cell := _world_to_cell(enemy.global_position)
-	if _entity_cells.has(eid) and _entity_cells[eid] == new_cell:
-		return  # Same cell, nothing to do
+	if not _slot_of.has(eid):
+		return
+	var slot: int = _slot_of[eid]
+	var pos := enemy.global_position
+	_positions[slot] = pos
+	if not _dirty:
+		_drift = maxf(_drift, pos.distance_to(_indexed_positions[slot]))
 
-	# Remove from old cell
-	if _entity_cells.has(eid):
-		var old_cell: Vector2i = _entity_cells[eid]
-		if _grid.has(old_cell):
-			_grid[old_cell].erase(enemy)
-			if _grid[old_cell].is_empty():
-				_grid.erase(old_cell)
 
-	# Add to new cell
-	if not _grid.has(new_cell):
-		_grid[new_cell] = []
-	_grid[new_cell].append(enemy)
-	_entity_cells[eid] = new_cell
+func clear() -> void:
+	_nodes.clear()
+	_positions.clear()
+	_slot_of.clear()
+	_cell_start.clear()
+	_cell_slots.clear()
+	_indexed_positions.clear()
+	_cols = 0
+	_rows = 0
+	_drift = 0.0
+	_dirty = false
 
 
-func get_enemies_in_radius(center: Vector2, radius: float) -> Array[Node2D]:
-	var result: Array[Node2D] = []
+func _rebuild() -> void:
+	var n := _positions.size()
+	_dirty = false
+	_drift = 0.0
+	_indexed_positions = _positions.duplicate()
+	if n == 0:
+		_cols = 0
+		_rows = 0
+		return
+
+	# Grid bounds from the occupied cells
+	var min_cell := _world_to_cell(_positions[0])
+	var max_cell := min_cell
+	for i in range(1, n):
+		var c := _world_to_cell(_positions[i])
+		min_cell = min_cell.min(c)
+		max_cell = max_cell.max(c)
+	_origin_cell = min_cell
+	_cols = max_cell.x - min_cell.x + 1
+	_rows = max_cell.y - min_cell.y + 1
+
+	# Counting sort: histogram, prefix sum, scatter
+	_cell_start.resize(_cols * _rows + 1)
+	_cell_start.fill(0)
+	_slot_cells.resize(n)
+	for i in n:
+		var c := _world_to_cell(_positions[i]) - _origin_cell
+		var idx := c.y * _cols + c.x
+		_slot_cells[i] = idx
+		_cell_start[idx + 1] += 1
+	for idx in _cols * _rows:
+		_cell_start[idx + 1] += _cell_start[idx]
+	_cell_slots.resize(n)
+	var fill := _cell_start.duplicate()
+	for i in n:
+		var idx := _slot_cells[i]
+		_cell_slots[fill[idx]] = i
+		fill[idx] += 1
+
+
+func _ensure_index() -> void:
+	if _dirty:
+		_rebuild()
+
+
+## Cell range (inclusive, grid-relative) covering an AABB plus drift.
+## Returns Rect2i with size -1 when the query misses the grid entirely.
+func _cell_range(min_pos: Vector2, max_pos: Vector2) -> Rect2i:
+	var pad := Vector2(_drift, _drift)
+	var lo := _world_to_cell(min_pos - pad) - _origin_cell
+	var hi := _world_to_cell(max_pos + pad) - _origin_cell
+	lo = lo.max(Vector2i.ZERO)
+	hi = hi.min(Vector2i(_cols - 1, _rows - 1))
+	if lo.x > hi.x or lo.y > hi.y:
+		return Rect2i(0, 0, -1, -1)
+	return Rect2i(lo, hi - lo)
+
+
+static func _write(out: Array[Node2D], count: int, node: Node2D) -> void:
+	if count < out.size():
+		out[count] = node
+	else:
+		out.append(node)
+
+
+# -- Queries --
+
+func query_radius(center: Vector2, radius: float, out: Array[Node2D]) -> int:
+	## Enemies within radius of center.
+	_ensure_index()
+	if _cols == 0:
+		return 0
+	var cells := _cell_range(center - Vector2(radius, radius), center + Vector2(radius, radius))
 	var radius_sq := radius * radius
+	var count := 0
+	for cy in range(cells.position.y, cells.end.y + 1):
+		var row := cy * _cols
+		for cx in range(cells.position.x, cells.end.x + 1):
+			var idx := row + cx
+			for k in range(_cell_start[idx], _cell_start[idx + 1]):
+				var slot := _cell_slots[k]
+				if center.distance_squared_to(_positions[slot]) <= radius_sq:
+					_write(out, count, _nodes[slot])
+					count += 1
+	return count
 
-	# Compute AABB of the query circle in cell coordinates
-	var min_cell := _world_to_cell(center - Vector2(radius, radius))
-	var max_cell := _world_to_cell(center + Vector2(radius, radius))
 
-	for cx in range(min_cell.x, max_cell.x + 1):
-		for cy in range(min_cell.y, max_cell.y + 1):
-			var cell := Vector2i(cx, cy)
-			if not _grid.has(cell):
-				continue
-			for enemy in _grid[cell]:
-				if is_instance_valid(enemy):
-					if center.distance_squared_to(enemy.global_position) <= radius_sq:
-						result.append(enemy)
+func query_cone(origin: Vector2, direction: Vector2, half_angle: float, cone_range: float,
+		out: Array[Node2D]) -> int:
+	## Enemies within cone_range of origin and half_angle (radians) of direction.
+	_ensure_index()
+	if _cols == 0:
+		return 0
+	var cells := _cell_range(origin - Vector2(cone_range, cone_range), origin + Vector2(cone_range, cone_range))
+	var range_sq := cone_range * cone_range
+	var dir := direction.normalized()
+	var cos_limit := cos(half_angle)
+	var count := 0
+	for cy in range(cells.position.y, cells.end.y + 1):
+		var row := cy * _cols
+		for cx in range(cells.position.x, cells.end.x + 1):
+			var idx := row + cx
+			for k in range(_cell_start[idx], _cell_start[idx + 1]):
+				var slot := _cell_slots[k]
+				var to_enemy := _positions[slot] - origin
+				var d_sq := to_enemy.length_squared()
+				if d_sq > range_sq:
+					continue
+				# Enemy on the apex counts as inside
+				if d_sq > 0.0 and dir.dot(to_enemy) < cos_limit * sqrt(d_sq):
+					continue
+				_write(out, count, _nodes[slot])
+				count += 1
+	return count
 
-	return result
 
+func query_capsule(from: Vector2, to: Vector2, radius: float, out: Array[Node2D],
+		end_margin: float = -1.0) -> int:
+	## Enemies within radius of the segment from-to. With end_margin >= 0,
+	## hits must also project onto the segment extended by end_margin.
+	_ensure_index()
+	if _cols == 0:
+		return 0
+	var cells := _cell_range(from.min(to) - Vector2(radius, radius), from.max(to) + Vector2(radius, radius))
+	var seg := to - from
+	var seg_len := seg.length()
+	var seg_dir := seg / seg_len if seg_len > 0.0 else Vector2.ZERO
+	var radius_sq := radius * radius
+	var count := 0
+	for cy in range(cells.position.y, cells.end.y + 1):
+		var row := cy * _cols
+		for cx in range(cells.position.x, cells.end.x + 1):
+			var idx := row + cx
+			for k in range(_cell_start[idx], _cell_start[idx + 1]):
+				var slot := _cell_slots[k]
+				var pos := _positions[slot]
+				var along := (pos - from).dot(seg_dir)
+				if end_margin >= 0.0 and (along < -end_margin or along > seg_len + end_margin):
+					continue
+				var closest := from + seg_dir * clampf(along, 0.0, seg_len)
+				if pos.distance_squared_to(closest) <= radius_sq:
+					_write(out, count, _nodes[slot])
+					count += 1
+	return count
 
-func clear() -> void:
-	_grid.clear()
-	_entity_cells.clear()
+
+func query_nearest_unhit(center: Vector2, radius: float, hit_set: Dictionary) -> Node2D:
+	## Nearest enemy within radius whose instance_id is not a key of hit_set.
+	_ensure_index()
+	if _cols == 0:
+		return null
+	var cells := _cell_range(center - Vector2(radius, radius), center + Vector2(radius, radius))
+	var best: Node2D = null
+	var best_sq := radius * radius
+	for cy in range(cells.position.y, cells.end.y + 1):
+		var row := cy * _cols
+		for cx in range(cells.position.x, cells.end.x + 1):
+			var idx := row + cx
+			for k in range(_cell_start[idx], _cell_start[idx + 1]):
+				var slot := _cell_slots[k]
+				var d := center.distance_squared_to(_positions[slot])
+				if d > best_sq:
+					continue
+				var node := _nodes[slot]
+				if hit_set.has(node.get_instance_id()):
+					continue
+				best_sq = d
+				best = node
+	return best
+
+
+func get_occupancy() -> Vector2i:
+	## (occupied cells, most enemies in one cell) of the current index.
+	_ensure_index()
+	var occupied := 0
+	var busiest := 0
+	for idx in _cols * _rows:
+		var n := _cell_start[idx + 1] - _cell_start[idx]
+		if n > 0:
+			occupied += 1
+			busiest = maxi(busiest, n)
+	return Vector2i(occupied, busiest)
+
+
+func get_enemies_in_radius(center: Vector2, radius: float) -> Array[Node2D]:
+	## Allocating convenience wrapper around query_radius().
+	var result: Array[Node2D] = []
+	result.resize(query_radius(center, radius, result))
+	return result
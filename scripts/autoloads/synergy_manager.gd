@@ -1,8 +1,7 @@
 extends Node
-## Manages proximity-based tower synergies. Recalculates damage/rate/range
-## multipliers whenever towers are placed, sold, or upgraded.
-
-signal synergy_changed(tower: Node2D)
+## Manages proximity-based tower synergies. Keeps a tile-indexed adjacency
+## graph of towers whose types pair up, updating only the edges a placement
+## or sale touches, and pushes damage/rate multipliers to changed towers.
 
 ## Synergy definition format:
 ##   id: unique string
@@ -113,12 +112,23 @@ const SYNERGY_RANGE = 3  ## Chebyshev distance in tiles
 ## Map of tile position → tower reference
 var _tower_grid: Dictionary = {}  # Vector2i -> BaseTower
 
+## Adjacency index: towers in range whose types form a synergy pair.
+## Placement and sale touch only these edges (no neighborhood rescans).
+var _edges: Dictionary = {}  # instance_id -> Array[BaseTower]
+var _tower_type: Dictionary = {}  # instance_id -> tower_id
+var _partner_counts: Dictionary = {}  # instance_id -> { partner tower_id: neighbors in range }
+
+## Pair lookup, built from SYNERGIES once: "own_id|partner_id" -> this
+## side's rules ({ id, name, bonus, rate, max_stacks, is_buff }).
+var _pair_rules: Dictionary = {}
+
 ## Map of tower instance_id → active synergy info
 ## { instance_id: { "damage_mult": float, "rate_mult": float, "synergies": [...] } }
 var _tower_synergies: Dictionary = {}
 
 
 func _ready() -> void:
+	_build_pair_rules()
 	SignalBus.tower_placed.connect(_on_tower_placed)
 	SignalBus.tower_sold.connect(_on_tower_sold)
 	SignalBus.tower_upgraded.connect(_on_tower_upgraded)
@@ -127,24 +137,99 @@ func _ready() -> void:
 
 func clear() -> void:
 	_tower_grid.clear()
+	_edges.clear()
+	_tower_type.clear()
+	_partner_counts.clear()
 	_tower_synergies.clear()
 
 
+func _build_pair_rules() -> void:
+	for synergy in SYNERGIES:
+		var rate_a: float = synergy.get("rate_a", 1.0)
+		var rate_b: float = synergy.get("rate_b", 1.0)
+		_add_pair_rule(synergy["tower_a"], synergy["tower_b"], synergy, synergy["bonus_a"], rate_a)
+		# Self-synergies use the a-side values only
+		if synergy["tower_a"] != synergy["tower_b"]:
+			_add_pair_rule(synergy["tower_b"], synergy["tower_a"], synergy, synergy["bonus_b"], rate_b)
+
+
+func _add_pair_rule(own_id: String, partner_id: String, synergy: Dictionary,
+		bonus: float, rate_bonus: float) -> void:
+	var key := _pair_key(own_id, partner_id)
+	if not _pair_rules.has(key):
+		_pair_rules[key] = []
+	_pair_rules[key].append({
+		"id": synergy["id"],
+		"name": synergy["name"],
+		"bonus": bonus,
+		"rate": rate_bonus,
+		"max_stacks": synergy["max_stacks"],
+		"is_buff": bonus >= 1.0 and rate_bonus >= 1.0,
+	})
+
+
+static func _pair_key(own_id: String, partner_id: String) -> String:
+	return own_id + "|" + partner_id
+
+
 func _on_tower_placed(tower: Node2D, tile_pos: Vector2i) -> void:
 	if not tower is BaseTower:
 		return
+	var id := tower.get_instance_id()
+	var tower_id: String = tower.tower_data.tower_id if tower.tower_data else ""
 	_tower_grid[tile_pos] = tower
-	_recalculate_for_tower(tower, tile_pos)
-	_recalculate_neighbors(tile_pos)
+	_tower_type[id] = tower_id
+	_edges[id] = []
+	_partner_counts[id] = {}
+
+	# One scan of the placement neighborhood adds this tower's edges
+	var touched: Array[BaseTower] = [tower]
+	if not tower_id.is_empty():
+		for dx in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
+			for dy in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
+				if dx == 0 and dy == 0:
+					continue
+				var neighbor_tile := tile_pos + Vector2i(dx, dy)
+				if not _tower_grid.has(neighbor_tile):
+					continue
+				var ref = _tower_grid[neighbor_tile]
+				if not is_instance_valid(ref):
+					_tower_grid.erase(neighbor_tile)
+					continue
+				var neighbor: BaseTower = ref as BaseTower
+				var neighbor_id: String = _tower_type.get(neighbor.get_instance_id(), "")
+				if not _pair_rules.has(_pair_key(tower_id, neighbor_id)):
+					continue
+				_add_edge(tower, tower_id, neighbor, neighbor_id)
+				touched.append(neighbor)
+
+	for t in touched:
+		_recalculate_for_tower(t)
 
 
 func _on_tower_sold(tower: Node2D, _refund: int) -> void:
 	if not tower is BaseTower:
 		return
+	var id := tower.get_instance_id()
+	var tower_id: String = _tower_type.get(id, "")
 	var tile_pos: Vector2i = tower._tile_pos
-	_tower_grid.erase(tile_pos)
-	_tower_synergies.erase(tower.get_instance_id())
-	_recalculate_neighbors(tile_pos)
+	if _tower_grid.get(tile_pos) == tower:
+		_tower_grid.erase(tile_pos)
+
+	# Remove only this tower's edges and re-evaluate the towers on them
+	var neighbors: Array = _edges.get(id, [])
+	_edges.erase(id)
+	_tower_type.erase(id)
+	_partner_counts.erase(id)
+	_tower_synergies.erase(id)
+	for neighbor in neighbors:
+		if not is_instance_valid(neighbor):
+			continue
+		var nid: int = neighbor.get_instance_id()
+		_edges[nid].erase(tower)
+		var counts: Dictionary = _partner_counts[nid]
+		counts[tower_id] = counts.get(tower_id, 1) - 1
+		_recalculate_for_tower(neighbor)
 
 
 func _on_tower_upgraded(tower: Node2D, _path_index: int, _tier: int) -> void:
@@ -154,22 +239,22 @@ func _on_tower_upgraded(tower: Node2D, _path_index: int, _tier: int) -> void:
 	_apply_synergy_to_tower(tower)
 
 
-func _recalculate_neighbors(center_tile: Vector2i) -> void:
-	for dx in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
-		for dy in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
-			if dx == 0 and dy == 0:
-				continue
-			var neighbor_tile := center_tile + Vector2i(dx, dy)
-			if _tower_grid.has(neighbor_tile):
-				var ref = _tower_grid[neighbor_tile]
-				if not is_instance_valid(ref):
-					_tower_grid.erase(neighbor_tile)
-					continue
-				_recalculate_for_tower(ref as BaseTower, neighbor_tile)
+func _add_edge(a: BaseTower, a_id: String, b: BaseTower, b_id: String) -> void:
+	var ia := a.get_instance_id()
+	var ib := b.get_instance_id()
+	_edges[ia].append(b)
+	_edges[ib].append(a)
+	var counts_a: Dictionary = _partner_counts[ia]
+	var counts_b: Dictionary = _partner_counts[ib]
+	counts_a[b_id] = counts_a.get(b_id, 0) + 1
+	counts_b[a_id] = counts_b.get(a_id, 0) + 1
 
 
-func _recalculate_for_tower(tower: BaseTower, tile_pos: Vector2i) -> void:
-	var tower_id: String = tower.tower_data.tower_id if tower.tower_data else ""
+func _recalculate_for_tower(tower: BaseTower) -> void:
+	## Rebuild a tower's multipliers from its partner counts; towers whose
+	## result did not change (e.g. already at max_stacks) are not touched.
+	var id := tower.get_instance_id()
+	var tower_id: String = _tower_type.get(id, "")
 	if tower_id.is_empty():
 		return
 
@@ -177,82 +262,57 @@ func _recalculate_for_tower(tower: BaseTower, tile_pos: Vector2i) -> void:
 	var rate_mult := 1.0
 	var active_synergies: Array = []
 
-	for synergy in SYNERGIES:
-		var is_a: bool = (tower_id == synergy["tower_a"])
-		var is_b: bool = (tower_id == synergy["tower_b"])
-		if not is_a and not is_b:
+	var counts: Dictionary = _partner_counts[id]
+	for partner_id in counts:
+		var count: int = counts[partner_id]
+		if count <= 0:
 			continue
-
-		# Find matching partners within range
-		var partner_id: String
-		var bonus: float
-		var rate_bonus: float
-		if synergy["tower_a"] == synergy["tower_b"]:
-			# Self-synergy: look for same tower type
-			partner_id = tower_id
-			bonus = synergy["bonus_a"]
-			rate_bonus = synergy.get("rate_a", 1.0)
-		elif is_a:
-			partner_id = synergy["tower_b"]
-			bonus = synergy["bonus_a"]
-			rate_bonus = synergy.get("rate_a", 1.0)
-		else:
-			partner_id = synergy["tower_a"]
-			bonus = synergy["bonus_b"]
-			rate_bonus = synergy.get("rate_b", 1.0)
-
-		var stack_count := 0
-		for dx in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
-			for dy in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
-				if dx == 0 and dy == 0:
-					continue
-				var check_tile := tile_pos + Vector2i(dx, dy)
-				if not _tower_grid.has(check_tile):
-					continue
-				var ref = _tower_grid[check_tile]
-				if not is_instance_valid(ref):
-					_tower_grid.erase(check_tile)
-					continue
-				var neighbor: BaseTower = ref as BaseTower
-				if neighbor == tower:
-					continue
-				var neighbor_id: String = neighbor.tower_data.tower_id if neighbor.tower_data else ""
-				if neighbor_id == partner_id:
-					stack_count += 1
-					if stack_count >= synergy["max_stacks"]:
-						break
-			if stack_count >= synergy["max_stacks"]:
-				break
-
-		if stack_count > 0:
-			damage_mult *= pow(bonus, stack_count)
-			rate_mult *= pow(rate_bonus, stack_count)
+		for rule in _pair_rules.get(_pair_key(tower_id, partner_id), []):
+			var stack_count: int = mini(count, rule["max_stacks"])
+			damage_mult *= pow(rule["bonus"], stack_count)
+			rate_mult *= pow(rule["rate"], stack_count)
 			active_synergies.append({
-				"id": synergy["id"],
-				"name": synergy["name"],
+				"id": rule["id"],
+				"name": rule["name"],
 				"stacks": stack_count,
-				"is_buff": bonus >= 1.0 and rate_bonus >= 1.0,
+				"is_buff": rule["is_buff"],
 			})
 
-	_tower_synergies[tower.get_instance_id()] = {
+	var info := {
 		"damage_mult": damage_mult,
 		"rate_mult": rate_mult,
 		"synergies": active_synergies,
 	}
+	# Edges changed even when the multipliers did not
+	tower.refresh_taser_links()
+	if _tower_synergies.has(id) and _tower_synergies[id] == info:
+		return
+	_tower_synergies[id] = info
 
 	if not active_synergies.is_empty():
-		print("[Synergy] ", tower_id, " @ ", tile_pos, " → ", active_synergies, " (dmg x", snapped(damage_mult, 0.01), ", rate x", snapped(rate_mult, 0.01), ")")
+		print("[Synergy] ", tower_id, " @ ", tower._tile_pos, " → ", active_synergies, " (dmg x", snapped(damage_mult, 0.01), ", rate x", snapped(rate_mult, 0.01), ")")
 
 	_apply_synergy_to_tower(tower)
-	synergy_changed.emit(tower)
+	tower.refresh_synergy_glow()
 
 
 func _apply_synergy_to_tower(tower: BaseTower) -> void:
 	var info: Dictionary = _tower_synergies.get(tower.get_instance_id(), {})
 	var damage_mult: float = info.get("damage_mult", 1.0)
 	var rate_mult: float = info.get("rate_mult", 1.0)
-	tower.weapon.apply_synergy(damage_mult)
-	tower.apply_synergy_rate(rate_mult)
+	tower.apply_synergy(damage_mult, rate_mult)
+
+
+## Returns the towers within SYNERGY_RANGE that form a synergy pair with
+## tower, optionally only those of one tower_id.
+func get_neighbors(tower: BaseTower, tower_id: String = "") -> Array[BaseTower]:
+	var result: Array[BaseTower] = []
+	for neighbor in _edges.get(tower.get_instance_id(), []):
+		if not is_instance_valid(neighbor):
+			continue
+		if tower_id.is_empty() or _tower_type.get(neighbor.get_instance_id(), "") == tower_id:
+			result.append(neighbor)
+	return result
 
 
 ## Returns array of active synergy dicts for a tower, or empty array.
@@ -0,0 +1,50 @@
+extends Node
+## Resolves tower targets from the SpatialGrid instead of per-tower Area2D
+## range tracking. Each attack tick runs one radius query into a shared
+## buffer and a single selection pass over the hits — no physics signals,
+## no per-tower enemy lists, no per-tick allocation.
+
+## Radius of the enemy HitArea circle (base_enemy.tscn). Range used to be
+## an Area2D overlap, which reached the enemy's edge, not its centre.
+const ENEMY_HIT_RADIUS = 8.0
+
+var _hits: Array[Node2D] = []  # Shared query buffer (single-threaded)
+
+
+func select_target(targeting: TargetingComponent, origin: Vector2, range_px: float) -> Node2D:
+	## Best enemy whose hit circle reaches within range_px of origin, for
+	## the component's priority and flying/stealth filters, or null.
+	var t0 := Time.get_ticks_usec()
+	var count := SpatialGrid.query_radius(origin, range_px + ENEMY_HIT_RADIUS, _hits)
+	var priority := targeting.priority
+	var best: BaseEnemy = null
+	var best_key := 0.0
+
+	for i in count:
+		var enemy := _hits[i] as BaseEnemy
+		if not enemy or not enemy.health or enemy.health.is_dead:
+			continue
+		if not targeting.can_target_flying and enemy.is_flying():
+			continue
+		if not targeting.can_target_stealth and enemy.is_stealthed():
+			continue
+
+		# Every priority reduces to "largest key wins"
+		var key: float
+		match priority:
+			Enums.TargetingPriority.FIRST:
+				key = enemy.get_path_progress()
+			Enums.TargetingPriority.LAST:
+				key = -enemy.get_path_progress()
+			Enums.TargetingPriority.STRONGEST:
+				key = enemy.health.current_hp
+			Enums.TargetingPriority.WEAKEST:
+				key = -enemy.health.current_hp
+			_:
+				key = -origin.distance_squared_to(enemy.global_position)
+		if not best or key > best_key:
+			best = enemy
+			best_key = key
+
+	PerfMonitor.add_time(PerfMonitor.Section.TARGETING, Time.get_ticks_usec() - t0)
+	return best
@@ -2,33 +2,67 @@ extends Node
 ## Stores and resolves stat modifiers from upgrades. When a tower
 ## upgrades, its modifier stack is updated here and final stats recomputed.
 
+## StatModifierData.stat_name -> slot in a compiled stat block.
+const STAT_SLOTS := {
+	"base_damage": Enums.TowerStat.DAMAGE,
+	"fire_rate": Enums.TowerStat.FIRE_RATE,
+	"base_range": Enums.TowerStat.RANGE,
+	"area_of_effect": Enums.TowerStat.AOE,
+	"pierce_count": Enums.TowerStat.PIERCE,
+	"chain_targets": Enums.TowerStat.CHAIN,
+	"crit_chance": Enums.TowerStat.CRIT_CHANCE,
+	"crit_multiplier": Enums.TowerStat.CRIT_MULT,
+}
 
-func apply_modifiers(base_value: float, modifiers: Array[StatModifierData]) -> float:
-	## Apply a stack of modifiers to a base stat value.
-	## Order: SET first (last wins), then ADD, then MULTIPLY.
-	var result := base_value
-	var has_set := false
 
-	# SET overrides (last one wins)
+func compile_stats(tower_data: TowerData, modifiers: Array[StatModifierData],
+		damage_mult: float = 1.0, rate_mult: float = 1.0) -> PackedFloat32Array:
+	## Fold a tower's base stats, upgrade modifiers and synergy multipliers
+	## into one flat block indexed by Enums.TowerStat. Modifiers apply in
+	## purchase order (as the game always has, and as balance_sim.py folds
+	## them); synergy multiplies damage and fire rate last.
+	var stats := PackedFloat32Array([
+		tower_data.base_damage,
+		tower_data.fire_rate,
+		tower_data.base_range,
+		tower_data.area_of_effect,
+		tower_data.pierce_count,
+		tower_data.chain_targets,
+		tower_data.crit_chance,
+		tower_data.crit_multiplier,
+	])
 	for mod in modifiers:
-		if mod.operation == Enums.ModifierOp.SET:
-			result = mod.value
-			has_set = true
+		var slot: int = STAT_SLOTS.get(mod.stat_name, -1)
+		if slot < 0:
+			continue
+		match mod.operation:
+			Enums.ModifierOp.ADD:
+				stats[slot] += mod.value
+			Enums.ModifierOp.MULTIPLY:
+				stats[slot] *= mod.value
+			Enums.ModifierOp.SET:
+				stats[slot] = mod.value
+	stats[Enums.TowerStat.DAMAGE] *= damage_mult
+	stats[Enums.TowerStat.FIRE_RATE] *= rate_mult
+	return stats
 
-	if not has_set:
-		result = base_value
 
-	# Additive pass
-	for mod in modifiers:
-		if mod.operation == Enums.ModifierOp.ADD:
-			result += mod.value
-
-	# Multiplicative pass
-	for mod in modifiers:
-		if mod.operation == Enums.ModifierOp.MULTIPLY:
-			result *= mod.value
-
-	return result
+func preview_next_tiers(tower: BaseTower) -> Array[PackedFloat32Array]:
+	## Compiled stats after buying the next tier of each upgrade path, one
+	## block per path (empty when the path is maxed). The tower's current
+	## synergy carries over.
+	var previews: Array[PackedFloat32Array] = []
+	var paths := tower.tower_data.upgrade_paths
+	for path_i in paths.size():
+		var tier: int = tower.upgrade.path_tiers[path_i]
+		if tier >= paths[path_i].tiers.size():
+			previews.append(PackedFloat32Array())
+			continue
+		var mods: Array[StatModifierData] = tower.upgrade.active_modifiers.duplicate()
+		mods.append_array(paths[path_i].tiers[tier].stat_modifiers)
+		previews.append(compile_stats(tower.tower_data, mods,
+			tower.get_synergy_damage_mult(), tower.get_synergy_rate_mult()))
+	return previews
 
 
 func get_upgrade_cost(tower_data: TowerData, path_index: int, tier: int) -> int:
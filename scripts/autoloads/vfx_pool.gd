@@ -1,18 +1,62 @@
 extends Node
 ## Object pool for VFX nodes (Labels and ColorRects) to avoid per-hit allocations.
+## Spawners check `enabled` first; the headless sim turns it off.
+##
+## Damage numbers are coalesced per enemy per frame and shown under an
+## on-screen budget (kills and crits first). Sparks, shards and coins are
+## drawn by one VFXParticles node per scene instead of a ColorRect each.
+
+## Floating text priority; a full budget evicts the oldest lower one
+enum Priority { NORMAL, CRIT, KILL, ALERT }
 
 const INITIAL_LABELS = 40
 const INITIAL_RECTS = 80
 const MAX_POOL_LABELS = 80  # 2x initial — overflow beyond this is queue_free'd
 const MAX_POOL_RECTS = 160
 
+const MAX_FLOATING_TEXT = 48  # Damage numbers + alerts on screen at once
+const MAX_PARTICLES = 600  # Sparks/shards beyond this are dropped
+const KILL_PARTICLE_RESERVE = 100  # Extra headroom kept for gold coins
+
+const DAMAGE_NUMBER_OFFSET = Vector2(-12, -20)
+const DAMAGE_NUMBER_RISE = 20.0
+const DAMAGE_NUMBER_TIME = 0.8
+const COIN_COLOR = Color("#E0C060")
+const COIN_TARGET = Vector2(40, 12)
+
+var enabled: bool = true
+
+## Running totals for PerfMonitor: pool reuse, fresh allocations, and
+## releases freed because the pool was full
+var stat_hits: int = 0
+var stat_misses: int = 0
+var stat_overflow: int = 0
+## Damage numbers merged into another this frame, and texts/particles
+## skipped because the on-screen budget was full
+var stat_merged: int = 0
+var stat_dropped: int = 0
+
 var _label_pool: Array[Label] = []
 var _rect_pool: Array[ColorRect] = []
 var _container: Node
+var _particles: VFXParticles
+
+# Damage numbers queued this frame, one slot per enemy
+var _pending_slot: Dictionary = {}  # enemy instance id -> slot
+var _pending_pos: PackedVector2Array = PackedVector2Array()
+var _pending_amount: PackedFloat32Array = PackedFloat32Array()
+var _pending_color: PackedColorArray = PackedColorArray()
+var _pending_priority: PackedByteArray = PackedByteArray()
+
+# Floating texts on screen, oldest first
+var _active_labels: Array[Label] = []
+var _active_tweens: Array[Tween] = []
+var _active_priority: PackedByteArray = PackedByteArray()
 
 
 func _ready() -> void:
 	_init_pool()
+	set_process(false)
 
 
 func _init_pool() -> void:
@@ -37,6 +81,11 @@ func reset_pool() -> void:
 	# Discard stale refs (nodes freed with the old scene) and rebuild
 	_label_pool.clear()
 	_rect_pool.clear()
+	_clear_pending()
+	_active_labels.clear()
+	_active_tweens.clear()
+	_active_priority.clear()
+	_particles = null
 	if is_instance_valid(_container):
 		_container.queue_free()
 	_init_pool()
@@ -48,8 +97,10 @@ func acquire_label() -> Label:
 		label = _label_pool.pop_back()
 		# Reparent out of pool container
 		_container.remove_child(label)
+		stat_hits += 1
 	else:
 		label = Label.new()
+		stat_misses += 1
 
 	# Reset properties
 	label.text = ""
@@ -64,8 +115,8 @@ func acquire_label() -> Label:
 
 
 func release_label(label: Label) -> void:
-	if not is_instance_valid(label):
-		return
+	if not is_instance_valid(label) or not label.visible:
+		return  # Freed, or already back in the pool
 	label.visible = false
 	# Remove all theme overrides
 	label.remove_theme_color_override("font_color")
@@ -81,6 +132,7 @@ func release_label(label: Label) -> void:
 		_label_pool.append(label)
 	else:
 		label.queue_free()
+		stat_overflow += 1
 
 
 func acquire_rect() -> ColorRect:
@@ -88,8 +140,10 @@ func acquire_rect() -> ColorRect:
 	if not _rect_pool.is_empty():
 		rect = _rect_pool.pop_back()
 		_container.remove_child(rect)
+		stat_hits += 1
 	else:
 		rect = ColorRect.new()
+		stat_misses += 1
 
 	# Reset properties
 	rect.color = Color.WHITE
@@ -116,3 +170,179 @@ func release_rect(rect: ColorRect) -> void:
 		_rect_pool.append(rect)
 	else:
 		rect.queue_free()
+		stat_overflow += 1
+
+
+# -- Damage numbers --
+
+func queue_damage_number(enemy: Node2D, amount: float, color: Color, is_crit: bool, is_kill: bool) -> void:
+	## Queue a damage number over enemy. Hits on the same enemy this frame
+	## merge into one number, shown at the start of the next frame.
+	if not enabled:
+		return
+	var priority := Priority.KILL if is_kill else (Priority.CRIT if is_crit else Priority.NORMAL)
+	var id := enemy.get_instance_id()
+	var slot: int = _pending_slot.get(id, -1)
+	if slot < 0:
+		_pending_slot[id] = _pending_pos.size()
+		_pending_pos.append(enemy.global_position + DAMAGE_NUMBER_OFFSET)
+		_pending_amount.append(amount)
+		_pending_color.append(color)
+		_pending_priority.append(priority)
+		set_process(true)
+		return
+	stat_merged += 1
+	_pending_pos[slot] = enemy.global_position + DAMAGE_NUMBER_OFFSET
+	_pending_amount[slot] += amount
+	if priority >= _pending_priority[slot]:
+		_pending_priority[slot] = priority
+		_pending_color[slot] = color
+
+
+func _process(_delta: float) -> void:
+	_flush_damage_numbers()
+	set_process(false)
+
+
+func _flush_damage_numbers() -> void:
+	# Highest priority, then biggest number, gets the budget first
+	var order: Array[int] = []
+	order.assign(range(_pending_pos.size()))
+	order.sort_custom(func(a: int, b: int) -> bool:
+		if _pending_priority[a] != _pending_priority[b]:
+			return _pending_priority[a] > _pending_priority[b]
+		return _pending_amount[a] > _pending_amount[b])
+
+	for slot in order:
+		var priority: int = _pending_priority[slot]
+		var text := str(int(_pending_amount[slot]))
+		if priority >= Priority.CRIT:
+			text += "!"
+		show_floating_text(text, _pending_pos[slot], _pending_color[slot],
+			14 if priority >= Priority.CRIT else 10,
+			DAMAGE_NUMBER_RISE, DAMAGE_NUMBER_TIME, priority as Priority)
+	_clear_pending()
+
+
+func _clear_pending() -> void:
+	_pending_slot.clear()
+	_pending_pos.clear()
+	_pending_amount.clear()
+	_pending_color.clear()
+	_pending_priority.clear()
+
+
+# -- Floating text budget --
+
+func show_floating_text(text: String, pos: Vector2, color: Color, font_size: int,
+		rise: float, duration: float, priority: Priority = Priority.NORMAL) -> void:
+	## Text that rises and fades at pos, counted against MAX_FLOATING_TEXT.
+	if not enabled:
+		return
+	if _active_labels.size() >= MAX_FLOATING_TEXT and not _evict_below(priority):
+		stat_dropped += 1
+		return
+
+	var label := acquire_label()
+	label.text = text
+	label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
+	label.add_theme_color_override("font_color", color)
+	label.add_theme_font_size_override("font_size", font_size)
+	label.global_position = pos
+	label.z_index = 100
+	get_tree().current_scene.add_child(label)
+
+	var tween := label.create_tween()
+	tween.set_parallel(true)
+	tween.tween_property(label, "position:y", label.position.y - rise, duration)
+	tween.tween_property(label, "modulate:a", 0.0, duration)
+	tween.chain().tween_callback(_finish_text.bind(label))
+
+	_active_labels.append(label)
+	_active_tweens.append(tween)
+	_active_priority.append(priority)
+
+
+func _evict_below(priority: int) -> bool:
+	## Cut the oldest on-screen text of lower priority. False if none.
+	for i in _active_labels.size():
+		if _active_priority[i] < priority:
+			var label := _active_labels[i]
+			if _active_tweens[i].is_valid():
+				_active_tweens[i].kill()
+			_remove_active(i)
+			release_label(label)
+			stat_dropped += 1
+			return true
+	return false
+
+
+func _finish_text(label: Label) -> void:
+	var i := _active_labels.find(label)
+	if i >= 0:
+		_remove_active(i)
+	release_label(label)
+
+
+func _remove_active(i: int) -> void:
+	_active_labels.remove_at(i)
+	_active_tweens.remove_at(i)
+	_active_priority.remove_at(i)
+
+
+# -- Particles --
+
+func spawn_burst(center: Vector2, count: int, color: Color, min_dist: float, max_dist: float,
+		duration: float, size: Vector2 = Vector2(2, 2)) -> void:
+	## count particles flying out of center in random directions, fading out.
+	if not enabled:
+		return
+	var particles := _get_particles()
+	var from := center - size * 0.5
+	for i in count:
+		if particles.count() >= MAX_PARTICLES:
+			stat_dropped += count - i
+			return
+		var angle := randf() * TAU
+		var to := from + Vector2(cos(angle), sin(angle)) * randf_range(min_dist, max_dist)
+		particles.add_burst(from, to, duration, size, color)
+
+
+func spawn_particle(from: Vector2, to: Vector2, duration: float, size: Vector2, color: Color) -> void:
+	## A single fading particle; from/to are its top-left corner.
+	if not enabled:
+		return
+	var particles := _get_particles()
+	if particles.count() >= MAX_PARTICLES:
+		stat_dropped += 1
+		return
+	particles.add_burst(from, to, duration, size, color)
+
+
+func spawn_coins(center: Vector2, count: int) -> void:
+	## Kill payout: coins pop up from center and fly to the gold counter.
+	if not enabled:
+		return
+	var particles := _get_particles()
+	var size := Vector2(4, 4)
+	var from := center - size * 0.5
+	for i in count:
+		if particles.count() >= MAX_PARTICLES + KILL_PARTICLE_RESERVE:
+			stat_dropped += count - i
+			return
+		var arc := Vector2(randf_range(-30, 30), randf_range(-40, -10))
+		particles.add_coin(from, from + arc, COIN_TARGET, i * 0.05, size, COIN_COLOR)
+
+
+func get_particle_count() -> int:
+	return _particles.count() if is_instance_valid(_particles) else 0
+
+
+func _get_particles() -> VFXParticles:
+	# One renderer per scene; a scene change frees it with everything else
+	if not is_instance_valid(_particles):
+		_particles = VFXParticles.new()
+		_particles.name = "VFXParticles"
+		_particles.z_index = 90
+		get_tree().current_scene.add_child(_particles)
+	return _particles
@@ -1,5 +1,8 @@
 extends Node
 ## Manages wave progression, enemy spawning, and between-wave timers.
+## Each wave is flattened into a time-sorted packed spawn timeline that
+## _process consumes with an accumulator — any number of spawns per frame,
+## scaled by spawn_speed, and steppable at a fixed timestep via step_spawns().
 
 signal spawn_enemy_requested(enemy_data: EnemyData, spawn_point_index: int, modifiers: Dictionary)
 
@@ -11,6 +14,21 @@ var is_spawning: bool = false
 var _between_wave_timer: float = 0.0
 var _waiting_for_next_wave: bool = false
 
+const SPAWN_GRACE_PERIOD = 1.5  # Seconds before a wave's first enemy
+
+## Spawn clock controls (between-wave timer is unaffected)
+var spawn_speed: float = 1.0
+var spawn_paused: bool = false
+
+# Current wave's spawn timeline (index-aligned, sorted by time)
+var _spawn_times: PackedFloat32Array = PackedFloat32Array()
+var _spawn_enemies: Array[EnemyData] = []
+var _spawn_points: PackedInt32Array = PackedInt32Array()
+var _spawn_modifier_idx: PackedInt32Array = PackedInt32Array()
+var _spawn_modifiers: Array[Dictionary] = []  # One per sequence
+var _spawn_cursor: int = 0
+var _spawn_clock: float = 0.0
+
 # Engagement: perfect wave streak
 var perfect_streak: int = 0
 var _wave_had_leak: bool = false
@@ -46,10 +64,16 @@ func _load_crowd_pool() -> void:
 				_crowd_pool.append(data)
 
 
+## True for the regular protestor types mixed into crowds at spawn time.
+func is_in_crowd_pool(data: EnemyData) -> bool:
+	return data in _crowd_pool
+
+
 func start_waves() -> void:
 	current_wave_index = -1
 	enemies_alive = 0
 	perfect_streak = 0
+	_clear_timeline()
 	_start_next_wave()
 
 
@@ -74,44 +98,75 @@ func _start_next_wave() -> void:
 
 
 func _spawn_wave(wave: WaveData) -> void:
-	# Build a flat timeline from all sequences, then sort by time.
-	# This interleaves different enemy types instead of spawning in batches.
-	var timeline: Array[Dictionary] = []
+	# Merge all sequences into one time-sorted timeline. This interleaves
+	# different enemy types instead of spawning in batches.
+	_clear_timeline()
 	var late_scale := _get_late_wave_hp_scale()
 
+	var seqs: Array[SpawnSequenceData] = []
+	var next_time := PackedFloat32Array()
+	var emitted := PackedInt32Array()
 	for seq in wave.spawn_sequences:
-		var t := seq.start_delay
+		if seq.count <= 0 or not seq.enemy_data:
+			continue
+		seqs.append(seq)
+		next_time.append(SPAWN_GRACE_PERIOD + seq.start_delay)
+		emitted.append(0)
+		_spawn_modifiers.append({
+			"hp_multiplier": seq.hp_multiplier * late_scale,
+			"speed_multiplier": seq.speed_multiplier,
+			"armor_bonus": seq.armor_bonus,
+		})
+
+	# k-way merge: each sequence is already in time order
+	while true:
+		var pick := -1
+		for k in seqs.size():
+			if emitted[k] < seqs[k].count and (pick < 0 or next_time[k] < next_time[pick]):
+				pick = k
+		if pick < 0:
+			break
+		var seq := seqs[pick]
 		var is_crowd := not _crowd_pool.is_empty() and seq.enemy_data.enemy_id not in _SPECIAL_IDS
-		for i in seq.count:
-			var enemy: EnemyData = _crowd_pool[randi() % _crowd_pool.size()] if is_crowd else seq.enemy_data
-			timeline.append({
-				"time": t,
-				"enemy_data": enemy,
-				"spawn_point_index": seq.spawn_point_index,
-				"modifiers": {
-					"hp_multiplier": seq.hp_multiplier * late_scale,
-					"speed_multiplier": seq.speed_multiplier,
-					"armor_bonus": seq.armor_bonus,
-				},
-			})
-			t += seq.spawn_interval
-
-	timeline.sort_custom(func(a: Dictionary, b: Dictionary) -> bool: return a["time"] < b["time"])
-
-	# Grace period before first enemy appears
-	await get_tree().create_timer(1.5).timeout
-
-	var elapsed := 0.0
-	for entry in timeline:
-		var wait: float = entry["time"] - elapsed
-		if wait > 0.0:
-			await get_tree().create_timer(wait).timeout
-		elapsed = entry["time"]
+		_spawn_times.append(next_time[pick])
+		_spawn_enemies.append(_crowd_pool[RngService.next_index(_crowd_pool.size())] if is_crowd else seq.enemy_data)
+		_spawn_points.append(seq.spawn_point_index)
+		_spawn_modifier_idx.append(pick)
+		next_time[pick] += seq.spawn_interval
+		emitted[pick] += 1
 
+	is_spawning = not _spawn_times.is_empty()
+
+
+## Advance the spawn clock by dt seconds and emit every spawn that came due.
+## Called from _process; a fixed-step driver can call it directly.
+func step_spawns(dt: float) -> void:
+	if not is_spawning:
+		return
+	_spawn_clock += dt
+	var total := _spawn_times.size()
+	var spawned := 0
+	while _spawn_cursor < total and _spawn_times[_spawn_cursor] <= _spawn_clock:
+		var i := _spawn_cursor
+		_spawn_cursor += 1
 		enemies_alive += 1
-		spawn_enemy_requested.emit(entry["enemy_data"], entry["spawn_point_index"], entry["modifiers"])
+		spawned += 1
+		spawn_enemy_requested.emit(_spawn_enemies[i], _spawn_points[i], _spawn_modifiers[_spawn_modifier_idx[i]])
+	if spawned > 0:
 		SignalBus.wave_enemies_remaining.emit(enemies_alive)
-
+	if _spawn_cursor >= total:
+		is_spawning = false
+		_clear_timeline()
+
+
+func _clear_timeline() -> void:
+	_spawn_times.clear()
+	_spawn_enemies.clear()
+	_spawn_points.clear()
+	_spawn_modifier_idx.clear()
+	_spawn_modifiers.clear()
+	_spawn_cursor = 0
+	_spawn_clock = 0.0
 	is_spawning = false
 
 
@@ -230,6 +285,9 @@ func get_between_wave_timer() -> float:
 
 
 func _process(delta: float) -> void:
+	if is_spawning and not spawn_paused:
+		step_spawns(delta * spawn_speed)
+
 	if _waiting_for_next_wave:
 		_between_wave_timer -= delta
 		if _between_wave_timer <= 0.0:
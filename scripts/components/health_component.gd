@@ -24,6 +24,8 @@ func _ready() -> void:
 	current_hp = max_hp
 	current_shield = shield
 	max_shield = shield
+	# Only regenerating shields need a per-frame callback
+	set_process(shield_regen_rate > 0.0)
 
 
 func take_damage(
@@ -44,10 +46,16 @@ func take_damage(
 		elemental_resistances, vulnerability_mod,
 		crit_chance, crit_mult,
 	)
-	var dmg: float = result["damage"]
 	var is_crit: bool = result["is_crit"]
+	var dmg := apply_raw_damage(result["damage"])
+	damage_taken.emit(dmg, damage_type, is_crit)
+	resolve_death()
+
 
-	# Shield absorbs first
+## Subtract already-calculated damage (shield first). Emits health_changed
+## but not damage_taken or died — callers follow up with resolve_death().
+## Returns the damage that reached HP.
+func apply_raw_damage(dmg: float) -> float:
 	if current_shield > 0.0:
 		var absorbed: float = min(current_shield, dmg)
 		current_shield -= absorbed
@@ -57,9 +65,11 @@ func take_damage(
 	current_hp -= dmg
 	current_hp = max(current_hp, 0.0)
 	health_changed.emit(current_hp, max_hp)
-	damage_taken.emit(dmg, damage_type, is_crit)
+	return dmg
+
 
-	if current_hp <= 0.0:
+func resolve_death() -> void:
+	if current_hp <= 0.0 and not is_dead:
 		is_dead = true
 		died.emit()
 
@@ -4,7 +4,14 @@ extends Node
 ## 1.0 = normal, 0.5 = 50% resist, 0.0 = immune, 2.0 = double damage.
 
 ## Key: Enums.DamageType, Value: float multiplier
-@export var resistances: Dictionary = {}
+@export var resistances: Dictionary = {}:
+	set(value):
+		resistances = value
+		_vector_dirty = true
+
+## Multiplier per DamageType index, rebuilt after resistances change
+var _vector: PackedFloat32Array = PackedFloat32Array()
+var _vector_dirty: bool = true
 
 
 func get_resistance(damage_type: Enums.DamageType) -> float:
@@ -15,6 +22,17 @@ func get_resistance(damage_type: Enums.DamageType) -> float:
 
 func set_resistance(damage_type: Enums.DamageType, value: float) -> void:
 	resistances[damage_type] = value
+	_vector_dirty = true
+
+
+func get_vector() -> PackedFloat32Array:
+	## Resistances as a packed per-DamageType array (used by batched damage).
+	if _vector_dirty:
+		_vector_dirty = false
+		_vector.resize(Enums.DamageType.size())
+		for damage_type in _vector.size():
+			_vector[damage_type] = get_resistance(damage_type)
+	return _vector
 
 
 func get_all() -> Dictionary:
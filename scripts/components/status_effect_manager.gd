@@ -1,15 +1,26 @@
 class_name StatusEffectManager
 extends Node
 ## Manages active status effects (debuffs) on an enemy.
+## Presence is a bitmask (bit = StatusEffectType); stacks live in packed
+## arrays in application order. Expiry is driven by EnemySystem's timer
+## wheel, so an enemy is only visited when one of its stacks runs out.
 
 signal effect_applied(effect_type: Enums.StatusEffectType)
 signal effect_removed(effect_type: Enums.StatusEffectType)
 
-## Active effects: key = StatusEffectType, value = Array of {data, remaining_time, stacks}
-var _active_effects: Dictionary = {}
+const MASK_SLOWED = (1 << Enums.StatusEffectType.FREEZE) | (1 << Enums.StatusEffectType.STUN)
 
-## Cache — recomputed only when effects change
-var _cache_dirty: bool = true
+## Bit per active Enums.StatusEffectType
+var effect_mask: int = 0
+
+# -- Stacks (index-aligned, oldest first) --
+var _types: PackedInt32Array = PackedInt32Array()
+var _expires: PackedFloat64Array = PackedFloat64Array()  # Wheel time
+var _potency: PackedFloat32Array = PackedFloat32Array()
+
+var _next_wake: float = INF  # Earliest deadline handed to the wheel
+
+## Totals — recomputed only when the stack set changes
 var _cached_slow: float = 1.0
 var _cached_dot_dps: float = 0.0
 var _cached_vuln: float = 1.0
@@ -17,124 +28,143 @@ var _cached_armor_shred: float = 0.0
 
 
 func apply_effect(data: StatusEffectData) -> void:
-	if randf() > data.apply_chance:
+	if not RngService.chance(data.apply_chance):
 		return
 
 	var effect_type := data.effect_type
-
-	if not _active_effects.has(effect_type):
-		_active_effects[effect_type] = []
-
-	var stack_list: Array = _active_effects[effect_type]
-
-	if stack_list.size() < data.stack_limit:
-		stack_list.append({
-			"data": data,
-			"remaining": data.duration,
-		})
-		_cache_dirty = true
+	var wheel := EnemySystem.status_wheel
+	var expires := wheel.now + data.duration
+
+	var count := 0
+	var oldest := -1
+	for i in _types.size():
+		if _types[i] == effect_type:
+			if oldest < 0:
+				oldest = i
+			count += 1
+
+	if count < data.stack_limit:
+		_types.append(effect_type)
+		_expires.append(expires)
+		_potency.append(data.potency)
+		effect_mask |= 1 << effect_type
+		_recompute()
+		_schedule(expires)
 		effect_applied.emit(effect_type)
-	else:
+	elif oldest >= 0:
 		# Refresh the oldest stack's duration
-		if not stack_list.is_empty():
-			stack_list[0]["remaining"] = data.duration
-
-
-func _process(delta: float) -> void:
-	var to_remove: Array[Enums.StatusEffectType] = []
-
-	for effect_type in _active_effects:
-		var stack_list: Array = _active_effects[effect_type]
+		_expires[oldest] = expires
+		_schedule(expires)
+
+
+func expire() -> void:
+	## Called by EnemySystem when the timer wheel reports this manager due.
+	var now := EnemySystem.status_wheel.now
+	if now < _next_wake:
+		return  # Stale wheel entry; a later one is pending
+	_next_wake = INF
+
+	var removed_mask := 0
+	var keep := 0
+	var next := INF
+	for i in _types.size():
+		if _expires[i] <= now:
+			removed_mask |= 1 << _types[i]
+			continue
+		next = minf(next, _expires[i])
+		_types[keep] = _types[i]
+		_expires[keep] = _expires[i]
+		_potency[keep] = _potency[i]
+		keep += 1
+	if keep != _types.size():
+		_types.resize(keep)
+		_expires.resize(keep)
+		_potency.resize(keep)
+		_rebuild_mask()
+		_recompute()
+	if next < INF:
+		_schedule(next)
+
+	# Types with no stacks left
+	removed_mask &= ~effect_mask
+	var effect_type := 0
+	while removed_mask:
+		if removed_mask & 1:
+			effect_removed.emit(effect_type)
+		removed_mask >>= 1
+		effect_type += 1
 
-		# Tick down durations
-		var i := stack_list.size() - 1
-		while i >= 0:
-			stack_list[i]["remaining"] -= delta
-			if stack_list[i]["remaining"] <= 0.0:
-				stack_list.remove_at(i)
-				_cache_dirty = true
-			i -= 1
 
-		if stack_list.is_empty():
-			to_remove.append(effect_type)
-
-	if not to_remove.is_empty():
-		_cache_dirty = true
-	for effect_type in to_remove:
-		_active_effects.erase(effect_type)
-		effect_removed.emit(effect_type)
+func has_effect(effect_type: Enums.StatusEffectType) -> bool:
+	return (effect_mask & (1 << effect_type)) != 0
 
 
-func has_effect(effect_type: Enums.StatusEffectType) -> bool:
-	return _active_effects.has(effect_type) and not _active_effects[effect_type].is_empty()
+func _schedule(deadline: float) -> void:
+	if deadline < _next_wake:
+		_next_wake = deadline
+		EnemySystem.status_wheel.schedule(self, deadline)
 
 
-func _recompute_cache() -> void:
-	_cache_dirty = false
+func _rebuild_mask() -> void:
+	effect_mask = 0
+	for t in _types:
+		effect_mask |= 1 << t
 
-	# Slow
-	if has_effect(Enums.StatusEffectType.FREEZE) or has_effect(Enums.StatusEffectType.STUN):
-		_cached_slow = 0.0
-	else:
-		var factor := 1.0
-		if _active_effects.has(Enums.StatusEffectType.SLOW):
-			for stack in _active_effects[Enums.StatusEffectType.SLOW]:
-				var data: StatusEffectData = stack["data"]
-				factor *= (1.0 - data.potency)
-		_cached_slow = max(factor, 0.0)
 
-	# DoT DPS
+func _recompute() -> void:
+	var slow := 1.0
 	var dot_total := 0.0
-	for effect_type in [Enums.StatusEffectType.POISON, Enums.StatusEffectType.BURN]:
-		if _active_effects.has(effect_type):
-			for stack in _active_effects[effect_type]:
-				var data: StatusEffectData = stack["data"]
-				dot_total += data.potency
-	_cached_dot_dps = dot_total
-
-	# Vulnerability
 	var vuln := 1.0
-	if _active_effects.has(Enums.StatusEffectType.MARK):
-		for stack in _active_effects[Enums.StatusEffectType.MARK]:
-			var data: StatusEffectData = stack["data"]
-			vuln += data.potency
+	var shred := 0.0
+	for i in _types.size():
+		match _types[i]:
+			Enums.StatusEffectType.SLOW:
+				slow *= (1.0 - _potency[i])
+			Enums.StatusEffectType.POISON, Enums.StatusEffectType.BURN:
+				dot_total += _potency[i]
+			Enums.StatusEffectType.MARK:
+				vuln += _potency[i]
+			Enums.StatusEffectType.ARMOR_SHRED:
+				shred += _potency[i]
+
+	# Freeze and stun stop movement outright
+	_cached_slow = 0.0 if effect_mask & MASK_SLOWED else maxf(slow, 0.0)
+	_cached_dot_dps = dot_total
 	_cached_vuln = vuln
+	_cached_armor_shred = minf(shred, 1.0)
 
-	# Armor shred
-	var shred := 0.0
-	if _active_effects.has(Enums.StatusEffectType.ARMOR_SHRED):
-		for stack in _active_effects[Enums.StatusEffectType.ARMOR_SHRED]:
-			var data: StatusEffectData = stack["data"]
-			shred += data.potency
-	_cached_armor_shred = min(shred, 1.0)
+	# Push movement-relevant totals to the batched enemy tick
+	var enemy := get_parent() as BaseEnemy
+	if enemy:
+		EnemySystem.set_status(enemy, _cached_slow, _cached_dot_dps)
 
 
 func get_slow_factor() -> float:
-	if _cache_dirty:
-		_recompute_cache()
 	return _cached_slow
 
 
 func get_dot_damage(delta: float) -> float:
-	if _cache_dirty:
-		_recompute_cache()
 	return _cached_dot_dps * delta
 
 
 func get_vulnerability_modifier() -> float:
-	if _cache_dirty:
-		_recompute_cache()
 	return _cached_vuln
 
 
 func get_armor_shred() -> float:
-	if _cache_dirty:
-		_recompute_cache()
 	return _cached_armor_shred
 
 
 func purge_all() -> void:
-	for effect_type in _active_effects.keys():
-		effect_removed.emit(effect_type)
-	_active_effects.clear()
-	_cache_dirty = true
+	var removed_mask := effect_mask
+	_types.clear()
+	_expires.clear()
+	_potency.clear()
+	effect_mask = 0
+	_recompute()
+	var effect_type := 0
+	while removed_mask:
+		if removed_mask & 1:
+			effect_removed.emit(effect_type)
+		removed_mask >>= 1
+		effect_type += 1
@@ -0,0 +1,322 @@
+class_name AmbientAnimator
+extends Node2D
+## Advances every decorative loop in the level from one _process instead
+## of a Timer per window light, looping tweens per fire/glow sprite and a
+## per-tower _process for synergy glows, badge shimmer and taser links.
+## State lives in packed arrays; each visual layer is a single canvas item
+## redrawn only when it changes:
+##   self         -- taser link bolts (scene root, above the world)
+##   WindowLights -- window flickers (under CityBackground/AnimatedDetails)
+##   TowerGlows   -- synergy diamonds (under World, above towers)
+## Sprite pulses (barrel fires, government glow, REC dots) are oscillators
+## that write one property per tick. Lower quality levels tick less often;
+## the level comes from the goligee/graphics/ambient_quality project setting
+## (0 high, 1 medium, 2 low), which mobile and web override and players can
+## set in override.cfg.
+## game.gd owns the single instance; towers find it by group.
+
+enum Quality { HIGH, MEDIUM, LOW }
+
+const UPDATE_INTERVAL: PackedFloat32Array = [0.0, 1.0 / 30.0, 1.0 / 12.0]  # Per Quality
+const QUALITY_SETTING = "goligee/graphics/ambient_quality"
+
+# Window lights
+const LIGHT_COLOR = Color("#C8A040")
+const LIGHT_SIZE = Vector2(3, 2)
+const LIGHT_FIRST_TOGGLE = Vector2(1.5, 4.0)  # randf_range bounds
+const LIGHT_TOGGLE = Vector2(1.0, 3.5)
+
+# Synergy glow (diamond on the tile footprint)
+const GLOW_RATE = 2.5  # Pulse radians per second
+const GLOW_HALF_W = 32.0
+const GLOW_HALF_H = 16.0
+
+# Max-upgrade badge shimmer
+const SHIMMER_HZ = 6.0
+const SHIMMER_LO = Color("#FFD060")
+const SHIMMER_HI = Color("#FFF0A0")
+
+# Taser link bolts
+const LINK_COLOR = Color("#E0E060", 0.3)
+const LINK_JITTER = 4.0
+const LINK_SEGMENTS = 4
+const LINK_FLICKER_INTERVAL = 0.15
+
+var quality: Quality = Quality.HIGH
+
+var _time: float = 0.0
+var _pending: float = 0.0  # Time since the last tick
+var _link_timer: float = 0.0
+
+var _lights_node: Node2D
+var _light_pos: PackedVector2Array = PackedVector2Array()
+var _light_on: PackedByteArray = PackedByteArray()
+var _light_timer: PackedFloat32Array = PackedFloat32Array()
+
+var _osc_item: Array[CanvasItem] = []
+var _osc_property: Array[NodePath] = []
+var _osc_from: Array = []
+var _osc_to: Array = []
+var _osc_half_period: PackedFloat32Array = PackedFloat32Array()
+var _osc_start: PackedFloat32Array = PackedFloat32Array()  # _time the cycle starts
+
+var _glows_node: Node2D
+var _glow_slot: Dictionary = {}  # tower instance_id -> slot
+var _glow_id: PackedInt64Array = PackedInt64Array()
+var _glow_pos: PackedVector2Array = PackedVector2Array()
+var _glow_color: PackedColorArray = PackedColorArray()
+var _glow_start: PackedFloat32Array = PackedFloat32Array()
+
+var _badges: Array[CanvasItem] = []
+
+var _link_owner: PackedInt64Array = PackedInt64Array()
+var _link_ends: PackedVector2Array = PackedVector2Array()  # from, to per link
+var _link_lines: PackedVector2Array = PackedVector2Array()  # Segment pairs, all links
+
+
+func _ready() -> void:
+	add_to_group("ambient_animator")
+	z_index = 5
+	# Feature-tag overrides (.mobile, .web) are already applied here
+	var setting: int = ProjectSettings.get_setting(QUALITY_SETTING, Quality.HIGH)
+	set_quality(clampi(setting, Quality.HIGH, Quality.LOW) as Quality)
+	if not GameManager.is_rendering():
+		# Registrations still land in the arrays, but nothing ticks or draws
+		set_process(false)
+		visible = false
+
+
+func setup(world: Node2D, details: Node2D) -> void:
+	## Create the glow and window layers inside the world / background.
+	_glows_node = Node2D.new()
+	_glows_node.name = "TowerGlows"
+	_glows_node.z_index = 2  # Above tower sprites so the diamond is visible
+	world.add_child(_glows_node)
+	_glows_node.draw.connect(_draw_glows)
+	_glows_node.visible = visible  # Hidden layers skip their redraws
+
+	_lights_node = Node2D.new()
+	_lights_node.name = "WindowLights"
+	details.add_child(_lights_node)
+	_lights_node.draw.connect(_draw_lights)
+	_lights_node.visible = visible
+
+
+func set_quality(value: Quality) -> void:
+	quality = value
+	_pending = 0.0
+
+
+# -- Registration --
+
+func add_window_lights(positions: PackedVector2Array) -> void:
+	## Lights toggle on and off at random intervals (positions are local to
+	## the details node passed to setup()).
+	for pos in positions:
+		_light_pos.append(pos)
+		_light_on.append(1)
+		_light_timer.append(randf_range(LIGHT_FIRST_TOGGLE.x, LIGHT_FIRST_TOGGLE.y))
+	if _lights_node:
+		_lights_node.queue_redraw()
+
+
+func add_oscillator(item: CanvasItem, property: NodePath, from: Variant, to: Variant,
+		half_period: float, delay: float = 0.0) -> void:
+	## Sine-eased ping-pong of item's property: from -> to over half_period,
+	## then back. Dropped automatically once item is freed.
+	_osc_item.append(item)
+	_osc_property.append(property)
+	_osc_from.append(from)
+	_osc_to.append(to)
+	_osc_half_period.append(half_period)
+	_osc_start.append(_time + delay)
+	item.set_indexed(property, from)
+
+
+func set_tower_glow(tower: Node2D, color: Color) -> void:
+	## Pulsing synergy diamond under tower; Color.TRANSPARENT removes it.
+	var id := tower.get_instance_id()
+	var slot: int = _glow_slot.get(id, -1)
+	if color.a <= 0.0:
+		if slot >= 0:
+			_remove_glow(slot)
+	elif slot >= 0:
+		_glow_color[slot] = color
+	else:
+		_glow_slot[id] = _glow_id.size()
+		_glow_id.append(id)
+		_glow_pos.append(_glows_node.to_local(tower.global_position) if _glows_node else tower.global_position)
+		_glow_color.append(color)
+		_glow_start.append(_time)
+	if _glows_node:
+		_glows_node.queue_redraw()
+
+
+func set_badge_shimmer(badge: CanvasItem, enabled: bool) -> void:
+	## Cycle badge's self_modulate through the shimmer golds (draw it white).
+	var i := _badges.find(badge)
+	if enabled and i < 0:
+		_badges.append(badge)
+	elif not enabled and i >= 0:
+		_badges.remove_at(i)
+		badge.self_modulate = Color.WHITE
+
+
+func set_links(owner: Node, ends: PackedVector2Array) -> void:
+	## Replace owner's link bolts; ends holds a from, to pair per link.
+	var id := owner.get_instance_id()
+	var i := _link_owner.size() - 1
+	while i >= 0:
+		if _link_owner[i] == id:
+			var last := _link_owner.size() - 1
+			_link_owner[i] = _link_owner[last]
+			_link_ends[i * 2] = _link_ends[last * 2]
+			_link_ends[i * 2 + 1] = _link_ends[last * 2 + 1]
+			_link_owner.resize(last)
+			_link_ends.resize(last * 2)
+		i -= 1
+	for j in range(0, ends.size() - 1, 2):
+		_link_owner.append(id)
+		_link_ends.append(ends[j])
+		_link_ends.append(ends[j + 1])
+	_rebuild_links()
+
+
+func remove_tower(tower: Node2D) -> void:
+	## Drop everything registered for tower (it is leaving the tree).
+	set_tower_glow(tower, Color.TRANSPARENT)
+	set_links(tower, PackedVector2Array())
+	for badge in tower.get_children():
+		if badge in _badges:
+			_badges.erase(badge)
+
+
+# -- Tick --
+
+func _process(delta: float) -> void:
+	_time += delta
+	_pending += delta
+	if _pending < UPDATE_INTERVAL[quality]:
+		return
+	var step := _pending
+	_pending = 0.0
+
+	_tick_lights(step)
+	_tick_oscillators()
+
+	if not _badges.is_empty():
+		var shimmer := SHIMMER_LO.lerp(SHIMMER_HI, sin(_time * SHIMMER_HZ * TAU) * 0.5 + 0.5)
+		for badge in _badges:
+			badge.self_modulate = shimmer
+
+	if not _glow_id.is_empty() and _glows_node:
+		_glows_node.queue_redraw()
+
+	if not _link_owner.is_empty():
+		_link_timer += step
+		if _link_timer >= LINK_FLICKER_INTERVAL:
+			_link_timer = fmod(_link_timer, LINK_FLICKER_INTERVAL)
+			_rebuild_links()
+
+
+func _tick_lights(step: float) -> void:
+	var changed := false
+	for i in _light_timer.size():
+		var t := _light_timer[i] - step
+		if t <= 0.0:
+			_light_on[i] = 1 - _light_on[i]
+			t += randf_range(LIGHT_TOGGLE.x, LIGHT_TOGGLE.y)
+			changed = true
+		_light_timer[i] = t
+	if changed and _lights_node:
+		_lights_node.queue_redraw()
+
+
+func _tick_oscillators() -> void:
+	var i := _osc_item.size() - 1
+	while i >= 0:
+		if not is_instance_valid(_osc_item[i]):
+			_remove_oscillator(i)
+		else:
+			var t := maxf(_time - _osc_start[i], 0.0) / _osc_half_period[i]
+			var weight := 0.5 - 0.5 * cos(t * PI)
+			_osc_item[i].set_indexed(_osc_property[i], lerp(_osc_from[i], _osc_to[i], weight))
+		i -= 1
+
+
+func _rebuild_links() -> void:
+	# Fresh jagged points for every bolt, as one segment list for draw_multiline
+	_link_lines.clear()
+	for i in _link_owner.size():
+		var from := _link_ends[i * 2]
+		var to := _link_ends[i * 2 + 1]
+		var perp := Vector2(from.y - to.y, to.x - from.x).normalized()
+		var prev := from
+		for s in range(1, LINK_SEGMENTS + 1):
+			var pt := to
+			if s < LINK_SEGMENTS:
+				pt = from.lerp(to, float(s) / LINK_SEGMENTS) + perp * randf_range(-LINK_JITTER, LINK_JITTER)
+			_link_lines.append(prev)
+			_link_lines.append(pt)
+			prev = pt
+	queue_redraw()
+
+
+# -- Removal --
+
+func _remove_oscillator(i: int) -> void:
+	var last := _osc_item.size() - 1
+	_osc_item[i] = _osc_item[last]
+	_osc_property[i] = _osc_property[last]
+	_osc_from[i] = _osc_from[last]
+	_osc_to[i] = _osc_to[last]
+	_osc_half_period[i] = _osc_half_period[last]
+	_osc_start[i] = _osc_start[last]
+	_osc_item.resize(last)
+	_osc_property.resize(last)
+	_osc_from.resize(last)
+	_osc_to.resize(last)
+	_osc_half_period.resize(last)
+	_osc_start.resize(last)
+
+
+func _remove_glow(slot: int) -> void:
+	var last := _glow_id.size() - 1
+	_glow_slot.erase(_glow_id[slot])
+	if slot != last:
+		_glow_id[slot] = _glow_id[last]
+		_glow_pos[slot] = _glow_pos[last]
+		_glow_color[slot] = _glow_color[last]
+		_glow_start[slot] = _glow_start[last]
+		_glow_slot[_glow_id[slot]] = slot
+	_glow_id.resize(last)
+	_glow_pos.resize(last)
+	_glow_color.resize(last)
+	_glow_start.resize(last)
+
+
+# -- Drawing --
+
+func _draw() -> void:
+	if not _link_lines.is_empty():
+		draw_multiline(_link_lines, LINK_COLOR, 1.0)
+
+
+func _draw_lights() -> void:
+	for i in _light_pos.size():
+		if _light_on[i]:
+			_lights_node.draw_rect(Rect2(_light_pos[i] - LIGHT_SIZE * 0.5, LIGHT_SIZE), LIGHT_COLOR)
+
+
+func _draw_glows() -> void:
+	for i in _glow_id.size():
+		var pulse_alpha := 0.35 + 0.25 * sin((_time - _glow_start[i]) * GLOW_RATE)
+		var color := _glow_color[i]
+		var c := _glow_pos[i]
+		var pts := PackedVector2Array([
+			c + Vector2(0, -GLOW_HALF_H), c + Vector2(GLOW_HALF_W, 0),
+			c + Vector2(0, GLOW_HALF_H), c + Vector2(-GLOW_HALF_W, 0),
+		])
+		_glows_node.draw_colored_polygon(pts, Color(color, pulse_alpha * 0.6))
+		pts.append(pts[0])
+		_glows_node.draw_polyline(pts, Color(color, pulse_alpha), 2.0)
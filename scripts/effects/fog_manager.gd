@@ -3,6 +3,17 @@ extends Node2D
 ## Atmospheric fog/gas system that intensifies with chemical tower count.
 ## Fog overlay is world-space (Sprite2D, z_index=40) so PointLight2D can illuminate it.
 ## Explosion/impact lights use light_mask bit 2 to only affect fog elements.
+##
+## Everything here is fill-rate bound, so it runs on a budget: impact lights
+## come from a fixed pool (nearby flashes merge into one light), chemical
+## towers in the same region share one wisp emitter, and the quality tier
+## (noise resolution, noise layers, light cap, wisp density) steps down when
+## the measured GPU frame time stays over budget and back up when it recovers.
+## Many GLES3 drivers report no GPU time; the tier then stays where it
+## started (MEDIUM on mobile/web), since total frame time can't tell fog
+## cost from CPU load or a 30 fps vsync cap.
+
+enum Quality { HIGH, MEDIUM, LOW }
 
 const CHEMICAL_TOWERS = {
 	"tear_gas": 0.06,
@@ -12,9 +23,10 @@ const AMBIENT_DENSITY = 0.18  # Always-visible atmospheric haze
 const MAX_DENSITY = 0.25
 const DENSITY_TWEEN_DURATION = 0.8
 
-const WISP_PARTICLE_COUNT = 10
+const WISP_PARTICLE_COUNT = 10  # Per chemical tower feeding an emitter
+const WISP_MAX_PARTICLES = 24  # Per shared emitter, however many towers feed it
 const WISP_LIFETIME = 3.5
-const WISP_SPREAD = 40.0
+const WISP_REGION_SIZE = 192.0  # World px; chemical towers in one region share an emitter
 
 const LIGHT_FADE_DURATION = 0.3
 const LIGHT_TEXTURE_SIZE = 64
@@ -27,6 +39,23 @@ const LIGHT_SCALE_MEDIUM = 1.5
 const LIGHT_SCALE_BIG = 2.5
 const BIG_ENEMY_HP = 500.0
 const MEDIUM_ENEMY_HP = 200.0
+const MAX_LIGHTS = 8  # Pool size; lower quality tiers use fewer
+const LIGHT_MERGE_RADIUS = 48.0  # A flash this close to a lit light re-lights it
+const LIGHT_MERGE_BOOST = 0.25  # Share of the merged flash's energy added on top
+
+const NOISE_FREQUENCY = 0.02  # At the HIGH tier's noise size
+
+# Per Quality
+const NOISE_SIZE: PackedInt32Array = [256, 128, 64]
+const NOISE_LAYERS: PackedInt32Array = [2, 2, 1]
+const LIGHT_CAP: PackedInt32Array = [8, 4, 2]
+const WISP_DENSITY: PackedFloat32Array = [1.0, 0.75, 0.5]
+
+# Frame-time budget driving the quality tier
+const GPU_BUDGET_MS = 12.0
+const BUDGET_WINDOW_MSEC = 2000  # Average over this long before deciding
+const RAISE_BELOW = 0.5  # Step up when under this share of the budget
+const RAISE_COOLDOWN_MSEC = 30000  # After a step down, stay put this long
 
 var _camera: Camera2D
 var _effects_container: Node2D
@@ -35,20 +64,53 @@ var _fog_material: ShaderMaterial
 var _target_density: float = AMBIENT_DENSITY
 var _current_density: float = AMBIENT_DENSITY
 var _density_tween: Tween
-var _wisps: Dictionary = {}  # tower instance_id -> CPUParticles2D
+var _wisps: Dictionary = {}  # region Vector2i -> CPUParticles2D
+var _wisp_sources: Dictionary = {}  # region Vector2i -> {tower instance_id: position}
+var _wisp_region_of: Dictionary = {}  # tower instance_id -> region Vector2i
+var _wisp_texture: Texture2D
 var _light_texture: Texture2D
 var _noise_texture: NoiseTexture2D
 var _dust_particles: CPUParticles2D
 var _last_zoom: float = 0.0
 
+## Impact lights currently fading (read by PerfMonitor)
+var active_lights: int = 0
+
+var quality: Quality = Quality.HIGH
+## Off during replay playback so benchmark runs compare like with like
+var adaptive: bool = true
+
+var _lights: Array[PointLight2D] = []
+var _light_peak: PackedFloat32Array = PackedFloat32Array()  # Energy when (re)lit
+var _light_age: PackedFloat32Array = PackedFloat32Array()  # Seconds since (re)lit
+
+var _viewport_rid: RID
+var _budget_load_sum: float = 0.0
+var _budget_samples: int = 0
+var _budget_window_start: int = 0
+var _raise_blocked_until: int = 0
+
 
 func setup(game_node: Node2D, camera: Camera2D, effects: Node2D) -> void:
 	_camera = camera
 	_effects_container = effects
+	add_to_group("fog_manager")  # PerfMonitor finds the light count here
 	_last_zoom = camera.zoom.x if camera else 1.0
+	if OS.has_feature("mobile") or OS.has_feature("web"):
+		quality = Quality.MEDIUM
+	adaptive = not ReplayRecorder.is_playing()
+	_viewport_rid = get_viewport().get_viewport_rid()
+	RenderingServer.viewport_set_measure_render_time(_viewport_rid, true)
+	_budget_window_start = Time.get_ticks_msec()
 	_create_noise_texture()
 	_create_light_texture()
+	_create_light_pool()
 	_create_fog_overlay(game_node)
+	set_quality(quality)
+	if not GameManager.is_rendering():
+		# Nothing is drawn: no dust, wisps, impact lights or budget sampling
+		set_process(false)
+		return
 	_create_dust_particles(game_node)
 	_connect_signals()
 
@@ -56,13 +118,20 @@ func setup(game_node: Node2D, camera: Camera2D, effects: Node2D) -> void:
 func _create_noise_texture() -> void:
 	var noise := FastNoiseLite.new()
 	noise.noise_type = FastNoiseLite.TYPE_SIMPLEX_SMOOTH
-	noise.frequency = 0.02
 	noise.fractal_octaves = 3
 	_noise_texture = NoiseTexture2D.new()
 	_noise_texture.noise = noise
 	_noise_texture.seamless = true
-	_noise_texture.width = 256
-	_noise_texture.height = 256
+	_apply_noise_size()
+
+
+func _apply_noise_size() -> void:
+	# Raise the frequency as the texture shrinks so one tile still spans the
+	# same stretch of noise (same fog pattern, coarser sampling)
+	var size := NOISE_SIZE[quality]
+	_noise_texture.noise.frequency = NOISE_FREQUENCY * NOISE_SIZE[Quality.HIGH] / size
+	_noise_texture.width = size
+	_noise_texture.height = size
 
 
 func _create_light_texture() -> void:
@@ -78,6 +147,20 @@ func _create_light_texture() -> void:
 	_light_texture = ImageTexture.create_from_image(img)
 
 
+func _create_light_pool() -> void:
+	for i in MAX_LIGHTS:
+		var light := PointLight2D.new()
+		light.texture = _light_texture
+		light.color = LIGHT_COLOR_WARM
+		# Bit 2 only -- isolate to fog elements
+		light.range_item_cull_mask = 2
+		light.enabled = false
+		add_child(light)
+		_lights.append(light)
+	_light_peak.resize(MAX_LIGHTS)
+	_light_age.resize(MAX_LIGHTS)
+
+
 func _create_fog_overlay(game_node: Node2D) -> void:
 	_fog_overlay = Sprite2D.new()
 	_fog_overlay.name = "FogOverlay"
@@ -178,7 +261,11 @@ func _connect_signals() -> void:
 	SignalBus.chemical_impact.connect(_on_chemical_impact)
 
 
-func _process(_delta: float) -> void:
+func _process(delta: float) -> void:
+	if active_lights > 0:
+		_tick_lights(delta)
+	if adaptive:
+		_sample_budget()
 	if not _camera or not _fog_overlay:
 		return
 	# Follow camera so fog and dust always cover the viewport
@@ -245,43 +332,120 @@ func _set_density(value: float) -> void:
 
 
 # ---------------------------------------------------------------------------
-# Local wisps (CPUParticles2D per chemical tower)
+# Quality budget
+# ---------------------------------------------------------------------------
+
+func set_quality(value: Quality) -> void:
+	quality = value
+	if _noise_texture:
+		_apply_noise_size()
+	if _fog_material:
+		_fog_material.set_shader_parameter("noise_layers", NOISE_LAYERS[quality])
+	# Lights beyond the new cap go dark now rather than finishing their fade
+	for i in range(LIGHT_CAP[quality], _lights.size()):
+		if _lights[i].enabled:
+			_release_light(i)
+	for region in _wisps:
+		_update_wisp(region)
+
+
+func _sample_budget() -> void:
+	var gpu_ms := RenderingServer.viewport_get_measured_render_time_gpu(_viewport_rid)
+	if gpu_ms > 0.0:  # 0 = the driver can't time the GPU (or not yet)
+		_budget_load_sum += gpu_ms / GPU_BUDGET_MS
+		_budget_samples += 1
+
+	var now := Time.get_ticks_msec()
+	if now - _budget_window_start < BUDGET_WINDOW_MSEC:
+		return
+	if _budget_samples == 0:
+		_budget_window_start = now
+		return
+	var budget_load := _budget_load_sum / _budget_samples  # 1.0 = exactly on budget
+	_budget_load_sum = 0.0
+	_budget_samples = 0
+	_budget_window_start = now
+
+	if budget_load > 1.0 and quality < Quality.LOW:
+		set_quality((quality + 1) as Quality)
+		_raise_blocked_until = now + RAISE_COOLDOWN_MSEC
+	elif budget_load < RAISE_BELOW and quality > Quality.HIGH and now >= _raise_blocked_until:
+		set_quality((quality - 1) as Quality)
+
+
+# ---------------------------------------------------------------------------
+# Local wisps (one CPUParticles2D per region with chemical towers)
 # ---------------------------------------------------------------------------
 
 func _spawn_wisp(tower: Node2D) -> void:
 	if not _effects_container:
 		return
-	var particles := CPUParticles2D.new()
-	particles.emitting = true
-	particles.amount = WISP_PARTICLE_COUNT
-	particles.lifetime = WISP_LIFETIME
-	particles.one_shot = false
-	particles.explosiveness = 0.0
-	particles.direction = Vector2(0, -1)
-	particles.spread = 60.0
-	particles.initial_velocity_min = 3.0
-	particles.initial_velocity_max = 8.0
-	particles.gravity = Vector2.ZERO
-	particles.scale_amount_min = 2.0
-	particles.scale_amount_max = 4.0
-	particles.color = Color(0.45, 0.50, 0.35, 0.15)
-
-	# Small white circle texture for wisp particles
-	var img := Image.create(4, 4, false, Image.FORMAT_RGBA8)
-	img.fill(Color.WHITE)
-	particles.texture = ImageTexture.create_from_image(img)
-
-	particles.global_position = tower.global_position
-	_effects_container.add_child(particles)
-	_wisps[tower.get_instance_id()] = particles
+	var id := tower.get_instance_id()
+	var region := Vector2i((tower.global_position / WISP_REGION_SIZE).floor())
+	_wisp_region_of[id] = region
+	if region not in _wisp_sources:
+		_wisp_sources[region] = {}
+	_wisp_sources[region][id] = tower.global_position
+
+	if region not in _wisps:
+		var particles := CPUParticles2D.new()
+		particles.emitting = true
+		particles.lifetime = WISP_LIFETIME
+		particles.one_shot = false
+		particles.explosiveness = 0.0
+		particles.emission_shape = CPUParticles2D.EMISSION_SHAPE_RECTANGLE
+		particles.direction = Vector2(0, -1)
+		particles.spread = 60.0
+		particles.initial_velocity_min = 3.0
+		particles.initial_velocity_max = 8.0
+		particles.gravity = Vector2.ZERO
+		particles.scale_amount_min = 2.0
+		particles.scale_amount_max = 4.0
+		particles.color = Color(0.45, 0.50, 0.35, 0.15)
+		if not _wisp_texture:
+			# Small white square shared by every emitter
+			var img := Image.create(4, 4, false, Image.FORMAT_RGBA8)
+			img.fill(Color.WHITE)
+			_wisp_texture = ImageTexture.create_from_image(img)
+		particles.texture = _wisp_texture
+		_effects_container.add_child(particles)
+		_wisps[region] = particles
+	_update_wisp(region)
+
+
+func _update_wisp(region: Vector2i) -> void:
+	## Center region's emitter on its towers, cover them all, and size the
+	## particle count to the tower count (capped, scaled by quality).
+	var particles: CPUParticles2D = _wisps[region]
+	var sources: Dictionary = _wisp_sources[region]
+	var lo := Vector2.INF
+	var hi := -Vector2.INF
+	for pos in sources.values():
+		lo = lo.min(pos)
+		hi = hi.max(pos)
+	particles.global_position = (lo + hi) * 0.5
+	particles.emission_rect_extents = (hi - lo) * 0.5
+	var amount := mini(WISP_PARTICLE_COUNT * sources.size(), WISP_MAX_PARTICLES)
+	amount = maxi(int(amount * WISP_DENSITY[quality]), 1)
+	if particles.amount != amount:
+		particles.amount = amount  # Restarts emission, so only on change
 
 
 func _remove_wisp(tower: Node2D) -> void:
 	var id := tower.get_instance_id()
-	if id not in _wisps:
+	if id not in _wisp_region_of:
 		return
-	var particles: CPUParticles2D = _wisps[id]
-	_wisps.erase(id)
+	var region: Vector2i = _wisp_region_of[id]
+	_wisp_region_of.erase(id)
+	var sources: Dictionary = _wisp_sources[region]
+	sources.erase(id)
+	if not sources.is_empty():
+		_update_wisp(region)
+		return
+
+	_wisp_sources.erase(region)
+	var particles: CPUParticles2D = _wisps[region]
+	_wisps.erase(region)
 	if is_instance_valid(particles):
 		particles.emitting = false
 		# Let remaining particles finish, then free
@@ -291,7 +455,7 @@ func _remove_wisp(tower: Node2D) -> void:
 
 
 # ---------------------------------------------------------------------------
-# Explosion / impact lights
+# Explosion / impact lights (fixed pool)
 # ---------------------------------------------------------------------------
 
 func _on_enemy_killed(enemy: Node2D, _gold: int) -> void:
@@ -315,17 +479,55 @@ func _on_chemical_impact(pos: Vector2, _intensity: float) -> void:
 
 
 func _spawn_light(pos: Vector2, energy: float, light_scale: float) -> void:
-	var light := PointLight2D.new()
-	light.texture = _light_texture
-	light.color = LIGHT_COLOR_WARM
-	light.energy = energy
-	light.texture_scale = light_scale
+	## Merge into a lit light nearby, else take a free slot, else replace
+	## the dimmest light if this flash is brighter; otherwise drop it.
+	var free_slot := -1
+	var dimmest := -1
+	var merge_dist_sq := LIGHT_MERGE_RADIUS * LIGHT_MERGE_RADIUS
+	for i in LIGHT_CAP[quality]:
+		var light := _lights[i]
+		if not light.enabled:
+			if free_slot < 0:
+				free_slot = i
+			continue
+		if light.global_position.distance_squared_to(pos) <= merge_dist_sq:
+			light.global_position = light.global_position.lerp(pos, 0.5)
+			light.texture_scale = maxf(light.texture_scale, light_scale)
+			_light_peak[i] = minf(maxf(light.energy, energy) + energy * LIGHT_MERGE_BOOST, LIGHT_ENERGY_BIG)
+			_light_age[i] = 0.0
+			light.energy = _light_peak[i]
+			return
+		if dimmest < 0 or light.energy < _lights[dimmest].energy:
+			dimmest = i
+
+	var slot := free_slot
+	if slot < 0:
+		if dimmest < 0 or _lights[dimmest].energy >= energy:
+			return
+		slot = dimmest
+	else:
+		active_lights += 1
+	var light := _lights[slot]
 	light.global_position = pos
-	# Bit 2 only -- isolate to fog elements
-	light.range_item_cull_mask = 2
-	add_child(light)
-
-	# Fade out and free
-	var tween := create_tween()
-	tween.tween_property(light, "energy", 0.0, LIGHT_FADE_DURATION)
-	tween.tween_callback(light.queue_free)
+	light.texture_scale = light_scale
+	light.energy = energy
+	light.enabled = true
+	_light_peak[slot] = energy
+	_light_age[slot] = 0.0
+
+
+func _tick_lights(delta: float) -> void:
+	# Linear fade to zero over LIGHT_FADE_DURATION, then back to the pool
+	for i in _lights.size():
+		if not _lights[i].enabled:
+			continue
+		_light_age[i] += delta
+		if _light_age[i] >= LIGHT_FADE_DURATION:
+			_release_light(i)
+		else:
+			_lights[i].energy = _light_peak[i] * (1.0 - _light_age[i] / LIGHT_FADE_DURATION)
+
+
+func _release_light(i: int) -> void:
+	_lights[i].enabled = false
+	active_lights -= 1
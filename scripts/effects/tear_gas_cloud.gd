@@ -28,6 +28,8 @@ var _burst_particles: CPUParticles2D
 var _continuous_particles: CPUParticles2D
 var _ground_haze: Sprite2D
 var _smoke_texture: ImageTexture
+var _hits: Array[Node2D] = []  # SpatialGrid query buffer
+var _batch := DamageBatch.new()
 
 
 func _ready() -> void:
@@ -43,6 +45,10 @@ func init(p_damage: float, p_dtype: Enums.DamageType,
 	damage_type = p_dtype
 	on_hit_effects = p_effects
 	source_tower = p_source
+	_batch.base_damage = damage_per_tick
+	_batch.damage_type = damage_type
+	_batch.on_hit_effects = on_hit_effects
+	_batch.source_tower = source_tower
 
 
 func _process(delta: float) -> void:
@@ -69,29 +75,9 @@ func _process(delta: float) -> void:
 
 
 func _apply_cloud_damage() -> void:
-	var enemies := SpatialGrid.get_enemies_in_radius(global_position, CLOUD_RADIUS)
-	for node in enemies:
-		if not node is BaseEnemy:
-			continue
-		var enemy: BaseEnemy = node as BaseEnemy
-		if not enemy.health or enemy.health.is_dead:
-			continue
-
-		# Track kill attribution
-		if is_instance_valid(source_tower):
-			enemy.last_hit_by = source_tower
-
-		var resists: Dictionary = enemy.resistances.get_all() if enemy.resistances else {}
-		var vuln_mod := enemy.get_vulnerability_modifier()
-		if enemy.status_effects:
-			vuln_mod *= DamageCalculator.get_status_synergy_mult(damage_type, enemy.status_effects)
-		var armor_shred := enemy.get_armor_shred()
-		enemy.health.take_damage(damage_per_tick, damage_type, resists, vuln_mod, 0.0, 1.0, armor_shred)
-
-		# Apply status effects (slow/poison from upgrades)
-		if enemy.status_effects:
-			for effect in on_hit_effects:
-				enemy.status_effects.apply_effect(effect)
+	# One batch per tick: damage, kill attribution and on-hit slow/poison
+	var count := SpatialGrid.query_radius(global_position, CLOUD_RADIUS, _hits)
+	DamageCalculator.apply_batch(_batch, _hits, count)
 
 
 func _setup_ground_haze() -> void:
@@ -0,0 +1,114 @@
+class_name VFXParticles
+extends Node2D
+## Draws every short-lived spark, shard and coin in one _draw() pass instead
+## of a ColorRect node + tween per particle. Particles live in packed arrays
+## (swap-removed when done); VFXPool owns the single instance per scene.
+
+const KIND_BURST = 0  # start -> end, fading out
+const KIND_COIN = 1  # start -> mid -> end in two legs, no fade
+
+const COIN_RISE_TIME = 0.2
+const COIN_FLY_TIME = 0.3
+
+var _kind: PackedByteArray = PackedByteArray()
+var _start: PackedVector2Array = PackedVector2Array()
+var _mid: PackedVector2Array = PackedVector2Array()
+var _end: PackedVector2Array = PackedVector2Array()
+var _size: PackedVector2Array = PackedVector2Array()
+var _color: PackedColorArray = PackedColorArray()
+var _age: PackedFloat32Array = PackedFloat32Array()  # Negative while delayed
+var _duration: PackedFloat32Array = PackedFloat32Array()
+
+
+func _ready() -> void:
+	set_process(false)
+
+
+func count() -> int:
+	return _kind.size()
+
+
+func clear() -> void:
+	_kind.clear()
+	_start.clear()
+	_mid.clear()
+	_end.clear()
+	_size.clear()
+	_color.clear()
+	_age.clear()
+	_duration.clear()
+	set_process(false)
+	queue_redraw()
+
+
+func add_burst(from: Vector2, to: Vector2, duration: float, size: Vector2, color: Color) -> void:
+	## One particle moving from -> to (top-left corners) while fading out.
+	_append(KIND_BURST, from, from, to, size, color, 0.0, duration)
+
+
+func add_coin(from: Vector2, mid: Vector2, to: Vector2, delay: float, size: Vector2, color: Color) -> void:
+	## A coin that waits delay seconds at from, arcs to mid, then flies to to.
+	_append(KIND_COIN, from, mid, to, size, color, -delay, COIN_RISE_TIME + COIN_FLY_TIME)
+
+
+func _append(kind: int, from: Vector2, mid: Vector2, to: Vector2, size: Vector2,
+		color: Color, age: float, duration: float) -> void:
+	_kind.append(kind)
+	_start.append(from)
+	_mid.append(mid)
+	_end.append(to)
+	_size.append(size)
+	_color.append(color)
+	_age.append(age)
+	_duration.append(duration)
+	set_process(true)
+
+
+func _process(delta: float) -> void:
+	var i := _kind.size() - 1
+	while i >= 0:
+		_age[i] += delta
+		if _age[i] >= _duration[i]:
+			_remove_at(i)
+		i -= 1
+	if _kind.is_empty():
+		set_process(false)
+	queue_redraw()
+
+
+func _remove_at(i: int) -> void:
+	var last := _kind.size() - 1
+	if i != last:
+		_kind[i] = _kind[last]
+		_start[i] = _start[last]
+		_mid[i] = _mid[last]
+		_end[i] = _end[last]
+		_size[i] = _size[last]
+		_color[i] = _color[last]
+		_age[i] = _age[last]
+		_duration[i] = _duration[last]
+	_kind.resize(last)
+	_start.resize(last)
+	_mid.resize(last)
+	_end.resize(last)
+	_size.resize(last)
+	_color.resize(last)
+	_age.resize(last)
+	_duration.resize(last)
+
+
+func _draw() -> void:
+	for i in _kind.size():
+		var age := maxf(_age[i], 0.0)
+		var pos: Vector2
+		var color := _color[i]
+		if _kind[i] == KIND_COIN:
+			if age < COIN_RISE_TIME:
+				pos = _start[i].lerp(_mid[i], age / COIN_RISE_TIME)
+			else:
+				pos = _mid[i].lerp(_end[i], minf((age - COIN_RISE_TIME) / COIN_FLY_TIME, 1.0))
+		else:
+			var t := minf(age / _duration[i], 1.0)
+			pos = _start[i].lerp(_end[i], t)
+			color.a *= 1.0 - t
+		draw_rect(Rect2(pos, _size[i]), color)
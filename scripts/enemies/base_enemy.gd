@@ -1,9 +1,11 @@
 class_name BaseEnemy
 extends Node2D
-## Base class for all enemies. Follows waypoints from PathfindingManager.
+## Base class for all enemies. Follows waypoints from PathfindingManager;
+## movement, DoT and status timers are advanced in bulk by EnemySystem.
 ## Composed of child components: HealthComponent, ResistanceComponent,
 ## StatusEffectManager, LootComponent.
-## Supports 8-direction walk animation via AnimatedSprite2D.
+## Supports 8-direction walk animation via AnimatedSprite2D. Crowd-pool
+## types are drawn by the scene's CrowdRenderer instead of their own nodes.
 
 @export var enemy_data: EnemyData
 
@@ -15,18 +17,20 @@ extends Node2D
 @onready var animated_sprite: AnimatedSprite2D = $AnimatedSprite
 @onready var health_bar: ProgressBar = $HealthBar
 
-var base_speed: float = 1.0
+var base_speed: float = 1.0:
+	set(value):
+		base_speed = value
+		EnemySystem.set_speed(self, value)
 var _movement_type: Enums.MovementType = Enums.MovementType.GROUND
 var _stealth: bool = false
 
-var _waypoints: PackedVector2Array = PackedVector2Array()
-var _waypoint_index: int = 0
 var _spawn_index: int = -1
-var _distance_traveled: float = 0.0
-var _total_path_length: float = 0.0
 
 var last_hit_by: Node2D  ## Tower that last dealt damage (for kill attribution)
-var velocity: Vector2 = Vector2.ZERO  ## Last frame movement direction (for crossfire calc)
+## Last frame movement direction (for crossfire calc)
+var velocity: Vector2:
+	get:
+		return EnemySystem.get_velocity(self)
 
 ## Corpse cleanup: track lingering corpses globally, cap at 30
 static var _corpses: Array[Node2D] = []
@@ -55,6 +59,8 @@ const DAMAGE_COLORS = {
 }
 
 var _flash_material: ShaderMaterial
+## Set when CrowdRenderer draws this enemy (sprites, bar and flash unused)
+var _crowd: CrowdRenderer
 
 ## Flying enemy rotor animation
 var _rotor_sprite: Sprite2D
@@ -63,11 +69,7 @@ var _rotor_frame: int = 0
 var _rotor_timer: float = 0.0
 const ROTOR_FRAME_TIME = 0.06
 
-## Drone zig-zag (press_drone only)
-var _zigzag_enabled: bool = false
-var _zigzag_perpendicular: Vector2 = Vector2.ZERO
-var _zigzag_time: float = 0.0
-var _zigzag_current_offset: float = 0.0
+## Drone zig-zag (press_drone only, applied by EnemySystem)
 const ZIGZAG_AMPLITUDE = 12.0
 const ZIGZAG_FREQUENCY = 3.5
 
@@ -107,9 +109,18 @@ func _ready() -> void:
 		else:
 			sprite.texture = EntitySprites.create_protestor()
 
+	# Common crowd types hand their visuals to the batched renderer
+	var crowd := get_tree().get_first_node_in_group("crowd_renderer") as CrowdRenderer
+	if crowd and crowd.is_crowd_type(enemy_data) and crowd.add(self):
+		_crowd = crowd
+		animated_sprite.stop()
+		animated_sprite.visible = false
+		sprite.visible = false
+		health_bar.visible = false
+
 	# Set up damage flash shader material on the active visual node
 	var shader := load("res://assets/shaders/damage_flash.gdshader") as Shader
-	if shader:
+	if shader and not _crowd:
 		_flash_material = ShaderMaterial.new()
 		_flash_material.shader = shader
 		if _use_animated:
@@ -129,8 +140,16 @@ func _ready() -> void:
 
 	if is_flying():
 		_setup_flying_visuals()
-	else:
-		PathfindingManager.path_updated.connect(_on_path_updated)
+	# Movement runs in EnemySystem; _process only drives flying visuals
+	set_process(is_flying())
+
+
+func _exit_tree() -> void:
+	# Grid queries trust their slots — never leave a freed enemy behind
+	SpatialGrid.unregister(self)
+	EnemySystem.unregister(self)
+	if _crowd:
+		_crowd.remove(self)
 
 
 func _setup_flying_visuals() -> void:
@@ -244,12 +263,13 @@ func _apply_theme_skin() -> void:
 			sprite.modulate = skin.tint
 
 
-func _update_animation_direction(move_dir: Vector2) -> void:
-	"""Update walk animation based on movement direction."""
-	if not _use_animated or move_dir.is_zero_approx():
+func set_walk_direction(idx: int) -> void:
+	"""Update walk animation for an 8-way sector (index into DIR_NAMES)."""
+	if _crowd:
+		_crowd.set_direction(self, idx)
+		return
+	if not _use_animated:
 		return
-	var angle := move_dir.angle()  # radians, 0=right, PI/2=down
-	var idx := wrapi(roundi(angle / (TAU / 8.0)), 0, 8)
 	var dir_name: String = DIR_NAMES[idx]
 
 	if dir_name == _current_dir:
@@ -263,22 +283,17 @@ func _update_animation_direction(move_dir: Vector2) -> void:
 
 func setup_path(spawn_index: int) -> void:
 	_spawn_index = spawn_index
+	var waypoints: PackedVector2Array
 	if is_flying():
-		_waypoints = PathfindingManager.get_flying_path(spawn_index)
+		waypoints = PathfindingManager.get_flying_path(spawn_index)
 	else:
-		_waypoints = PathfindingManager.get_path_for_spawn(spawn_index)
+		waypoints = PathfindingManager.get_path_for_spawn(spawn_index)
+	EnemySystem.register(self, waypoints)
 
-	if not _waypoints.is_empty():
-		global_position = _waypoints[0]
-		_waypoint_index = 1
-	_total_path_length = _calculate_path_length(_waypoints)
-	_distance_traveled = 0.0
-
-	# Zig-zag for press_drone: compute perpendicular to overall flight direction
-	if enemy_data and enemy_data.enemy_id == "press_drone" and _waypoints.size() >= 2:
-		_zigzag_enabled = true
-		var flight_dir := (_waypoints[_waypoints.size() - 1] - _waypoints[0]).normalized()
-		_zigzag_perpendicular = Vector2(-flight_dir.y, flight_dir.x)
+	# Zig-zag for press_drone: perpendicular to overall flight direction
+	if enemy_data and enemy_data.enemy_id == "press_drone" and waypoints.size() >= 2:
+		var flight_dir := (waypoints[waypoints.size() - 1] - waypoints[0]).normalized()
+		EnemySystem.set_zigzag(self, Vector2(-flight_dir.y, flight_dir.x))
 
 
 func apply_wave_modifiers(modifiers: Dictionary) -> void:
@@ -291,6 +306,8 @@ func apply_wave_modifiers(modifiers: Dictionary) -> void:
 		health.armor += modifiers["armor_bonus"]
 	health_bar.max_value = health.max_hp
 	health_bar.value = health.current_hp
+	if _crowd:
+		_crowd.set_health(self, health.get_hp_ratio())
 
 
 func _process(delta: float) -> void:
@@ -302,50 +319,6 @@ func _process(delta: float) -> void:
 			_rotor_frame = (_rotor_frame + 1) % _rotor_textures.size()
 			_rotor_sprite.texture = _rotor_textures[_rotor_frame]
 
-	# Move along waypoints
-	if _waypoints.is_empty() or _waypoint_index >= _waypoints.size():
-		return
-
-	var slow_factor := status_effects.get_slow_factor()
-	var current_speed := base_speed * slow_factor
-	var move_budget := current_speed * 32.0 * delta
-
-	# Remove previous zig-zag offset before moving along path
-	if _zigzag_enabled:
-		global_position -= _zigzag_perpendicular * _zigzag_current_offset
-
-	# Track movement direction for animation
-	var prev_pos := global_position
-
-	while move_budget > 0.0 and _waypoint_index < _waypoints.size():
-		var target_pos := _waypoints[_waypoint_index]
-		var to_target := target_pos - global_position
-		var dist_to_target := to_target.length()
-
-		if dist_to_target <= move_budget:
-			global_position = target_pos
-			move_budget -= dist_to_target
-			_distance_traveled += dist_to_target
-			_waypoint_index += 1
-		else:
-			global_position += to_target.normalized() * move_budget
-			_distance_traveled += move_budget
-			move_budget = 0.0
-
-	# Apply zig-zag offset after movement
-	if _zigzag_enabled:
-		_zigzag_time += delta
-		_zigzag_current_offset = sin(_zigzag_time * ZIGZAG_FREQUENCY * TAU) * ZIGZAG_AMPLITUDE
-		global_position += _zigzag_perpendicular * _zigzag_current_offset
-
-	# Update walk animation direction and velocity for crossfire
-	var move_dir := global_position - prev_pos
-	velocity = move_dir
-	_update_animation_direction(move_dir)
-
-	# Update spatial grid cell
-	SpatialGrid.update_position(self)
-
 	# Orbit camera zone around helicopter and redraw beam
 	if _camera_zone and is_instance_valid(_camera_zone):
 		_camera_orbit_angle += CAMERA_ORBIT_SPEED * TAU * delta
@@ -356,51 +329,16 @@ func _process(delta: float) -> void:
 	if _camera_beam_node and is_instance_valid(_camera_beam_node):
 		_camera_beam_node.queue_redraw()
 
-	# Apply DoT (raw damage, bypasses armor but uses proper death handling)
-	var dot_dmg := status_effects.get_dot_damage(delta)
-	if dot_dmg > 0.0 and not health.is_dead:
-		health.current_hp -= dot_dmg
-		health.current_hp = max(health.current_hp, 0.0)
-		health.health_changed.emit(health.current_hp, health.max_hp)
-		if health.current_hp <= 0.0:
-			health.is_dead = true
-			health.died.emit()
-
-	# Check if reached end of path
-	if _waypoint_index >= _waypoints.size():
-		_reached_end()
-
-
-func _on_path_updated(spawn_index: int) -> void:
-	if spawn_index != _spawn_index or is_flying():
-		return
-
-	var new_waypoints := PathfindingManager.get_path_for_spawn(spawn_index)
-	if new_waypoints.is_empty():
-		return
-
-	var closest_idx := 0
-	var closest_dist := INF
-	for i in new_waypoints.size():
-		var dist := global_position.distance_squared_to(new_waypoints[i])
-		if dist < closest_dist:
-			closest_dist = dist
-			closest_idx = i
-
-	_waypoints = new_waypoints
-	_waypoint_index = closest_idx
-	_total_path_length = _calculate_path_length(new_waypoints)
-	_distance_traveled = 0.0
-	for i in range(1, closest_idx):
-		_distance_traveled += new_waypoints[i - 1].distance_to(new_waypoints[i])
-
 
 func _on_died() -> void:
 	SpatialGrid.unregister(self)
+	EnemySystem.unregister(self)
 	_cleanup_camera_zone()
 	SignalBus.enemy_killed.emit(self, loot.gold_reward)
 	_spawn_gold_coins()
 	set_process(false)
+	if _crowd:
+		_crowd.mark_dead(self)
 
 	var hit_area := get_node_or_null("HitArea") as Area2D
 	if hit_area:
@@ -408,10 +346,10 @@ func _on_died() -> void:
 		hit_area.set_deferred("monitoring", false)
 	health_bar.visible = false
 
-	var visual: CanvasItem = animated_sprite if _use_animated else sprite
+	var visual := _get_visual()
 
 	# Play death animation if available
-	if _use_animated and animated_sprite.sprite_frames:
+	if _use_animated and not _crowd and animated_sprite.sprite_frames:
 		var death_anim := "death_" + _current_dir
 		if not animated_sprite.sprite_frames.has_animation(death_anim):
 			death_anim = "death_se"
@@ -422,7 +360,6 @@ func _on_died() -> void:
 	# Flying enemies: stop rotors, drop visual to ground level on death
 	if is_flying():
 		visual.position.y = 0.0
-		_zigzag_enabled = false
 		if _rotor_sprite:
 			_rotor_sprite.queue_free()
 			_rotor_sprite = null
@@ -456,6 +393,8 @@ func _remove_corpse_and_free() -> void:
 func _on_health_changed(current: float, max_hp: float) -> void:
 	health_bar.max_value = max_hp
 	health_bar.value = current
+	if _crowd:
+		_crowd.set_health(self, current / max_hp if max_hp > 0.0 else 1.0)
 
 	# Speed burst: one-time speed increase when HP drops below threshold
 	if not _speed_burst_triggered and enemy_data and enemy_data.speed_burst_threshold > 0.0:
@@ -474,15 +413,19 @@ func _on_damage_taken(amount: float, damage_type: Enums.DamageType, is_crit: boo
 	_play_hit_reaction()
 
 
+## Lightweight hit cue for batched damage: number and flash only.
+func show_hit(amount: float, damage_type: Enums.DamageType, is_crit: bool) -> void:
+	_spawn_damage_number(amount, damage_type, is_crit)
+	_flash_damage()
+
+
 func _play_hit_reaction() -> void:
-	if health.is_dead:
-		return
+	if health.is_dead or _crowd:
+		return  # Crowd instances have no sprite node to knock back
 	var visual: CanvasItem = animated_sprite if _use_animated else sprite
 
 	# Micro-knockback in opposite direction of movement
-	var knockback_dir := Vector2.ZERO
-	if _waypoint_index < _waypoints.size():
-		knockback_dir = -(_waypoints[_waypoint_index] - global_position).normalized()
+	var knockback_dir := -(EnemySystem.get_next_waypoint(self) - global_position).normalized()
 	var tween := create_tween()
 	tween.tween_property(visual, "position", visual.position + knockback_dir * 1.5, 0.05)
 	tween.tween_property(visual, "position", Vector2.ZERO, 0.05)
@@ -499,6 +442,7 @@ func _play_hit_reaction() -> void:
 
 func _reached_end() -> void:
 	SpatialGrid.unregister(self)
+	EnemySystem.unregister(self)
 	_cleanup_camera_zone()
 	var hp_ratio := health.current_hp / health.max_hp if health.max_hp > 0.0 else 1.0
 	if hp_ratio < 0.1 and hp_ratio > 0.0:
@@ -512,34 +456,15 @@ func _reached_end() -> void:
 # -- Game Juice Effects --
 
 func _spawn_damage_number(amount: float, damage_type: Enums.DamageType, is_crit: bool) -> void:
-	var label := VFXPool.acquire_label()
-	var text := str(int(amount))
-	if is_crit:
-		text += "!"
-	label.text = text
-	label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
-
-	var color: Color = DAMAGE_COLORS.get(damage_type, Color.WHITE)
-	label.add_theme_color_override("font_color", color)
-
-	if is_crit:
-		label.add_theme_font_size_override("font_size", 14)
-	else:
-		label.add_theme_font_size_override("font_size", 10)
-
-	label.global_position = global_position + Vector2(-12, -20)
-	label.z_index = 100
-
-	get_tree().current_scene.add_child(label)
-
-	var tween := label.create_tween()
-	tween.set_parallel(true)
-	tween.tween_property(label, "position:y", label.position.y - 20.0, 0.8)
-	tween.tween_property(label, "modulate:a", 0.0, 0.8)
-	tween.chain().tween_callback(VFXPool.release_label.bind(label))
+	# Coalesced per enemy per frame and budgeted by VFXPool
+	VFXPool.queue_damage_number(self, amount, DAMAGE_COLORS.get(damage_type, Color.WHITE),
+		is_crit, health.current_hp <= 0.0)
 
 
 func _flash_damage() -> void:
+	if _crowd:
+		_crowd.flash(self)
+		return
 	if not _flash_material:
 		return
 	_flash_material.set_shader_parameter("flash_amount", 1.0)
@@ -547,8 +472,15 @@ func _flash_damage() -> void:
 	tween.tween_property(_flash_material, "shader_parameter/flash_amount", 0.0, 0.15)
 
 
+func _get_visual() -> CanvasItem:
+	## Node whose modulate tints this enemy (the root when crowd-rendered).
+	if _crowd:
+		return self
+	return animated_sprite if _use_animated else sprite
+
+
 func _flash_speed_burst() -> void:
-	var visual: CanvasItem = animated_sprite if _use_animated else sprite
+	var visual := _get_visual()
 	var original_modulate := visual.modulate
 	visual.modulate = Color(1.5, 1.2, 0.8)
 	var tween := create_tween()
@@ -557,70 +489,22 @@ func _flash_speed_burst() -> void:
 
 func _spawn_impact_sparks(damage_type: Enums.DamageType) -> void:
 	var spark_color: Color = DAMAGE_COLORS.get(damage_type, Color("#C8A040"))
-	var spark_count := 3
-	for i in spark_count:
-		var spark := VFXPool.acquire_rect()
-		spark.size = Vector2(2, 2)
-		spark.color = spark_color
-		spark.global_position = global_position + Vector2(-1, -1)
-		spark.z_index = 80
-		get_tree().current_scene.add_child(spark)
-		var dir := Vector2(randf_range(-1, 1), randf_range(-1, 1)).normalized()
-		var target_pos := spark.global_position + dir * randf_range(6, 14)
-		var tween := spark.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(spark, "global_position", target_pos, 0.2).set_ease(Tween.EASE_OUT)
-		tween.tween_property(spark, "modulate:a", 0.0, 0.2)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(spark))
+	VFXPool.spawn_burst(global_position, 3, spark_color, 6.0, 14.0, 0.2)
 
 
 func _spawn_gold_coins() -> void:
-	var coin_count := clampi(loot.gold_reward / 5, 3, 5)
-	for i in coin_count:
-		var coin := VFXPool.acquire_rect()
-		coin.size = Vector2(4, 4)
-		coin.color = Color("#E0C060")
-		coin.global_position = global_position + Vector2(-2, -2)
-		coin.z_index = 100
-
-		get_tree().current_scene.add_child(coin)
-
-		var target_pos := Vector2(40, 12)
-		var arc_offset := Vector2(randf_range(-30, 30), randf_range(-40, -10))
-		var mid_point := coin.global_position + arc_offset
-
-		var tween := coin.create_tween()
-		var delay := i * 0.05
-		if delay > 0.0:
-			tween.tween_interval(delay)
-		tween.tween_property(coin, "global_position", mid_point, 0.2).set_ease(Tween.EASE_OUT)
-		tween.tween_property(coin, "global_position", target_pos, 0.3).set_ease(Tween.EASE_IN)
-		tween.tween_callback(VFXPool.release_rect.bind(coin))
+	VFXPool.spawn_coins(global_position, clampi(loot.gold_reward / 5, 3, 5))
 
 
 func _spawn_near_miss_label() -> void:
-	var label := VFXPool.acquire_label()
-	var hp_left := int(health.current_hp)
-	label.text = "Almost! " + str(hp_left) + " HP left!"
-	label.horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
-	label.add_theme_color_override("font_color", Color("#C87878"))
-	label.add_theme_font_size_override("font_size", 11)
-	label.global_position = global_position + Vector2(-40, -24)
-	label.z_index = 100
-	get_tree().current_scene.add_child(label)
-	var tween := label.create_tween()
-	tween.set_parallel(true)
-	tween.tween_property(label, "position:y", label.position.y - 28.0, 1.5)
-	tween.tween_property(label, "modulate:a", 0.0, 1.5)
-	tween.chain().tween_callback(VFXPool.release_label.bind(label))
+	VFXPool.show_floating_text("Almost! " + str(int(health.current_hp)) + " HP left!",
+		global_position + Vector2(-40, -24), Color("#C87878"), 11, 28.0, 1.5, VFXPool.Priority.ALERT)
 
 
 # -- Public API for targeting system --
 
 func get_path_progress() -> float:
-	if _total_path_length <= 0.0:
-		return 0.0
-	return _distance_traveled / _total_path_length
+	return EnemySystem.get_progress(self)
 
 
 func is_flying() -> bool:
@@ -642,24 +526,15 @@ func get_armor_shred() -> float:
 ## Push enemy backward along its path by `distance` pixels.
 ## Used by Agent Provocateur to make enemies retreat.
 func push_back_on_path(distance: float) -> void:
-	if _waypoints.is_empty() or is_flying():
+	if is_flying():
 		return
-	var remaining := distance
-	while remaining > 0.0 and _waypoint_index > 0:
-		var prev_wp := _waypoints[_waypoint_index - 1]
-		var to_prev := prev_wp - global_position
-		var dist := to_prev.length()
-		if dist <= remaining:
-			global_position = prev_wp
-			remaining -= dist
-			_distance_traveled -= dist
-			_waypoint_index -= 1
-		else:
-			global_position += to_prev.normalized() * remaining
-			_distance_traveled -= remaining
-			remaining = 0.0
-	_distance_traveled = maxf(_distance_traveled, 0.0)
-	SpatialGrid.update_position(self)
+	EnemySystem.push_back(self, distance)
+
+
+## Shove the enemy off its path line (e.g. water cannon knockback).
+## It walks back onto the path toward its next waypoint.
+func displace(offset: Vector2) -> void:
+	EnemySystem.displace(self, offset)
 
 
 # -- News Helicopter Camera Zone --
@@ -763,9 +638,3 @@ func _draw_camera_beam() -> void:
 		var p1 := zone_pos + Vector2(cos(a1) * ellipse_hw, sin(a1) * ellipse_hh)
 		_camera_beam_node.draw_line(p0, p1, CAMERA_BEAM_OUTLINE, 1.0)
 
-
-func _calculate_path_length(path: PackedVector2Array) -> float:
-	var length := 0.0
-	for i in range(1, path.size()):
-		length += path[i - 1].distance_to(path[i])
-	return length
@@ -0,0 +1,328 @@
+class_name CrowdRenderer
+extends Node2D
+## Draws the common crowd enemies (WaveManager's crowd pool) through one
+## MultiMeshInstance2D per enemy type instead of an AnimatedSprite2D,
+## flash material and health bar per node. Each type's walk frames are
+## packed into one atlas; frame, direction and flash ride in per-instance
+## custom data, skin tint and corpse fade in the instance color.
+##
+## Render state lives in dense packed arrays (swap-remove on remove());
+## BaseEnemy only pushes changes (direction, hits, health, death). Instances
+## are y-sorted within their type by a counting sort each frame. The crowd
+## draws as a single layer of the Enemies container, so it no longer
+## interleaves with towers by depth.
+
+const SHADER = preload("res://assets/shaders/crowd_sprite.gdshader")
+
+const FLOATS_PER_INSTANCE = 16  # Transform2D (8) + color (4) + custom (4)
+const FLASH_TIME = 0.15  # Matches BaseEnemy._flash_damage()
+const SORT_BUCKET = 2.0  # Pixels per y-sort bucket
+
+const HEALTH_BAR_OFFSET = Vector2(-8, -18)
+const HEALTH_BAR_SIZE = Vector2(16, 2)
+const HEALTH_BAR_BG = Color(0.1, 0.1, 0.12, 0.7)
+const HEALTH_BAR_FILL = Color("#C05050")
+
+# -- Atlases, one per enemy type --
+var _type_of_id: Dictionary = {}  # enemy_id -> type index, -1 = can't batch
+var _meshes: Array[MultiMeshInstance2D] = []
+var _type_tint: PackedColorArray = PackedColorArray()
+var _type_fps: PackedFloat32Array = PackedFloat32Array()
+var _type_cols: PackedInt32Array = PackedInt32Array()
+var _type_fill: PackedInt32Array = PackedInt32Array()  # Instances this frame
+var _quad: ArrayMesh
+
+# -- Instance slots (index-aligned) --
+var _enemies: Array[BaseEnemy] = []
+var _slot_of: Dictionary = {}  # instance_id -> slot
+var _type: PackedInt32Array = PackedInt32Array()
+var _dir: PackedInt32Array = PackedInt32Array()  # Atlas row
+var _anim_time: PackedFloat32Array = PackedFloat32Array()
+var _flash: PackedFloat32Array = PackedFloat32Array()
+var _hp_ratio: PackedFloat32Array = PackedFloat32Array()
+var _alive: PackedByteArray = PackedByteArray()
+
+# Per-frame scratch
+var _pos: PackedVector2Array = PackedVector2Array()
+var _color: PackedColorArray = PackedColorArray()
+var _key: PackedInt32Array = PackedInt32Array()
+var _counts: PackedInt32Array = PackedInt32Array()
+var _order: PackedInt32Array = PackedInt32Array()
+var _buffer: PackedFloat32Array = PackedFloat32Array()
+
+var _bars: Node2D
+
+
+func _ready() -> void:
+	add_to_group("crowd_renderer")
+	_quad = _build_quad(Vector2(32, 32))
+	_bars = Node2D.new()
+	_bars.name = "HealthBars"
+	_bars.z_index = 1
+	_bars.draw.connect(_draw_bars)
+	add_child(_bars)
+	set_process(false)
+
+
+func add(enemy: BaseEnemy) -> bool:
+	## Take over drawing enemy. False if its type has no batchable walk
+	## cycle (the enemy then keeps its own sprite).
+	var eid := enemy.get_instance_id()
+	if _slot_of.has(eid):
+		return true
+	var type := _get_type(enemy.enemy_data.enemy_id)
+	if type < 0:
+		return false
+	_slot_of[eid] = _enemies.size()
+	_enemies.append(enemy)
+	_type.append(type)
+	_dir.append(BaseEnemy.DIR_NAMES.find("se"))
+	_anim_time.append(0.0)
+	_flash.append(0.0)
+	_hp_ratio.append(1.0)
+	_alive.append(1)
+	set_process(true)
+	return true
+
+
+func remove(enemy: BaseEnemy) -> void:
+	var eid := enemy.get_instance_id()
+	if not _slot_of.has(eid):
+		return
+	var slot: int = _slot_of[eid]
+	var last := _enemies.size() - 1
+	if slot != last:
+		var moved := _enemies[last]
+		_enemies[slot] = moved
+		_slot_of[moved.get_instance_id()] = slot
+		_type[slot] = _type[last]
+		_dir[slot] = _dir[last]
+		_anim_time[slot] = _anim_time[last]
+		_flash[slot] = _flash[last]
+		_hp_ratio[slot] = _hp_ratio[last]
+		_alive[slot] = _alive[last]
+	_enemies.resize(last)
+	_type.resize(last)
+	_dir.resize(last)
+	_anim_time.resize(last)
+	_flash.resize(last)
+	_hp_ratio.resize(last)
+	_alive.resize(last)
+	_slot_of.erase(eid)
+
+
+func is_crowd_type(data: EnemyData) -> bool:
+	return data != null and WaveManager.is_in_crowd_pool(data) \
+		and data.movement_type != Enums.MovementType.FLYING
+
+
+# -- Per-enemy state pushed by BaseEnemy --
+
+func set_direction(enemy: BaseEnemy, dir_idx: int) -> void:
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot >= 0:
+		_dir[slot] = dir_idx
+
+
+func flash(enemy: BaseEnemy) -> void:
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot >= 0:
+		_flash[slot] = 1.0
+
+
+func set_health(enemy: BaseEnemy, ratio: float) -> void:
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot >= 0:
+		_hp_ratio[slot] = ratio
+
+
+func mark_dead(enemy: BaseEnemy) -> void:
+	## Freeze the walk cycle and hide the bar; the corpse keeps drawing
+	## (tinted through the node's modulate) until the enemy is freed.
+	var slot: int = _slot_of.get(enemy.get_instance_id(), -1)
+	if slot >= 0:
+		_alive[slot] = 0
+		_hp_ratio[slot] = 1.0
+
+
+# -- Atlas building --
+
+func _get_type(enemy_id: String) -> int:
+	if _type_of_id.has(enemy_id):
+		return _type_of_id[enemy_id]
+	var type := _build_type(enemy_id)
+	_type_of_id[enemy_id] = type
+	return type
+
+
+func _build_type(enemy_id: String) -> int:
+	var skin := ThemeManager.get_enemy_skin(enemy_id)
+	if not skin or not skin.animation_frames:
+		return -1
+	var frames := skin.animation_frames
+
+	# Every direction needs a walk cycle of same-sized frames
+	var cols := 0
+	for dir_name in BaseEnemy.DIR_NAMES:
+		var anim: String = "walk_" + dir_name
+		if not frames.has_animation(anim) or frames.get_frame_count(anim) == 0:
+			return -1
+		cols = maxi(cols, frames.get_frame_count(anim))
+	var frame_size := Vector2i(frames.get_frame_texture("walk_" + BaseEnemy.DIR_NAMES[0], 0).get_size())
+
+	var rows := BaseEnemy.DIR_NAMES.size()
+	var atlas := Image.create(cols * frame_size.x, rows * frame_size.y, false, Image.FORMAT_RGBA8)
+	for row in rows:
+		var anim: String = "walk_" + BaseEnemy.DIR_NAMES[row]
+		var count := frames.get_frame_count(anim)
+		for col in cols:
+			# Shorter cycles repeat to fill the row
+			var img := frames.get_frame_texture(anim, col % count).get_image()
+			if not img or img.get_size() != frame_size:
+				return -1
+			if img.is_compressed():
+				img.decompress()
+			img.convert(Image.FORMAT_RGBA8)
+			atlas.blit_rect(img, Rect2i(Vector2i.ZERO, frame_size), Vector2i(col, row) * frame_size)
+
+	var material := ShaderMaterial.new()
+	material.shader = SHADER
+	material.set_shader_parameter("grid", Vector2(cols, rows))
+
+	var multimesh := MultiMesh.new()
+	multimesh.transform_format = MultiMesh.TRANSFORM_2D
+	multimesh.use_colors = true
+	multimesh.use_custom_data = true
+	multimesh.mesh = _quad if frame_size == Vector2i(32, 32) else _build_quad(Vector2(frame_size))
+	multimesh.instance_count = 0
+
+	var mesh_instance := MultiMeshInstance2D.new()
+	mesh_instance.name = "Crowd_" + enemy_id
+	mesh_instance.multimesh = multimesh
+	mesh_instance.texture = ImageTexture.create_from_image(atlas)
+	mesh_instance.material = material
+	add_child(mesh_instance)
+	move_child(_bars, -1)  # Bars stay on top of every crowd layer
+
+	_meshes.append(mesh_instance)
+	_type_tint.append(skin.tint)
+	_type_fps.append(frames.get_animation_speed("walk_" + BaseEnemy.DIR_NAMES[0]))
+	_type_cols.append(cols)
+	_type_fill.append(0)
+	return _meshes.size() - 1
+
+
+func _build_quad(size: Vector2) -> ArrayMesh:
+	# Built by hand: QuadMesh is Y-up and would draw the atlas upside down
+	var half := size * 0.5
+	var arrays := []
+	arrays.resize(Mesh.ARRAY_MAX)
+	arrays[Mesh.ARRAY_VERTEX] = PackedVector2Array([
+		Vector2(-half.x, -half.y), Vector2(half.x, -half.y),
+		Vector2(half.x, half.y), Vector2(-half.x, half.y),
+	])
+	arrays[Mesh.ARRAY_TEX_UV] = PackedVector2Array([
+		Vector2(0, 0), Vector2(1, 0), Vector2(1, 1), Vector2(0, 1),
+	])
+	arrays[Mesh.ARRAY_INDEX] = PackedInt32Array([0, 1, 2, 0, 2, 3])
+	var mesh := ArrayMesh.new()
+	mesh.add_surface_from_arrays(Mesh.PRIMITIVE_TRIANGLES, arrays)
+	return mesh
+
+
+# -- Frame update --
+
+func _process(delta: float) -> void:
+	var n := _enemies.size()
+	var type_count := _meshes.size()
+	_type_fill.fill(0)
+	if n == 0:
+		for mesh_instance in _meshes:
+			mesh_instance.multimesh.visible_instance_count = 0
+		_bars.queue_redraw()
+		set_process(false)
+		return
+
+	# Gather positions/colors and advance animation
+	_pos.resize(n)
+	_color.resize(n)
+	var min_y := INF
+	var max_y := -INF
+	for i in n:
+		var enemy := _enemies[i]
+		var p := enemy.position
+		_pos[i] = p
+		min_y = minf(min_y, p.y)
+		max_y = maxf(max_y, p.y)
+		_color[i] = _type_tint[_type[i]] * enemy.modulate
+		if _alive[i]:
+			_anim_time[i] += delta
+		if _flash[i] > 0.0:
+			_flash[i] = maxf(_flash[i] - delta / FLASH_TIME, 0.0)
+		_type_fill[_type[i]] += 1
+
+	# Counting sort on (type, corpses first, y bucket)
+	var rows := int((max_y - min_y) / SORT_BUCKET) + 1
+	var keys := type_count * 2 * rows
+	_counts.resize(keys + 1)
+	_counts.fill(0)
+	_key.resize(n)
+	for i in n:
+		var k := (_type[i] * 2 + _alive[i]) * rows + int((_pos[i].y - min_y) / SORT_BUCKET)
+		_key[i] = k
+		_counts[k + 1] += 1
+	for k in keys:
+		_counts[k + 1] += _counts[k]
+	_order.resize(n)
+	for i in n:
+		var k := _key[i]
+		_order[_counts[k]] = i
+		_counts[k] += 1
+
+	# One buffer upload per type
+	var at := 0
+	for t in type_count:
+		var count := _type_fill[t]
+		var multimesh := _meshes[t].multimesh
+		if count > multimesh.instance_count:
+			multimesh.instance_count = nearest_po2(count)
+		if count > 0:
+			_buffer.resize(multimesh.instance_count * FLOATS_PER_INSTANCE)
+			var fps := _type_fps[t]
+			var cols := _type_cols[t]
+			for k in count:
+				var i := _order[at + k]
+				var o := k * FLOATS_PER_INSTANCE
+				var p := _pos[i]
+				var c := _color[i]
+				_buffer[o] = 1.0
+				_buffer[o + 1] = 0.0
+				_buffer[o + 2] = 0.0
+				_buffer[o + 3] = p.x
+				_buffer[o + 4] = 0.0
+				_buffer[o + 5] = 1.0
+				_buffer[o + 6] = 0.0
+				_buffer[o + 7] = p.y
+				_buffer[o + 8] = c.r
+				_buffer[o + 9] = c.g
+				_buffer[o + 10] = c.b
+				_buffer[o + 11] = c.a
+				_buffer[o + 12] = float(int(_anim_time[i] * fps) % cols)
+				_buffer[o + 13] = float(_dir[i])
+				_buffer[o + 14] = _flash[i]
+				_buffer[o + 15] = 0.0
+			multimesh.buffer = _buffer
+		multimesh.visible_instance_count = count
+		at += count
+
+	_bars.queue_redraw()
+
+
+func _draw_bars() -> void:
+	# Only hurt, living enemies show a bar
+	for i in _enemies.size():
+		if not _alive[i] or _hp_ratio[i] >= 1.0:
+			continue
+		var corner := _enemies[i].position + HEALTH_BAR_OFFSET
+		_bars.draw_rect(Rect2(corner, HEALTH_BAR_SIZE), HEALTH_BAR_BG)
+		_bars.draw_rect(Rect2(corner, Vector2(HEALTH_BAR_SIZE.x * _hp_ratio[i], HEALTH_BAR_SIZE.y)), HEALTH_BAR_FILL)
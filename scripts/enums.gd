@@ -69,6 +69,18 @@ enum ModifierOp {
 	SET,        ## base = value
 }
 
+## Slots of a tower's compiled stat block (UpgradeRegistry.compile_stats).
+enum TowerStat {
+	DAMAGE,
+	FIRE_RATE,
+	RANGE,
+	AOE,
+	PIERCE,
+	CHAIN,
+	CRIT_CHANCE,
+	CRIT_MULT,
+}
+
 ## Game speed states.
 enum GameSpeed {
 	PAUSED,
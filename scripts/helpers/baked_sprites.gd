@@ -0,0 +1,50 @@
+class_name BakedSprites
+extends RefCounted
+## Serves the procedural sprites pre-rendered by tools/bake_sprites.py.
+## The helper generators ask here first and only run their set_pixel
+## loops for variants missing from the atlas (new colours, unbaked seeds).
+
+const MANIFEST_PATH = "res://assets/sprites/_baked/procedural_atlas.json"
+const MANIFEST_VERSION = 1
+
+static var _atlas: Texture2D
+static var _regions: Dictionary = {}   # key -> Rect2
+static var _textures: Dictionary = {}  # key -> AtlasTexture
+static var _loaded: bool = false
+
+
+static func get_texture(key: String) -> Texture2D:
+	## Baked texture for key, or null when the atlas does not contain it.
+	if _textures.has(key):
+		return _textures[key]
+	if not _loaded:
+		_load_manifest()
+	if not _regions.has(key):
+		return null
+	var tex := AtlasTexture.new()
+	tex.atlas = _atlas
+	tex.region = _regions[key]
+	_textures[key] = tex
+	return tex
+
+
+static func color_key(color: Color) -> String:
+	## Colour part of a parameterised key, e.g. "606068".
+	return color.to_html(false)
+
+
+static func _load_manifest() -> void:
+	_loaded = true
+	if not FileAccess.file_exists(MANIFEST_PATH):
+		return
+	var manifest = JSON.parse_string(FileAccess.get_file_as_string(MANIFEST_PATH))
+	if not manifest is Dictionary or int(manifest.get("version", 0)) != MANIFEST_VERSION:
+		push_warning("BakedSprites: unreadable manifest, using runtime generation")
+		return
+	var atlas_path: String = MANIFEST_PATH.get_base_dir().path_join(manifest["atlas"])
+	if not ResourceLoader.exists(atlas_path):
+		return
+	_atlas = load(atlas_path)
+	for key in manifest["sprites"]:
+		var r: Array = manifest["sprites"][key]
+		_regions[key] = Rect2(r[0], r[1], r[2], r[3])
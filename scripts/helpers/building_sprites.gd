@@ -7,7 +7,11 @@ const TILE_W = 64
 const TILE_H = 32
 
 
-static func create_government_building() -> ImageTexture:
+static func create_government_building() -> Texture2D:
+	var baked := BakedSprites.get_texture("government_building")
+	if baked:
+		return baked
+
 	# ~4 tiles wide, 2 tiles deep, ~80px tall — brutalist with columns
 	var w := 192
 	var h := 128
@@ -120,7 +124,11 @@ static func create_government_building() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_guard_booth() -> ImageTexture:
+static func create_guard_booth() -> Texture2D:
+	var baked := BakedSprites.get_texture("guard_booth")
+	if baked:
+		return baked
+
 	# 1x1 tile, ~24px tall — dark metal box with slit window
 	var w := 32
 	var h := 40
@@ -151,7 +159,11 @@ static func create_guard_booth() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_apartment_block() -> ImageTexture:
+static func create_apartment_block() -> Texture2D:
+	var baked := BakedSprites.get_texture("apartment_block")
+	if baked:
+		return baked
+
 	# 2x1 tiles, ~48px tall
 	var w := 64
 	var h := 64
@@ -193,7 +205,11 @@ static func create_apartment_block() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_wall_segment() -> ImageTexture:
+static func create_wall_segment() -> Texture2D:
+	var baked := BakedSprites.get_texture("wall_segment")
+	if baked:
+		return baked
+
 	# 1 tile wide, ~16px tall — concrete wall with optional chain-link on top
 	var w := 32
 	var h := 24
@@ -0,0 +1,17 @@
+class_name DamageBatch
+extends RefCounted
+## One damage spec for DamageCalculator.apply_batch(): every target takes
+## the same base damage, damage type, crit chance and on-hit effects.
+## Owners (clouds, beams, chain projectiles) keep one instance and refill
+## it per tick instead of resolving each enemy separately.
+
+var base_damage: float = 0.0
+var damage_type: Enums.DamageType = Enums.DamageType.KINETIC
+var crit_chance: float = 0.0
+var crit_multiplier: float = 1.0
+var on_hit_effects: Array[StatusEffectData] = []
+var source_tower: Node2D = null  ## Kill attribution
+
+## Optional per-target damage factor, index-aligned with the target buffer
+## (e.g. chain falloff). Ignored unless it covers every target.
+var damage_scale: PackedFloat32Array = PackedFloat32Array()
@@ -6,7 +6,12 @@ extends RefCounted
 
 # -- TOWERS (32x32) --
 
-static func create_tower_turret(base_color: Color, accent_color: Color) -> ImageTexture:
+static func create_tower_turret(base_color: Color, accent_color: Color) -> Texture2D:
+	var key := "tower_turret_%s_%s" % [BakedSprites.color_key(base_color), BakedSprites.color_key(accent_color)]
+	var baked := BakedSprites.get_texture(key)
+	if baked:
+		return baked
+
 	# Isometric turret: pedestal base + barrel
 	var size := 32
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
@@ -46,15 +51,19 @@ static func create_tower_turret(base_color: Color, accent_color: Color) -> Image
 	return ImageTexture.create_from_image(img)
 
 
-static func create_arrow_tower() -> ImageTexture:
+static func create_arrow_tower() -> Texture2D:
 	return create_tower_turret(Color("#606068"), Color("#90A0B8"))
 
 
-static func create_cannon_tower() -> ImageTexture:
+static func create_cannon_tower() -> Texture2D:
 	return create_tower_turret(Color("#585850"), Color("#A08060"))
 
 
-static func create_ice_tower() -> ImageTexture:
+static func create_ice_tower() -> Texture2D:
+	var baked := BakedSprites.get_texture("ice_tower")
+	if baked:
+		return baked
+
 	# Distinct look: crystalline shape
 	var size := 32
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
@@ -89,7 +98,12 @@ static func create_ice_tower() -> ImageTexture:
 
 # -- ENEMIES (16x16) --
 
-static func create_enemy_figure(body_color: Color, accent_color: Color) -> ImageTexture:
+static func create_enemy_figure(body_color: Color, accent_color: Color) -> Texture2D:
+	var key := "enemy_figure_%s_%s" % [BakedSprites.color_key(body_color), BakedSprites.color_key(accent_color)]
+	var baked := BakedSprites.get_texture(key)
+	if baked:
+		return baked
+
 	# Small humanoid figure silhouette
 	var size := 16
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
@@ -122,17 +136,21 @@ static func create_enemy_figure(body_color: Color, accent_color: Color) -> Image
 	return ImageTexture.create_from_image(img)
 
 
-static func create_protestor() -> ImageTexture:
+static func create_protestor() -> Texture2D:
 	return create_enemy_figure(Color("#D06040"), Color("#F0F0F0"))
 
 
-static func create_agitator_elite() -> ImageTexture:
+static func create_agitator_elite() -> Texture2D:
 	return create_enemy_figure(Color("#A04050"), Color("#D04040"))
 
 
-static func create_press_drone() -> ImageTexture:
+static func create_press_drone() -> Texture2D:
 	## 16x16 quadcopter body: center module, 4 arms, motor mounts, camera lens.
 	## Rotors are a separate overlay — see create_press_drone_rotors().
+	var baked := BakedSprites.get_texture("press_drone")
+	if baked:
+		return baked
+
 	var size := 16
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
 	var body := Color("#3A3A4A")
@@ -181,9 +199,13 @@ static func create_press_drone() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_press_drone_rotors(frame: int) -> ImageTexture:
+static func create_press_drone_rotors(frame: int) -> Texture2D:
 	## 16x16 rotor overlay for quadcopter. Alternates blade orientation.
 	## frame 0: blades horizontal (—), frame 1: blades vertical (|)
+	var baked := BakedSprites.get_texture("press_drone_rotors_%d" % frame)
+	if baked:
+		return baked
+
 	var size := 16
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
 	var blade := Color("#A0A8B8", 0.7)
@@ -218,9 +240,13 @@ static func create_press_drone_rotors(frame: int) -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_news_helicopter() -> ImageTexture:
+static func create_news_helicopter() -> Texture2D:
 	## 16x16 helicopter body: fuselage, tail boom, cockpit window, skids.
 	## Main rotor is a separate overlay — see create_news_helicopter_rotor().
+	var baked := BakedSprites.get_texture("news_helicopter")
+	if baked:
+		return baked
+
 	var size := 16
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
 	var body := Color("#505868")
@@ -282,9 +308,13 @@ static func create_news_helicopter() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_news_helicopter_rotor(frame: int) -> ImageTexture:
+static func create_news_helicopter_rotor(frame: int) -> Texture2D:
 	## 16x16 main rotor overlay for helicopter. 2-blade rotor in 2 orientations.
 	## frame 0: diagonal NE-SW, frame 1: diagonal NW-SE
+	var baked := BakedSprites.get_texture("news_helicopter_rotor_%d" % frame)
+	if baked:
+		return baked
+
 	var size := 16
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
 	var blade := Color("#B0B8C8", 0.6)
@@ -324,7 +354,11 @@ static func create_news_helicopter_rotor(frame: int) -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_mob_boss() -> ImageTexture:
+static func create_mob_boss() -> Texture2D:
+	var baked := BakedSprites.get_texture("mob_boss")
+	if baked:
+		return baked
+
 	# Larger, more imposing figure
 	var size := 16
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
@@ -360,7 +394,11 @@ static func create_mob_boss() -> ImageTexture:
 
 # -- PROJECTILES (8x8) --
 
-static func create_projectile_streak(color: Color) -> ImageTexture:
+static func create_projectile_streak(color: Color) -> Texture2D:
+	var baked := BakedSprites.get_texture("projectile_streak_%s" % BakedSprites.color_key(color))
+	if baked:
+		return baked
+
 	var img := Image.create(8, 8, false, Image.FORMAT_RGBA8)
 	var bright := color.lightened(0.3)
 
@@ -378,7 +416,11 @@ static func create_projectile_streak(color: Color) -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_cannonball() -> ImageTexture:
+static func create_cannonball() -> Texture2D:
+	var baked := BakedSprites.get_texture("cannonball")
+	if baked:
+		return baked
+
 	var img := Image.create(8, 8, false, Image.FORMAT_RGBA8)
 	var color := Color("#484850")
 	var highlight := Color("#60606A")
@@ -396,7 +438,11 @@ static func create_cannonball() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_ice_shard() -> ImageTexture:
+static func create_ice_shard() -> Texture2D:
+	var baked := BakedSprites.get_texture("ice_shard")
+	if baked:
+		return baked
+
 	var img := Image.create(8, 8, false, Image.FORMAT_RGBA8)
 	var color := Color("#80C0E0")
 	var bright := Color("#B0E0F0")
@@ -415,8 +461,12 @@ static func create_ice_shard() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_tear_gas_canister() -> ImageTexture:
+static func create_tear_gas_canister() -> Texture2D:
 	## 8x8 dark metal cylinder with orange warning band.
+	var baked := BakedSprites.get_texture("tear_gas_canister")
+	if baked:
+		return baked
+
 	var img := Image.create(8, 8, false, Image.FORMAT_RGBA8)
 	var body := Color("#404048")
 	var dark := Color("#303038")
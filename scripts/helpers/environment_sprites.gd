@@ -4,7 +4,11 @@ extends RefCounted
 ## barricades, rubble, graffiti, vehicles, puddles, etc.
 
 
-static func create_rubble(seed_val: int) -> ImageTexture:
+static func create_rubble(seed_val: int) -> Texture2D:
+	var baked := BakedSprites.get_texture("rubble_%d" % seed_val)
+	if baked:
+		return baked
+
 	# 16x16 transparent with scattered debris pixels
 	var img := Image.create(16, 16, false, Image.FORMAT_RGBA8)
 	var colors := [Color("#28282C"), Color("#3A3A3E"), Color("#2E2E32"), Color("#242428")]
@@ -20,7 +24,11 @@ static func create_rubble(seed_val: int) -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_barricade() -> ImageTexture:
+static func create_barricade() -> Texture2D:
+	var baked := BakedSprites.get_texture("barricade")
+	if baked:
+		return baked
+
 	# Isometric box shape, toppled — 32x16
 	var img := Image.create(32, 16, false, Image.FORMAT_RGBA8)
 	var main := Color("#484850")
@@ -39,7 +47,11 @@ static func create_barricade() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_wire_coil() -> ImageTexture:
+static func create_wire_coil() -> Texture2D:
+	var baked := BakedSprites.get_texture("wire_coil")
+	if baked:
+		return baked
+
 	# Concertina wire spiral — 24x12
 	var img := Image.create(24, 12, false, Image.FORMAT_RGBA8)
 	var wire_color := Color("#585860")
@@ -53,7 +65,11 @@ static func create_wire_coil() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_graffiti_tag(seed_val: int) -> ImageTexture:
+static func create_graffiti_tag(seed_val: int) -> Texture2D:
+	var baked := BakedSprites.get_texture("graffiti_tag_%d" % seed_val)
+	if baked:
+		return baked
+
 	# Small pixel text/tag — 12x6
 	var img := Image.create(12, 6, false, Image.FORMAT_RGBA8)
 	var colors := [Color("#D04040"), Color("#F0F0F0"), Color("#A0D8A0")]
@@ -70,7 +86,11 @@ static func create_graffiti_tag(seed_val: int) -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_burned_vehicle() -> ImageTexture:
+static func create_burned_vehicle() -> Texture2D:
+	var baked := BakedSprites.get_texture("burned_vehicle")
+	if baked:
+		return baked
+
 	# Elongated dark shape with ember pixels — 48x24
 	var img := Image.create(48, 24, false, Image.FORMAT_RGBA8)
 	var body := Color("#1E1E22")
@@ -110,7 +130,11 @@ static func create_burned_vehicle() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_puddle() -> ImageTexture:
+static func create_puddle() -> Texture2D:
+	var baked := BakedSprites.get_texture("puddle")
+	if baked:
+		return baked
+
 	# 12x6 ellipse — dark reflective
 	var img := Image.create(12, 6, false, Image.FORMAT_RGBA8)
 	var puddle_color := Color("#1A1A1E")
@@ -129,7 +153,11 @@ static func create_puddle() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_sandbag_stack() -> ImageTexture:
+static func create_sandbag_stack() -> Texture2D:
+	var baked := BakedSprites.get_texture("sandbag_stack")
+	if baked:
+		return baked
+
 	# 20x12 — stacked bags
 	var img := Image.create(20, 12, false, Image.FORMAT_RGBA8)
 	var bag_light := Color("#605848")
@@ -155,7 +183,11 @@ static func create_sandbag_stack() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_oil_barrel() -> ImageTexture:
+static func create_oil_barrel() -> Texture2D:
+	var baked := BakedSprites.get_texture("oil_barrel")
+	if baked:
+		return baked
+
 	# 16x20 isometric oil barrel — dark metal with rust patches and top ellipse
 	var img := Image.create(16, 20, false, Image.FORMAT_RGBA8)
 	var body := Color("#2A2A30")
@@ -196,7 +228,11 @@ static func create_oil_barrel() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_fire_particle(seed_val: int) -> ImageTexture:
+static func create_fire_particle(seed_val: int) -> Texture2D:
+	var baked := BakedSprites.get_texture("fire_particle_%d" % (seed_val % 5))
+	if baked:
+		return baked
+
 	# 8x10 flame shape — core white-yellow to outer orange-red, wobble per seed
 	var img := Image.create(8, 10, false, Image.FORMAT_RGBA8)
 	var core := Color("#FFFBE0")       # white-yellow
@@ -232,7 +268,11 @@ static func create_fire_particle(seed_val: int) -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_fire_glow() -> ImageTexture:
+static func create_fire_glow() -> Texture2D:
+	var baked := BakedSprites.get_texture("fire_glow")
+	if baked:
+		return baked
+
 	# 24x12 radial gradient ellipse — warm orange, max 25% alpha
 	var img := Image.create(24, 12, false, Image.FORMAT_RGBA8)
 	var glow_color := Color("#FF8020")
@@ -250,7 +290,11 @@ static func create_fire_glow() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_tire_stack() -> ImageTexture:
+static func create_tire_stack() -> Texture2D:
+	var baked := BakedSprites.get_texture("tire_stack")
+	if baked:
+		return baked
+
 	# 16x12 two stacked rubber tires
 	var img := Image.create(16, 12, false, Image.FORMAT_RGBA8)
 	var rubber := Color("#1E1E22")
@@ -285,7 +329,11 @@ static func create_tire_stack() -> ImageTexture:
 	return ImageTexture.create_from_image(img)
 
 
-static func create_fallen_sign(seed_val: int) -> ImageTexture:
+static func create_fallen_sign(seed_val: int) -> Texture2D:
+	var baked := BakedSprites.get_texture("fallen_sign_%d" % seed_val)
+	if baked:
+		return baked
+
 	# 20x10 fallen cardboard protest sign with random text color
 	var img := Image.create(20, 10, false, Image.FORMAT_RGBA8)
 	var cardboard := Color("#8A7858")
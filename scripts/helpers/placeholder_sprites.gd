@@ -3,7 +3,11 @@ extends RefCounted
 ## Generates colored placeholder textures at runtime for towers, enemies,
 ## and projectiles when no sprite asset is assigned.
 
-static func create_diamond(size: int, color: Color) -> ImageTexture:
+static func create_diamond(size: int, color: Color) -> Texture2D:
+	var baked := BakedSprites.get_texture("diamond_%d_%s" % [size, BakedSprites.color_key(color)])
+	if baked:
+		return baked
+
 	var img := Image.create(size, size, false, Image.FORMAT_RGBA8)
 	var half := size / 2.0
 	var quarter := size / 4.0
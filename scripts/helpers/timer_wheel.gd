@@ -0,0 +1,75 @@
+class_name TimerWheel
+extends RefCounted
+## Hashed timer wheel. Deadlines hash into SLOT_COUNT buckets of SLOT_TIME
+## seconds; advance() only visits the buckets whose tick has passed, so
+## objects with nothing due cost nothing. Deadlines more than one lap out
+## stay in their bucket until the lap they belong to.
+
+const SLOT_TIME = 0.05
+const SLOT_COUNT = 64
+
+var now: float = 0.0
+
+var _tick: int = 0  # Last tick whose bucket has been processed
+var _targets: Array[Array] = []  # slot -> Array of Objects
+var _deadlines: Array[PackedFloat64Array] = []  # slot -> deadlines, index-aligned
+var _due: Array[Object] = []  # Reused result of advance()
+
+
+func _init() -> void:
+	for i in SLOT_COUNT:
+		_targets.append([])
+		_deadlines.append(PackedFloat64Array())
+
+
+func schedule(target: Object, deadline: float) -> void:
+	## Report target from advance() once now >= deadline (up to SLOT_TIME late).
+	var tick := maxi(ceili(deadline / SLOT_TIME), _tick + 1)
+	var slot := tick % SLOT_COUNT
+	_targets[slot].append(target)
+	var deadlines := _deadlines[slot]
+	deadlines.append(deadline)
+	_deadlines[slot] = deadlines
+
+
+func advance(delta: float) -> Array[Object]:
+	## Move the clock forward and return every target that came due.
+	## The returned array is reused by the next call.
+	_due.clear()
+	now += delta
+	var target_tick := floori(now / SLOT_TIME)
+	# After a full lap every bucket has been visited once
+	var first := maxi(_tick + 1, target_tick - SLOT_COUNT + 1)
+	for tick in range(first, target_tick + 1):
+		_fire_slot(tick % SLOT_COUNT)
+	_tick = maxi(_tick, target_tick)
+	return _due
+
+
+func clear() -> void:
+	for i in SLOT_COUNT:
+		_targets[i].clear()
+		_deadlines[i].clear()
+	_due.clear()
+	now = 0.0
+	_tick = 0
+
+
+func _fire_slot(slot: int) -> void:
+	var targets: Array = _targets[slot]
+	var deadlines: PackedFloat64Array = _deadlines[slot]
+	if targets.is_empty():
+		return
+	# Compact in place: due entries leave, later laps stay
+	var keep := 0
+	for i in targets.size():
+		if deadlines[i] <= now:
+			if is_instance_valid(targets[i]):
+				_due.append(targets[i])
+			continue
+		targets[keep] = targets[i]
+		deadlines[keep] = deadlines[i]
+		keep += 1
+	targets.resize(keep)
+	deadlines.resize(keep)
+	_deadlines[slot] = deadlines
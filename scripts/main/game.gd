@@ -35,6 +35,7 @@ var _dps_window: Array[float] = []
 var _dps_timer: float = 0.0
 var _tile_source_id: int = 0
 var _barrel_nodes: Array[Node2D] = []
+var _ambient: AmbientAnimator
 var _debug_label: Label = null
 var _debug_enabled: bool = false
 var _music_player: AudioStreamPlayer
@@ -59,6 +60,17 @@ func _ready() -> void:
 	projectile_container.add_to_group("projectiles")
 	effects_container.add_to_group("effects")
 
+	# Batched renderer for crowd-pool enemies (found by group in BaseEnemy)
+	var crowd := CrowdRenderer.new()
+	crowd.name = "CrowdRenderer"
+	enemy_container.add_child(crowd)
+
+	# Shared driver for flickers, pulses and tower glows (found by group in BaseTower)
+	_ambient = AmbientAnimator.new()
+	_ambient.name = "AmbientAnimator"
+	add_child(_ambient)
+	_ambient.setup($World, $CityBackground/AnimatedDetails)
+
 	# Build the map programmatically and get spawn/goal tiles
 	var map_result := MapBuilder.build_map(tile_map)
 	spawn_tiles = map_result["spawn_tiles"]
@@ -207,6 +219,7 @@ func _ready() -> void:
 	SignalBus.screen_shake.connect(_shake_camera)
 
 	SignalBus.enemy_damaged.connect(_on_enemy_damaged_stats)
+	SignalBus.enemies_damaged.connect(_on_enemies_damaged_stats)
 	SignalBus.enemy_killed.connect(_on_enemy_killed_stats)
 	SignalBus.enemy_reached_end.connect(_on_enemy_leaked_stats)
 	SignalBus.wave_completed.connect(_on_wave_completed_stats)
@@ -242,6 +255,12 @@ func _ready() -> void:
 		vignette_rect.material = mat
 	vignette_layer.add_child(vignette_rect)
 
+	if GameManager.is_headless_sim:
+		# The sim driver places towers and starts waves itself
+		_intro_cover.queue_free()
+		GameManager.start_game()
+		return
+
 	# Atmospheric fog/gas overlay (intensifies with chemical towers)
 	_fog_manager = FogManager.new()
 	add_child(_fog_manager)
@@ -250,6 +269,9 @@ func _ready() -> void:
 	# Background music — starts during intro comic
 	_setup_bgm()
 
+	# Tier 5 skins, portraits and banners load in the background from here
+	AssetPreloader.start("late")
+
 	# Intro comic → briefing → spawn indicator → waves
 	GameManager.start_game()
 	# TESTING: skip intro comic + briefing, go straight to gameplay
@@ -337,7 +359,9 @@ func _set_camera_pos(pos: Vector2) -> void:
 func _on_restart() -> void:
 	Engine.time_scale = 1.0
 	SpatialGrid.clear()
+	EnemySystem.clear()
 	VFXPool.reset_pool()
+	ProjectilePool.reset_pool()
 	SynergyManager.clear()
 	AbilityManager.reset()
 	# Null out autoload refs to scene nodes before reload to prevent stale access
@@ -374,6 +398,7 @@ func _on_briefing_dismissed_show_indicator() -> void:
 
 
 func _on_spawn_indicator_clicked() -> void:
+	ReplayRecorder.record_command("wave")
 	_spawn_indicator.hide_indicator()
 	if not _waves_started:
 		_waves_started = true
@@ -383,6 +408,13 @@ func _on_spawn_indicator_clicked() -> void:
 
 
 func _on_manifestation_ready(next_wave_number: int) -> void:
+	if GameManager.is_headless_sim:
+		WaveManager.advance_wave()
+		return
+	if ReplayRecorder.is_playing():
+		# The recorded indicator click starts the wave; no pausing briefing
+		_spawn_indicator.show_indicator()
+		return
 	_show_manifestation_briefing(next_wave_number)
 
 
@@ -421,6 +453,11 @@ func _on_enemy_damaged_stats(_enemy: Node2D, amount: float, _dtype: Enums.Damage
 	_dps_window.append(amount)
 
 
+func _on_enemies_damaged_stats(total: float, _hit_count: int, _dtype: Enums.DamageType) -> void:
+	_stats["total_damage"] += total
+	_dps_window.append(total)
+
+
 func _on_enemy_killed_stats(_enemy: Node2D, _gold: int) -> void:
 	_stats["total_kills"] += 1
 
@@ -497,15 +534,13 @@ func _setup_city_background() -> void:
 
 
 func _setup_flickering_windows() -> void:
-	var details := $CityBackground/AnimatedDetails
-
 	# Scatter flickering yellow lights near tall building positions
 	var building_tiles := [
 		Vector2i(-5, -3), Vector2i(-6, 3), Vector2i(-7, 8),  # left panelkas
 		Vector2i(12, -4), Vector2i(20, -3),                    # back panelkas
 		Vector2i(28, 1), Vector2i(28, -4),                     # right panelkas
 	]
-	var window_positions: Array[Vector2] = []
+	var window_positions := PackedVector2Array()
 	for tile in building_tiles:
 		var base := tile_map.map_to_local(tile)
 		# 2-3 lights per building at various heights
@@ -514,27 +549,7 @@ func _setup_flickering_windows() -> void:
 		if randf() > 0.4:
 			window_positions.append(base + Vector2(randf_range(-10, 10), randf_range(-140, -70)))
 
-	var light_img := Image.create(3, 2, false, Image.FORMAT_RGBA8)
-	light_img.fill(Color("#C8A040"))
-	var light_tex := ImageTexture.create_from_image(light_img)
-
-	for i in window_positions.size():
-		var light := Sprite2D.new()
-		light.texture = light_tex
-		light.texture_filter = CanvasItem.TEXTURE_FILTER_NEAREST
-		light.position = window_positions[i]
-		details.add_child(light)
-
-		var timer := Timer.new()
-		timer.wait_time = randf_range(1.5, 4.0)
-		timer.autostart = true
-		timer.timeout.connect(_on_window_flicker.bind(light, timer))
-		light.add_child(timer)
-
-
-func _on_window_flicker(light: Sprite2D, timer: Timer) -> void:
-	light.visible = not light.visible
-	timer.wait_time = randf_range(1.0, 3.5)
+	_ambient.add_window_lights(window_positions)
 
 
 func _setup_govt_glow() -> void:
@@ -549,9 +564,7 @@ func _setup_govt_glow() -> void:
 
 	var bright := Color(1.3, 1.25, 1.1)
 	var dim := Color(1.1, 1.05, 0.95)
-	var tween := create_tween().set_loops()
-	tween.tween_property(govt_sprite, "self_modulate", dim, 2.0).set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
-	tween.tween_property(govt_sprite, "self_modulate", bright, 2.0).set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
+	_ambient.add_oscillator(govt_sprite, ^"self_modulate", bright, dim, 2.0)
 
 
 # ---------------------------------------------------------------------------
@@ -617,11 +630,7 @@ func _animate_barrels() -> void:
 		var fire_b: Sprite2D = barrel.get_child(3) as Sprite2D
 
 		# Glow alpha pulse
-		var glow_tween := create_tween().set_loops()
-		glow_tween.tween_property(glow, "modulate:a", 0.12, 0.8) \
-			.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
-		glow_tween.tween_property(glow, "modulate:a", 0.25, 0.8) \
-			.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
+		_ambient.add_oscillator(glow, ^"modulate:a", 0.25, 0.12, 0.8)
 
 		# Fire A — scale oscillation + alpha flicker + vertical bob
 		_animate_fire_sprite(fire_a, 0.6, 0.0)
@@ -651,30 +660,7 @@ func _setup_bgm() -> void:
 
 func _animate_fire_sprite(fire: Sprite2D, period: float, phase: float) -> void:
 	var base_y := fire.position.y
-
-	# Scale oscillation
-	var scale_tween := create_tween().set_loops()
-	if phase > 0.0:
-		scale_tween.tween_interval(phase)
-	scale_tween.tween_property(fire, "scale", Vector2(1.15, 1.25), period) \
-		.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
-	scale_tween.tween_property(fire, "scale", Vector2(0.9, 0.85), period) \
-		.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
-
-	# Alpha flicker
-	var alpha_tween := create_tween().set_loops()
-	if phase > 0.0:
-		alpha_tween.tween_interval(phase * 0.7)
-	alpha_tween.tween_property(fire, "modulate:a", 0.6, period * 0.8) \
-		.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
-	alpha_tween.tween_property(fire, "modulate:a", 1.0, period * 0.8) \
-		.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
-
-	# Vertical bob
-	var bob_tween := create_tween().set_loops()
-	if phase > 0.0:
-		bob_tween.tween_interval(phase * 1.2)
-	bob_tween.tween_property(fire, "position:y", base_y - 2.0, period * 1.1) \
-		.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
-	bob_tween.tween_property(fire, "position:y", base_y + 1.0, period * 1.1) \
-		.set_ease(Tween.EASE_IN_OUT).set_trans(Tween.TRANS_SINE)
+	# Scale oscillation, alpha flicker and vertical bob, each slightly offset
+	_ambient.add_oscillator(fire, ^"scale", Vector2(0.9, 0.85), Vector2(1.15, 1.25), period, phase)
+	_ambient.add_oscillator(fire, ^"modulate:a", 1.0, 0.6, period * 0.8, phase * 0.7)
+	_ambient.add_oscillator(fire, ^"position:y", base_y + 1.0, base_y - 2.0, period * 1.1, phase * 1.2)
@@ -1,11 +1,14 @@
 class_name GridOverlay
 extends Node2D
 ## Draws subtle diamond outlines on buildable tiles to show the grid.
+## Tiles where a tower would seal the enemy path are tinted red.
 
 var _tile_map: TileMapLayer
 var _map_w: int
 var _map_h: int
+var _buildable_tiles: Array[Vector2i] = []
 var _buildable_positions: Array[Vector2] = []
+var _cuts_path: Array[bool] = []  # Parallel to _buildable_positions
 var _diamond_half_w := 32.0
 var _diamond_half_h := 16.0
 
@@ -22,15 +25,35 @@ func setup(tile_map: TileMapLayer, map_w: int, map_h: int) -> void:
 			var pos := Vector2i(x, y)
 			var td := _tile_map.get_cell_tile_data(pos)
 			if td and td.get_custom_data("buildable"):
+				_buildable_tiles.append(pos)
 				_buildable_positions.append(_tile_map.map_to_local(pos))
+	_cuts_path.resize(_buildable_tiles.size())
+	_cuts_path.fill(false)
+
+	PathfindingManager.placement_changed.connect(_on_placement_changed)
+	queue_redraw()
+
+
+func _on_placement_changed() -> void:
+	var mask := PathfindingManager.get_placeable_mask()
+	var rect := PathfindingManager.get_grid_rect()
+	for i in _buildable_tiles.size():
+		var tile := _buildable_tiles[i]
+		var cuts := false
+		if rect.has_point(tile):
+			var idx := (tile.y - rect.position.y) * rect.size.x + (tile.x - rect.position.x)
+			cuts = mask[idx] == PathfindingManager.PLACE_CUTS_PATH
+		_cuts_path[i] = cuts
 	queue_redraw()
 
 
 func _draw() -> void:
 	var color := Color("#30A0D8A0")  # Subtle cyan, ~19% opacity
+	var cut_color := Color("#C0404060")  # Muted red: would block the path
 	var hw := _diamond_half_w
 	var hh := _diamond_half_h
-	for center in _buildable_positions:
+	for i in _buildable_positions.size():
+		var center := _buildable_positions[i]
 		var pts := PackedVector2Array([
 			center + Vector2(0, -hh),
 			center + Vector2(hw, 0),
@@ -38,4 +61,4 @@ func _draw() -> void:
 			center + Vector2(-hw, 0),
 			center + Vector2(0, -hh),
 		])
-		draw_polyline(pts, color, 1.0)
+		draw_polyline(pts, cut_color if _cuts_path[i] else color, 1.0)
@@ -0,0 +1,273 @@
+extends SceneTree
+## Headless fast-forward driver. Loads the game scene with VFX, fog and
+## music off, builds a tower layout, runs the waves back to back and writes
+## per-wave stats as JSON.
+##
+##   godot --headless --fixed-fps 60 -s res://scripts/main/headless_sim.gd -- \
+##       --layout=layout.json --waves=10 --seed=1 --out=sim_stats.json
+##
+## The engine's --fixed-fps is required: every frame then advances exactly
+## 1/fps of game time with no real-time sync, so a run is as fast as the CPU
+## allows and repeats exactly for the same seed and layout. The engine
+## consumes that flag, so the script can't read it; pass the same rate as
+## --fps (default 60). The first frame's delta is checked against it and the
+## run aborts if the step isn't fixed. Gameplay randomness comes
+## from RngService. The layout is tools/balance_sim.py's format (a placement
+## list, or a layout_search.py results file — rank 1 is used); towers the
+## starting gold can't cover are funded and reported under build.granted_gold.
+##
+## Options (after --):
+##   --fps=N              Step rate given to --fixed-fps (default: 60)
+##   --layout=PATH        Tower layout JSON (default: no towers)
+##   --waves=N            Stop after wave N (default: all)
+##   --seed=N             Gameplay RNG seed (default: 0)
+##   --max-seconds=N      Game-time cap before giving up (default: 3600)
+##   --out=PATH           Write the report here instead of stdout
+##   --perf-csv=PATH      Also dump PerfMonitor's last frames as CSV
+
+const TAG = "HeadlessSim"
+const OPTIONS: PackedStringArray = [
+	"--fps", "--layout", "--waves", "--seed", "--max-seconds", "--out", "--perf-csv",
+]
+
+var _fps: int = 0
+var _seed: int = 0
+var _wave_limit: int = 0  # 0 = all waves
+var _max_sim_seconds: float = 3600.0
+var _layout_path: String = ""
+var _out_path: String = ""
+var _perf_csv_path: String = ""
+
+var _step_checked: bool = false
+var _started: bool = false
+var _finished: bool = false
+var _sim_time: float = 0.0
+var _frames: int = 0
+var _run_start_usec: int = 0
+var _last_frame_usec: int = 0
+
+var _build := {"towers": 0, "failed": [], "granted_gold": 0}
+var _waves: Array[Dictionary] = []
+var _wave: Dictionary = {}  # Stats for the wave in progress (empty between waves)
+var _wave_start_usec: int = 0
+
+
+func _initialize() -> void:
+	if not _parse_args():
+		quit(1)
+		return
+	Engine.physics_ticks_per_second = _fps
+	AudioServer.set_bus_mute(0, true)
+	GameManager.is_headless_sim = true
+	VFXPool.enabled = false
+	change_scene_to_file(SimRunner.GAME_SCENE)
+
+
+func _process(delta: float) -> bool:
+	if _finished:
+		return true
+	if not _started:
+		if not _step_checked and not SimRunner.is_fixed_step(TAG, delta, _fps):
+			_finished = true
+			quit(1)
+			return true
+		_step_checked = true
+		if current_scene and current_scene.is_node_ready():
+			_start_run()
+		return false
+
+	var now := Time.get_ticks_usec()
+	_sim_time += delta
+	_frames += 1
+
+	if not _wave.is_empty():
+		_wave["frames"] += 1
+		_wave["max_frame_ms"] = maxf(_wave["max_frame_ms"], (now - _last_frame_usec) / 1000.0)
+		_wave["peak_enemies"] = maxi(_wave["peak_enemies"], EnemySystem.get_count())
+	_last_frame_usec = now
+
+	if _sim_time >= _max_sim_seconds:
+		_finish("timeout")
+	return _finished
+
+
+# -- Setup --
+
+func _parse_args() -> bool:
+	var options = SimRunner.parse_options(TAG, OPTIONS)
+	if options == null:
+		return false
+	_fps = SimRunner.get_fps(TAG, options)
+	_layout_path = options.get("--layout", "")
+	_wave_limit = options.get("--waves", "0").to_int()
+	_seed = options.get("--seed", "0").to_int()
+	_max_sim_seconds = options.get("--max-seconds", str(_max_sim_seconds)).to_float()
+	_out_path = options.get("--out", "")
+	_perf_csv_path = options.get("--perf-csv", "")
+	return _fps > 0
+
+
+func _start_run() -> void:
+	_started = true
+	RngService.seed_with(_seed)
+
+	SignalBus.wave_started.connect(_on_wave_started)
+	SignalBus.wave_completed.connect(_on_wave_completed)
+	SignalBus.enemy_spawned.connect(_on_enemy_spawned)
+	SignalBus.enemy_damaged.connect(_on_enemy_damaged)
+	SignalBus.enemies_damaged.connect(_on_enemies_damaged)
+	SignalBus.enemy_killed.connect(_on_enemy_killed)
+	SignalBus.enemy_reached_end.connect(_on_enemy_reached_end)
+	SignalBus.all_waves_completed.connect(_finish.bind("complete"))
+	SignalBus.game_over.connect(func(victory: bool): _finish("won" if victory else "lost"))
+
+	if not _layout_path.is_empty() and not _build_layout():
+		_finish("bad_layout")
+		return
+
+	_run_start_usec = Time.get_ticks_usec()
+	_last_frame_usec = _run_start_usec
+	PerfMonitor.reset()  # Exclude scene load and layout build
+	WaveManager.start_waves()
+
+
+func _build_layout() -> bool:
+	var doc = JSON.parse_string(FileAccess.get_file_as_string(_layout_path))
+	if doc is Dictionary and doc.has("results"):
+		doc = doc["results"][0]["layout"]
+	if not doc is Array:
+		push_error("%s: can't read layout %s" % [TAG, _layout_path])
+		return false
+
+	var towers := SimRunner.load_tower_data()
+	var placer: TowerPlacer = current_scene.tower_placer
+	for placement in doc:
+		var data: TowerData = towers.get(placement["tower"])
+		var tile := Vector2i(placement["tile"][0], placement["tile"][1])
+		if not data:
+			_build["failed"].append("%s@%d,%d: unknown tower" % [placement["tower"], tile.x, tile.y])
+			continue
+		_fund(data.build_cost)
+		var tower := placer.place_tower(data, tile)
+		if not tower:
+			_build["failed"].append("%s@%d,%d: tile not placeable" % [data.tower_id, tile.x, tile.y])
+			continue
+		_build["towers"] += 1
+
+		var tiers: Array = placement.get("tiers", [])
+		for path_i in tiers.size():
+			for i in int(tiers[path_i]):
+				if path_i < data.upgrade_paths.size():
+					var path := data.upgrade_paths[path_i]
+					var next_tier: int = tower.upgrade.path_tiers[path_i]
+					if next_tier < path.tiers.size():
+						_fund(path.tiers[next_tier].cost)
+				if not tower.upgrade.do_upgrade(path_i):
+					_build["failed"].append("%s@%d,%d: path %d tier %d" % [
+						data.tower_id, tile.x, tile.y, path_i, i + 1])
+					break
+	return true
+
+
+func _fund(cost: int) -> void:
+	## Top up gold so a layout beyond the starting budget can still be built.
+	if EconomyManager.can_afford(cost):
+		return
+	var short := cost - EconomyManager.gold / EconomyManager.BUDGET_SCALE
+	EconomyManager.add_gold_data(short)
+	_build["granted_gold"] += short
+
+
+# -- Per-wave stats --
+
+func _on_wave_started(wave_number: int) -> void:
+	_wave_start_usec = Time.get_ticks_usec()
+	_wave = {
+		"wave": wave_number,
+		"spawned": 0,
+		"kills": 0,
+		"leaks": 0,
+		"lives_lost": 0,
+		"damage": 0.0,
+		"gold_earned": 0,
+		"peak_enemies": 0,
+		"sim_start": _sim_time,
+		"frames": 0,
+		"max_frame_ms": 0.0,
+	}
+
+
+func _on_wave_completed(wave_number: int) -> void:
+	_close_wave(true)
+	if _wave_limit > 0 and wave_number >= _wave_limit:
+		_finish("complete")
+
+
+func _close_wave(cleared: bool) -> void:
+	if _wave.is_empty():
+		return
+	_wave["cleared"] = cleared
+	var wall_ms := (Time.get_ticks_usec() - _wave_start_usec) / 1000.0
+	_wave["sim_seconds"] = _sim_time - _wave["sim_start"]
+	_wave.erase("sim_start")
+	_wave["wall_ms"] = wall_ms
+	_wave["avg_frame_ms"] = wall_ms / maxi(_wave["frames"], 1)
+	_wave["lives"] = GameManager.lives
+	_wave["gold"] = EconomyManager.gold / EconomyManager.BUDGET_SCALE
+	_waves.append(_wave)
+	_wave = {}
+
+
+func _on_enemy_spawned(_enemy: Node2D) -> void:
+	if not _wave.is_empty():
+		_wave["spawned"] += 1
+
+
+func _on_enemy_damaged(_enemy: Node2D, amount: float, _damage_type: Enums.DamageType) -> void:
+	if not _wave.is_empty():
+		_wave["damage"] += amount
+
+
+func _on_enemies_damaged(total: float, _hit_count: int, _damage_type: Enums.DamageType) -> void:
+	if not _wave.is_empty():
+		_wave["damage"] += total
+
+
+func _on_enemy_killed(_enemy: Node2D, gold_reward: int) -> void:
+	if not _wave.is_empty():
+		_wave["kills"] += 1
+		_wave["gold_earned"] += gold_reward
+
+
+func _on_enemy_reached_end(_enemy: Node2D, lives_cost: int) -> void:
+	if not _wave.is_empty():
+		_wave["leaks"] += 1
+		_wave["lives_lost"] += lives_cost
+
+
+# -- Report --
+
+func _finish(result: String) -> void:
+	if _finished:
+		return
+	_finished = true
+	_close_wave(false)  # A wave still running when the run ends
+
+	var wall_seconds := (Time.get_ticks_usec() - _run_start_usec) / 1_000_000.0
+	var report := {
+		"result": result,
+		"seed": _seed,
+		"fps": _fps,
+		"layout": _layout_path,
+		"waves_cleared": _waves.filter(func(w): return w["cleared"]).size(),
+		"lives": GameManager.lives,
+		"gold": EconomyManager.gold / EconomyManager.BUDGET_SCALE,
+		"sim_seconds": _sim_time,
+		"wall_seconds": wall_seconds,
+		"speedup": _sim_time / wall_seconds if wall_seconds > 0.0 else 0.0,
+		"frames": _frames,
+		"build": _build,
+		"waves": _waves,
+		"perf": PerfMonitor.get_summary(),
+	}
+	SimRunner.write_report(TAG, report, _out_path, _perf_csv_path)
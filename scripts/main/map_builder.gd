@@ -1,6 +1,7 @@
 class_name MapBuilder
 extends RefCounted
-## Programmatically builds a TileSet and paints an isometric map at runtime.
+## Paints the isometric map from the MapData baked by tools/bake_map.py,
+## building the TileSet and atlas at runtime only when no bake is present.
 ## Called from game.gd before PathfindingManager init.
 
 const TILE_W = 64
@@ -9,6 +10,8 @@ const MAP_W = 24
 const MAP_H = 14
 const BORDER = 12  # extended ground tiles around the playable area
 
+const MAP_DATA_PATH = "res://data/maps/downtown.tres"
+
 # Atlas tile IDs — 5 functional types, 3 visuals
 const GROUND_A = Vector2i(0, 0)   # walkable + buildable
 const GROUND_B = Vector2i(1, 0)   # walkable + buildable
@@ -34,6 +37,50 @@ const EDGE_DARKEN = 0.15
 
 
 static func build_map(tile_map: TileMapLayer) -> Dictionary:
+	# Prebaked level (tools/bake_map.py); build it here only if that is missing
+	var map_data := _load_map_data()
+	if map_data == null:
+		map_data = generate_map_data()
+
+	var tile_set := map_data.tile_set
+	tile_map.tile_set = tile_set
+	var source_id := tile_set.get_source_id(0)
+
+	# Open grid, no predefined path. Players build towers freely; A* finds
+	# the enemy route dynamically. Only rule: at least one path from spawn
+	# to goal must remain open.
+	var cells := map_data.cells
+	var i := 0
+	for y in MAP_H:
+		for x in MAP_W:
+			tile_map.set_cell(Vector2i(x, y), source_id, Vector2i(cells[i], 0))
+			i += 1
+
+	var obstacle_tiles: Dictionary = {}  # Vector2i → true
+	for pos in map_data.obstacle_tiles:
+		obstacle_tiles[pos] = true
+
+	return {
+		"spawn_tiles": map_data.spawn_tiles.duplicate(),
+		"goal_tiles": map_data.goal_tiles.duplicate(),
+		"obstacle_tiles": obstacle_tiles,
+		"source_id": source_id,
+	}
+
+
+static func _load_map_data() -> MapData:
+	if not ResourceLoader.exists(MAP_DATA_PATH):
+		return null
+	var map_data := load(MAP_DATA_PATH) as MapData
+	if map_data == null or not map_data.is_valid_for(Vector2i(MAP_W, MAP_H)):
+		push_warning("MapBuilder: stale %s, building map at runtime" % MAP_DATA_PATH)
+		return null
+	return map_data
+
+
+static func generate_map_data() -> MapData:
+	## Runtime equivalent of tools/bake_map.py: assembles the atlas and
+	## TileSet and rolls the tile hashes.
 	# 1. Create TileSet
 	var tile_set := TileSet.new()
 	tile_set.tile_shape = TileSet.TILE_SHAPE_ISOMETRIC
@@ -71,7 +118,7 @@ static func build_map(tile_map: TileMapLayer) -> Dictionary:
 	for i in TILE_COUNT:
 		source.create_tile(Vector2i(i, 0))
 
-	var source_id := tile_set.add_source(source)
+	tile_set.add_source(source)
 
 	# 4. Custom data per tile type
 	for tid in [GROUND_A, GROUND_B, GROUND_C]:
@@ -87,15 +134,11 @@ static func build_map(tile_map: TileMapLayer) -> Dictionary:
 	wall_data.set_custom_data("walkable", false)
 	wall_data.set_custom_data("buildable", false)
 
-	# 5. Assign TileSet
-	tile_map.tile_set = tile_set
-
-	# 6. Paint the map — open grid, no predefined path.
-	# Players build towers freely; A* finds the enemy route dynamically.
-	# Only rule: at least one path from spawn to goal must remain open.
-	var spawn_tiles: Array[Vector2i] = []
-	var goal_tiles: Array[Vector2i] = []
-	var obstacle_tiles: Dictionary = {}  # Vector2i → true
+	# 5. Paint the cells
+	var map_data := MapData.new()
+	map_data.tile_set = tile_set
+	map_data.size = Vector2i(MAP_W, MAP_H)
+	map_data.cells.resize(MAP_W * MAP_H)
 	var ground_variants := [GROUND_A, GROUND_B, GROUND_C]
 
 	for y in MAP_H:
@@ -116,23 +159,18 @@ static func build_map(tile_map: TileMapLayer) -> Dictionary:
 				var obs_hash := _tile_hash(x, y, 777)
 				if obs_hash % 100 < 14:
 					tile = NOBUILD
-					obstacle_tiles[pos] = true
+					map_data.obstacle_tiles.append(pos)
 				else:
 					tile = ground_variants[hash_val % ground_variants.size()]
 
 			if is_spawn:
-				spawn_tiles.append(pos)
+				map_data.spawn_tiles.append(pos)
 			if is_goal:
-				goal_tiles.append(pos)
+				map_data.goal_tiles.append(pos)
 
-			tile_map.set_cell(pos, source_id, tile)
+			map_data.cells[y * MAP_W + x] = tile.x
 
-	return {
-		"spawn_tiles": spawn_tiles,
-		"goal_tiles": goal_tiles,
-		"obstacle_tiles": obstacle_tiles,
-		"source_id": source_id,
-	}
+	return map_data
 
 
 static func _try_load_tile(atlas_img: Image, tile_index: int, tile_name: String) -> bool:
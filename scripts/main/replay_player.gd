@@ -0,0 +1,253 @@
+extends SceneTree
+## Plays a ReplayRecorder session back at a fixed timestep and reports the
+## frame-time distribution, overall and per wave, so the same real session
+## can be compared across builds. Runs rendered or with --headless.
+##
+##   godot [--headless] --fixed-fps 60 -s res://scripts/main/replay_player.gd -- \
+##       --replay=user://replays/replay_2026-01-01T12-00-00.json --out=bench.json
+##
+## --fixed-fps is required (see headless_sim.gd): game time then advances a
+## fixed step per frame, so every command lands on its recorded tick no
+## matter how slow the frame was. Pass the same rate as --fps (default 60);
+## the first frame's delta is checked against it. Unlike the headless sim,
+## VFX, fog and the HUD stay on (unless run --headless); only audio is muted.
+##
+## Options (after --):
+##   --fps=N              Step rate given to --fixed-fps (default: 60)
+##   --replay=PATH        Replay JSON written by ReplayRecorder (required)
+##   --max-seconds=N      Game-time cap (default: the recorded length + 60)
+##   --out=PATH           Write the report here instead of stdout
+##   --perf-csv=PATH      Also dump PerfMonitor's last frames as CSV
+
+const TAG = "ReplayPlayer"
+const OPTIONS: PackedStringArray = ["--fps", "--replay", "--max-seconds", "--out", "--perf-csv"]
+const TAIL_SECONDS = 60.0  # Keep playing after the last recorded tick
+const PERCENTILES = [50, 90, 99]
+
+var _fps: int = 0
+var _replay_path: String = ""
+var _max_sim_seconds: float = 0.0
+var _out_path: String = ""
+var _perf_csv_path: String = ""
+
+var _replay: Dictionary = {}
+var _commands: Array = []
+var _next_command: int = 0
+var _tick_rate: int = 60
+var _towers: Dictionary = {}  # tower_id -> TowerData
+var _failed: Array[String] = []
+
+var _step_checked: bool = false
+var _started: bool = false
+var _finished: bool = false
+var _sim_time: float = 0.0
+var _run_start_usec: int = 0
+var _last_frame_usec: int = 0
+var _frame_ms: PackedFloat32Array = PackedFloat32Array()
+var _frame_wave: PackedInt32Array = PackedInt32Array()  # Wave number per frame
+var _wave: int = 0
+
+
+func _initialize() -> void:
+	if not _parse_args() or not _load_replay():
+		quit(1)
+		return
+	Engine.physics_ticks_per_second = _fps
+	AudioServer.set_bus_mute(0, true)
+	ReplayRecorder.begin_playback()
+	change_scene_to_file(SimRunner.GAME_SCENE)
+
+
+func _process(delta: float) -> bool:
+	if _finished:
+		return true
+	if not _started:
+		if not _step_checked and not SimRunner.is_fixed_step(TAG, delta, _fps):
+			_finished = true
+			quit(1)
+			return true
+		_step_checked = true
+		if current_scene and current_scene.is_node_ready():
+			_start_run()
+		return false
+
+	var now := Time.get_ticks_usec()
+	_frame_ms.append((now - _last_frame_usec) / 1000.0)
+	_frame_wave.append(_wave)
+	_last_frame_usec = now
+
+	_sim_time += delta
+	var tick := int(_sim_time * _tick_rate)
+	while _next_command < _commands.size() and int(_commands[_next_command]["tick"]) <= tick:
+		_apply(_commands[_next_command])
+		_next_command += 1
+
+	if _sim_time >= _max_sim_seconds:
+		_finish("end")
+	return _finished
+
+
+# -- Setup --
+
+func _parse_args() -> bool:
+	var options = SimRunner.parse_options(TAG, OPTIONS)
+	if options == null:
+		return false
+	_fps = SimRunner.get_fps(TAG, options)
+	_replay_path = options.get("--replay", "")
+	_max_sim_seconds = options.get("--max-seconds", "0").to_float()
+	_out_path = options.get("--out", "")
+	_perf_csv_path = options.get("--perf-csv", "")
+	if _replay_path.is_empty():
+		push_error("%s: --replay=PATH is required" % TAG)
+		return false
+	return _fps > 0
+
+
+func _load_replay() -> bool:
+	var doc = JSON.parse_string(FileAccess.get_file_as_string(_replay_path))
+	if not doc is Dictionary or int(doc.get("version", 0)) != ReplayRecorder.REPLAY_VERSION:
+		push_error("%s: can't read replay %s" % [TAG, _replay_path])
+		return false
+	_replay = doc
+	_commands = doc.get("commands", [])
+	_tick_rate = int(doc.get("tick_rate", ReplayRecorder.TICK_RATE))
+	if _max_sim_seconds <= 0.0:
+		_max_sim_seconds = float(doc.get("end_tick", 0)) / _tick_rate + TAIL_SECONDS
+	return true
+
+
+func _start_run() -> void:
+	_started = true
+	RngService.seed_with(int(_replay["seed"]))
+
+	var waves: Array[WaveData] = []
+	for path in _replay.get("waves", []):
+		var wave := load(path) as WaveData
+		if wave:
+			waves.append(wave)
+		else:
+			_failed.append("wave %s: missing" % path)
+	WaveManager.waves = waves
+
+	_towers = SimRunner.load_tower_data()
+
+	SignalBus.wave_started.connect(func(wave_number: int): _wave = wave_number)
+	SignalBus.all_waves_completed.connect(_finish.bind("complete"))
+	SignalBus.game_over.connect(func(victory: bool): _finish("won" if victory else "lost"))
+
+	_run_start_usec = Time.get_ticks_usec()
+	_last_frame_usec = _run_start_usec
+	PerfMonitor.reset()  # Exclude scene load
+
+
+# -- Commands --
+
+func _apply(command: Dictionary) -> void:
+	var cmd: String = command["cmd"]
+	match cmd:
+		"place":
+			var data: TowerData = _towers.get(command["tower"])
+			var placer: TowerPlacer = current_scene.tower_placer
+			if not data or not placer.place_tower(data, _tile(command)):
+				_fail(command)
+		"upgrade":
+			var tower := _tower_at(command)
+			if not tower or not tower.upgrade.do_upgrade(int(command["path"])):
+				_fail(command)
+		"sell":
+			var tower := _tower_at(command)
+			if tower:
+				tower.sell()
+			else:
+				_fail(command)
+		"ability":
+			var data := AbilityManager.get_ability_data(command["id"])
+			if not data or not AbilityManager.is_ready_to_use(data.ability_id):
+				_fail(command)
+				return
+			AbilityManager.start_placement(data)
+			if AbilityManager.is_placing():
+				AbilityManager.confirm_placement(Vector2(command["pos"][0], command["pos"][1]))
+				if AbilityManager.is_placing():
+					AbilityManager.cancel_placement()
+					_fail(command)
+		"speed":
+			GameManager.set_speed(int(command["speed"]) as Enums.GameSpeed)
+		"wave":
+			current_scene._on_spawn_indicator_clicked()
+		"call_wave":
+			WaveManager.call_next_wave()
+		_:
+			_fail(command)
+
+
+func _tile(command: Dictionary) -> Vector2i:
+	return Vector2i(int(command["tile"][0]), int(command["tile"][1]))
+
+
+func _tower_at(command: Dictionary) -> BaseTower:
+	var tower = SynergyManager._tower_grid.get(_tile(command))
+	return tower if is_instance_valid(tower) else null
+
+
+func _fail(command: Dictionary) -> void:
+	# The run has diverged from the recording (e.g. gameplay code changed)
+	_failed.append("%d %s" % [int(command["tick"]), JSON.stringify(command)])
+
+
+# -- Report --
+
+func _frame_stats(frame_ms: PackedFloat32Array) -> Dictionary:
+	if frame_ms.is_empty():
+		return {"frames": 0}
+	var sorted := frame_ms.duplicate()
+	sorted.sort()
+	var total := 0.0
+	for ms in sorted:
+		total += ms
+	var stats := {
+		"frames": sorted.size(),
+		"avg_ms": total / sorted.size(),
+		"max_ms": sorted[sorted.size() - 1],
+	}
+	for p in PERCENTILES:
+		stats["p%d_ms" % p] = sorted[mini(sorted.size() * p / 100, sorted.size() - 1)]
+	return stats
+
+
+func _finish(result: String) -> void:
+	if _finished:
+		return
+	_finished = true
+
+	# Waves only move forward, so each one is a contiguous run of frames
+	var waves := []
+	var run_start := 0
+	for i in range(1, _frame_ms.size() + 1):
+		if i < _frame_ms.size() and _frame_wave[i] == _frame_wave[run_start]:
+			continue
+		var stats := _frame_stats(_frame_ms.slice(run_start, i))
+		stats["wave"] = _frame_wave[run_start]
+		waves.append(stats)
+		run_start = i
+
+	var wall_seconds := (Time.get_ticks_usec() - _run_start_usec) / 1_000_000.0
+	var report := {
+		"result": result,
+		"replay": _replay_path,
+		"recorded_build": _replay.get("build", ""),
+		"build": ProjectSettings.get_setting("application/config/version", ""),
+		"headless": DisplayServer.get_name() == "headless",
+		"fps": _fps,
+		"seed": _replay["seed"],
+		"commands": _next_command,
+		"failed": _failed,
+		"waves_reached": WaveManager.current_wave_index + 1,
+		"sim_seconds": _sim_time,
+		"wall_seconds": wall_seconds,
+		"frame_ms": _frame_stats(_frame_ms),
+		"waves": waves,
+		"perf": PerfMonitor.get_summary(),
+	}
+	SimRunner.write_report(TAG, report, _out_path, _perf_csv_path)
@@ -0,0 +1,69 @@
+class_name SimRunner
+extends RefCounted
+## Shared plumbing for the fixed-step SceneTree drivers (headless_sim.gd,
+## replay_player.gd): option parsing, the fixed-step check, tower data
+## lookup and report output. tag prefixes every error ("HeadlessSim", ...).
+
+const GAME_SCENE = "res://scenes/main/game.tscn"
+const TOWER_DIR = "res://data/towers"
+const DEFAULT_FPS = 60
+
+
+static func parse_options(tag: String, names: PackedStringArray) -> Variant:
+	## The --key=value options after --, as {"--key": "value"}. Returns null
+	## (after reporting it) on an option not in names.
+	var options := {}
+	for arg in OS.get_cmdline_user_args():
+		var key := arg.get_slice("=", 0)
+		if key not in names:
+			push_error("%s: unknown option %s" % [tag, arg])
+			return null
+		options[key] = arg.substr(key.length() + 1)
+	return options
+
+
+static func get_fps(tag: String, options: Dictionary) -> int:
+	## The --fps option: the rate also given to the engine's --fixed-fps,
+	## which the engine consumes so scripts can't read it. 0 if invalid.
+	var fps: int = options.get("--fps", str(DEFAULT_FPS)).to_int()
+	if fps <= 0:
+		push_error("%s: --fps must be positive" % tag)
+		return 0
+	return fps
+
+
+static func is_fixed_step(tag: String, delta: float, fps: int) -> bool:
+	## Call with the first frame's delta: under --fixed-fps it is exactly 1/fps.
+	if is_equal_approx(delta, 1.0 / fps):
+		return true
+	push_error("%s: frame delta %f != 1/%d; run with --fixed-fps %d" % [tag, delta, fps, fps])
+	return false
+
+
+static func load_tower_data() -> Dictionary:
+	## tower_id -> TowerData for every tower resource (exported builds too).
+	var towers := {}
+	for file in DirAccess.get_files_at(TOWER_DIR):
+		var path := TOWER_DIR.path_join(file.trim_suffix(".remap"))
+		if not path.ends_with(".tres"):
+			continue
+		var data := load(path) as TowerData
+		if data:
+			towers[data.tower_id] = data
+	return towers
+
+
+static func write_report(tag: String, report: Dictionary, out_path: String, perf_csv_path: String) -> void:
+	## Print report as JSON, or write it to out_path; optionally dump
+	## PerfMonitor's frame buffer as CSV too.
+	if not perf_csv_path.is_empty():
+		PerfMonitor.export_csv(perf_csv_path)
+	var text := JSON.stringify(report, "\t")
+	if out_path.is_empty():
+		print(text)
+		return
+	var file := FileAccess.open(out_path, FileAccess.WRITE)
+	if file:
+		file.store_string(text)
+	else:
+		push_error("%s: can't write %s" % [tag, out_path])
@@ -24,41 +24,49 @@ var _timer: float = 0.0
 var _trail: Line2D
 var _trail_points: PackedVector2Array = PackedVector2Array()
 const MAX_TRAIL_POINTS = 5
+const TRAIL_FADE_TIME = 0.15
+
+var _built: bool = false
+var _has_scene_texture: bool = false
+var _hits: Array[Node2D] = []  # SpatialGrid query buffer, reused per shot
+var _batch := DamageBatch.new()  # Damage spec for multi-target hits
 
 @onready var sprite: Sprite2D = $Sprite2D
 
 
 func _ready() -> void:
-	if sprite and not sprite.texture:
-		_apply_themed_sprite()
+	# Pooled projectiles re-run _ready on every reuse (ProjectilePool calls
+	# request_ready), so node construction happens once and state per shot
+	if not _built:
+		_built = true
+		_build()
+	_spawn()
+
+
+func _build() -> void:
+	## One-time setup: child nodes that survive across pooled reuses.
+	_has_scene_texture = sprite != null and sprite.texture != null
 
 	_trail = Line2D.new()
 	_trail.width = 2.0
 	_trail.default_color = Color(1, 1, 1, 0.4)
 	_trail.z_index = -1
 	_trail.top_level = true
-	var grad := Gradient.new()
-	grad.set_color(0, Color(1, 1, 1, 0.0))
-	grad.set_color(1, Color(1, 1, 1, 0.4))
-	_trail.gradient = grad
 	add_child(_trail)
 
 
+func _spawn() -> void:
+	## Per-shot setup, runs after init() each time the projectile enters play.
+	if sprite and not _has_scene_texture:
+		_apply_themed_sprite()
+	if _trail:
+		_trail_points.clear()
+		_trail.points = _trail_points
+		_trail.gradient = ProjectilePool.get_trail_gradient(damage_type)
+
+
 func _apply_themed_sprite() -> void:
-	match damage_type:
-		Enums.DamageType.HYDRAULIC:
-			sprite.texture = EntitySprites.create_ice_shard()
-		Enums.DamageType.KINETIC:
-			sprite.texture = EntitySprites.create_cannonball()
-		_:
-			var color := Color("#F0D0D8")
-			if damage_type == Enums.DamageType.CHEMICAL:
-				color = Color("#E08040")
-			elif damage_type == Enums.DamageType.SONIC:
-				color = Color("#80E060")
-			elif damage_type == Enums.DamageType.ELECTRIC:
-				color = Color("#E0E060")
-			sprite.texture = EntitySprites.create_projectile_streak(color)
+	sprite.texture = ProjectilePool.get_projectile_texture(damage_type)
 
 
 func init(
@@ -79,30 +87,22 @@ func init(
 	crit_chance = p_crit_chance
 	crit_multiplier = p_crit_mult
 	on_hit_effects = p_effects
+	_timer = 0.0
 	_has_target = is_instance_valid(target)
 	if _has_target:
 		_direction = (target.global_position - global_position).normalized()
 
-	if _trail:
-		var tc := ThemeManager.get_damage_type_color(damage_type)
-		_trail.default_color = Color(tc, 0.4)
-		var g := Gradient.new()
-		g.set_color(0, Color(tc, 0.0))
-		g.set_color(1, Color(tc, 0.4))
-		_trail.gradient = g
-
 
 func _process(delta: float) -> void:
 	if _trail:
 		_trail_points.append(global_position)
 		if _trail_points.size() > MAX_TRAIL_POINTS:
-			_trail_points = _trail_points.slice(_trail_points.size() - MAX_TRAIL_POINTS)
+			_trail_points.remove_at(0)
 		_trail.points = _trail_points
 
 	_timer += delta
 	if _timer >= lifetime:
-		_fade_trail()
-		queue_free()
+		_despawn()
 		return
 
 	# Track toward target if still alive
@@ -125,8 +125,7 @@ func _hit_target(hit_enemy: Node2D) -> void:
 	pierce_remaining -= 1
 	if pierce_remaining <= 0:
 		_spawn_impact_particles()
-		_fade_trail()
-		queue_free()
+		_despawn()
 
 
 func _apply_damage_to(enemy: Node2D) -> void:
@@ -162,37 +161,50 @@ func _apply_damage_to(enemy: Node2D) -> void:
 
 func _apply_aoe_damage(center: Vector2) -> void:
 	var radius_px := aoe_radius * 32.0
-	var enemies_nearby := SpatialGrid.get_enemies_in_radius(center, radius_px)
-	for enemy in enemies_nearby:
-		_apply_damage_to(enemy)
+	var count := SpatialGrid.query_radius(center, radius_px, _hits)
+	_apply_damage_to_hits(count)
+
+
+func _prepare_batch() -> DamageBatch:
+	## This shot's damage spec, with no per-target scaling.
+	_batch.base_damage = damage
+	_batch.damage_type = damage_type
+	_batch.crit_chance = crit_chance
+	_batch.crit_multiplier = crit_multiplier
+	_batch.on_hit_effects = on_hit_effects
+	_batch.source_tower = source_tower
+	_batch.damage_scale.clear()
+	return _batch
+
+
+func _apply_damage_to_hits(count: int) -> void:
+	## One batched hit on _hits[0..count).
+	DamageCalculator.apply_batch(_prepare_batch(), _hits, count)
 
 
 func _spawn_impact_particles() -> void:
-	var color := ThemeManager.get_damage_type_color(damage_type)
-	for i in randi_range(2, 4):
-		var shard := VFXPool.acquire_rect()
-		shard.size = Vector2(2, 2)
-		shard.color = color
-		shard.global_position = global_position + Vector2(-1, -1)
-		shard.z_index = 50
-		get_tree().current_scene.add_child(shard)
-		var angle := randf() * TAU
-		var end_pos := shard.global_position + Vector2(cos(angle), sin(angle)) * randf_range(6.0, 14.0)
-		var tween := shard.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(shard, "global_position", end_pos, 0.25).set_ease(Tween.EASE_OUT)
-		tween.tween_property(shard, "modulate:a", 0.0, 0.25)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(shard))
+	VFXPool.spawn_burst(global_position, randi_range(2, 4),
+		ThemeManager.get_damage_type_color(damage_type), 6.0, 14.0, 0.25)
+
+
+func _despawn() -> void:
+	## End of the shot: leave a fading trail behind and return to the pool.
+	_fade_trail()
+	ProjectilePool.release(self)
 
 
 func _fade_trail() -> void:
-	if not _trail:
+	if not _trail or _trail_points.size() < 2:
 		return
-	var trail_ref := _trail
-	_trail = null
-	trail_ref.top_level = true
-	remove_child(trail_ref)
-	get_tree().current_scene.add_child(trail_ref)
-	var tween := trail_ref.create_tween()
-	tween.tween_property(trail_ref, "modulate:a", 0.0, 0.15)
-	tween.tween_callback(trail_ref.queue_free)
+	# The trail node stays with the pooled projectile; a pooled line fades out
+	var ghost := ProjectilePool.acquire_line()
+	ghost.width = _trail.width
+	ghost.gradient = _trail.gradient
+	ghost.z_index = _trail.z_index
+	ghost.points = _trail_points
+	_trail_points.clear()
+	_trail.points = _trail_points
+	get_tree().current_scene.add_child(ghost)
+	var tween := ghost.create_tween()
+	tween.tween_property(ghost, "modulate:a", 0.0, TRAIL_FADE_TIME)
+	tween.tween_callback(ProjectilePool.release_line.bind(ghost))
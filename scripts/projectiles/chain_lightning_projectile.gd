@@ -18,13 +18,16 @@ var _fade_elapsed: float = 0.0
 var _chain_done: bool = false
 
 
-func _ready() -> void:
+func _build() -> void:
 	# Hide the default sprite and skip trail
 	if sprite:
 		sprite.visible = false
-	if _trail:
-		_trail.queue_free()
-		_trail = null
+
+
+func _spawn() -> void:
+	_fade_elapsed = 0.0
+	_chain_done = false
+	_bolts.clear()
 
 	# Execute chain immediately on spawn
 	_execute_chain()
@@ -35,11 +38,11 @@ func _execute_chain() -> void:
 	var chain_falloff: float = 0.5
 
 	if is_instance_valid(source_tower) and source_tower.weapon:
-		chain_targets_count = source_tower.weapon.chain_targets
+		chain_targets_count = source_tower.weapon.final_chain_targets
 		chain_falloff = source_tower.weapon.chain_damage_falloff
 
 	if not is_instance_valid(target):
-		queue_free()
+		_despawn()
 		return
 
 	# Track hit enemies to avoid double-hits
@@ -53,89 +56,63 @@ func _execute_chain() -> void:
 	hit_set[target.get_instance_id()] = true
 
 	# -- Chain hops --
+	# Hop targets are collected first (damage doesn't affect the search),
+	# then resolved as one batch with the falloff as per-target scale
+	var batch := _prepare_batch()
 	var current_pos: Vector2 = target.global_position
-	var current_damage: float = damage
+	var falloff: float = 1.0
 	var hop_alpha: float = 1.0
+	var hops := 0
 
 	for i in chain_targets_count:
-		current_damage *= chain_falloff
+		falloff *= chain_falloff
 		hop_alpha *= HOP_ALPHA_DECAY
 
 		var next_target := _find_nearest_unhit(current_pos, hit_set)
 		if not next_target:
 			break
 
-		# Apply reduced damage
-		if next_target is BaseEnemy:
-			var e := next_target as BaseEnemy
-			if e.health:
-				if is_instance_valid(source_tower):
-					e.last_hit_by = source_tower
-				var resists: Dictionary = e.resistances.get_all() if e.resistances else {}
-				var vuln_mod := e.get_vulnerability_modifier()
-				if e.status_effects:
-					vuln_mod *= DamageCalculator.get_status_synergy_mult(damage_type, e.status_effects)
-				var armor_shred := e.get_armor_shred()
-				e.health.take_damage(current_damage, damage_type, resists, vuln_mod, crit_chance, crit_multiplier, armor_shred)
-
-		_apply_effects_to(next_target)
+		if hops < _hits.size():
+			_hits[hops] = next_target
+		else:
+			_hits.append(next_target)
+		batch.damage_scale.append(falloff)
+		hops += 1
 		_spawn_bolt(current_pos, next_target.global_position, hop_alpha)
 		_spawn_spark(next_target.global_position)
 
 		hit_set[next_target.get_instance_id()] = true
 		current_pos = next_target.global_position
 
+	DamageCalculator.apply_batch(batch, _hits, hops)
 	_chain_done = true
 
 
 func _find_nearest_unhit(from_pos: Vector2, hit_set: Dictionary) -> Node2D:
-	var best: Node2D = null
-	var best_dist := CHAIN_RADIUS + 1.0
-
-	for node in SpatialGrid.get_enemies_in_radius(from_pos, CHAIN_RADIUS):
-		if not node is BaseEnemy:
-			continue
-		var enemy: BaseEnemy = node as BaseEnemy
-		if hit_set.has(enemy.get_instance_id()):
-			continue
-		if not enemy.health or enemy.health.is_dead:
-			continue
-		var dist := from_pos.distance_to(enemy.global_position)
-		if dist < best_dist:
-			best_dist = dist
-			best = enemy
-
-	return best
-
-
-func _apply_effects_to(enemy: Node2D) -> void:
-	if enemy is BaseEnemy:
-		var e := enemy as BaseEnemy
-		if e.status_effects:
-			for effect in on_hit_effects:
-				e.status_effects.apply_effect(effect)
-		return
-	var effect_mgr := enemy.get_node_or_null("StatusEffectManager") as StatusEffectManager
-	if effect_mgr:
-		for effect in on_hit_effects:
-			effect_mgr.apply_effect(effect)
+	var node := SpatialGrid.query_nearest_unhit(from_pos, CHAIN_RADIUS, hit_set)
+	while node:
+		var enemy := node as BaseEnemy
+		if enemy and enemy.health and not enemy.health.is_dead:
+			return enemy
+		# Not a live enemy — exclude it and look again
+		hit_set[node.get_instance_id()] = true
+		node = SpatialGrid.query_nearest_unhit(from_pos, CHAIN_RADIUS, hit_set)
+	return null
 
 
 func _spawn_bolt(from: Vector2, to: Vector2, alpha: float) -> void:
-	var bolt := Line2D.new()
+	var bolt := ProjectilePool.acquire_line()
 	bolt.width = BOLT_WIDTH
 	bolt.default_color = Color(BOLT_COLOR, alpha)
 	bolt.z_index = 25
-	bolt.top_level = true
 
 	bolt.points = _build_jagged_points(from, to)
 
 	# Glow layer (slightly wider, dimmer)
-	var glow := Line2D.new()
+	var glow := ProjectilePool.acquire_line()
 	glow.width = BOLT_WIDTH + 2.0
 	glow.default_color = Color("#E0E060", alpha * 0.3)
 	glow.z_index = 24
-	glow.top_level = true
 	glow.points = bolt.points
 
 	get_tree().current_scene.add_child(glow)
@@ -162,21 +139,7 @@ func _build_jagged_points(from: Vector2, to: Vector2) -> PackedVector2Array:
 
 
 func _spawn_spark(pos: Vector2) -> void:
-	for i in randi_range(2, 3):
-		var spark := VFXPool.acquire_rect()
-		spark.size = Vector2(2, 2)
-		spark.color = SPARK_COLOR
-		spark.global_position = pos + Vector2(-1, -1)
-		spark.z_index = 50
-		get_tree().current_scene.add_child(spark)
-
-		var angle := randf() * TAU
-		var end_pos := spark.global_position + Vector2(cos(angle), sin(angle)) * randf_range(4.0, 10.0)
-		var tween := spark.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(spark, "global_position", end_pos, 0.2).set_ease(Tween.EASE_OUT)
-		tween.tween_property(spark, "modulate:a", 0.0, 0.2)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(spark))
+	VFXPool.spawn_burst(pos, randi_range(2, 3), SPARK_COLOR, 4.0, 10.0, 0.2)
 
 
 func _process(delta: float) -> void:
@@ -188,10 +151,9 @@ func _process(delta: float) -> void:
 
 	if alpha <= 0.0:
 		for bolt in _bolts:
-			if is_instance_valid(bolt):
-				bolt.queue_free()
+			ProjectilePool.release_line(bolt)
 		_bolts.clear()
-		queue_free()
+		_despawn()
 		return
 
 	for bolt in _bolts:
@@ -25,18 +25,9 @@ var _has_dealt_damage: bool = false
 var _shimmer: CPUParticles2D
 
 
-func _ready() -> void:
-	_start_pos = global_position
-	if is_instance_valid(target):
-		_end_pos = target.global_position
-	else:
-		_end_pos = global_position + _direction * 150.0
-
+func _build() -> void:
 	if sprite:
 		sprite.visible = false
-	if _trail:
-		_trail.queue_free()
-		_trail = null
 
 	# Glow beam (wider, orange/red, behind core)
 	_glow = Line2D.new()
@@ -48,7 +39,6 @@ func _ready() -> void:
 	glow_grad.set_color(0, COLOR_GLOW)
 	glow_grad.set_color(1, COLOR_GLOW_EDGE)
 	_glow.gradient = glow_grad
-	_glow.points = PackedVector2Array([_start_pos, _start_pos])
 	add_child(_glow)
 
 	# Core beam (narrow, bright white-yellow)
@@ -57,7 +47,6 @@ func _ready() -> void:
 	_core.z_index = 20
 	_core.width = 2.0
 	_core.default_color = COLOR_CORE
-	_core.points = PackedVector2Array([_start_pos, _start_pos])
 	add_child(_core)
 
 	# Heat shimmer particles rising from beam
@@ -69,7 +58,6 @@ func _ready() -> void:
 	_shimmer.lifetime = 0.4
 	_shimmer.one_shot = false
 	_shimmer.explosiveness = 0.2
-	_shimmer.global_position = _start_pos
 	_shimmer.direction = Vector2(0, -1)
 	_shimmer.spread = 35.0
 	_shimmer.initial_velocity_min = 10.0
@@ -81,6 +69,25 @@ func _ready() -> void:
 	add_child(_shimmer)
 
 
+func _spawn() -> void:
+	_start_pos = global_position
+	if is_instance_valid(target):
+		_end_pos = target.global_position
+	else:
+		_end_pos = global_position + _direction * 150.0
+
+	_phase = 0
+	_phase_timer = 0.0
+	_has_dealt_damage = false
+
+	_glow.points = PackedVector2Array([_start_pos, _start_pos])
+	_glow.modulate.a = 1.0
+	_core.points = PackedVector2Array([_start_pos, _start_pos])
+	_core.modulate.a = 1.0
+	_shimmer.global_position = _start_pos
+	_shimmer.restart()
+
+
 func _apply_themed_sprite() -> void:
 	pass
 
@@ -115,7 +122,7 @@ func _process(delta: float) -> void:
 			_core.modulate.a = 1.0 - t
 			_glow.modulate.a = 1.0 - t
 			if t >= 1.0:
-				queue_free()
+				_despawn()
 
 
 func _deal_line_damage() -> void:
@@ -123,40 +130,13 @@ func _deal_line_damage() -> void:
 		return
 	_has_dealt_damage = true
 
-	var line_dir := (_end_pos - _start_pos)
-	var line_len := line_dir.length()
-	if line_len < 1.0:
+	if _start_pos.distance_to(_end_pos) < 1.0:
 		return
-	var line_norm := line_dir / line_len
-
-	var query_center := (_start_pos + _end_pos) * 0.5
-	var query_radius := line_len * 0.5 + LINE_HIT_WIDTH
-	var enemies := SpatialGrid.get_enemies_in_radius(query_center, query_radius)
-	for enemy in enemies:
-		if not enemy is Node2D:
-			continue
-		var to_enemy: Vector2 = enemy.global_position - _start_pos
-		var proj: float = to_enemy.dot(line_norm)
-		if proj < -4.0 or proj > line_len + 4.0:
-			continue
-		var closest := _start_pos + line_norm * clampf(proj, 0.0, line_len)
-		var perp_dist: float = enemy.global_position.distance_to(closest)
-		if perp_dist <= LINE_HIT_WIDTH:
-			_apply_damage_to(enemy)
+
+	# Capsule around the segment, cut 4px past either end
+	var count := SpatialGrid.query_capsule(_start_pos, _end_pos, LINE_HIT_WIDTH, _hits, 4.0)
+	_apply_damage_to_hits(count)
 
 
 func _spawn_ember_burst() -> void:
-	for i in randi_range(4, 6):
-		var ember := VFXPool.acquire_rect()
-		ember.size = Vector2(2, 2)
-		ember.color = COLOR_EMBER
-		ember.global_position = _end_pos + Vector2(-1, -1)
-		ember.z_index = 50
-		get_tree().current_scene.add_child(ember)
-		var angle := randf() * TAU
-		var end_pos := ember.global_position + Vector2(cos(angle), sin(angle)) * randf_range(5.0, 12.0)
-		var tween := ember.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(ember, "global_position", end_pos, 0.2).set_ease(Tween.EASE_OUT)
-		tween.tween_property(ember, "modulate:a", 0.0, 0.2)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(ember))
+	VFXPool.spawn_burst(_end_pos, randi_range(4, 6), COLOR_EMBER, 5.0, 12.0, 0.2)
@@ -24,18 +24,9 @@ var _has_dealt_damage: bool = false
 var _mist: CPUParticles2D
 
 
-func _ready() -> void:
-	_start_pos = global_position
-	if is_instance_valid(target):
-		_end_pos = target.global_position
-	else:
-		_end_pos = global_position + _direction * 150.0
-
+func _build() -> void:
 	if sprite:
 		sprite.visible = false
-	if _trail:
-		_trail.queue_free()
-		_trail = null
 
 	# Spray cone (wider, gradient orange)
 	_spray = Line2D.new()
@@ -50,7 +41,6 @@ func _ready() -> void:
 	spray_grad.set_color(0, COLOR_CORE)
 	spray_grad.set_color(1, COLOR_EDGE)
 	_spray.gradient = spray_grad
-	_spray.points = PackedVector2Array([_start_pos, _start_pos])
 	add_child(_spray)
 
 	# Core line (thin bright center inside the cone)
@@ -59,7 +49,6 @@ func _ready() -> void:
 	_core_line.z_index = 21
 	_core_line.width = 1.5
 	_core_line.default_color = COLOR_CORE
-	_core_line.points = PackedVector2Array([_start_pos, _start_pos])
 	add_child(_core_line)
 
 	# Mist particles drifting from spray path
@@ -71,8 +60,6 @@ func _ready() -> void:
 	_mist.lifetime = 0.35
 	_mist.one_shot = false
 	_mist.explosiveness = 0.3
-	_mist.global_position = _start_pos
-	_mist.direction = (_end_pos - _start_pos).normalized()
 	_mist.spread = 60.0
 	_mist.initial_velocity_min = 8.0
 	_mist.initial_velocity_max = 20.0
@@ -83,6 +70,26 @@ func _ready() -> void:
 	add_child(_mist)
 
 
+func _spawn() -> void:
+	_start_pos = global_position
+	if is_instance_valid(target):
+		_end_pos = target.global_position
+	else:
+		_end_pos = global_position + _direction * 150.0
+
+	_phase = 0
+	_phase_timer = 0.0
+	_has_dealt_damage = false
+
+	_spray.points = PackedVector2Array([_start_pos, _start_pos])
+	_spray.modulate.a = 1.0
+	_core_line.points = PackedVector2Array([_start_pos, _start_pos])
+	_core_line.modulate.a = 1.0
+	_mist.global_position = _start_pos
+	_mist.direction = (_end_pos - _start_pos).normalized()
+	_mist.restart()
+
+
 func _apply_themed_sprite() -> void:
 	pass
 
@@ -117,7 +124,7 @@ func _process(delta: float) -> void:
 			_spray.modulate.a = 1.0 - t
 			_core_line.modulate.a = 1.0 - t
 			if t >= 1.0:
-				queue_free()
+				_despawn()
 
 
 func _deal_line_damage() -> void:
@@ -125,40 +132,13 @@ func _deal_line_damage() -> void:
 		return
 	_has_dealt_damage = true
 
-	var line_dir := (_end_pos - _start_pos)
-	var line_len := line_dir.length()
-	if line_len < 1.0:
+	if _start_pos.distance_to(_end_pos) < 1.0:
 		return
-	var line_norm := line_dir / line_len
-
-	var query_center := (_start_pos + _end_pos) * 0.5
-	var query_radius := line_len * 0.5 + LINE_HIT_WIDTH
-	var enemies := SpatialGrid.get_enemies_in_radius(query_center, query_radius)
-	for enemy in enemies:
-		if not enemy is Node2D:
-			continue
-		var to_enemy: Vector2 = enemy.global_position - _start_pos
-		var proj: float = to_enemy.dot(line_norm)
-		if proj < -4.0 or proj > line_len + 4.0:
-			continue
-		var closest := _start_pos + line_norm * clampf(proj, 0.0, line_len)
-		var perp_dist: float = enemy.global_position.distance_to(closest)
-		if perp_dist <= LINE_HIT_WIDTH:
-			_apply_damage_to(enemy)
+
+	# Capsule around the segment, cut 4px past either end
+	var count := SpatialGrid.query_capsule(_start_pos, _end_pos, LINE_HIT_WIDTH, _hits, 4.0)
+	_apply_damage_to_hits(count)
 
 
 func _spawn_droplets() -> void:
-	for i in randi_range(3, 5):
-		var drop := VFXPool.acquire_rect()
-		drop.size = Vector2(2, 2)
-		drop.color = COLOR_DROP
-		drop.global_position = _end_pos + Vector2(-1, -1)
-		drop.z_index = 50
-		get_tree().current_scene.add_child(drop)
-		var angle := randf() * TAU
-		var end_pos := drop.global_position + Vector2(cos(angle), sin(angle)) * randf_range(5.0, 12.0)
-		var tween := drop.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(drop, "global_position", end_pos, 0.2).set_ease(Tween.EASE_OUT)
-		tween.tween_property(drop, "modulate:a", 0.0, 0.2)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(drop))
+	VFXPool.spawn_burst(_end_pos, randi_range(3, 5), COLOR_DROP, 5.0, 12.0, 0.2)
@@ -30,13 +30,15 @@ var _screen_center: Vector2  # center in screen UV coords
 static var _sonic_shader: Shader
 
 
-func _ready() -> void:
+func _build() -> void:
 	# Hide sprite and skip trail (same pattern as chain lightning)
 	if sprite:
 		sprite.visible = false
-	if _trail:
-		_trail.queue_free()
-		_trail = null
+
+
+func _spawn() -> void:
+	_elapsed = 0.0
+	_current_radius = 0.0
 
 	# Capture origin (muzzle position = our spawn point)
 	_origin = Vector2.ZERO  # _draw() uses local coords
@@ -71,42 +73,30 @@ func _setup_distortion_overlay() -> void:
 	if not _sonic_shader:
 		_sonic_shader = load("res://assets/shaders/sonic_wave.gdshader")
 
-	_shader_mat = ShaderMaterial.new()
-	_shader_mat.shader = _sonic_shader
+	# Overlay and material are kept with the pooled projectile and reused
+	if not is_instance_valid(_overlay):
+		_shader_mat = ShaderMaterial.new()
+		_shader_mat.shader = _sonic_shader
+		_shader_mat.set_shader_parameter("wave_width", SHADER_WAVE_WIDTH)
+		_shader_mat.set_shader_parameter("ring_freq", SHADER_RING_FREQ)
+
+		_overlay = ColorRect.new()
+		_overlay.material = _shader_mat
+		_overlay.mouse_filter = Control.MOUSE_FILTER_IGNORE
+		_overlay.z_index = 100
+		_overlay.top_level = true
+		_overlay.position = Vector2.ZERO
+
 	_shader_mat.set_shader_parameter("center", _screen_center)
 	_shader_mat.set_shader_parameter("radius", 0.0)
 	_shader_mat.set_shader_parameter("strength", SHADER_STRENGTH_START)
-	_shader_mat.set_shader_parameter("wave_width", SHADER_WAVE_WIDTH)
-	_shader_mat.set_shader_parameter("ring_freq", SHADER_RING_FREQ)
-
-	_overlay = ColorRect.new()
-	_overlay.material = _shader_mat
-	_overlay.mouse_filter = Control.MOUSE_FILTER_IGNORE
-	_overlay.z_index = 100
 	_overlay.size = get_viewport_rect().size
-	_overlay.top_level = true
-	_overlay.position = Vector2.ZERO
 
 	get_tree().current_scene.add_child(_overlay)
 
 
 func _spawn_pressure_particles() -> void:
-	for i in randi_range(6, 8):
-		var spec := VFXPool.acquire_rect()
-		spec.size = Vector2(2, 2)
-		spec.color = PARTICLE_COLOR
-		spec.global_position = global_position + Vector2(-1, -1)
-		spec.z_index = 50
-		get_tree().current_scene.add_child(spec)
-
-		var angle := randf() * TAU
-		var dist := randf_range(40.0, 80.0)
-		var end_pos := spec.global_position + Vector2(cos(angle), sin(angle)) * dist
-		var tween := spec.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(spec, "global_position", end_pos, 0.3).set_ease(Tween.EASE_OUT)
-		tween.tween_property(spec, "modulate:a", 0.0, 0.3)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(spec))
+	VFXPool.spawn_burst(global_position, randi_range(6, 8), PARTICLE_COLOR, 40.0, 80.0, 0.3)
 
 
 func _process(delta: float) -> void:
@@ -115,7 +105,7 @@ func _process(delta: float) -> void:
 	_current_radius = minf(_elapsed * EXPAND_SPEED, MAX_RADIUS)
 
 	# Update shader distortion
-	if _shader_mat:
+	if is_instance_valid(_overlay) and _overlay.is_inside_tree():
 		var viewport := get_viewport()
 		if viewport:
 			var vp_size := viewport.get_visible_rect().size
@@ -131,8 +121,7 @@ func _process(delta: float) -> void:
 
 	# Clean up after effect duration
 	if _elapsed >= EFFECT_DURATION:
-		_cleanup()
-		queue_free()
+		_despawn()
 
 
 func _draw() -> void:
@@ -158,8 +147,13 @@ func _draw() -> void:
 		draw_arc(_origin, ring_radius, 0.0, TAU, 32, color, ARC_WIDTH)
 
 
-func _cleanup() -> void:
-	if is_instance_valid(_overlay):
-		_overlay.queue_free()
-		_overlay = null
-	_shader_mat = null
+func _despawn() -> void:
+	if is_instance_valid(_overlay) and _overlay.get_parent():
+		_overlay.get_parent().remove_child(_overlay)
+	super()
+
+
+func _notification(what: int) -> void:
+	# A detached overlay is not freed with the scene — free it with us
+	if what == NOTIFICATION_PREDELETE and is_instance_valid(_overlay) and not _overlay.get_parent():
+		_overlay.free()
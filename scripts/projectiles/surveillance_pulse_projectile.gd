@@ -23,13 +23,14 @@ var _current_radius: float = 0.0
 var _origin: Vector2
 
 
-func _ready() -> void:
+func _build() -> void:
 	if sprite:
 		sprite.visible = false
-	if _trail:
-		_trail.queue_free()
-		_trail = null
 
+
+func _spawn() -> void:
+	_elapsed = 0.0
+	_current_radius = 0.0
 	_origin = Vector2.ZERO  # _draw() uses local coords
 
 	# Apply 360° AoE damage immediately
@@ -44,24 +45,15 @@ func _apply_themed_sprite() -> void:
 
 
 func _spawn_data_particles() -> void:
+	if not VFXPool.enabled:
+		return
+	var from := global_position + Vector2(-1, -1)
 	for i in randi_range(8, 12):
-		var spec := VFXPool.acquire_rect()
 		# Rectangular "data bit" specs — 1x1 or 2x1
-		spec.size = Vector2(2, 1) if randf() > 0.5 else Vector2(1, 1)
-		spec.color = PARTICLE_COLOR
-		spec.global_position = global_position + Vector2(-1, -1)
-		spec.z_index = 50
-		get_tree().current_scene.add_child(spec)
-
+		var size := Vector2(2, 1) if randf() > 0.5 else Vector2(1, 1)
 		var angle := randf() * TAU
-		var dist := randf_range(30.0, 70.0)
-		var end_pos := spec.global_position + Vector2(cos(angle), sin(angle)) * dist
-		var dur := randf_range(0.5, 0.8)
-		var tween := spec.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(spec, "global_position", end_pos, dur).set_ease(Tween.EASE_OUT)
-		tween.tween_property(spec, "modulate:a", 0.0, dur)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(spec))
+		var to := from + Vector2(cos(angle), sin(angle)) * randf_range(30.0, 70.0)
+		VFXPool.spawn_particle(from, to, randf_range(0.5, 0.8), size, PARTICLE_COLOR)
 
 
 func _process(delta: float) -> void:
@@ -72,7 +64,7 @@ func _process(delta: float) -> void:
 	queue_redraw()
 
 	if _elapsed >= EFFECT_DURATION:
-		queue_free()
+		_despawn()
 
 
 func _draw() -> void:
@@ -13,7 +13,12 @@ var _base_scale: Vector2
 var _cloud_scene: PackedScene  # Not used — cloud is created in code
 
 
-func _ready() -> void:
+func _build() -> void:
+	# No trail — the arc and tumbling canister carry the motion
+	pass
+
+
+func _spawn() -> void:
 	# Capture target position at fire time (ground-targeted, not tracking)
 	if is_instance_valid(target):
 		_end_pos = target.global_position
@@ -23,10 +28,14 @@ func _ready() -> void:
 
 	_start_pos = global_position
 	_base_scale = Vector2.ONE
+	_flight_timer = 0.0
 
 	# Override sprite to show a grenade canister
-	if sprite and not sprite.texture:
-		_apply_themed_sprite()
+	if sprite:
+		sprite.scale = _base_scale
+		sprite.rotation = 0.0
+		if not sprite.texture:
+			_apply_themed_sprite()
 
 
 func _apply_themed_sprite() -> void:
@@ -37,8 +46,7 @@ func _process(delta: float) -> void:
 	# Skip base class tracking — we do our own arc movement
 	_timer += delta
 	if _timer >= lifetime:
-		_fade_trail()
-		queue_free()
+		_despawn()
 		return
 
 	_flight_timer += delta
@@ -90,5 +98,4 @@ func _on_impact() -> void:
 		get_tree().current_scene.add_child(cloud)
 
 	SignalBus.chemical_impact.emit(_end_pos, 1.0)
-	_fade_trail()
-	queue_free()
+	_despawn()
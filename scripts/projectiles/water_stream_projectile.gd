@@ -23,23 +23,11 @@ var _has_dealt_damage: bool = false
 var _spray: CPUParticles2D
 
 
-func _ready() -> void:
-	# Capture positions
-	_start_pos = global_position
-	if is_instance_valid(target):
-		_end_pos = target.global_position
-	else:
-		_end_pos = global_position + _direction * 150.0
-
-	# Hide the bullet sprite — the Line2D IS the visual
+func _build() -> void:
+	# Hide the bullet sprite — the Line2D IS the visual (and no base trail)
 	if sprite:
 		sprite.visible = false
 
-	# Don't create base trail
-	if _trail:
-		_trail.queue_free()
-		_trail = null
-
 	# Build the stream line
 	_stream = Line2D.new()
 	_stream.top_level = true
@@ -53,7 +41,6 @@ func _ready() -> void:
 	grad.set_color(0, COLOR_CORE)
 	grad.set_color(1, COLOR_EDGE)
 	_stream.gradient = grad
-	_stream.points = PackedVector2Array([_start_pos, _start_pos])
 	add_child(_stream)
 
 	# Spray particles along the stream
@@ -65,8 +52,6 @@ func _ready() -> void:
 	_spray.lifetime = 0.3
 	_spray.one_shot = false
 	_spray.explosiveness = 0.3
-	_spray.global_position = _start_pos
-	_spray.direction = (_end_pos - _start_pos).normalized()
 	_spray.spread = 25.0
 	_spray.initial_velocity_min = 20.0
 	_spray.initial_velocity_max = 50.0
@@ -77,6 +62,25 @@ func _ready() -> void:
 	add_child(_spray)
 
 
+func _spawn() -> void:
+	# Capture positions
+	_start_pos = global_position
+	if is_instance_valid(target):
+		_end_pos = target.global_position
+	else:
+		_end_pos = global_position + _direction * 150.0
+
+	_phase = 0
+	_phase_timer = 0.0
+	_has_dealt_damage = false
+
+	_stream.points = PackedVector2Array([_start_pos, _start_pos])
+	_stream.modulate.a = 1.0
+	_spray.global_position = _start_pos
+	_spray.direction = (_end_pos - _start_pos).normalized()
+	_spray.restart()
+
+
 func _apply_themed_sprite() -> void:
 	# No sprite needed — stream is the visual
 	pass
@@ -110,7 +114,7 @@ func _process(delta: float) -> void:
 			var t := clampf(_phase_timer / FADE_DURATION, 0.0, 1.0)
 			_stream.modulate.a = 1.0 - t
 			if t >= 1.0:
-				queue_free()
+				_despawn()
 
 
 func _deal_line_damage() -> void:
@@ -118,43 +122,13 @@ func _deal_line_damage() -> void:
 		return
 	_has_dealt_damage = true
 
-	var line_dir := (_end_pos - _start_pos)
-	var line_len := line_dir.length()
-	if line_len < 1.0:
+	if _start_pos.distance_to(_end_pos) < 1.0:
 		return
-	var line_norm := line_dir / line_len
-
-	var query_center := (_start_pos + _end_pos) * 0.5
-	var query_radius := line_len * 0.5 + LINE_HIT_WIDTH
-	var enemies := SpatialGrid.get_enemies_in_radius(query_center, query_radius)
-	for enemy in enemies:
-		if not enemy is Node2D:
-			continue
-		# Project enemy position onto the line segment
-		var to_enemy: Vector2 = enemy.global_position - _start_pos
-		var proj: float = to_enemy.dot(line_norm)
-		# Must be within the line segment (with small tolerance)
-		if proj < -4.0 or proj > line_len + 4.0:
-			continue
-		# Perpendicular distance
-		var closest := _start_pos + line_norm * clampf(proj, 0.0, line_len)
-		var perp_dist: float = enemy.global_position.distance_to(closest)
-		if perp_dist <= LINE_HIT_WIDTH:
-			_apply_damage_to(enemy)
+
+	# Capsule around the segment, cut 4px past either end
+	var count := SpatialGrid.query_capsule(_start_pos, _end_pos, LINE_HIT_WIDTH, _hits, 4.0)
+	_apply_damage_to_hits(count)
 
 
 func _spawn_splash_particles() -> void:
-	for i in randi_range(3, 5):
-		var drop := VFXPool.acquire_rect()
-		drop.size = Vector2(2, 2)
-		drop.color = COLOR_SPLASH
-		drop.global_position = _end_pos + Vector2(-1, -1)
-		drop.z_index = 50
-		get_tree().current_scene.add_child(drop)
-		var angle := randf() * TAU
-		var end_pos := drop.global_position + Vector2(cos(angle), sin(angle)) * randf_range(5.0, 12.0)
-		var tween := drop.create_tween()
-		tween.set_parallel(true)
-		tween.tween_property(drop, "global_position", end_pos, 0.2).set_ease(Tween.EASE_OUT)
-		tween.tween_property(drop, "modulate:a", 0.0, 0.2)
-		tween.chain().tween_callback(VFXPool.release_rect.bind(drop))
+	VFXPool.spawn_burst(_end_pos, randi_range(3, 5), COLOR_SPLASH, 5.0, 12.0, 0.2)
@@ -0,0 +1,22 @@
+class_name MapData
+extends Resource
+## A painted level, baked offline by tools/bake_map.py. MapBuilder assigns
+## the TileSet and writes cells straight from these bytes instead of
+## building the atlas and rolling tile hashes at level start.
+
+## Isometric TileSet over the baked tile atlas (buildable/walkable layers).
+@export var tile_set: TileSet
+## Playable area in tiles.
+@export var size: Vector2i
+## Atlas column per cell, row-major (y * size.x + x). All tiles sit in atlas row 0.
+@export var cells: PackedByteArray = PackedByteArray()
+@export var spawn_tiles: Array[Vector2i] = []
+@export var goal_tiles: Array[Vector2i] = []
+## Interior NOBUILD tiles placed by the obstacle roll.
+@export var obstacle_tiles: Array[Vector2i] = []
+## Hash of map_builder.gd and the tile PNGs at bake time (bake_map.py --check).
+@export var source_hash: String
+
+
+func is_valid_for(map_size: Vector2i) -> bool:
+	return tile_set != null and size == map_size and cells.size() == size.x * size.y
@@ -9,7 +9,6 @@ extends Node2D
 @onready var weapon: WeaponComponent = $WeaponComponent
 @onready var targeting: TargetingComponent = $TargetingComponent
 @onready var upgrade: UpgradeComponent = $UpgradeComponent
-@onready var range_area: Area2D = $RangeArea
 @onready var sprite: Sprite2D = $Sprite2D
 @onready var turret_sprite: Sprite2D = $TurretSprite
 @onready var muzzle_point: Marker2D = $MuzzlePoint
@@ -18,6 +17,8 @@ extends Node2D
 var _tile_pos: Vector2i
 var kill_count: int = 0
 var _show_range: bool = false
+var _projectile_container: Node
+var _range_px: float = 0.0  # Attack radius in pixels, kept in sync with upgrades
 
 ## Turret textures for 8 directions: S, SW, W, NW, N, NE, E, SE
 var _turret_textures: Array[Texture2D] = []
@@ -34,7 +35,6 @@ const TOWER_SCALE = 0.75
 const BADGE_BRONZE = Color("#B08040")
 const BADGE_SILVER = Color("#A0A8B8")
 const BADGE_GOLD = Color("#FFD060")
-const BADGE_SHIMMER_HI = Color("#FFF0A0")
 const BADGE_OUTLINE = Color("#1A1A1E")
 const CHEVRON_W = 8.0   # half-width of chevron V
 const CHEVRON_H = 5.0   # depth of V
@@ -42,20 +42,19 @@ const CHEVRON_SPACING = 6.0
 var _badge_node: Node2D
 var _total_upgrades: int = 0
 
-# Synergy glow
-var _synergy_node: Node2D
+# Synergy glow, badge shimmer and taser bolts are animated by AmbientAnimator
+var _ambient: AmbientAnimator
 var _synergy_color: Color = Color.TRANSPARENT
-var _synergy_pulse: float = 0.0
+var _synergy_damage_mult: float = 1.0
 var _synergy_rate_mult: float = 1.0
 
-# Taser tower-to-tower electric links
-var _taser_links: Dictionary = {}  # neighbor instance_id -> Line2D
-const TASER_LINK_RANGE = 3  # Chebyshev tile distance
-const TASER_LINK_COLOR = Color("#E0E060", 0.3)
-const TASER_LINK_JITTER = 4.0
-const TASER_LINK_SEGMENTS = 4
-const TASER_LINK_FLICKER_INTERVAL = 0.15
-var _link_flicker_timer: float = 0.0
+## Final stats indexed by Enums.TowerStat (UpgradeRegistry.compile_stats).
+## Rebuilt only on upgrade or synergy change; stats_version bumps on every
+## rebuild and on suppression, so readers can cache against it.
+var stats: PackedFloat32Array = PackedFloat32Array()
+var stats_version: int = 0
+
+# Taser tower-to-tower electric links (to taser neighbors in SynergyManager's index)
 var _is_taser: bool = false
 
 # Camera zone suppression (news helicopter ability)
@@ -99,31 +98,20 @@ func _ready() -> void:
 	add_child(_badge_node)
 	_badge_node.draw.connect(_draw_rank_badge)
 
-	_synergy_node = Node2D.new()
-	_synergy_node.z_index = 2  # Above tower sprites so diamond is visible
-	add_child(_synergy_node)
-	_synergy_node.draw.connect(_draw_synergy_glow)
+	_ambient = get_tree().get_first_node_in_group("ambient_animator") as AmbientAnimator
 
-	range_area.area_entered.connect(_on_enemy_entered_range)
-	range_area.area_exited.connect(_on_enemy_exited_range)
 	attack_timer.timeout.connect(_on_attack_timer)
 	upgrade.upgraded.connect(_on_upgraded)
 	SignalBus.enemy_killed.connect(_on_enemy_killed)
 	SignalBus.tower_selected.connect(_on_tower_selected)
 	SignalBus.tower_deselected.connect(_on_tower_deselected)
-	SynergyManager.synergy_changed.connect(_on_synergy_changed)
 
 	# Surveillance Hub: +1 bonus gold per enemy killed within range
 	if tower_data and tower_data.tower_id == "surveillance_hub":
 		SignalBus.enemy_killed.connect(_on_surveillance_kill_bonus)
 
-	# Taser tower-to-tower electric links
+	# Taser tower-to-tower electric links (refreshed by SynergyManager)
 	_is_taser = tower_data and tower_data.tower_id == "taser_grid"
-	if _is_taser:
-		SignalBus.tower_placed.connect(_on_taser_neighbor_changed)
-		SignalBus.tower_sold.connect(_on_taser_neighbor_sold)
-		# Defer initial link refresh so our tile_pos is set by the placer first
-		_refresh_taser_links.call_deferred()
 
 	# Tower body for camera zone detection (layer 6)
 	var tower_body := Area2D.new()
@@ -140,7 +128,6 @@ func _ready() -> void:
 	tower_body.add_child(body_shape)
 	add_child(tower_body)
 
-	set_process(false)  # Only enable when synergy glow or taser links are active
 	print("[TOWER] _ready DONE")
 
 
@@ -156,14 +143,11 @@ func _init_from_data() -> void:
 	weapon.chain_targets = tower_data.chain_targets
 	weapon.chain_damage_falloff = tower_data.chain_damage_falloff
 	weapon.on_hit_effects = tower_data.on_hit_effects
-	weapon._recalculate()
-
-	attack_timer.wait_time = 1.0 / tower_data.fire_rate
-	attack_timer.start()
 
 	targeting.can_target_flying = tower_data.can_target_flying
-	_update_range_shape(tower_data.base_range)
 	upgrade.init(tower_data)
+	_recompile_stats()
+	attack_timer.start()
 	_apply_theme_skin()
 
 
@@ -215,30 +199,14 @@ func _aim_at(target_pos: Vector2) -> void:
 	turret_sprite.texture = _turret_textures[idx]
 
 
-func _update_range_shape(range_val: float) -> void:
-	var collision := range_area.get_node_or_null("CollisionShape2D") as CollisionShape2D
-	if collision:
-		var shape := CircleShape2D.new()
-		shape.radius = range_val * 32.0
-		collision.shape = shape
-
-
-func _on_enemy_entered_range(area: Area2D) -> void:
-	var enemy := area.get_parent()
-	if enemy is BaseEnemy:
-		targeting.add_enemy(enemy)
-
-
-func _on_enemy_exited_range(area: Area2D) -> void:
-	var enemy := area.get_parent()
-	if enemy is BaseEnemy:
-		targeting.remove_enemy(enemy)
+func _update_range(range_val: float) -> void:
+	_range_px = range_val * 32.0
 
 
 func _on_attack_timer() -> void:
 	if is_suppressed():
 		return
-	var target := targeting.update_target(global_position, attack_timer.wait_time)
+	var target := targeting.update_target(global_position, _range_px)
 	if target:
 		_aim_at(target.global_position)
 		_fire_at(target)
@@ -258,7 +226,7 @@ func _fire_at(target: Node2D) -> void:
 				_spawn_crossfire_popup(target)
 
 	if weapon.projectile_scene:
-		var proj: Node2D = weapon.projectile_scene.instantiate()
+		var proj: Node2D = ProjectilePool.acquire(weapon.projectile_scene)
 		# Spawn from muzzle point if turret is active, otherwise tower center
 		if _turret_textures.size() == 8:
 			proj.global_position = muzzle_point.global_position
@@ -278,9 +246,10 @@ func _fire_at(target: Node2D) -> void:
 				weapon.final_crit_multiplier,
 				weapon.on_hit_effects,
 			)
-		var proj_container := get_tree().get_first_node_in_group("projectiles")
-		if proj_container:
-			proj_container.add_child(proj)
+		if not is_instance_valid(_projectile_container):
+			_projectile_container = get_tree().get_first_node_in_group("projectiles")
+		if _projectile_container:
+			_projectile_container.add_child(proj)
 		else:
 			get_parent().add_child(proj)
 
@@ -296,30 +265,16 @@ func _on_upgraded(path_index: int, tier: int) -> void:
 		_total_upgrades += t
 	_badge_node.queue_redraw()
 
-	# Enable processing for shimmer animation when fully maxed
-	if _is_fully_upgraded():
-		set_process(true)
-
-	weapon.apply_stat_modifiers(upgrade.active_modifiers)
+	# Maxed badge is drawn white and tinted by the shared shimmer
+	if _ambient and _is_fully_upgraded():
+		_ambient.set_badge_shimmer(_badge_node, true)
 
 	var combined_effects: Array[StatusEffectData] = []
 	combined_effects.append_array(tower_data.on_hit_effects)
 	combined_effects.append_array(upgrade.unlocked_effects)
 	weapon.on_hit_effects = combined_effects
 
-	_recalculate_attack_timer()
-
-	var final_range := tower_data.base_range
-	for mod in upgrade.active_modifiers:
-		if mod.stat_name == "base_range":
-			match mod.operation:
-				Enums.ModifierOp.ADD:
-					final_range += mod.value
-				Enums.ModifierOp.MULTIPLY:
-					final_range *= mod.value
-				Enums.ModifierOp.SET:
-					final_range = mod.value
-	_update_range_shape(final_range)
+	_recompile_stats()
 
 	# Tier 5 evo: swap turret sprites to evolved variant
 	if tier == 5:
@@ -343,25 +298,30 @@ func get_sell_value() -> int:
 	return int(upgrade.get_total_invested() * tower_data.sell_ratio)
 
 
-## Apply synergy fire rate multiplier to the attack timer.
-func apply_synergy_rate(rate_mult: float) -> void:
+## Called by SynergyManager when this tower's synergy multipliers change.
+func apply_synergy(damage_mult: float, rate_mult: float) -> void:
+	if damage_mult == _synergy_damage_mult and rate_mult == _synergy_rate_mult:
+		return
+	_synergy_damage_mult = damage_mult
 	_synergy_rate_mult = rate_mult
-	_recalculate_attack_timer()
+	_recompile_stats()
+
+
+func get_synergy_damage_mult() -> float:
+	return _synergy_damage_mult
+
 
+func get_synergy_rate_mult() -> float:
+	return _synergy_rate_mult
 
-func _recalculate_attack_timer() -> void:
-	var final_rate := tower_data.fire_rate
-	for mod in upgrade.active_modifiers:
-		if mod.stat_name == "fire_rate":
-			match mod.operation:
-				Enums.ModifierOp.ADD:
-					final_rate += mod.value
-				Enums.ModifierOp.MULTIPLY:
-					final_rate *= mod.value
-				Enums.ModifierOp.SET:
-					final_rate = mod.value
-	final_rate *= _synergy_rate_mult
-	attack_timer.wait_time = 1.0 / max(final_rate, 0.1)
+
+func _recompile_stats() -> void:
+	stats = UpgradeRegistry.compile_stats(tower_data, upgrade.active_modifiers,
+		_synergy_damage_mult, _synergy_rate_mult)
+	stats_version += 1
+	weapon.apply_stats(stats)
+	attack_timer.wait_time = 1.0 / max(stats[Enums.TowerStat.FIRE_RATE], 0.1)
+	_update_range(stats[Enums.TowerStat.RANGE])
 
 
 func _on_enemy_killed(enemy: Node2D, _gold: int) -> void:
@@ -397,32 +357,11 @@ func _draw() -> void:
 
 
 func get_current_range() -> float:
-	var final_range := tower_data.base_range
-	for mod in upgrade.active_modifiers:
-		if mod.stat_name == "base_range":
-			match mod.operation:
-				Enums.ModifierOp.ADD:
-					final_range += mod.value
-				Enums.ModifierOp.MULTIPLY:
-					final_range *= mod.value
-				Enums.ModifierOp.SET:
-					final_range = mod.value
-	return final_range
+	return stats[Enums.TowerStat.RANGE]
 
 
 func get_current_fire_rate() -> float:
-	var final_rate := tower_data.fire_rate
-	for mod in upgrade.active_modifiers:
-		if mod.stat_name == "fire_rate":
-			match mod.operation:
-				Enums.ModifierOp.ADD:
-					final_rate += mod.value
-				Enums.ModifierOp.MULTIPLY:
-					final_rate *= mod.value
-				Enums.ModifierOp.SET:
-					final_rate = mod.value
-	final_rate *= _synergy_rate_mult
-	return final_rate
+	return stats[Enums.TowerStat.FIRE_RATE]
 
 
 func _on_tower_selected(tower: Node2D) -> void:
@@ -457,6 +396,8 @@ func _play_recoil(target: Node2D) -> void:
 
 
 func _spawn_crossfire_popup(target: Node2D) -> void:
+	if not VFXPool.enabled:
+		return
 	var label := VFXPool.acquire_label()
 	label.text = "CROSSFIRE"
 	label.add_theme_font_size_override("font_size", 8)
@@ -473,6 +414,8 @@ func _spawn_crossfire_popup(target: Node2D) -> void:
 
 
 func _spawn_muzzle_flash() -> void:
+	if not VFXPool.enabled:
+		return
 	var flash := VFXPool.acquire_rect()
 	flash.size = Vector2(4, 4)
 	flash.color = ThemeManager.get_damage_type_color(weapon.damage_type)
@@ -492,7 +435,7 @@ func _draw_rank_badge() -> void:
 	var is_maxed := _is_fully_upgraded()
 
 	if is_maxed:
-		_draw_shield_badge(anchor, _get_shimmer_gold(), true)
+		_draw_shield_badge(anchor, Color.WHITE if _ambient else BADGE_GOLD, true)
 	elif _total_upgrades >= 5:
 		_draw_shield_badge(anchor, BADGE_GOLD, false)
 	elif _total_upgrades >= 3:
@@ -545,11 +488,6 @@ func _draw_shield_badge(center: Vector2, color: Color, small: bool = false) -> v
 			_badge_node.draw_line(pts[i], pts[(i + 1) % pts.size()], BADGE_OUTLINE, 1.5)
 
 
-func _get_shimmer_gold() -> Color:
-	var t := sin(Time.get_ticks_msec() * 0.006 * TAU) * 0.5 + 0.5  # 0-1 oscillation ~3Hz
-	return BADGE_GOLD.lerp(BADGE_SHIMMER_HI, t)
-
-
 func _is_fully_upgraded() -> bool:
 	if not tower_data or tower_data.upgrade_paths.is_empty():
 		return false
@@ -565,14 +503,11 @@ func _is_fully_upgraded() -> bool:
 	return true
 
 
-func _on_synergy_changed(tower: Node2D) -> void:
-	if tower != self:
-		return
+## Called by SynergyManager when this tower's active synergies change.
+func refresh_synergy_glow() -> void:
 	var synergies := SynergyManager.get_tower_synergies(self)
 	if synergies.is_empty():
 		_synergy_color = Color.TRANSPARENT
-		if _taser_links.is_empty():
-			set_process(false)
 	else:
 		# Green for buff, red for debuff
 		var has_buff := false
@@ -588,41 +523,8 @@ func _on_synergy_changed(tower: Node2D) -> void:
 			_synergy_color = Color("#C04040")  # red for debuff
 		else:
 			_synergy_color = Color("#40C060")  # green for buff
-		set_process(true)
-	_synergy_node.queue_redraw()
-
-
-func _process(delta: float) -> void:
-	if _synergy_color.a > 0.0:
-		_synergy_pulse += delta * 2.5
-		_synergy_node.queue_redraw()
-
-	# Shimmer redraw for max-upgraded badge
-	if _is_fully_upgraded():
-		_badge_node.queue_redraw()
-
-	if _is_taser and not _taser_links.is_empty():
-		_link_flicker_timer += delta
-		if _link_flicker_timer >= TASER_LINK_FLICKER_INTERVAL:
-			_link_flicker_timer -= TASER_LINK_FLICKER_INTERVAL
-			_rerandomize_link_bolts()
-
-
-func _draw_synergy_glow() -> void:
-	if _synergy_color == Color.TRANSPARENT:
-		return
-	var pulse_alpha := 0.35 + 0.25 * sin(_synergy_pulse)
-	var glow_color := Color(_synergy_color, pulse_alpha * 0.6)
-	var outline_color := Color(_synergy_color, pulse_alpha)
-	# Pulsing diamond matching the isometric tile footprint
-	var hw := 32.0
-	var hh := 16.0
-	var pts := PackedVector2Array([
-		Vector2(0, -hh), Vector2(hw, 0), Vector2(0, hh), Vector2(-hw, 0), Vector2(0, -hh),
-	])
-	_synergy_node.draw_colored_polygon(PackedVector2Array([pts[0], pts[1], pts[2], pts[3]]), glow_color)
-	for i in 4:
-		_synergy_node.draw_line(pts[i], pts[i + 1], outline_color, 2.0)
+	if _ambient:
+		_ambient.set_tower_glow(self, _synergy_color)
 
 
 # -- Camera zone suppression API --
@@ -639,6 +541,7 @@ func suppress() -> void:
 	if _suppression_count == 1:
 		_apply_suppression_visuals()
 		attack_timer.paused = true
+		stats_version += 1
 		SignalBus.tower_suppressed.emit(self)
 
 
@@ -649,6 +552,7 @@ func unsuppress() -> void:
 	if _suppression_count == 0:
 		_remove_suppression_visuals()
 		attack_timer.paused = false
+		stats_version += 1
 		SignalBus.tower_unsuppressed.emit(self)
 
 
@@ -660,10 +564,8 @@ func _apply_suppression_visuals() -> void:
 	add_child(_rec_dot)
 	_rec_dot.draw.connect(_draw_rec_dot)
 	# Pulse the REC dot alpha
-	var tween := _rec_dot.create_tween()
-	tween.set_loops()
-	tween.tween_property(_rec_dot, "modulate:a", 0.3, 0.4).set_trans(Tween.TRANS_SINE)
-	tween.tween_property(_rec_dot, "modulate:a", 1.0, 0.4).set_trans(Tween.TRANS_SINE)
+	if _ambient:
+		_ambient.add_oscillator(_rec_dot, ^"modulate:a", 1.0, 0.3, 0.4)
 	_rec_dot.queue_redraw()
 
 
@@ -694,93 +596,29 @@ func sell() -> void:
 	queue_free()
 
 
-# -- Taser tower-to-tower electric links --
-
-func _on_taser_neighbor_changed(_tower: Node2D, _tile_pos_arg: Vector2i) -> void:
-	_refresh_taser_links()
+func _exit_tree() -> void:
+	if is_instance_valid(_ambient):
+		_ambient.remove_tower(self)
 
 
-func _on_taser_neighbor_sold(_tower: Node2D, _refund: int) -> void:
-	# Defer so the sold tower is removed from _tower_grid first
-	_refresh_taser_links.call_deferred()
-
-
-func _refresh_taser_links() -> void:
-	_clear_taser_links()
+# -- Taser tower-to-tower electric links --
 
-	if not _is_taser:
+## Called by SynergyManager when this tower's neighbor edges change.
+func refresh_taser_links() -> void:
+	if not _is_taser or not _ambient:
 		return
 
-	for tile_pos_key in SynergyManager._tower_grid:
-		var neighbor: BaseTower = SynergyManager._tower_grid[tile_pos_key]
-		if neighbor == self:
-			continue
-		if not is_instance_valid(neighbor) or not neighbor.tower_data:
-			continue
-		if neighbor.tower_data.tower_id != "taser_grid":
-			continue
-
-		# Check Chebyshev distance
-		var dx := absi(tile_pos_key.x - _tile_pos.x)
-		var dy := absi(tile_pos_key.y - _tile_pos.y)
-		if maxi(dx, dy) > TASER_LINK_RANGE:
-			continue
-
+	var ends := PackedVector2Array()
+	for neighbor in SynergyManager.get_neighbors(self, "taser_grid"):
 		# Only draw from lower instance_id to higher (one link per pair)
 		if get_instance_id() >= neighbor.get_instance_id():
 			continue
+		ends.append(global_position)
+		ends.append(neighbor.global_position)
 
-		var bolt := _build_link_bolt(global_position, neighbor.global_position)
-		get_tree().current_scene.add_child(bolt)
-		_taser_links[neighbor.get_instance_id()] = bolt
-
-	# Enable processing if we have links or synergy glow
-	if not _taser_links.is_empty() or _synergy_color.a > 0.0:
-		set_process(true)
-
-
-func _build_link_bolt(from: Vector2, to: Vector2) -> Line2D:
-	var bolt := Line2D.new()
-	bolt.width = 1.0
-	bolt.default_color = TASER_LINK_COLOR
-	bolt.z_index = 5
-	bolt.top_level = true
-	bolt.points = _build_link_jagged_points(from, to)
-	return bolt
-
-
-func _build_link_jagged_points(from: Vector2, to: Vector2) -> PackedVector2Array:
-	var points := PackedVector2Array()
-	points.append(from)
-
-	var diff := to - from
-	var perp := Vector2(-diff.y, diff.x).normalized()
-
-	for i in range(1, TASER_LINK_SEGMENTS):
-		var t := float(i) / float(TASER_LINK_SEGMENTS)
-		var base_pt := from.lerp(to, t)
-		var offset := perp * randf_range(-TASER_LINK_JITTER, TASER_LINK_JITTER)
-		points.append(base_pt + offset)
-
-	points.append(to)
-	return points
-
-
-func _rerandomize_link_bolts() -> void:
-	for nid in _taser_links:
-		var bolt: Line2D = _taser_links[nid]
-		if not is_instance_valid(bolt):
-			continue
-		if bolt.points.size() < 2:
-			continue
-		var from: Vector2 = bolt.points[0]
-		var to: Vector2 = bolt.points[bolt.points.size() - 1]
-		bolt.points = _build_link_jagged_points(from, to)
+	_ambient.set_links(self, ends)
 
 
 func _clear_taser_links() -> void:
-	for nid in _taser_links:
-		var bolt: Line2D = _taser_links[nid]
-		if is_instance_valid(bolt):
-			bolt.queue_free()
-	_taser_links.clear()
+	if _ambient:
+		_ambient.set_links(self, PackedVector2Array())
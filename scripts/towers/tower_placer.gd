@@ -204,24 +204,31 @@ func _update_confirm_icon(show: bool) -> void:
 
 
 func _do_place(tile_pos: Vector2i) -> void:
+	if place_tower(_current_tower_data, tile_pos):
+		SignalBus.build_mode_exited.emit()
+
+
+## Build a tower outside of build mode (also used by the headless sim).
+## Returns null if the tile is taken, would seal the path, or gold is short.
+func place_tower(tower_data: TowerData, tile_pos: Vector2i) -> BaseTower:
 	if not _is_tile_buildable(tile_pos):
-		return
+		return null
 	if not PathfindingManager.can_place_tower(tile_pos):
 		SignalBus.path_blocked.emit()
-		return
-	if not EconomyManager.spend_gold(_current_tower_data.build_cost):
-		return
-	var tower_scene := _current_tower_data.scene
+		return null
+	var tower_scene := tower_data.scene
 	if not tower_scene:
-		return
+		return null
+	if not EconomyManager.spend_gold(tower_data.build_cost):
+		return null
 	var tower: BaseTower = tower_scene.instantiate()
-	tower.tower_data = _current_tower_data
+	tower.tower_data = tower_data
 	tower._tile_pos = tile_pos
 	tower.global_position = tile_map.to_global(tile_map.map_to_local(tile_pos))
 	tower_container.add_child(tower)
 	PathfindingManager.place_tower(tile_pos)
 	SignalBus.tower_placed.emit(tower, tile_pos)
-	SignalBus.build_mode_exited.emit()
+	return tower
 
 
 func _is_tile_buildable(tile_pos: Vector2i) -> bool:
@@ -1056,6 +1056,7 @@ func _on_last_stand_entered() -> void:
 
 
 func _on_send_wave_pressed() -> void:
+	ReplayRecorder.record_command("call_wave")
 	WaveManager.call_next_wave()
 
 
@@ -18,6 +18,8 @@ var _btn_glow_tween: Tween
 
 
 func _ready() -> void:
+	# Stream the game scene's resources in while the menu is up
+	AssetPreloader.start("game")
 	_blackletter_font = load("res://assets/fonts/PirataOne-Regular.ttf")
 	mouse_default_cursor_shape = CURSOR_ARROW
 
@@ -9,6 +9,8 @@ var _state: int = State.HIDDEN
 var _selected_tower: BaseTower
 var _preview_path: int = -1
 var _blackletter_font: Font
+var _shown_version: int = -1  # Selected tower's stats_version at the last refresh
+var _previews: Array[PackedFloat32Array] = []  # Next-tier stat block per path
 
 # UI nodes (built programmatically)
 var _main_vbox: VBoxContainer
@@ -78,6 +80,13 @@ func _ready() -> void:
 	_apply_panel_style()
 
 
+func _process(_delta: float) -> void:
+	# Synergy changes and suppression recompile the tower's stats while open
+	if _state != State.HIDDEN and is_instance_valid(_selected_tower) \
+			and _selected_tower.stats_version != _shown_version:
+		_refresh()
+
+
 func _exit_tree() -> void:
 	_selected_tower = null
 	_stat_bars.clear()
@@ -195,6 +204,8 @@ func _refresh() -> void:
 		return
 
 	var td := _selected_tower.tower_data
+	_shown_version = _selected_tower.stats_version
+	_previews = UpgradeRegistry.preview_next_tiers(_selected_tower)
 	_tower_name_label.text = td.get_display_name()
 	_sell_button.text = "SELL (" + EconomyManager.format_cost(_selected_tower.get_sell_value()) + ")"
 
@@ -364,7 +375,7 @@ func _show_preview(path_index: int) -> void:
 	var tier_data := path.tiers[current_tier]
 
 	# Update stat bar green deltas + value labels
-	_update_row1_previews(tier_data.stat_modifiers)
+	_update_row1_previews(path_index)
 
 	# -- Info area: description + effect unlocks --
 
@@ -411,13 +422,13 @@ func _hide_preview() -> void:
 		bar_data["value_label"].text = _format_stat(bar_data["name"], current_val)
 
 
-func _update_row1_previews(extra_mods: Array[StatModifierData]) -> void:
+func _update_row1_previews(path_index: int) -> void:
 	for bar_data in _stat_bars:
 		if not is_instance_valid(bar_data["bar"]):
 			continue
 		var stat_name: String = bar_data["name"]
 		var current_val := _get_tower_stat(stat_name)
-		var preview_val := _compute_preview_stat(stat_name, extra_mods)
+		var preview_val := _get_preview_stat(stat_name, path_index)
 		var max_val: float = bar_data["max_val"]
 
 		if absf(preview_val - current_val) > 0.01:
@@ -469,11 +480,11 @@ func _get_visible_stats() -> Array[String]:
 	var td := _selected_tower.tower_data
 	var stats: Array[String] = ["base_damage", "fire_rate", "base_range"]
 
-	if td.area_of_effect > 0 or _selected_tower.weapon.final_aoe > 0:
+	if td.area_of_effect > 0 or _get_tower_stat("area_of_effect") > 0:
 		stats.append("area_of_effect")
-	if td.pierce_count > 1 or _selected_tower.weapon.final_pierce > 1:
+	if td.pierce_count > 1 or _get_tower_stat("pierce_count") > 1:
 		stats.append("pierce_count")
-	if td.chain_targets > 0 or _selected_tower.weapon.chain_targets > 0:
+	if td.chain_targets > 0 or _get_tower_stat("chain_targets") > 0:
 		stats.append("chain_targets")
 	if _get_slow_potency() > 0.0:
 		stats.append("slow")
@@ -484,22 +495,10 @@ func _get_visible_stats() -> Array[String]:
 func _get_tower_stat(stat_name: String) -> float:
 	if not is_instance_valid(_selected_tower):
 		return 0.0
-	match stat_name:
-		"base_damage":
-			return _selected_tower.weapon.final_damage
-		"fire_rate":
-			return _selected_tower.get_current_fire_rate()
-		"base_range":
-			return _selected_tower.get_current_range()
-		"area_of_effect":
-			return _selected_tower.weapon.final_aoe
-		"pierce_count":
-			return float(_selected_tower.weapon.final_pierce)
-		"chain_targets":
-			return float(_selected_tower.weapon.chain_targets)
-		"slow":
-			return _get_slow_potency()
-	return 0.0
+	if stat_name == "slow":
+		return _get_slow_potency()
+	var slot: int = UpgradeRegistry.STAT_SLOTS.get(stat_name, -1)
+	return _selected_tower.stats[slot] if slot >= 0 else 0.0
 
 
 func _get_slow_potency() -> float:
@@ -512,47 +511,13 @@ func _get_slow_potency() -> float:
 	return max_slow
 
 
-func _compute_preview_stat(stat_name: String, extra_mods: Array[StatModifierData]) -> float:
-	if not is_instance_valid(_selected_tower) or not _selected_tower.tower_data:
-		return 0.0
-	var td := _selected_tower.tower_data
-
-	var base_val: float
-	match stat_name:
-		"base_damage": base_val = td.base_damage
-		"fire_rate": base_val = td.fire_rate
-		"base_range": base_val = td.base_range
-		"area_of_effect": base_val = td.area_of_effect
-		"pierce_count": base_val = float(td.pierce_count)
-		"chain_targets": base_val = float(td.chain_targets)
-		"slow": return _get_slow_potency()
-		_: return 0.0
-
-	var result := base_val
-	for mod in _selected_tower.upgrade.active_modifiers:
-		if mod.stat_name == stat_name:
-			result = _apply_mod(result, mod)
-	for mod in extra_mods:
-		if mod.stat_name == stat_name:
-			result = _apply_mod(result, mod)
-
-	if stat_name == "base_damage":
-		result *= _selected_tower.weapon.synergy_damage_mult
-	elif stat_name == "fire_rate":
-		result *= _selected_tower._synergy_rate_mult
-
-	return result
-
-
-func _apply_mod(base: float, mod: StatModifierData) -> float:
-	match mod.operation:
-		Enums.ModifierOp.ADD:
-			return base + mod.value
-		Enums.ModifierOp.MULTIPLY:
-			return base * mod.value
-		Enums.ModifierOp.SET:
-			return mod.value
-	return base
+func _get_preview_stat(stat_name: String, path_index: int) -> float:
+	if path_index >= _previews.size() or _previews[path_index].is_empty():
+		return _get_tower_stat(stat_name)
+	var slot: int = UpgradeRegistry.STAT_SLOTS.get(stat_name, -1)
+	if slot < 0:
+		return _get_tower_stat(stat_name)  # Slow comes from unlocked effects
+	return _previews[path_index][slot]
 
 
 func _format_stat(stat_name: String, value: float) -> String:
@@ -0,0 +1,21 @@
+extends RefCounted
+## Base for tests/test_*.gd. Checks record a failure and carry on, so one
+## run reports every broken check. Tests that need nodes add them under
+## tree.root and free them before returning.
+
+var tree: SceneTree
+var failures: PackedStringArray = PackedStringArray()
+var current_test: String = ""
+
+
+func check(condition: bool, message: String) -> void:
+	if not condition:
+		failures.append("%s: %s" % [current_test, message])
+
+
+func check_eq(actual: Variant, expected: Variant, message: String) -> void:
+	check(actual == expected, "%s (got %s, expected %s)" % [message, actual, expected])
+
+
+func check_near(actual: float, expected: float, message: String, tolerance: float = 0.0001) -> void:
+	check(absf(actual - expected) <= tolerance, "%s (got %f, expected %f)" % [message, actual, expected])
@@ -0,0 +1,47 @@
+extends SceneTree
+## Headless checks for game logic that can be exercised in isolation.
+##
+##   godot --headless -s res://tests/run_tests.gd [-- --filter=timer_wheel]
+##
+## Runs every test_* method of every tests/test_*.gd script (each extends
+## gd_test.gd), prints the failed checks and exits 1 if there were any.
+## Autoloads are live, so tests can drive the real singletons; each test
+## leaves them as it found them.
+
+const TEST_DIR = "res://tests"
+
+var _filter: String = ""
+
+
+func _initialize() -> void:
+	for arg in OS.get_cmdline_user_args():
+		if arg.begins_with("--filter="):
+			_filter = arg.get_slice("=", 1)
+
+
+func _process(_delta: float) -> bool:
+	# Run on the first frame, once every autoload is in the tree and ready
+	var failed := 0
+	var run := 0
+	for listed in DirAccess.get_files_at(TEST_DIR):
+		var file := listed.trim_suffix(".remap")
+		if not file.begins_with("test_") or not file.ends_with(".gd"):
+			continue
+		if not _filter.is_empty() and _filter not in file:
+			continue
+		var test = load(TEST_DIR.path_join(file)).new()
+		test.tree = self
+		for method in test.get_method_list():
+			var method_name: String = method["name"]
+			if not method_name.begins_with("test_"):
+				continue
+			test.current_test = "%s.%s" % [file.get_basename(), method_name]
+			test.call(method_name)
+			run += 1
+		for failure in test.failures:
+			printerr("FAIL ", failure)
+		failed += test.failures.size()
+
+	print("%d tests, %d failed checks" % [run, failed])
+	quit(1 if failed > 0 else 0)
+	return true
@@ -0,0 +1,77 @@
+extends "res://tests/gd_test.gd"
+## UpgradeRegistry.compile_stats() folds modifiers onto the base stats in
+## purchase order, so recompiling (e.g. on every synergy change) never
+## stacks an upgrade twice.
+
+const TOWER_SCENE = preload("res://scenes/towers/base_tower.tscn")
+const TASER = preload("res://data/towers/taser_grid.tres")
+
+
+func _mod(stat_name: String, operation: Enums.ModifierOp, value: float) -> StatModifierData:
+	var mod := StatModifierData.new()
+	mod.stat_name = stat_name
+	mod.operation = operation
+	mod.value = value
+	return mod
+
+
+func test_chain_not_compounded() -> void:
+	var mods: Array[StatModifierData] = [
+		_mod("chain_targets", Enums.ModifierOp.ADD, 1.0),
+		_mod("chain_targets", Enums.ModifierOp.ADD, 1.0),
+	]
+	var base_chain: int = TASER.chain_targets
+	var first := UpgradeRegistry.compile_stats(TASER, mods)
+	check_eq(first[Enums.TowerStat.CHAIN], base_chain + 2.0, "both upgrades added once")
+	for i in 3:
+		check_eq(UpgradeRegistry.compile_stats(TASER, mods), first, "recompile %d is stable" % i)
+	check_eq(UpgradeRegistry.compile_stats(TASER, mods, 1.15)[Enums.TowerStat.CHAIN],
+		first[Enums.TowerStat.CHAIN], "synergy leaves chain alone")
+	check_eq(TASER.chain_targets, base_chain, "tower data not modified")
+
+
+func test_purchase_order() -> void:
+	var set_then_mult: Array[StatModifierData] = [
+		_mod("base_damage", Enums.ModifierOp.SET, 20.0),
+		_mod("base_damage", Enums.ModifierOp.MULTIPLY, 1.5),
+	]
+	var mult_then_set: Array[StatModifierData] = [
+		_mod("base_damage", Enums.ModifierOp.MULTIPLY, 1.5),
+		_mod("base_damage", Enums.ModifierOp.SET, 20.0),
+	]
+	check_near(UpgradeRegistry.compile_stats(TASER, set_then_mult)[Enums.TowerStat.DAMAGE], 30.0, "SET then MULTIPLY")
+	check_near(UpgradeRegistry.compile_stats(TASER, mult_then_set)[Enums.TowerStat.DAMAGE], 20.0, "MULTIPLY then SET")
+
+	var unknown: Array[StatModifierData] = [_mod("not_a_stat", Enums.ModifierOp.SET, 99.0)]
+	var no_mods: Array[StatModifierData] = []
+	check_eq(UpgradeRegistry.compile_stats(TASER, unknown), UpgradeRegistry.compile_stats(TASER, no_mods),
+		"unknown stat names are skipped")
+
+
+func test_synergy_scales_damage_and_rate_only() -> void:
+	var no_mods: Array[StatModifierData] = []
+	var base := UpgradeRegistry.compile_stats(TASER, no_mods)
+	var boosted := UpgradeRegistry.compile_stats(TASER, no_mods, 1.15, 1.3)
+	for slot in Enums.TowerStat.values():
+		var factor := 1.0
+		if slot == Enums.TowerStat.DAMAGE:
+			factor = 1.15
+		elif slot == Enums.TowerStat.FIRE_RATE:
+			factor = 1.3
+		check_near(boosted[slot], base[slot] * factor, "%s slot" % Enums.TowerStat.keys()[slot])
+
+
+func test_tower_recompile() -> void:
+	var tower: BaseTower = TOWER_SCENE.instantiate()
+	tower.tower_data = TASER
+	tree.root.add_child(tower)
+	tower.upgrade.active_modifiers.append(_mod("chain_targets", Enums.ModifierOp.ADD, 1.0))
+	tower.upgrade.upgraded.emit(0, 1)
+	check_eq(tower.weapon.final_chain_targets, TASER.chain_targets + 1, "upgrade applied")
+
+	var damage := tower.stats[Enums.TowerStat.DAMAGE]
+	for mult in [1.15, 1.3225, 1.15, 1.0]:
+		tower.apply_synergy(mult, 1.0)
+		check_eq(tower.weapon.final_chain_targets, TASER.chain_targets + 1, "chain x%s synergy" % mult)
+		check_near(tower.stats[Enums.TowerStat.DAMAGE], damage * mult, "damage x%s synergy" % mult)
+	tower.free()
@@ -0,0 +1,71 @@
+extends "res://tests/gd_test.gd"
+## DamageCalculator.apply_batch() matches calculate_damage() for every
+## damage type: the packed armor table and cached resistance vector must
+## give the same numbers as the dictionary path.
+
+const ENEMY_SCENE = preload("res://scenes/enemies/base_enemy.tscn")
+const BASE_DAMAGE = 100.0
+
+
+func _spawn_enemy() -> BaseEnemy:
+	var data := EnemyData.new()
+	data.enemy_id = "shield_wall"
+	data.max_hp = 1.0e9  # Never dies, so every hit lands in full
+	data.armor = 40.0
+	data.armor_type = Enums.ArmorType.HEAVY
+	data.resistances = {Enums.DamageType.ELECTRIC: 0.5, Enums.DamageType.SONIC: 1.5}
+	var enemy: BaseEnemy = ENEMY_SCENE.instantiate()
+	enemy.enemy_data = data
+	tree.root.add_child(enemy)
+	return enemy
+
+
+func _expected(enemy: BaseEnemy, damage_type: Enums.DamageType) -> float:
+	var health := enemy.health
+	return DamageCalculator.calculate_damage(BASE_DAMAGE, damage_type, health.armor_type,
+		health.armor, enemy.resistances.get_all(), 1.0, 0.0, 1.0)["damage"]
+
+
+func test_matches_calculate_damage() -> void:
+	var vfx_enabled := VFXPool.enabled
+	VFXPool.enabled = false
+	var enemy := _spawn_enemy()
+	var targets: Array[Node2D] = [enemy]
+	var batch := DamageBatch.new()
+	batch.base_damage = BASE_DAMAGE
+
+	for damage_type in Enums.DamageType.values():
+		batch.damage_type = damage_type
+		var hp_before := enemy.health.current_hp
+		var dealt := DamageCalculator.apply_batch(batch, targets, 1)
+		var expected := _expected(enemy, damage_type)
+		check_near(dealt, expected, "%s damage" % Enums.DamageType.keys()[damage_type], 0.01)
+		check_near(hp_before - enemy.health.current_hp, dealt, "returned total is what HP lost", 0.01)
+
+	enemy.free()
+	VFXPool.enabled = vfx_enabled
+
+
+func test_damage_scale() -> void:
+	var vfx_enabled := VFXPool.enabled
+	VFXPool.enabled = false
+	var near := _spawn_enemy()
+	var far := _spawn_enemy()
+	var targets: Array[Node2D] = [near, far]
+	var batch := DamageBatch.new()
+	batch.base_damage = BASE_DAMAGE
+	batch.damage_type = Enums.DamageType.ELECTRIC
+	var expected := _expected(near, batch.damage_type)
+
+	batch.damage_scale = PackedFloat32Array([1.0, 0.5])
+	check_near(DamageCalculator.apply_batch(batch, targets, 2), expected * 1.5,
+		"per-target scale applied", 0.01)
+	batch.damage_scale = PackedFloat32Array([0.5])
+	check_near(DamageCalculator.apply_batch(batch, targets, 2), expected * 2.0,
+		"scale shorter than the targets is ignored", 0.01)
+	check_near(DamageCalculator.apply_batch(batch, targets, 1), expected * 0.5,
+		"only targets[0..count) are hit", 0.01)
+
+	near.free()
+	far.free()
+	VFXPool.enabled = vfx_enabled
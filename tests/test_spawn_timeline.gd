@@ -0,0 +1,96 @@
+extends "res://tests/gd_test.gd"
+## WaveManager's spawn timeline, driven through start_waves()/step_spawns():
+## sequences interleave in time order, each keeps its own spacing and spawn
+## point, and a step releases every entry that came due.
+
+const STEP = 0.07
+const EPSILON = 0.0001
+
+
+func _make_wave() -> WaveData:
+	# Special enemy ids, so the crowd pool doesn't swap the types
+	var boss := EnemyData.new()
+	boss.enemy_id = "union_boss"
+	var van := EnemyData.new()
+	van.enemy_id = "armored_van"
+
+	var a := SpawnSequenceData.new()
+	a.enemy_data = boss
+	a.count = 3
+	a.spawn_interval = 1.0
+	var empty := SpawnSequenceData.new()
+	empty.enemy_data = boss
+	empty.count = 0
+	var b := SpawnSequenceData.new()
+	b.enemy_data = van
+	b.count = 2
+	b.spawn_interval = 0.7
+	b.start_delay = 0.4
+	b.spawn_point_index = 1
+
+	var wave := WaveData.new()
+	wave.wave_number = 1
+	wave.spawn_sequences = [a, empty, b]
+	return wave
+
+
+func test_merged_timeline() -> void:
+	var saved_waves := WaveManager.waves
+	var waves: Array[WaveData] = [_make_wave()]
+	WaveManager.waves = waves
+
+	# [enemy_id, spawn point, clock when released]
+	var spawned := []
+	var clock := [0.0]
+	var on_spawn := func(data: EnemyData, point: int, _mods: Dictionary):
+		spawned.append([data.enemy_id, point, clock[0]])
+	WaveManager.spawn_enemy_requested.connect(on_spawn)
+
+	WaveManager.start_waves()
+	check(WaveManager.is_spawning, "wave armed")
+	var steps := 0
+	while WaveManager.is_spawning and steps < 1000:
+		clock[0] += STEP
+		WaveManager.step_spawns(STEP)
+		steps += 1
+
+	# a0 b0 a1 b1 a2, offsets from the grace period
+	var expected := [
+		["union_boss", 0, 0.0], ["armored_van", 1, 0.4], ["union_boss", 0, 1.0],
+		["armored_van", 1, 1.1], ["union_boss", 0, 2.0],
+	]
+	check_eq(spawned.size(), expected.size(), "every spawn of every non-empty sequence")
+	for i in mini(spawned.size(), expected.size()):
+		var due: float = WaveManager.SPAWN_GRACE_PERIOD + expected[i][2]
+		var at: float = spawned[i][2]
+		check_eq(spawned[i][0], expected[i][0], "spawn %d type" % i)
+		check_eq(spawned[i][1], expected[i][1], "spawn %d point" % i)
+		check(at >= due - EPSILON and at < due + STEP + EPSILON,
+			"spawn %d released on the first step at or after %.2f (got %.2f)" % [i, due, at])
+	check_eq(WaveManager.enemies_alive, expected.size(), "each spawn counted alive")
+	check(not WaveManager.is_spawning, "timeline done")
+
+	WaveManager.spawn_enemy_requested.disconnect(on_spawn)
+	WaveManager.waves = saved_waves
+	WaveManager.current_wave_index = -1
+	WaveManager.enemies_alive = 0
+
+
+func test_long_step_releases_all_due() -> void:
+	var saved_waves := WaveManager.waves
+	var waves: Array[WaveData] = [_make_wave()]
+	WaveManager.waves = waves
+	var spawned := []
+	var on_spawn := func(data: EnemyData, _point: int, _mods: Dictionary): spawned.append(data.enemy_id)
+	WaveManager.spawn_enemy_requested.connect(on_spawn)
+
+	WaveManager.start_waves()
+	WaveManager.step_spawns(WaveManager.SPAWN_GRACE_PERIOD + 1.05)
+	check_eq(spawned, ["union_boss", "armored_van", "union_boss"], "several spawns in one step, in order")
+	WaveManager.step_spawns(10.0)
+	check_eq(spawned.size(), 5, "the rest on a long step")
+
+	WaveManager.spawn_enemy_requested.disconnect(on_spawn)
+	WaveManager.waves = saved_waves
+	WaveManager.current_wave_index = -1
+	WaveManager.enemies_alive = 0
@@ -0,0 +1,57 @@
+extends "res://tests/gd_test.gd"
+## SynergyManager's adjacency index, driven by the tower_placed/tower_sold
+## signals: a placement or sale adds or removes only that tower's edges,
+## and the neighbors' multipliers follow.
+
+const TOWER_SCENE = preload("res://scenes/towers/base_tower.tscn")
+const TASER = preload("res://data/towers/taser_grid.tres")
+const POWER_GRID_BONUS = 1.15  # taser_grid self-synergy, max 2 stacks
+
+
+func _place(tile_pos: Vector2i) -> BaseTower:
+	var tower: BaseTower = TOWER_SCENE.instantiate()
+	tower.tower_data = TASER
+	tower._tile_pos = tile_pos  # Set before the signal, as TowerPlacer does
+	tree.root.add_child(tower)
+	SignalBus.tower_placed.emit(tower, tile_pos)
+	return tower
+
+
+func test_place_and_sell() -> void:
+	SynergyManager.clear()
+	var left := _place(Vector2i(0, 0))
+	var middle := _place(Vector2i(1, 0))
+	var right := _place(Vector2i(SynergyManager.SYNERGY_RANGE, 0))
+	var far := _place(Vector2i(SynergyManager.SYNERGY_RANGE + 1, 5))
+
+	check_eq(SynergyManager.get_neighbors(left).size(), 2, "left sees middle and right")
+	check_eq(SynergyManager.get_neighbors(middle).size(), 2, "middle sees both ends")
+	check_eq(SynergyManager.get_neighbors(right).size(), 2, "right edge is at range")
+	check_eq(SynergyManager.get_neighbors(far).size(), 0, "far tower is out of range")
+	check_near(SynergyManager.get_damage_multiplier(left), pow(POWER_GRID_BONUS, 2), "two stacks")
+	check_near(SynergyManager.get_damage_multiplier(far), 1.0, "no synergy")
+
+	# A third neighbor is capped at max_stacks
+	var extra := _place(Vector2i(0, 1))
+	check_eq(SynergyManager.get_neighbors(left).size(), 3, "edge added")
+	check_near(SynergyManager.get_damage_multiplier(left), pow(POWER_GRID_BONUS, 2), "capped at two stacks")
+	SignalBus.tower_sold.emit(extra, 0)
+	extra.free()
+
+	SignalBus.tower_sold.emit(middle, 0)
+	check_eq(SynergyManager.get_neighbors(middle).size(), 0, "sold tower's edges removed")
+	check_near(SynergyManager.get_damage_multiplier(middle), 1.0, "sold tower's synergy dropped")
+	middle.free()
+	var left_neighbors := SynergyManager.get_neighbors(left)
+	check(left_neighbors.size() == 1 and left_neighbors[0] == right, "only the edge to right left")
+	check_eq(SynergyManager.get_neighbors(right).size(), 1, "right keeps its edge to left")
+	check_near(SynergyManager.get_damage_multiplier(left), POWER_GRID_BONUS, "one stack left")
+
+	var again := _place(Vector2i(1, 0))
+	check_near(SynergyManager.get_damage_multiplier(right), pow(POWER_GRID_BONUS, 2), "re-placing restores the edge")
+	SignalBus.tower_sold.emit(again, 0)
+	again.free()
+
+	SynergyManager.clear()
+	for tower in [left, right, far]:
+		tower.free()
@@ -0,0 +1,59 @@
+extends "res://tests/gd_test.gd"
+## TimerWheel: deadlines fire on the tick they hash to, never early, and
+## freed targets are dropped instead of reported.
+
+
+func test_fires_when_due() -> void:
+	var wheel := TimerWheel.new()
+	var a := RefCounted.new()
+	var b := RefCounted.new()
+	wheel.schedule(a, 0.12)
+	wheel.schedule(b, 0.30)
+	check_eq(wheel.advance(0.10).size(), 0, "nothing due at 0.10")
+	var due := wheel.advance(0.05).duplicate()
+	check_eq(due, [a], "a due at 0.15")
+	due = wheel.advance(0.20).duplicate()
+	check_eq(due, [b], "b due at 0.35")
+	check_eq(wheel.advance(1.0).size(), 0, "each target is reported once")
+
+
+func test_later_lap_waits() -> void:
+	var wheel := TimerWheel.new()
+	var lap := TimerWheel.SLOT_TIME * TimerWheel.SLOT_COUNT
+	var a := RefCounted.new()
+	wheel.schedule(a, lap + 1.0)
+	check_eq(wheel.advance(lap + 0.5).size(), 0, "shares a bucket with an earlier lap but isn't due")
+	var due := wheel.advance(0.55).duplicate()
+	check_eq(due, [a], "due on its own lap")
+
+
+func test_large_step_catches_up() -> void:
+	var wheel := TimerWheel.new()
+	var targets := []
+	for i in 10:
+		var t := RefCounted.new()
+		targets.append(t)
+		wheel.schedule(t, 0.4 * i)
+	var due := wheel.advance(10.0).duplicate()
+	check_eq(due.size(), targets.size(), "a step longer than a lap reports everything due")
+
+
+func test_stale_entries_dropped() -> void:
+	var wheel := TimerWheel.new()
+	var kept := RefCounted.new()
+	var freed := Object.new()
+	wheel.schedule(freed, 0.1)
+	wheel.schedule(kept, 0.1)
+	freed.free()
+	var due := wheel.advance(0.2).duplicate()
+	check_eq(due, [kept], "freed target is skipped")
+	check_eq(wheel.advance(5.0).size(), 0, "and not reported later")
+
+
+func test_clear() -> void:
+	var wheel := TimerWheel.new()
+	wheel.schedule(RefCounted.new(), 0.1)
+	wheel.advance(0.05)
+	wheel.clear()
+	check_eq(wheel.now, 0.0, "clock reset")
+	check_eq(wheel.advance(1.0).size(), 0, "pending entries dropped")
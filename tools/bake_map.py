@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""Bake the tile atlas, TileSet and painted map that MapBuilder loads.
+
+MapBuilder.build_map used to build the level on every start. It created
+a TileSet, assembled the tile atlas Image (get_image() and a format
+conversion per tile PNG, or per-pixel diamonds as a fallback), and
+rolled the tile hashes to paint every cell and place obstacles. This
+script does that work once:
+
+  * tile_atlas.png   -- the five atlas slots, 64x32 each
+  * map_tileset.tres -- isometric TileSet over the atlas, with the
+                        buildable/walkable custom data layers
+  * downtown.tres    -- MapData: atlas column per cell, plus the spawn,
+                        goal and obstacle tiles
+
+At level start MapBuilder loads downtown.tres and calls set_cell() from
+its cell bytes. It only falls back to building at runtime when the bake
+is missing or does not match its map size. balance_sim.build_map() reads
+the same file, so offline path analysis uses exactly the shipped map.
+
+The painting mirrors map_builder.gd, using balance_sim's tile hash.
+downtown.tres records a hash of map_builder.gd and the tile PNGs, and
+--check reports a stale bake after either one changes.
+
+Usage:
+    python3 tools/bake_map.py            # bake atlas, TileSet and map
+    python3 tools/bake_map.py --check    # exit 1 if the bake is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: numpy and Pillow required. Run: pip install numpy Pillow")
+    sys.exit(1)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import balance_sim as sim  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+MAP_BUILDER = PROJECT_ROOT / "scripts" / "main" / "map_builder.gd"
+TILES_DIR = PROJECT_ROOT / "assets" / "sprites" / "tiles"
+ATLAS_PATH = PROJECT_ROOT / "assets" / "sprites" / "_baked" / "tile_atlas.png"
+TILESET_PATH = PROJECT_ROOT / "data" / "maps" / "map_tileset.tres"
+MAP_PATH = sim.MAP_DATA_PATH
+
+# ---------------------------------------------------------------------------
+# MapBuilder mirrors
+# ---------------------------------------------------------------------------
+
+TILE_W = 64
+TILE_H = 32
+
+GROUND_A, GROUND_B, GROUND_C, NOBUILD, WALL = range(5)
+GROUND_VARIANTS = (GROUND_A, GROUND_B, GROUND_C)
+
+# Atlas slot -> tile PNG; slots 3 and 4 reuse ground visuals
+TILE_NAMES = ["concrete_a", "concrete_b", "concrete_c", "concrete_a", "concrete_b"]
+
+# Procedural fallback base colours, per slot
+FALLBACK_COLORS = ["#4A4A52", "#505058", "#464650", "#4A4A52", "#505058"]
+EDGE_THICKNESS_PX = 1.0
+EDGE_DARKEN = 0.15
+
+# (buildable, walkable) per slot
+TILE_FLAGS = [(True, True), (True, True), (True, True), (False, True), (False, False)]
+
+# Godot enum values used in the .tres files
+TILE_SHAPE_ISOMETRIC = 1
+TILE_LAYOUT_DIAMOND_DOWN = 5
+TYPE_BOOL = 1
+
+
+def res_path(path: Path) -> str:
+    return "res://" + path.relative_to(PROJECT_ROOT).as_posix()
+
+
+# ---------------------------------------------------------------------------
+# Atlas
+# ---------------------------------------------------------------------------
+
+def fallback_tile(code: str) -> np.ndarray:
+    """Port of MapBuilder._draw_isometric_tile (flat diamond, dark rim)."""
+    rgb = np.array([int(code[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float64) / 255.0
+    cx, cy = TILE_W / 2.0, TILE_H / 2.0
+    edge_threshold = 1.0 - EDGE_THICKNESS_PX / min(cx, cy)
+    ys, xs = np.mgrid[0:TILE_H, 0:TILE_W]
+    d = np.abs(xs - cx + 0.5) / cx + np.abs(ys - cy + 0.5) / cy
+    tile = np.zeros((TILE_H, TILE_W, 4), dtype=np.uint8)
+    inside = d <= 1.0
+    rim = inside & (d > edge_threshold)
+    tile[inside, :3] = np.round(rgb * 255.0).astype(np.uint8)
+    tile[rim, :3] = np.round(rgb * (1.0 - EDGE_DARKEN) * 255.0).astype(np.uint8)
+    tile[inside, 3] = 255
+    return tile
+
+
+def build_atlas() -> np.ndarray:
+    atlas = np.zeros((TILE_H, TILE_W * len(TILE_NAMES), 4), dtype=np.uint8)
+    for i, name in enumerate(TILE_NAMES):
+        png = TILES_DIR / f"tile_{name}.png"
+        if png.exists():
+            img = np.asarray(Image.open(png).convert("RGBA"))[:TILE_H, :TILE_W]
+            atlas[:img.shape[0], i * TILE_W:i * TILE_W + img.shape[1]] = img
+        else:
+            atlas[:, i * TILE_W:(i + 1) * TILE_W] = fallback_tile(FALLBACK_COLORS[i])
+    return atlas
+
+
+# ---------------------------------------------------------------------------
+# Map painting
+# ---------------------------------------------------------------------------
+
+def paint() -> tuple[list[int], list[tuple[int, int]]]:
+    """Atlas column per cell (row-major) and the obstacle tiles."""
+    cells = []
+    obstacles = []
+    for y in range(sim.MAP_H):
+        for x in range(sim.MAP_W):
+            if (x, y) in (sim.SPAWN_TILE, sim.GOAL_TILE):
+                cells.append(NOBUILD)
+            elif y in (0, sim.MAP_H - 1) or x in (0, sim.MAP_W - 1):
+                cells.append(WALL)
+            elif sim.tile_hash(x, y, 777) % 100 < sim.OBSTACLE_PERCENT:
+                cells.append(NOBUILD)
+                obstacles.append((x, y))
+            else:
+                cells.append(GROUND_VARIANTS[sim.tile_hash(x, y, 42) % len(GROUND_VARIANTS)])
+    return cells, obstacles
+
+
+def sources_hash() -> str:
+    digest = hashlib.sha256(MAP_BUILDER.read_bytes())
+    for name in sorted(set(TILE_NAMES)):
+        png = TILES_DIR / f"tile_{name}.png"
+        if png.exists():
+            digest.update(png.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# .tres writers
+# ---------------------------------------------------------------------------
+
+def tileset_tres() -> str:
+    lines = [
+        '[gd_resource type="TileSet" load_steps=3 format=3]',
+        "",
+        f'[ext_resource type="Texture2D" path="{res_path(ATLAS_PATH)}" id="1_atlas"]',
+        "",
+        '[sub_resource type="TileSetAtlasSource" id="TileSetAtlasSource_map"]',
+        'texture = ExtResource("1_atlas")',
+        f"texture_region_size = Vector2i({TILE_W}, {TILE_H})",
+    ]
+    for i, (buildable, walkable) in enumerate(TILE_FLAGS):
+        lines += [
+            f"{i}:0/0 = 0",
+            f"{i}:0/0/custom_data_0 = {str(buildable).lower()}",
+            f"{i}:0/0/custom_data_1 = {str(walkable).lower()}",
+        ]
+    lines += [
+        "",
+        "[resource]",
+        f"tile_shape = {TILE_SHAPE_ISOMETRIC}",
+        f"tile_layout = {TILE_LAYOUT_DIAMOND_DOWN}",
+        f"tile_size = Vector2i({TILE_W}, {TILE_H})",
+        'custom_data_layer_0/name = "buildable"',
+        f"custom_data_layer_0/type = {TYPE_BOOL}",
+        'custom_data_layer_1/name = "walkable"',
+        f"custom_data_layer_1/type = {TYPE_BOOL}",
+        'sources/0 = SubResource("TileSetAtlasSource_map")',
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def vector2i_array(tiles: list[tuple[int, int]]) -> str:
+    return "Array[Vector2i]([" + ", ".join(f"Vector2i({x}, {y})" for x, y in tiles) + "])"
+
+
+def map_tres(cells: list[int], obstacles: list[tuple[int, int]]) -> str:
+    return "\n".join([
+        '[gd_resource type="Resource" script_class="MapData" load_steps=3 format=3]',
+        "",
+        '[ext_resource type="Script" path="res://scripts/resources/map_data.gd" id="1_md"]',
+        f'[ext_resource type="TileSet" path="{res_path(TILESET_PATH)}" id="2_ts"]',
+        "",
+        "[resource]",
+        'script = ExtResource("1_md")',
+        'tile_set = ExtResource("2_ts")',
+        f"size = Vector2i({sim.MAP_W}, {sim.MAP_H})",
+        f"cells = PackedByteArray({', '.join(map(str, cells))})",
+        f"spawn_tiles = {vector2i_array([sim.SPAWN_TILE])}",
+        f"goal_tiles = {vector2i_array([sim.GOAL_TILE])}",
+        f"obstacle_tiles = {vector2i_array(obstacles)}",
+        f'source_hash = "{sources_hash()}"',
+    ]) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Bake / check
+# ---------------------------------------------------------------------------
+
+def bake() -> tuple[int, int]:
+    cells, obstacles = paint()
+    ATLAS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    MAP_PATH.parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(build_atlas(), "RGBA").save(ATLAS_PATH, optimize=True)
+    TILESET_PATH.write_text(tileset_tres())
+    MAP_PATH.write_text(map_tres(cells, obstacles))
+    return len(cells), len(obstacles)
+
+
+def check() -> int:
+    missing = [p for p in (ATLAS_PATH, TILESET_PATH, MAP_PATH) if not p.exists()]
+    if missing:
+        print(f"MISSING: {', '.join(str(p.relative_to(PROJECT_ROOT)) for p in missing)} -- run tools/bake_map.py")
+        return 1
+    stale = []
+    if not np.array_equal(np.asarray(Image.open(ATLAS_PATH).convert("RGBA")), build_atlas()):
+        stale.append("atlas")
+    if TILESET_PATH.read_text() != tileset_tres():
+        stale.append("tileset")
+    if MAP_PATH.read_text() != map_tres(*paint()):
+        stale.append("map")
+    if stale:
+        print(f"STALE: {', '.join(stale)} -- run tools/bake_map.py")
+        return 1
+    print(f"OK: {sim.MAP_W}x{sim.MAP_H} map baked")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bake the tile atlas, TileSet and painted map")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the baked map is missing or stale")
+    args = parser.parse_args()
+
+    if args.check:
+        return check()
+
+    cell_count, obstacle_count = bake()
+    print(f"Baked {cell_count} cells ({obstacle_count} obstacles)")
+    for path in (ATLAS_PATH, TILESET_PATH, MAP_PATH):
+        print(f"  {path.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
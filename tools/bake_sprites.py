@@ -0,0 +1,1084 @@
+#!/usr/bin/env python3
+"""Bake the procedural fallback sprites into a single atlas.
+
+EntitySprites, BuildingSprites, EnvironmentSprites and PlaceholderSprites
+(scripts/helpers/) draw their textures pixel by pixel with Image.set_pixel
+every time they are called -- on every launch and again on each theme
+switch. This script ports those generators to Python, renders every
+variant the game actually asks for and packs them into one PNG atlas plus
+a JSON manifest of regions. BakedSprites looks sprites up in the manifest
+and the GDScript generators only run for variants missing from it (a new
+tower colour, an unbaked prop seed).
+
+The ports mirror the GDScript line for line, including GDScript integer
+division, so the atlas matches runtime output up to 8-bit rounding. The
+manifest stores a hash of the four helper scripts; --check reports a stale
+bake after one of them changes.
+
+Output:
+    assets/sprites/_baked/procedural_atlas.png
+    assets/sprites/_baked/procedural_atlas.json
+
+Usage:
+    python3 tools/bake_sprites.py            # bake atlas + manifest
+    python3 tools/bake_sprites.py --check    # exit 1 if the bake is stale
+    python3 tools/bake_sprites.py --list     # print baked sprite keys
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: numpy and Pillow required. Run: pip install numpy Pillow")
+    sys.exit(1)
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import balance_sim as sim  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+HELPERS_DIR = PROJECT_ROOT / "scripts" / "helpers"
+BAKED_DIR = PROJECT_ROOT / "assets" / "sprites" / "_baked"
+ATLAS_PATH = BAKED_DIR / "procedural_atlas.png"
+MANIFEST_PATH = BAKED_DIR / "procedural_atlas.json"
+
+MANIFEST_VERSION = 1
+
+# Scripts whose generators are baked; their hash marks the bake stale
+SOURCE_SCRIPTS = [
+    "entity_sprites.gd",
+    "building_sprites.gd",
+    "environment_sprites.gd",
+    "placeholder_sprites.gd",
+]
+
+ATLAS_WIDTH = 512
+# Transparent gutter between regions so linear filtering never bleeds
+PADDING = 1
+
+TAU = math.tau
+
+
+# ---------------------------------------------------------------------------
+# Godot Color / Image shims
+# ---------------------------------------------------------------------------
+
+class Color(NamedTuple):
+    r: float
+    g: float
+    b: float
+    a: float = 1.0
+
+    @classmethod
+    def html(cls, code: str, alpha: float = 1.0) -> Color:
+        code = code.lstrip("#")
+        r, g, b = (int(code[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
+        return cls(r, g, b, alpha)
+
+    def darkened(self, amount: float) -> Color:
+        k = 1.0 - amount
+        return Color(self.r * k, self.g * k, self.b * k, self.a)
+
+    def lightened(self, amount: float) -> Color:
+        return Color(
+            self.r + (1.0 - self.r) * amount,
+            self.g + (1.0 - self.g) * amount,
+            self.b + (1.0 - self.b) * amount,
+            self.a,
+        )
+
+    def lerp(self, to: Color, weight: float) -> Color:
+        return Color(*(a + (b - a) * weight for a, b in zip(self, to)))
+
+    def with_alpha(self, alpha: float) -> Color:
+        return Color(self.r, self.g, self.b, alpha)
+
+    def to_html(self) -> str:
+        """Lowercase RRGGBB, as Color.to_html(false) produces."""
+        return "".join(f"{round(c * 255):02x}" for c in (self.r, self.g, self.b))
+
+    def to_rgba8(self) -> tuple[int, int, int, int]:
+        return tuple(min(255, max(0, round(c * 255))) for c in self)
+
+
+class Img:
+    """Image.create(w, h, false, FORMAT_RGBA8) with set_pixel."""
+
+    def __init__(self, w: int, h: int):
+        self.w = w
+        self.h = h
+        self.pixels = np.zeros((h, w, 4), dtype=np.uint8)
+
+    def set_pixel(self, x: int, y: int, color: Color) -> None:
+        self.pixels[y, x] = color.to_rgba8()
+
+
+def idiv(a: int, b: int) -> int:
+    """GDScript integer division (truncates toward zero)."""
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b >= 0) else -q
+
+
+def hash2(a: int, b: int) -> int:
+    return abs((a * 73856093 + b * 19349663) & 0xFFFFFF)
+
+
+def hash3(a: int, b: int, c: int) -> int:
+    return abs((a * 73856093 + b * 19349663 + c * 83492791) & 0xFFFFFF)
+
+
+# ---------------------------------------------------------------------------
+# EntitySprites
+# ---------------------------------------------------------------------------
+
+def tower_turret(base_color: Color, accent_color: Color) -> Img:
+    size = 32
+    img = Img(size, size)
+    dark = base_color.darkened(0.2)
+    light = base_color.lightened(0.15)
+
+    half = size / 2.0
+    for y in range(16, 28):
+        for x in range(size):
+            dx = abs(x - half + 0.5) / half
+            dy = abs(y - 22.0 + 0.5) / 6.0
+            if dx + dy <= 1.0:
+                color = dark if x < int(half) else base_color
+                if y > 24:
+                    color = color.darkened(0.15)
+                img.set_pixel(x, y, color)
+
+    for y in range(8, 18):
+        for x in range(10, 22):
+            img.set_pixel(x, y, dark if x < 16 else light)
+
+    for x in range(18, 28):
+        for y in range(11, 14):
+            img.set_pixel(x, y, accent_color)
+
+    img.set_pixel(28, 12, accent_color.lightened(0.3))
+    return img
+
+
+def ice_tower() -> Img:
+    size = 32
+    img = Img(size, size)
+    base = Color.html("#80A0C0")
+    dark = Color.html("#506880")
+    glow = Color.html("#B0D0E8")
+
+    half = size / 2.0
+    for y in range(14, 28):
+        for x in range(size):
+            dx = abs(x - half + 0.5) / half
+            dy = abs(y - 22.0 + 0.5) / 6.0
+            if dx + dy <= 1.0:
+                img.set_pixel(x, y, dark if x < int(half) else base)
+
+    for y in range(4, 16):
+        width_at_y = int((16.0 - y) / 12.0 * 6.0) + 2
+        for x in range(16 - width_at_y, 16 + width_at_y):
+            if 0 <= x < size:
+                color = base
+                if x < 16:
+                    color = dark
+                if y < 8:
+                    color = glow
+                img.set_pixel(x, y, color)
+    return img
+
+
+def enemy_figure(body_color: Color, accent_color: Color) -> Img:
+    img = Img(16, 16)
+    dark = body_color.darkened(0.25)
+
+    for y in range(2, 6):
+        for x in range(6, 10):
+            dx = x - 8.0
+            dy = y - 4.0
+            if dx * dx + dy * dy <= 4.5:
+                img.set_pixel(x, y, body_color)
+
+    for y in range(6, 11):
+        for x in range(5, 11):
+            img.set_pixel(x, y, body_color if x >= 8 else dark)
+
+    for y in range(11, 15):
+        img.set_pixel(6, y, dark)
+        img.set_pixel(7, y, dark)
+        img.set_pixel(9, y, body_color)
+        img.set_pixel(10, y, body_color)
+
+    for x in range(3, 8):
+        img.set_pixel(x, 8, accent_color)
+    return img
+
+
+def press_drone() -> Img:
+    size = 16
+    img = Img(size, size)
+    body = Color.html("#3A3A4A")
+    body_hi = Color.html("#4A4A5A")
+    arm = Color.html("#505060")
+    motor = Color.html("#2A2A38")
+    motor_hi = Color.html("#606070")
+    lens = Color.html("#D04040")
+    led_front = Color.html("#40D060")
+    led_rear = Color.html("#D04040")
+
+    for y in range(6, 10):
+        for x in range(6, 10):
+            img.set_pixel(x, y, body_hi if x + y < 14 else body)
+    img.set_pixel(7, 8, Color.html("#2A2A38"))
+    img.set_pixel(8, 8, Color.html("#2A2A38"))
+    img.set_pixel(7, 9, lens)
+    img.set_pixel(8, 9, lens)
+    img.set_pixel(7, 6, led_front)
+    img.set_pixel(7, 9, led_rear)
+
+    for x, y in [(5, 5), (4, 4), (5, 4), (10, 5), (11, 4), (10, 4),
+                 (5, 10), (4, 11), (5, 11), (10, 10), (11, 11), (10, 11)]:
+        img.set_pixel(x, y, arm)
+
+    for cx, cy in [(3, 3), (12, 3), (3, 12), (12, 12)]:
+        for dy in range(2):
+            for dx in range(2):
+                px = cx - 1 + dx
+                py = cy - 1 + dy
+                if 0 <= px < size and 0 <= py < size:
+                    img.set_pixel(px, py, motor if dx + dy < 2 else motor_hi)
+    return img
+
+
+def press_drone_rotors(frame: int) -> Img:
+    size = 16
+    img = Img(size, size)
+    blade = Color.html("#A0A8B8", 0.7)
+    blur = Color.html("#808898", 0.35)
+
+    for cx, cy in [(3, 3), (12, 3), (3, 12), (12, 12)]:
+        if frame == 0:
+            for dx in range(-2, 3):
+                px = cx + dx
+                if 0 <= px < size:
+                    img.set_pixel(px, cy, blade)
+                    if cy - 1 >= 0:
+                        img.set_pixel(px, cy - 1, blur)
+                    if cy + 1 < size:
+                        img.set_pixel(px, cy + 1, blur)
+        else:
+            for dy in range(-2, 3):
+                py = cy + dy
+                if 0 <= py < size:
+                    img.set_pixel(cx, py, blade)
+                    if cx - 1 >= 0:
+                        img.set_pixel(cx - 1, py, blur)
+                    if cx + 1 < size:
+                        img.set_pixel(cx + 1, py, blur)
+    return img
+
+
+def news_helicopter() -> Img:
+    img = Img(16, 16)
+    body = Color.html("#505868")
+    body_hi = Color.html("#606878")
+    dark = Color.html("#383E48")
+    window = Color.html("#70B0D0")
+    window_hi = Color.html("#90D0E8")
+    tail = Color.html("#404850")
+    tail_dark = Color.html("#303840")
+    stripe = Color.html("#D04040")
+    hub = Color.html("#2A2A38")
+    skid = Color.html("#303038")
+
+    for y in range(5, 12):
+        row_half = 4 if 7 <= y <= 9 else (3 if 6 <= y <= 10 else 2)
+        for x in range(8 - row_half, 8 + row_half):
+            c = body_hi if (x >= 8 and y <= 8) else body
+            if y in (5, 11):
+                c = dark
+            img.set_pixel(x, y, c)
+
+    img.set_pixel(10, 7, window_hi)
+    img.set_pixel(10, 8, window)
+    img.set_pixel(11, 7, window_hi)
+    img.set_pixel(11, 8, window)
+    img.set_pixel(9, 7, window)
+
+    for x in range(5, 10):
+        img.set_pixel(x, 10, stripe)
+
+    for x in range(1, 5):
+        img.set_pixel(x, 8, tail)
+        img.set_pixel(x, 9, tail_dark)
+
+    img.set_pixel(1, 7, tail)
+    img.set_pixel(1, 6, tail)
+    img.set_pixel(0, 7, tail_dark)
+
+    for x in range(3):
+        img.set_pixel(x, 5, Color.html("#A0A8B8", 0.5))
+
+    img.set_pixel(7, 7, hub)
+    img.set_pixel(8, 7, hub)
+
+    for x in range(5, 11):
+        img.set_pixel(x, 13, skid)
+    for x in range(6, 10):
+        img.set_pixel(x, 12, skid)
+    return img
+
+
+def news_helicopter_rotor(frame: int) -> Img:
+    size = 16
+    img = Img(size, size)
+    blade = Color.html("#B0B8C8", 0.6)
+    tip = Color.html("#C0C8D8", 0.8)
+    blur = Color.html("#808898", 0.25)
+    cx, cy = 7, 7
+    sign = -1 if frame == 0 else 1
+
+    for i in range(-6, 7):
+        px = cx + i
+        py = cy + sign * idiv(i, 2)
+        if 0 <= px < size and 0 <= py < size:
+            img.set_pixel(px, py, tip if abs(i) >= 5 else blade)
+            if py - 1 >= 0:
+                img.set_pixel(px, py - 1, blur)
+            if py + 1 < size:
+                img.set_pixel(px, py + 1, blur)
+    return img
+
+
+def mob_boss() -> Img:
+    img = Img(16, 16)
+    body = Color.html("#802030")
+    dark = body.darkened(0.2)
+    glow = Color.html("#D04040")
+
+    for y in range(1, 5):
+        for x in range(5, 11):
+            dx = x - 8.0
+            dy = y - 3.0
+            if dx * dx + dy * dy <= 6:
+                img.set_pixel(x, y, body)
+
+    for y in range(5, 12):
+        for x in range(3, 13):
+            img.set_pixel(x, y, body if x >= 8 else dark)
+
+    for y in range(12, 16):
+        for x in (5, 6, 10, 11):
+            img.set_pixel(x, y, dark)
+
+    for x in (3, 12):
+        for y in range(6, 11):
+            img.set_pixel(x, y, glow)
+    return img
+
+
+def projectile_streak(color: Color) -> Img:
+    img = Img(8, 8)
+    bright = color.lightened(0.3)
+    for x in range(2, 7):
+        img.set_pixel(x, 3, color)
+        img.set_pixel(x, 4, color)
+    img.set_pixel(6, 3, bright)
+    img.set_pixel(6, 4, bright)
+    img.set_pixel(1, 3, color.darkened(0.3))
+    img.set_pixel(1, 4, color.darkened(0.3))
+    return img
+
+
+def cannonball() -> Img:
+    img = Img(8, 8)
+    color = Color.html("#484850")
+    highlight = Color.html("#60606A")
+    for y in range(8):
+        for x in range(8):
+            dx = x - 4.0
+            dy = y - 4.0
+            if dx * dx + dy * dy <= 9:
+                img.set_pixel(x, y, highlight if (dx < 0 and dy < 0) else color)
+    return img
+
+
+def ice_shard() -> Img:
+    img = Img(8, 8)
+    color = Color.html("#80C0E0")
+    bright = Color.html("#B0E0F0")
+    for y in range(8):
+        for x in range(8):
+            dx = abs(x - 4.0) / 4.0
+            dy = abs(y - 4.0) / 2.0
+            if dx + dy <= 1.0:
+                img.set_pixel(x, y, bright if y < 4 else color)
+    return img
+
+
+def tear_gas_canister() -> Img:
+    img = Img(8, 8)
+    body = Color.html("#404048")
+    dark = Color.html("#303038")
+    band = Color.html("#E08040")
+    cap = Color.html("#505058")
+
+    for x in range(2, 6):
+        img.set_pixel(x, 0, cap)
+    for y in range(1, 7):
+        for x in range(2, 6):
+            c = body if x >= 4 else dark
+            if 3 <= y <= 4:
+                c = band if x >= 4 else band.darkened(0.2)
+            img.set_pixel(x, y, c)
+    for x in range(2, 6):
+        img.set_pixel(x, 7, dark)
+    return img
+
+
+# ---------------------------------------------------------------------------
+# BuildingSprites
+# ---------------------------------------------------------------------------
+
+def government_building() -> Img:
+    w, h = 192, 128
+    img = Img(w, h)
+
+    roof_color = Color.html("#585860")
+    wall_lit = Color.html("#484850")
+    wall_shadow = Color.html("#3A3A3E")
+    wall_dark = Color.html("#2E2E32")
+    window_lit = Color.html("#F0F0F0")
+    window_dark = Color.html("#1E1E22")
+    door_color = Color.html("#1A1A1E")
+    column_color = Color.html("#60606A")
+    step_color = Color.html("#484850")
+
+    bx, by, bw, bh, roof_h = 16, 8, 160, 80, 8
+
+    for y in range(by + roof_h, by + roof_h + bh):
+        t = (y - by - roof_h) / bh
+        for x in range(bx + bw // 2, bx + bw):
+            img.set_pixel(x, y, wall_lit.darkened(t * 0.15))
+        for x in range(bx, bx + bw // 2):
+            img.set_pixel(x, y, wall_shadow.darkened(t * 0.15))
+
+    for y in range(by, by + roof_h):
+        for x in range(bx + 2, bx + bw - 2):
+            img.set_pixel(x, y, roof_color)
+
+    for x in range(bx, bx + bw):
+        img.set_pixel(x, by + roof_h, wall_dark)
+
+    col_spacing = bw // 6
+    for i in range(1, 6):
+        col_x = bx + i * col_spacing
+        for y in range(by + roof_h + 4, by + roof_h + bh - 8):
+            if 0 <= col_x < w:
+                img.set_pixel(col_x, y, column_color)
+                if col_x + 1 < w:
+                    img.set_pixel(col_x + 1, y, column_color)
+
+    win_rows = [by + roof_h + 12, by + roof_h + 28, by + roof_h + 44]
+    win_cols_right = [bx + bw // 2 + 12 + i * 20 for i in range(3)]
+    win_cols_left = [bx + 12 + i * 20 for i in range(3)]
+    for wy in win_rows:
+        for wx in win_cols_right + win_cols_left:
+            wc = window_lit if hash2(wx, wy) % 3 != 0 else window_dark
+            for dy in range(4):
+                for dx in range(6):
+                    px, py = wx + dx, wy + dy
+                    if 0 <= px < w and 0 <= py < h:
+                        img.set_pixel(px, py, wc)
+
+    door_x = bx + bw // 2 - 8
+    door_y = by + roof_h + bh - 16
+    for dy in range(16):
+        for dx in range(16):
+            px, py = door_x + dx, door_y + dy
+            if 0 <= px < w and 0 <= py < h:
+                img.set_pixel(px, py, door_color)
+    for dy in range(16):
+        if door_x > 0 and door_y + dy < h:
+            img.set_pixel(door_x, door_y + dy, column_color)
+        if door_x + 15 < w and door_y + dy < h:
+            img.set_pixel(door_x + 15, door_y + dy, column_color)
+
+    for step in range(3):
+        sy = by + roof_h + bh + step * 2
+        sx = door_x - 2 - step * 2
+        sw = 20 + step * 4
+        for dx in range(sw):
+            for dy in range(2):
+                px, py = sx + dx, sy + dy
+                if 0 <= px < w and 0 <= py < h:
+                    img.set_pixel(px, py, step_color.darkened(step * 0.08))
+    return img
+
+
+def guard_booth() -> Img:
+    img = Img(32, 40)
+    wall_color = Color.html("#3A3A3E")
+    roof_color = Color.html("#484850")
+    slit_color = Color.html("#C8A040")
+
+    for y in range(8, 36):
+        for x in range(4, 28):
+            img.set_pixel(x, y, wall_color.darkened(0.12) if x < 16 else wall_color)
+    for y in range(4, 8):
+        for x in range(2, 30):
+            img.set_pixel(x, y, roof_color)
+    for x in range(8, 24):
+        for y in range(14, 17):
+            img.set_pixel(x, y, slit_color)
+    return img
+
+
+def apartment_block() -> Img:
+    w, h = 64, 64
+    img = Img(w, h)
+    wall_lit = Color.html("#404048")
+    wall_dark = Color.html("#32323A")
+    roof_color = Color.html("#484850")
+    window_lit = Color.html("#F0F0F0")
+    window_dark = Color.html("#1E1E22")
+
+    for y in range(6, 56):
+        t = (y - 6) / 50.0
+        for x in range(2, 62):
+            color = wall_lit if x >= 32 else wall_dark
+            img.set_pixel(x, y, color.darkened(t * 0.1))
+
+    for y in range(2, 6):
+        for x in range(64):
+            img.set_pixel(x, y, roof_color)
+
+    for row in range(4):
+        for col in range(5):
+            wx = 6 + col * 11
+            wy = 10 + row * 11
+            wc = window_lit if hash2(wx + col, wy + row) % 4 != 0 else window_dark
+            for dy in range(4):
+                for dx in range(5):
+                    px, py = wx + dx, wy + dy
+                    if px < w and py < h:
+                        img.set_pixel(px, py, wc)
+    return img
+
+
+def wall_segment() -> Img:
+    w, h = 32, 24
+    img = Img(w, h)
+    wall_color = Color.html("#3A3A3E")
+    fence_color = Color.html("#585860")
+
+    for y in range(8, 22):
+        for x in range(2, 30):
+            color = wall_color
+            if x < 16:
+                color = color.darkened(0.08)
+            if hash2(x, y) % 11 == 0:
+                color = color.lightened(0.05)
+            img.set_pixel(x, y, color)
+
+    for y in range(4, 8):
+        for x in range(2, 30):
+            if (x + y) % 3 == 0:
+                img.set_pixel(x, y, fence_color)
+
+    for x in (2, 15, 29):
+        for y in range(2, 10):
+            if x < w and y < h:
+                img.set_pixel(x, y, fence_color)
+    return img
+
+
+# ---------------------------------------------------------------------------
+# EnvironmentSprites
+# ---------------------------------------------------------------------------
+
+def rubble(seed_val: int) -> Img:
+    img = Img(16, 16)
+    colors = [Color.html("#28282C"), Color.html("#3A3A3E"), Color.html("#2E2E32"), Color.html("#242428")]
+    for i in range(10):
+        h = hash3(seed_val, i, 0)
+        x = h % 14 + 1
+        y = (h // 17) % 14 + 1
+        c = colors[h % len(colors)]
+        img.set_pixel(x, y, c)
+        if h % 3 == 0 and x + 1 < 16:
+            img.set_pixel(x + 1, y, c.darkened(0.1))
+    return img
+
+
+def barricade() -> Img:
+    img = Img(32, 16)
+    main = Color.html("#484850")
+    shadow = Color.html("#3A3A3E")
+    stripe = Color.html("#F0F0F0")
+    for y in range(4, 14):
+        for x in range(4, 28):
+            color = main if y < 9 else shadow
+            if (x + y) % 8 < 2:
+                color = stripe
+            img.set_pixel(x, y, color)
+    return img
+
+
+def wire_coil() -> Img:
+    img = Img(24, 12)
+    wire_color = Color.html("#585860")
+    for i in range(48):
+        t = i / 48.0 * TAU * 2.0
+        x = int(12.0 + math.cos(t) * (4.0 + i * 0.15))
+        y = int(6.0 + math.sin(t) * 3.0)
+        if 0 <= x < 24 and 0 <= y < 12:
+            img.set_pixel(x, y, wire_color)
+    return img
+
+
+def graffiti_tag(seed_val: int) -> Img:
+    img = Img(12, 6)
+    colors = [Color.html("#D04040"), Color.html("#F0F0F0"), Color.html("#A0D8A0")]
+    tag_color = colors[seed_val % len(colors)]
+    for i in range(8):
+        h = hash3(seed_val, i, 7)
+        x = 1 + h % 10
+        y = 1 + (h // 11) % 4
+        if x < 12 and y < 6:
+            img.set_pixel(x, y, tag_color)
+            if x + 1 < 12:
+                img.set_pixel(x + 1, y, tag_color.darkened(0.15))
+    return img
+
+
+def burned_vehicle() -> Img:
+    img = Img(48, 24)
+    body = Color.html("#1E1E22")
+    frame = Color.html("#28282C")
+    ember = Color.html("#D06030")
+    ember_dim = Color.html("#903020")
+
+    for y in range(8, 20):
+        x_start = 4 + idiv(20 - y, 3) if y < 14 else 4
+        x_end = 44 - idiv(20 - y, 3) if y < 14 else 44
+        for x in range(max(x_start, 0), min(x_end, 48)):
+            img.set_pixel(x, y, body)
+
+    for x in range(6, 42):
+        img.set_pixel(x, 19, frame)
+    for x in range(8, 16):
+        for y in range(6, 10):
+            img.set_pixel(x, y, frame)
+
+    for wx in (12, 34):
+        for dy in range(-2, 3):
+            for dx in range(-2, 3):
+                if dx * dx + dy * dy <= 4:
+                    px, py = wx + dx, 19 + dy
+                    if 0 <= px < 48 and 0 <= py < 24:
+                        img.set_pixel(px, py, Color.html("#121216"))
+
+    img.set_pixel(18, 10, ember)
+    img.set_pixel(22, 8, ember_dim)
+    img.set_pixel(30, 11, ember)
+    return img
+
+
+def puddle() -> Img:
+    img = Img(12, 6)
+    puddle_color = Color.html("#1A1A1E")
+    highlight = Color.html("#28282C")
+    for y in range(6):
+        for x in range(12):
+            dx = (x - 6.0) / 6.0
+            dy = (y - 3.0) / 3.0
+            if dx * dx + dy * dy <= 1.0:
+                img.set_pixel(x, y, highlight if (y == 2 and 4 < x < 8) else puddle_color)
+    return img
+
+
+def sandbag_stack() -> Img:
+    img = Img(20, 12)
+    bag_light = Color.html("#605848")
+    bag_dark = Color.html("#484038")
+    seam = Color.html("#383028")
+
+    for y in range(6, 12):
+        for x in range(2, 18):
+            color = bag_light if x < 10 else bag_dark
+            if x == 10:
+                color = seam
+            img.set_pixel(x, y, color)
+
+    for y in range(2, 7):
+        for x in range(5, 15):
+            img.set_pixel(x, y, bag_dark if y > 4 else bag_light)
+    return img
+
+
+def oil_barrel() -> Img:
+    img = Img(16, 20)
+    body = Color.html("#2A2A30")
+    rust = Color.html("#5A3828")
+    rim = Color.html("#3A3A42")
+    top = Color.html("#383840")
+    highlight = Color.html("#44444C")
+
+    for y in range(6, 20):
+        for x in range(3, 13):
+            if abs(x - 7.5) > 5.0:
+                continue
+            color = body
+            if x in (5, 6):
+                color = highlight
+            if (x * 7 + y * 13) % 17 < 2:
+                color = rust
+            if y >= 18:
+                color = rim
+            img.set_pixel(x, y, color)
+
+    for y in range(4, 8):
+        for x in range(3, 13):
+            dx = (x - 7.5) / 5.0
+            dy = (y - 5.5) / 1.8
+            if dx * dx + dy * dy <= 1.0:
+                img.set_pixel(x, y, rim if dy < -0.3 else top)
+    return img
+
+
+def fire_particle(seed_val: int) -> Img:
+    img = Img(8, 10)
+    core = Color.html("#FFFBE0")
+    mid = Color.html("#FFA820")
+    outer = Color.html("#E04010")
+    tip = Color.html("#C03008")
+
+    wobble = (seed_val % 5) - 2
+
+    for y in range(10):
+        for x in range(8):
+            cx = 3.5 + wobble * (y / 10.0) * 0.3
+            dx = abs(x - cx)
+            width = 3.5 * (1.0 - y / 12.0)
+            if dx > width:
+                continue
+            t = y / 10.0
+            if t < 0.25:
+                color = tip.lerp(outer, t / 0.25)
+            elif t < 0.5:
+                color = outer.lerp(mid, (t - 0.25) / 0.25)
+            elif t < 0.8:
+                color = mid.lerp(core, (t - 0.5) / 0.3)
+            else:
+                color = core
+            edge_t = dx / width
+            img.set_pixel(x, y, color.with_alpha(min(1.0, max(0.3, 1.0 - edge_t * 0.6))))
+    return img
+
+
+def fire_glow() -> Img:
+    img = Img(24, 12)
+    glow_color = Color.html("#FF8020")
+    for y in range(12):
+        for x in range(24):
+            dx = (x - 11.5) / 12.0
+            dy = (y - 5.5) / 6.0
+            dist = dx * dx + dy * dy
+            if dist > 1.0:
+                continue
+            img.set_pixel(x, y, glow_color.with_alpha((1.0 - dist) * 0.25))
+    return img
+
+
+def tire_stack() -> Img:
+    img = Img(16, 12)
+    rubber = Color.html("#1E1E22")
+    tread = Color.html("#2A2A30")
+    rim = Color.html("#343438")
+
+    for y in range(6, 12):
+        for x in range(1, 15):
+            dx = (x - 7.5) / 7.0
+            dy = (y - 9.0) / 3.0
+            if dx * dx + dy * dy <= 1.0:
+                img.set_pixel(x, y, tread if abs(dy) < 0.4 else rubber)
+
+    for y in range(1, 8):
+        for x in range(2, 14):
+            dx = (x - 7.5) / 6.0
+            dy = (y - 4.0) / 3.0
+            d2 = dx * dx + dy * dy
+            if d2 <= 1.0:
+                color = tread if abs(dy) < 0.4 else rubber
+                if 0.5 < d2 < 0.7:
+                    color = rim
+                img.set_pixel(x, y, color)
+    return img
+
+
+def fallen_sign(seed_val: int) -> Img:
+    img = Img(20, 10)
+    cardboard = Color.html("#8A7858")
+    cardboard_dark = Color.html("#706048")
+    text_colors = [Color.html("#D04040"), Color.html("#2040A0"), Color.html("#206020")]
+    text_color = text_colors[seed_val % len(text_colors)]
+
+    for y in range(2, 9):
+        x_off = idiv(y - 2, 4)
+        for x in range(2 + x_off, 18 + x_off):
+            if x >= 20:
+                continue
+            img.set_pixel(x, y, cardboard if y < 6 else cardboard_dark)
+
+    for i in range(6):
+        h = hash3(seed_val, i, 33)
+        x = 4 + h % 12
+        y = 3 + (h // 13) % 4
+        if x < 19 and y < 8:
+            img.set_pixel(x, y, text_color)
+            if x + 1 < 19:
+                img.set_pixel(x + 1, y, text_color.darkened(0.2))
+
+    for y in range(5, 10):
+        img.set_pixel(1, y, Color.html("#605040"))
+    return img
+
+
+# ---------------------------------------------------------------------------
+# PlaceholderSprites
+# ---------------------------------------------------------------------------
+
+def diamond(size: int, color: Color) -> Img:
+    img = Img(size, size)
+    half = size / 2.0
+    quarter = size / 4.0
+    for y in range(size):
+        for x in range(size):
+            dx = abs(x - half + 0.5) / half
+            dy = abs(y - half + 0.5) / quarter
+            if dx + dy <= 1.0:
+                img.set_pixel(x, y, color.darkened(0.25) if y > half else color)
+    return img
+
+
+# ---------------------------------------------------------------------------
+# Variant catalogue
+# ---------------------------------------------------------------------------
+
+# (base, accent) palettes BaseTower uses for its fallback turrets
+TURRET_PALETTES = [
+    ("#606068", "#90A0B8"),  # rubber_bullet / default
+    ("#585850", "#A08060"),  # tear_gas
+    ("#505060", "#E0E060"),  # taser_grid
+    ("#303040", "#A0A0C0"),  # surveillance_hub
+    ("#585050", "#E08040"),  # pepper_spray
+    ("#405040", "#80E060"),  # lrad_cannon
+    ("#504058", "#C080E0"),  # microwave_emitter
+]
+
+# (body, accent) palettes for enemy figures
+FIGURE_PALETTES = [
+    ("#D06040", "#F0F0F0"),  # protestor
+    ("#A04050", "#D04040"),  # agitator_elite
+]
+
+# BaseProjectile streak colours per damage type
+STREAK_COLORS = ["#F0D0D8", "#E08040", "#80E060", "#E0E060"]
+
+# PlaceholderSprites.create_diamond calls (TowerPlacer ghost)
+DIAMONDS = [(20, "#90A0B8")]
+
+# EnvironmentBuilder seeds: graffiti tags use i * 7 + 13, spawn rubble 500 + i
+GRAFFITI_SEEDS = [i * 7 + 13 for i in range(7)]
+SPAWN_RUBBLE_SEEDS = [500 + i for i in range(3)]
+
+# EnvironmentBuilder.build_obstacle_props roll thresholds (h % 20)
+OBSTACLE_RUBBLE_ROLLS = range(10, 14)
+OBSTACLE_SIGN_ROLLS = range(16, 18)
+
+
+def prop_seeds() -> tuple[list[int], list[int]]:
+    """Rubble and fallen-sign seeds EnvironmentBuilder uses on this map."""
+    rubble_seeds = list(SPAWN_RUBBLE_SEEDS)
+    for y in range(sim.MAP_H):
+        for x in range(sim.MAP_W):
+            if y in (0, sim.MAP_H - 1) or x in (0, sim.MAP_W - 1):
+                h = sim.tile_hash(x, y, 111)
+                if h % 10 < 3:
+                    rubble_seeds.append(h)
+
+    game_map = sim.build_map()
+    obstacles = game_map.walkable - game_map.buildable - {game_map.spawn, game_map.goal}
+    sign_seeds = []
+    for x, y in sorted(obstacles):
+        h = sim.tile_hash(x, y, 999)
+        if h % 20 in OBSTACLE_RUBBLE_ROLLS:
+            rubble_seeds.append(h)
+        elif h % 20 in OBSTACLE_SIGN_ROLLS:
+            sign_seeds.append(h)
+    return sorted(set(rubble_seeds)), sorted(set(sign_seeds))
+
+
+def catalogue() -> dict[str, Callable[[], Img]]:
+    """Manifest key -> generator. Keys must match BakedSprites callers."""
+    def key_color(code: str) -> str:
+        return Color.html(code).to_html()
+
+    sprites: dict[str, Callable[[], Img]] = {}
+    for base, accent in TURRET_PALETTES:
+        key = f"tower_turret_{key_color(base)}_{key_color(accent)}"
+        sprites[key] = lambda b=base, a=accent: tower_turret(Color.html(b), Color.html(a))
+    sprites["ice_tower"] = ice_tower
+    for body, accent in FIGURE_PALETTES:
+        key = f"enemy_figure_{key_color(body)}_{key_color(accent)}"
+        sprites[key] = lambda b=body, a=accent: enemy_figure(Color.html(b), Color.html(a))
+    sprites["press_drone"] = press_drone
+    sprites["news_helicopter"] = news_helicopter
+    for frame in range(2):
+        sprites[f"press_drone_rotors_{frame}"] = lambda f=frame: press_drone_rotors(f)
+        sprites[f"news_helicopter_rotor_{frame}"] = lambda f=frame: news_helicopter_rotor(f)
+    sprites["mob_boss"] = mob_boss
+    for code in STREAK_COLORS:
+        sprites[f"projectile_streak_{key_color(code)}"] = lambda c=code: projectile_streak(Color.html(c))
+    sprites["cannonball"] = cannonball
+    sprites["ice_shard"] = ice_shard
+    sprites["tear_gas_canister"] = tear_gas_canister
+
+    sprites["government_building"] = government_building
+    sprites["guard_booth"] = guard_booth
+    sprites["apartment_block"] = apartment_block
+    sprites["wall_segment"] = wall_segment
+
+    sprites["barricade"] = barricade
+    sprites["wire_coil"] = wire_coil
+    sprites["burned_vehicle"] = burned_vehicle
+    sprites["puddle"] = puddle
+    sprites["sandbag_stack"] = sandbag_stack
+    sprites["oil_barrel"] = oil_barrel
+    sprites["fire_glow"] = fire_glow
+    sprites["tire_stack"] = tire_stack
+    # Only seed % 5 shapes a flame, so five variants cover every seed
+    for variant in range(5):
+        sprites[f"fire_particle_{variant}"] = lambda v=variant: fire_particle(v)
+    rubble_seeds, sign_seeds = prop_seeds()
+    for seed in rubble_seeds:
+        sprites[f"rubble_{seed}"] = lambda s=seed: rubble(s)
+    for seed in GRAFFITI_SEEDS:
+        sprites[f"graffiti_tag_{seed}"] = lambda s=seed: graffiti_tag(s)
+    for seed in sign_seeds:
+        sprites[f"fallen_sign_{seed}"] = lambda s=seed: fallen_sign(s)
+
+    for size, code in DIAMONDS:
+        sprites[f"diamond_{size}_{key_color(code)}"] = lambda s=size, c=code: diamond(s, Color.html(c))
+    return sprites
+
+
+# ---------------------------------------------------------------------------
+# Atlas packing
+# ---------------------------------------------------------------------------
+
+def pack(images: dict[str, Img], width: int) -> tuple[dict[str, list[int]], int]:
+    """Shelf-pack images tallest first. Returns key -> [x, y, w, h] and atlas height."""
+    order = sorted(images, key=lambda k: (-images[k].h, -images[k].w, k))
+    regions: dict[str, list[int]] = {}
+    x = y = shelf_h = 0
+    for key in order:
+        img = images[key]
+        if img.w > width:
+            raise ValueError(f"{key} ({img.w}px) is wider than the atlas ({width}px)")
+        if x + img.w > width:
+            x = 0
+            y += shelf_h + PADDING
+            shelf_h = 0
+        regions[key] = [x, y, img.w, img.h]
+        x += img.w + PADDING
+        shelf_h = max(shelf_h, img.h)
+    return regions, y + shelf_h
+
+
+def sources_hash() -> str:
+    digest = hashlib.sha256()
+    for name in SOURCE_SCRIPTS:
+        digest.update(name.encode())
+        digest.update((HELPERS_DIR / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def bake() -> dict:
+    images = {key: gen() for key, gen in catalogue().items()}
+    regions, height = pack(images, ATLAS_WIDTH)
+    atlas = np.zeros((height, ATLAS_WIDTH, 4), dtype=np.uint8)
+    for key, (x, y, w, h) in regions.items():
+        atlas[y:y + h, x:x + w] = images[key].pixels
+
+    BAKED_DIR.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(atlas, "RGBA").save(ATLAS_PATH, optimize=True)
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "sources": sources_hash(),
+        "atlas": ATLAS_PATH.name,
+        "size": [ATLAS_WIDTH, height],
+        "sprites": dict(sorted(regions.items())),
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=1) + "\n")
+    return manifest
+
+
+def check() -> int:
+    if not MANIFEST_PATH.exists() or not ATLAS_PATH.exists():
+        print(f"MISSING: {MANIFEST_PATH.relative_to(PROJECT_ROOT)} -- run tools/bake_sprites.py")
+        return 1
+    manifest = json.loads(MANIFEST_PATH.read_text())
+    stale = []
+    if manifest.get("version") != MANIFEST_VERSION:
+        stale.append("manifest version")
+    if manifest.get("sources") != sources_hash():
+        stale.append("helper scripts changed")
+    missing = sorted(set(catalogue()) - set(manifest.get("sprites", {})))
+    if missing:
+        stale.append(f"{len(missing)} sprites missing")
+    if stale:
+        print(f"STALE: {', '.join(stale)} -- run tools/bake_sprites.py")
+        return 1
+    print(f"OK: {len(manifest['sprites'])} sprites baked")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bake procedural fallback sprites into an atlas")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the baked atlas is missing or stale")
+    parser.add_argument("--list", action="store_true", help="Print the sprite keys that would be baked")
+    args = parser.parse_args()
+
+    if args.check:
+        return check()
+    if args.list:
+        for key in catalogue():
+            print(key)
+        return 0
+
+    manifest = bake()
+    w, h = manifest["size"]
+    print(f"Baked {len(manifest['sprites'])} sprites into {w}x{h} atlas")
+    print(f"  {ATLAS_PATH.relative_to(PROJECT_ROOT)}")
+    print(f"  {MANIFEST_PATH.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
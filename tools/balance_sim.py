@@ -0,0 +1,1184 @@
+#!/usr/bin/env python3
+"""Headless balance simulator for tower layouts.
+
+Replays the game's combat rules outside Godot so layouts can be scored in
+bulk. Tower, enemy and wave stats are read straight from data/*.tres and
+synergies from SynergyManager.SYNERGIES, so the simulator follows the data
+as it is tuned. The map is rebuilt with the same tile hash as MapBuilder.
+The remaining game constants are mirrored by hand; check_constants() reads
+them back out of the GDScript sources and loading refuses to run on a
+mismatch, so a retuned constant can't silently skew the scores.
+
+The model is deliberately coarse: projectiles hit instantly, enemies have
+no hitbox radius and zig-zag / triggered abilities are ignored. Enough to
+rank layouts against each other, not to predict exact wave outcomes.
+
+Layout JSON is a list of placements:
+    [{"tower": "rubber_bullet", "tile": [5, 6], "tiers": [2, 0, 0]}, ...]
+
+Usage:
+    python3 tools/balance_sim.py LAYOUT.json [--waves 1-10] [--seed 1]
+    python3 tools/balance_sim.py RESULTS.json --rank 1   # replay a search result
+
+A search result is replayed over every seed it was scored with and the
+aggregate is reported the way layout_search.py scored it (mean score, worst
+waves cleared); --seed replays a single seed instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import math
+import random
+import re
+import sys
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+SYNERGY_SCRIPT = SCRIPTS_DIR / "autoloads" / "synergy_manager.gd"
+MAP_DATA_PATH = DATA_DIR / "maps" / "downtown.tres"  # tools/bake_map.py
+
+# ---------------------------------------------------------------------------
+# Game constants (mirrors of the GDScript sources, see check_constants)
+# ---------------------------------------------------------------------------
+
+# map_builder.gd
+MAP_W = 24
+MAP_H = 14
+SPAWN_TILE = (0, 6)
+GOAL_TILE = (MAP_W - 1, 8)
+OBSTACLE_SEED = 777
+OBSTACLE_PERCENT = 14
+NOBUILD_TILE = 3  # atlas columns; 0-2 are ground
+WALL_TILE = 4
+
+# One "tile" of range / speed is 32 px (base_tower.gd, base_enemy.gd)
+UNIT_PX = 32.0
+
+# wave_manager.gd
+SPAWN_GRACE = 1.5
+CROWD_FILES = ("rioter", "blonde_protestor", "goth_protestor", "student", "grandma", "masked")
+SPECIAL_IDS = ("shield_wall", "union_boss", "armored_van", "infiltrator", "press_drone", "news_helicopter")
+
+# damage_calculator.gd
+ARMOR_CONSTANT = 100.0
+ARMOR_MATRIX = [
+    [1.0, 1.0, 1.0, 0.7, 0.5, 0.8],        # KINETIC
+    [1.25, 1.5, 1.0, 0.75, 0.5, 0.9],      # CHEMICAL
+    [1.0, 1.25, 1.0, 1.0, 0.75, 0.85],     # HYDRAULIC
+    [1.5, 1.0, 0.75, 1.25, 0.35, 0.9],     # ELECTRIC
+    [1.5, 1.25, 1.0, 1.0, 1.0, 0.7],       # SONIC
+    [1.0, 1.25, 0.75, 1.5, 0.35, 0.85],    # DIRECTED_ENERGY
+    [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],        # CYBER
+    [1.25, 1.0, 1.0, 0.5, 0.5, 0.75],      # PSYCHOLOGICAL
+]
+
+# Enums.DamageType / Enums.StatusEffectType / Enums.ModifierOp
+KINETIC, CHEMICAL, HYDRAULIC, ELECTRIC, SONIC, DIRECTED_ENERGY = range(6)
+SLOW, FREEZE, POISON, BURN, ARMOR_SHRED, STUN, MARK, WEAKEN = range(8)
+OP_ADD, OP_MULTIPLY, OP_SET = range(3)
+
+# (status, damage type, multiplier) — DamageCalculator.get_status_synergy_mult
+STATUS_SYNERGIES = (
+    (SLOW, ELECTRIC, 1.30),
+    (MARK, SONIC, 1.25),
+    (BURN, CHEMICAL, 1.20),
+    (ARMOR_SHRED, KINETIC, 1.25),
+    (POISON, DIRECTED_ENERGY, 1.20),
+)
+
+# Projectile behaviours, keyed by projectile scene stem
+LINE_HIT_WIDTH = {
+    "water_stream_projectile": 14.0,
+    "pepper_spray_projectile": 12.0,
+    "microwave_beam_projectile": 10.0,
+}
+CHAIN_RADIUS = 60.0
+CLOUD_DURATION = 3.0
+CLOUD_INTERVAL = 0.5
+CLOUD_RATIO = 0.4
+CLOUD_RADIUS = 40.0
+
+SYNERGY_RANGE = 3
+
+
+# ---------------------------------------------------------------------------
+# .tres parsing
+# ---------------------------------------------------------------------------
+
+_HEADER_RE = re.compile(r'^\[(\w+)(.*)\]$')
+_ATTR_RE = re.compile(r'(\w+)="([^"]*)"')
+_REF_RE = re.compile(r'(Sub|Ext)Resource\("([^"]+)"\)')
+
+
+def _parse_value(raw: str):
+    """Convert a Godot variant literal to a Python value (best effort)."""
+    text = _REF_RE.sub(lambda m: repr({"__%s__" % m.group(1).lower(): m.group(2)}), raw)
+    text = re.sub(r'\btrue\b', "True", text)
+    text = re.sub(r'\bfalse\b', "False", text)
+    text = re.sub(r'\bnull\b', "None", text)
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return raw
+
+
+def _balanced(text: str) -> bool:
+    depth = 0
+    in_str = False
+    for ch in text:
+        if ch == '"':
+            in_str = not in_str
+        elif not in_str and ch in "[{(":
+            depth += 1
+        elif not in_str and ch in "]})":
+            depth -= 1
+    return depth <= 0
+
+
+def parse_tres(path: Path) -> tuple[dict, dict, dict]:
+    """Split a .tres file into (ext_resources, sub_resources, resource)."""
+    ext: dict[str, str] = {}
+    subs: dict[str, dict] = {}
+    resource: dict = {}
+    current: dict | None = None
+    pending = ""
+
+    for line in path.read_text().splitlines():
+        if pending:
+            pending += "\n" + line
+            if _balanced(pending):
+                key, _, value = pending.partition("=")
+                current[key.strip()] = _parse_value(value.strip())
+                pending = ""
+            continue
+        line = line.strip()
+        if not line or line.startswith(";"):
+            continue
+        header = _HEADER_RE.match(line)
+        if header:
+            kind, attrs = header.group(1), dict(_ATTR_RE.findall(header.group(2)))
+            if kind == "ext_resource":
+                ext[attrs["id"]] = attrs["path"]
+                current = None
+            elif kind == "sub_resource":
+                current = subs.setdefault(attrs["id"], {})
+            elif kind == "resource":
+                current = resource
+            else:
+                current = None
+            continue
+        if current is None or "=" not in line:
+            continue
+        if not _balanced(line):
+            pending = line
+            continue
+        key, _, value = line.partition("=")
+        current[key.strip()] = _parse_value(value.strip())
+
+    return ext, subs, resource
+
+
+def _res_path(res_path: str) -> Path:
+    return PROJECT_ROOT / res_path.removeprefix("res://")
+
+
+_TRES_CACHE: dict[Path, dict] = {}
+
+
+def load_tres(path: Path) -> dict:
+    """Load a .tres file with sub/ext resource references resolved.
+
+    Nested .tres references are loaded recursively; any other external
+    resource (scripts, scenes, textures) resolves to its res:// path.
+    """
+    path = path.resolve()
+    if path in _TRES_CACHE:
+        return _TRES_CACHE[path]
+
+    ext, subs, resource = parse_tres(path)
+
+    def resolve(value):
+        if isinstance(value, list):
+            return [resolve(v) for v in value]
+        if isinstance(value, dict):
+            if "__sub__" in value:
+                return {k: resolve(v) for k, v in subs.get(value["__sub__"], {}).items()}
+            if "__ext__" in value:
+                target = ext.get(value["__ext__"], "")
+                if target.endswith(".tres") and _res_path(target).exists():
+                    return load_tres(_res_path(target))
+                return target
+            return {k: resolve(v) for k, v in value.items()}
+        return value
+
+    data = {k: resolve(v) for k, v in resource.items()}
+    _TRES_CACHE[path] = data
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Game data
+# ---------------------------------------------------------------------------
+
+class StatusEffect(NamedTuple):
+    type: int
+    duration: float
+    potency: float
+    stack_limit: int
+    apply_chance: float
+
+
+class Tier(NamedTuple):
+    cost: int
+    modifiers: tuple[tuple[str, int, float], ...]
+    unlocks: StatusEffect | None
+
+
+class TowerType(NamedTuple):
+    id: str
+    cost: int
+    damage: float
+    damage_type: int
+    range: float
+    fire_rate: float
+    aoe: float
+    pierce: int
+    crit_chance: float
+    crit_multiplier: float
+    chain_targets: int
+    chain_falloff: float
+    crossfire: float
+    can_target_flying: bool
+    on_hit: tuple[StatusEffect, ...]
+    projectile: str
+    paths: tuple[tuple[Tier, ...], ...]
+
+
+class EnemyType(NamedTuple):
+    id: str
+    hp: float
+    speed: float
+    armor: float
+    armor_type: int
+    shield: float
+    flying: bool
+    stealth: bool
+    resistances: dict[int, float]
+    lives_cost: int
+    burst_threshold: float
+    burst_multiplier: float
+
+
+class SpawnSequence(NamedTuple):
+    enemy: EnemyType
+    count: int
+    interval: float
+    delay: float
+    hp_multiplier: float
+    speed_multiplier: float
+    armor_bonus: float
+
+
+class Wave(NamedTuple):
+    number: int
+    sequences: tuple[SpawnSequence, ...]
+
+
+class GameData(NamedTuple):
+    towers: dict[str, TowerType]
+    crowd: tuple[EnemyType, ...]
+    waves: list[Wave]
+    synergies: list[dict]
+
+
+def _status_effect(res: dict) -> StatusEffect:
+    return StatusEffect(
+        type=int(res.get("effect_type", 0)),
+        duration=float(res.get("duration", 1.0)),
+        potency=float(res.get("potency", 0.0)),
+        stack_limit=int(res.get("stack_limit", 1)),
+        apply_chance=float(res.get("apply_chance", 1.0)),
+    )
+
+
+def _tower_type(res: dict) -> TowerType:
+    paths = []
+    for path in res.get("upgrade_paths", []):
+        tiers = []
+        for tier in path.get("tiers", []):
+            mods = tuple(
+                (m["stat_name"], int(m.get("operation", OP_ADD)), float(m.get("value", 0.0)))
+                for m in tier.get("stat_modifiers", [])
+            )
+            unlock = tier.get("unlocks_ability")
+            tiers.append(Tier(
+                cost=int(tier.get("cost", 100)),
+                modifiers=mods,
+                unlocks=_status_effect(unlock) if isinstance(unlock, dict) else None,
+            ))
+        paths.append(tuple(tiers))
+
+    return TowerType(
+        id=res["tower_id"],
+        cost=int(res.get("build_cost", 100)),
+        damage=float(res.get("base_damage", 10.0)),
+        damage_type=int(res.get("damage_type", KINETIC)),
+        range=float(res.get("base_range", 4.0)),
+        fire_rate=float(res.get("fire_rate", 1.0)),
+        aoe=float(res.get("area_of_effect", 0.0)),
+        pierce=int(res.get("pierce_count", 1)),
+        crit_chance=float(res.get("crit_chance", 0.0)),
+        crit_multiplier=float(res.get("crit_multiplier", 2.0)),
+        chain_targets=int(res.get("chain_targets", 0)),
+        chain_falloff=float(res.get("chain_damage_falloff", 0.5)),
+        crossfire=float(res.get("crossfire_bonus", 0.0)),
+        can_target_flying=bool(res.get("can_target_flying", True)),
+        on_hit=tuple(_status_effect(e) for e in res.get("on_hit_effects", [])),
+        projectile=Path(str(res.get("projectile_scene", ""))).stem,
+        paths=tuple(paths),
+    )
+
+
+def _enemy_type(res: dict) -> EnemyType:
+    return EnemyType(
+        id=res["enemy_id"],
+        hp=float(res.get("max_hp", 100.0)),
+        speed=float(res.get("base_speed", 1.0)),
+        armor=float(res.get("armor", 0.0)),
+        armor_type=int(res.get("armor_type", 0)),
+        shield=float(res.get("shield", 0.0)),
+        flying=int(res.get("movement_type", 0)) == 1,
+        stealth=bool(res.get("is_stealth", False)),
+        resistances={int(k): float(v) for k, v in res.get("resistances", {}).items()},
+        lives_cost=int(res.get("lives_cost", 1)),
+        burst_threshold=float(res.get("speed_burst_threshold", 0.0)),
+        burst_multiplier=float(res.get("speed_burst_multiplier", 2.0)),
+    )
+
+
+def load_synergies(script: Path = SYNERGY_SCRIPT) -> list[dict]:
+    """Read the SYNERGIES constant out of synergy_manager.gd."""
+    source = script.read_text()
+    match = re.search(r'^const SYNERGIES = (\[.*?^\])', source, re.S | re.M)
+    if not match:
+        raise ValueError(f"SYNERGIES not found in {script}")
+    return ast.literal_eval(match.group(1))
+
+
+# ---------------------------------------------------------------------------
+# Source checks
+# ---------------------------------------------------------------------------
+
+# (script, const or var name, mirrored value)
+_CONST_MIRRORS = (
+    ("main/map_builder.gd", "MAP_W", MAP_W),
+    ("main/map_builder.gd", "MAP_H", MAP_H),
+    ("autoloads/wave_manager.gd", "SPAWN_GRACE_PERIOD", SPAWN_GRACE),
+    ("autoloads/wave_manager.gd", "_CROWD_PATHS", [f"res://data/enemies/{name}.tres" for name in CROWD_FILES]),
+    ("autoloads/wave_manager.gd", "_SPECIAL_IDS", list(SPECIAL_IDS)),
+    ("autoloads/damage_calculator.gd", "ARMOR_CONSTANT", ARMOR_CONSTANT),
+    ("autoloads/damage_calculator.gd", "ARMOR_MATRIX", dict(enumerate(ARMOR_MATRIX))),
+    ("autoloads/damage_calculator.gd", "STATUS_SYNERGIES", [list(rule) for rule in STATUS_SYNERGIES]),
+    *(
+        (f"projectiles/{stem}.gd", "LINE_HIT_WIDTH", width)
+        for stem, width in LINE_HIT_WIDTH.items()
+    ),
+    ("projectiles/chain_lightning_projectile.gd", "CHAIN_RADIUS", CHAIN_RADIUS),
+    ("effects/tear_gas_cloud.gd", "cloud_duration", CLOUD_DURATION),
+    ("effects/tear_gas_cloud.gd", "DAMAGE_INTERVAL", CLOUD_INTERVAL),
+    ("effects/tear_gas_cloud.gd", "DAMAGE_RATIO", CLOUD_RATIO),
+    ("effects/tear_gas_cloud.gd", "CLOUD_RADIUS", CLOUD_RADIUS),
+    ("autoloads/synergy_manager.gd", "SYNERGY_RANGE", SYNERGY_RANGE),
+)
+
+# Values MapBuilder writes inline: (script, pattern, mirrored capture groups)
+_LITERAL_MIRRORS = (
+    ("main/map_builder.gd", r'is_spawn := \(x == (\d+) and y == (\d+)\)', SPAWN_TILE),
+    ("main/map_builder.gd", r'is_goal := \(x == MAP_W - 1 and y == (\d+)\)', GOAL_TILE[1:]),
+    ("main/map_builder.gd", r'obs_hash := _tile_hash\(x, y, (\d+)\)\s+if obs_hash % 100 < (\d+)',
+     (OBSTACLE_SEED, OBSTACLE_PERCENT)),
+    ("main/map_builder.gd", r'const NOBUILD\s*:= Vector2i\((\d+), 0\)', (NOBUILD_TILE,)),
+    ("main/map_builder.gd", r'const WALL\s*:= Vector2i\((\d+), 0\)', (WALL_TILE,)),
+)
+
+_ENUM_MIRRORS = {
+    "DamageType": {
+        "KINETIC": KINETIC, "CHEMICAL": CHEMICAL, "HYDRAULIC": HYDRAULIC,
+        "ELECTRIC": ELECTRIC, "SONIC": SONIC, "DIRECTED_ENERGY": DIRECTED_ENERGY,
+    },
+    "StatusEffectType": {
+        "SLOW": SLOW, "FREEZE": FREEZE, "POISON": POISON, "BURN": BURN,
+        "ARMOR_SHRED": ARMOR_SHRED, "STUN": STUN, "MARK": MARK, "WEAKEN": WEAKEN,
+    },
+    "ModifierOp": {"ADD": OP_ADD, "MULTIPLY": OP_MULTIPLY, "SET": OP_SET},
+}
+
+
+def load_enums(script: Path = SCRIPTS_DIR / "enums.gd") -> dict[str, int]:
+    """Enums.gd values keyed "Enum.NAME" (implicit values only)."""
+    values = {}
+    for enum, body in re.findall(r'^enum (\w+) \{(.*?)^\}', script.read_text(), re.S | re.M):
+        names = re.findall(r'^\s*([A-Z][A-Z0-9_]*)\s*,', body, re.M)
+        values.update({f"{enum}.{name}": i for i, name in enumerate(names)})
+    return values
+
+
+def gd_constant(script: Path, name: str, enums: dict[str, int]):
+    """Evaluate a literal const/var initialiser, resolving Enums.X.Y references."""
+    source = script.read_text()
+    match = re.search(rf'^(?:const|var) {name}\b[^=\n]*=\s*', source, re.M)
+    if not match:
+        raise ValueError(f"{name} not found in {script}")
+    text = ""
+    for line in source[match.end():].splitlines():
+        text += re.sub(r'\s*#.*$', "", line) + "\n"
+        if _balanced(text):
+            break
+    text = re.sub(r'\bEnums\.(\w+\.\w+)', lambda m: str(enums[m.group(1)]), text)
+    return ast.literal_eval(text.strip())
+
+
+def check_constants() -> list[str]:
+    """Compare every hand-mirrored constant with its GDScript source."""
+    enums = load_enums()
+    mismatches = []
+    for enum, names in _ENUM_MIRRORS.items():
+        for name, value in names.items():
+            actual = enums.get(f"{enum}.{name}")
+            if actual != value:
+                mismatches.append(f"Enums.{enum}.{name}: source {actual}, mirror {value}")
+    for rel, name, value in _CONST_MIRRORS:
+        actual = gd_constant(SCRIPTS_DIR / rel, name, enums)
+        if actual != value:
+            mismatches.append(f"{rel} {name}: source {actual!r}, mirror {value!r}")
+    for rel, pattern, value in _LITERAL_MIRRORS:
+        match = re.search(pattern, (SCRIPTS_DIR / rel).read_text())
+        actual = tuple(int(g) for g in match.groups()) if match else None
+        if actual != tuple(value):
+            mismatches.append(f"{rel} /{pattern}/: source {actual}, mirror {tuple(value)}")
+    return mismatches
+
+
+def load_game_data() -> GameData:
+    """Load every tower, enemy and wave resource plus the synergy table."""
+    mismatches = check_constants()
+    if mismatches:
+        raise ValueError("balance_sim.py constants out of sync with the GDScript sources:\n  "
+                         + "\n  ".join(mismatches))
+
+    towers: dict[str, TowerType] = {}
+    for path in sorted((DATA_DIR / "towers").glob("*.tres")):
+        tower = _tower_type(load_tres(path))
+        towers[tower.id] = tower
+
+    crowd = tuple(
+        _enemy_type(load_tres(DATA_DIR / "enemies" / f"{name}.tres"))
+        for name in CROWD_FILES
+        if (DATA_DIR / "enemies" / f"{name}.tres").exists()
+    )
+
+    waves: list[Wave] = []
+    for path in sorted((DATA_DIR / "waves").glob("wave_*.tres")):
+        res = load_tres(path)
+        sequences = []
+        for seq in res.get("spawn_sequences", []):
+            sequences.append(SpawnSequence(
+                enemy=_enemy_type(seq["enemy_data"]),
+                count=int(seq.get("count", 10)),
+                interval=float(seq.get("spawn_interval", 0.8)),
+                delay=float(seq.get("start_delay", 0.0)),
+                hp_multiplier=float(seq.get("hp_multiplier", 1.0)),
+                speed_multiplier=float(seq.get("speed_multiplier", 1.0)),
+                armor_bonus=float(seq.get("armor_bonus", 0.0)),
+            ))
+        waves.append(Wave(int(res.get("wave_number", len(waves) + 1)), tuple(sequences)))
+
+    return GameData(towers, crowd, waves, load_synergies())
+
+
+# ---------------------------------------------------------------------------
+# Map and pathing
+# ---------------------------------------------------------------------------
+
+def tile_hash(x: int, y: int, seed: int) -> int:
+    return abs((x * 73856093 + y * 19349663 + seed) & 0xFFFFFF)
+
+
+def tile_to_world(tile: tuple[int, int]) -> tuple[float, float]:
+    """Isometric diamond-down tile centre (constant offset dropped)."""
+    x, y = tile
+    return ((x - y) * 32.0, (x + y) * 16.0)
+
+
+class GameMap(NamedTuple):
+    walkable: frozenset[tuple[int, int]]
+    buildable: frozenset[tuple[int, int]]
+    spawn: tuple[int, int]
+    goal: tuple[int, int]
+
+
+def build_map() -> GameMap:
+    """The baked map MapBuilder paints, or its hash classification if unbaked."""
+    if MAP_DATA_PATH.exists():
+        return load_baked_map(MAP_DATA_PATH)
+    walkable = set()
+    buildable = set()
+    for y in range(MAP_H):
+        for x in range(MAP_W):
+            pos = (x, y)
+            if pos in (SPAWN_TILE, GOAL_TILE):
+                walkable.add(pos)
+            elif y in (0, MAP_H - 1) or x in (0, MAP_W - 1):
+                continue
+            elif tile_hash(x, y, OBSTACLE_SEED) % 100 < OBSTACLE_PERCENT:
+                walkable.add(pos)
+            else:
+                walkable.add(pos)
+                buildable.add(pos)
+    return GameMap(frozenset(walkable), frozenset(buildable), SPAWN_TILE, GOAL_TILE)
+
+
+def load_baked_map(path: Path) -> GameMap:
+    """Classify the cells of a MapData .tres written by bake_map.py."""
+    _, _, res = parse_tres(path)
+    width, height = _vector2i_list(res["size"])[0]
+    cells = [int(v) for v in re.findall(r"\d+", res["cells"].partition("(")[2])]
+    if len(cells) != width * height:
+        raise ValueError(f"{path}: {len(cells)} cells for a {width}x{height} map")
+    walkable = set()
+    buildable = set()
+    for i, cell in enumerate(cells):
+        pos = (i % width, i // width)
+        if cell != WALL_TILE:
+            walkable.add(pos)
+        if cell < NOBUILD_TILE:
+            buildable.add(pos)
+    spawn = _vector2i_list(res["spawn_tiles"])[0]
+    goal = _vector2i_list(res["goal_tiles"])[0]
+    return GameMap(frozenset(walkable), frozenset(buildable), spawn, goal)
+
+
+def _vector2i_list(raw: str) -> list[tuple[int, int]]:
+    return [(int(x), int(y)) for x, y in re.findall(r"Vector2i\((-?\d+), (-?\d+)\)", raw)]
+
+
+def find_path(game_map: GameMap, blocked) -> list[tuple[int, int]]:
+    """Shortest 4-connected tile path from spawn to goal, or [] if sealed."""
+    start, goal = game_map.spawn, game_map.goal
+    prev = {start: None}
+    queue = deque([start])
+    while queue:
+        cur = queue.popleft()
+        if cur == goal:
+            break
+        x, y = cur
+        for nxt in ((x + 1, y), (x, y + 1), (x - 1, y), (x, y - 1)):
+            if nxt in prev or nxt not in game_map.walkable or nxt in blocked:
+                continue
+            prev[nxt] = cur
+            queue.append(nxt)
+    if goal not in prev:
+        return []
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = prev[node]
+    path.reverse()
+    return path
+
+
+def can_place(game_map: GameMap, occupied, tile: tuple[int, int]) -> bool:
+    """Same rule as PathfindingManager.can_place_tower."""
+    if tile not in game_map.buildable or tile in occupied:
+        return False
+    return bool(find_path(game_map, set(occupied) | {tile}))
+
+
+# ---------------------------------------------------------------------------
+# Layouts
+# ---------------------------------------------------------------------------
+
+def crosspath_limits(tower: TowerType) -> tuple[int, int]:
+    """(max_paths_used, max_deep_tier) as UpgradeComponent.init picks them."""
+    return (1, 5) if len(tower.paths) == 1 else (2, 2)
+
+
+def tiers_valid(tower: TowerType, tiers) -> bool:
+    max_paths, max_deep = crosspath_limits(tower)
+    if len(tiers) < len(tower.paths):
+        return False
+    for i, t in enumerate(tiers):
+        if t < 0 or (t > 0 and (i >= len(tower.paths) or t > len(tower.paths[i]))):
+            return False
+    used = sum(1 for t in tiers if t > 0)
+    deep = sum(1 for t in tiers if t > max_deep)
+    return used <= max_paths and deep <= 1
+
+
+def placement_cost(tower: TowerType, tiers) -> int:
+    total = tower.cost
+    for path_i, tier in enumerate(tiers):
+        for tier_i in range(tier):
+            total += tower.paths[path_i][tier_i].cost
+    return total
+
+
+def layout_cost(data: GameData, layout: list[dict]) -> int:
+    return sum(placement_cost(data.towers[p["tower"]], p["tiers"]) for p in layout)
+
+
+def validate_layout(data: GameData, game_map: GameMap, layout: list[dict]) -> str | None:
+    """Return an error message, or None when the layout could be built."""
+    occupied = set()
+    for p in layout:
+        tower = data.towers.get(p["tower"])
+        if tower is None:
+            return f"unknown tower '{p['tower']}'"
+        tile = tuple(p["tile"])
+        if not can_place(game_map, occupied, tile):
+            return f"{p['tower']} at {tile} is not placeable"
+        if not tiers_valid(tower, p["tiers"]):
+            return f"{p['tower']} tiers {p['tiers']} break crosspath rules"
+        occupied.add(tile)
+    return None
+
+
+def synergy_multipliers(data: GameData, layout: list[dict]) -> list[tuple[float, float, list[str]]]:
+    """Per-placement (damage_mult, rate_mult, names), as SynergyManager computes them."""
+    grid = {tuple(p["tile"]): p["tower"] for p in layout}
+    out = []
+    for p in layout:
+        tx, ty = p["tile"]
+        tower_id = p["tower"]
+        dmg = rate = 1.0
+        names = []
+        for syn in data.synergies:
+            is_a = tower_id == syn["tower_a"]
+            is_b = tower_id == syn["tower_b"]
+            if not is_a and not is_b:
+                continue
+            if syn["tower_a"] == syn["tower_b"] or is_a:
+                partner = syn["tower_b"]
+                bonus, rate_bonus = syn["bonus_a"], syn.get("rate_a", 1.0)
+            else:
+                partner = syn["tower_a"]
+                bonus, rate_bonus = syn["bonus_b"], syn.get("rate_b", 1.0)
+            stacks = 0
+            for dx in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
+                for dy in range(-SYNERGY_RANGE, SYNERGY_RANGE + 1):
+                    if (dx or dy) and grid.get((tx + dx, ty + dy)) == partner:
+                        stacks += 1
+            stacks = min(stacks, syn["max_stacks"])
+            if stacks > 0:
+                dmg *= bonus ** stacks
+                rate *= rate_bonus ** stacks
+                names.append(syn["id"])
+        out.append((dmg, rate, names))
+    return out
+
+
+def layout_key(layout: list[dict]) -> str:
+    """Order-independent identity of a layout (for dedupe and seeding)."""
+    parts = sorted(f"{p['tower']}@{p['tile'][0]},{p['tile'][1]}:{''.join(map(str, p['tiers']))}" for p in layout)
+    return "|".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+def late_wave_hp_scale(wave_index: int) -> float:
+    """WaveManager._get_late_wave_hp_scale for a 0-based wave index."""
+    w = wave_index
+    if w <= 1:
+        return 1.0
+    scale = 1.10 ** max(0, min(w - 1, 8))
+    if w <= 9:
+        return scale
+    scale *= 1.14 ** max(0, min(w - 9, 15))
+    if w <= 24:
+        return scale
+    scale *= 1.17 ** max(0, min(w - 24, 15))
+    if w <= 39:
+        return scale
+    return scale * 1.20 ** max(0, min(w - 39, 10))
+
+
+class _Tower:
+    __slots__ = (
+        "id", "x", "y", "damage", "damage_type", "range_px", "interval", "timer",
+        "aoe", "crit_chance", "crit_multiplier", "chain_targets", "chain_falloff",
+        "crossfire", "can_target_flying", "effects", "projectile", "damage_dealt",
+    )
+
+
+class _Enemy:
+    __slots__ = (
+        "type", "hp", "max_hp", "shield", "armor", "speed", "x", "y", "path",
+        "path_len", "wp", "traveled", "vx", "vy", "effects", "burst", "alive",
+    )
+
+
+class WaveReport(NamedTuple):
+    wave: int
+    total_hp: float
+    damage: float
+    leaked: int
+
+
+class SimResult(NamedTuple):
+    waves_cleared: int
+    waves_played: int
+    lives_lost: int
+    first_leak_wave: int | None
+    score: float
+    reports: list[WaveReport]
+
+    def to_dict(self) -> dict:
+        return {
+            "waves_cleared": self.waves_cleared,
+            "waves_played": self.waves_played,
+            "lives_lost": self.lives_lost,
+            "first_leak_wave": self.first_leak_wave,
+            "score": round(self.score, 4),
+            "waves": [r._asdict() for r in self.reports],
+        }
+
+
+class Simulator:
+    """Fixed-timestep combat simulation of a static layout over a wave range."""
+
+    def __init__(
+        self,
+        data: GameData,
+        game_map: GameMap,
+        layout: list[dict],
+        seed: int = 0,
+        dt: float = 1.0 / 30.0,
+    ):
+        self.data = data
+        self.rng = random.Random(seed)
+        self.dt = dt
+        occupied = {tuple(p["tile"]) for p in layout}
+        tiles = find_path(game_map, occupied)
+        if not tiles:
+            raise ValueError("layout seals the path from spawn to goal")
+        self.ground_path = [tile_to_world(t) for t in tiles]
+        self.flying_path = [tile_to_world(game_map.spawn), tile_to_world(game_map.goal)]
+        self.towers = [self._compile_tower(p, syn) for p, syn in zip(layout, synergy_multipliers(data, layout))]
+        self.enemies: list[_Enemy] = []
+        self.clouds: list[list] = []  # [x, y, damage, remaining, tick_timer, tower]
+
+    # -- Setup --
+
+    def _compile_tower(self, placement: dict, synergy: tuple[float, float, list[str]]) -> _Tower:
+        tt = self.data.towers[placement["tower"]]
+        stats = {
+            "base_damage": tt.damage, "area_of_effect": tt.aoe, "pierce_count": float(tt.pierce),
+            "crit_chance": tt.crit_chance, "crit_multiplier": tt.crit_multiplier,
+            "chain_targets": float(tt.chain_targets), "base_range": tt.range, "fire_rate": tt.fire_rate,
+        }
+        effects = list(tt.on_hit)
+        # Tiers are bought path by path; modifiers fold in purchase order
+        for path_i, tier_count in enumerate(placement["tiers"]):
+            for tier in tt.paths[path_i][:tier_count] if tier_count else ():
+                for stat, op, value in tier.modifiers:
+                    if stat not in stats:
+                        continue
+                    if op == OP_ADD:
+                        stats[stat] += value
+                    elif op == OP_MULTIPLY:
+                        stats[stat] *= value
+                    else:
+                        stats[stat] = value
+                if tier.unlocks:
+                    effects.append(tier.unlocks)
+
+        dmg_mult, rate_mult, _ = synergy
+        t = _Tower()
+        t.id = tt.id
+        t.x, t.y = tile_to_world(tuple(placement["tile"]))
+        t.damage = stats["base_damage"] * dmg_mult
+        t.damage_type = tt.damage_type
+        t.range_px = stats["base_range"] * UNIT_PX
+        t.interval = 1.0 / max(stats["fire_rate"] * rate_mult, 0.1)
+        t.timer = t.interval
+        t.aoe = stats["area_of_effect"]
+        t.crit_chance = stats["crit_chance"]
+        t.crit_multiplier = stats["crit_multiplier"]
+        t.chain_targets = int(stats["chain_targets"])
+        t.chain_falloff = tt.chain_falloff
+        t.crossfire = tt.crossfire
+        t.can_target_flying = tt.can_target_flying
+        t.effects = tuple(effects)
+        t.projectile = tt.projectile
+        t.damage_dealt = 0.0
+        return t
+
+    def _spawn(self, et: EnemyType, hp_mult: float, speed_mult: float, armor_bonus: float) -> _Enemy:
+        e = _Enemy()
+        e.type = et
+        e.max_hp = e.hp = et.hp * hp_mult
+        e.shield = et.shield
+        e.armor = et.armor + armor_bonus
+        e.speed = et.speed * speed_mult
+        e.path = self.flying_path if et.flying else self.ground_path
+        e.path_len = sum(math.dist(a, b) for a, b in zip(e.path, e.path[1:])) or 1.0
+        e.x, e.y = e.path[0]
+        e.wp = 1
+        e.traveled = 0.0
+        e.vx = e.vy = 0.0
+        e.effects = {}
+        e.burst = False
+        e.alive = True
+        self.enemies.append(e)
+        return e
+
+    def _timeline(self, wave_index: int) -> list[tuple[float, EnemyType, float, float, float]]:
+        wave = self.data.waves[wave_index]
+        scale = late_wave_hp_scale(wave_index)
+        timeline = []
+        for seq in wave.sequences:
+            t = seq.delay
+            crowd = self.data.crowd
+            is_crowd = bool(crowd) and seq.enemy.id not in SPECIAL_IDS
+            for _ in range(seq.count):
+                enemy = crowd[self.rng.randrange(len(crowd))] if is_crowd else seq.enemy
+                timeline.append((t + SPAWN_GRACE, enemy, seq.hp_multiplier * scale, seq.speed_multiplier, seq.armor_bonus))
+                t += seq.interval
+        timeline.sort(key=lambda entry: entry[0])
+        return timeline
+
+    # -- Status effects --
+
+    @staticmethod
+    def _has(e: _Enemy, effect_type: int) -> bool:
+        return bool(e.effects.get(effect_type))
+
+    def _apply_effect(self, e: _Enemy, effect: StatusEffect) -> None:
+        if self.rng.random() > effect.apply_chance:
+            return
+        stacks = e.effects.setdefault(effect.type, [])
+        if len(stacks) < effect.stack_limit:
+            stacks.append([effect.duration, effect.potency])
+        elif stacks:
+            stacks[0][0] = effect.duration
+
+    def _slow_factor(self, e: _Enemy) -> float:
+        if self._has(e, FREEZE) or self._has(e, STUN):
+            return 0.0
+        factor = 1.0
+        for _, potency in e.effects.get(SLOW, ()):
+            factor *= 1.0 - potency
+        return max(factor, 0.0)
+
+    # -- Damage --
+
+    def _hit(self, tower: _Tower, e: _Enemy, damage: float, apply_effects: bool = True) -> None:
+        if not e.alive:
+            return
+        et = e.type
+        vuln = 1.0 + sum(p for _, p in e.effects.get(MARK, ()))
+        for status, dtype, mult in STATUS_SYNERGIES:
+            if dtype == tower.damage_type and self._has(e, status):
+                vuln *= mult
+        shred = min(sum(p for _, p in e.effects.get(ARMOR_SHRED, ())), 1.0)
+        armor = e.armor * (1.0 - shred)
+        dmg = (
+            damage
+            * ARMOR_MATRIX[tower.damage_type][et.armor_type]
+            * et.resistances.get(tower.damage_type, 1.0)
+            * (1.0 - armor / (armor + ARMOR_CONSTANT))
+            * vuln
+        )
+        if self.rng.random() < tower.crit_chance:
+            dmg *= tower.crit_multiplier
+        dmg = max(dmg, 0.0)
+        if e.shield > 0.0:
+            absorbed = min(e.shield, dmg)
+            e.shield -= absorbed
+            dmg -= absorbed
+        dealt = min(dmg, e.hp)
+        e.hp -= dealt
+        tower.damage_dealt += dealt
+        self._damage_this_wave += dealt
+        if e.hp <= 0.0:
+            e.alive = False
+            return
+        if et.burst_threshold > 0.0 and not e.burst and e.hp / e.max_hp <= et.burst_threshold:
+            e.burst = True
+            e.speed *= et.burst_multiplier
+        if apply_effects:
+            for effect in tower.effects:
+                self._apply_effect(e, effect)
+
+    def _in_radius(self, x: float, y: float, radius: float):
+        r2 = radius * radius
+        return [e for e in self.enemies if e.alive and (e.x - x) ** 2 + (e.y - y) ** 2 <= r2]
+
+    def _targetable(self, tower: _Tower, e: _Enemy) -> bool:
+        if not e.alive or e.type.stealth:
+            return False
+        if e.type.flying and not tower.can_target_flying:
+            return False
+        return (e.x - tower.x) ** 2 + (e.y - tower.y) ** 2 <= tower.range_px * tower.range_px
+
+    def _fire(self, tower: _Tower) -> None:
+        target = None
+        best = -1.0
+        for e in self.enemies:
+            if self._targetable(tower, e):
+                progress = e.traveled / e.path_len
+                if progress > best:
+                    best, target = progress, e
+        if target is None:
+            return
+
+        damage = tower.damage
+        if tower.crossfire > 0.0 and (target.vx or target.vy):
+            dx, dy = target.x - tower.x, target.y - tower.y
+            dist = math.hypot(dx, dy) or 1.0
+            speed = math.hypot(target.vx, target.vy)
+            dot = abs((target.vx * dx + target.vy * dy) / (speed * dist))
+            damage *= 1.0 + tower.crossfire * (1.0 - dot)
+
+        kind = tower.projectile
+        if kind in ("sonic_wave_projectile", "surveillance_pulse_projectile"):
+            for e in self._in_radius(tower.x, tower.y, tower.aoe * UNIT_PX):
+                self._hit(tower, e, damage)
+        elif kind in LINE_HIT_WIDTH:
+            width = LINE_HIT_WIDTH[kind]
+            ax, ay, bx, by = tower.x, tower.y, target.x, target.y
+            seg_x, seg_y = bx - ax, by - ay
+            seg_len2 = seg_x * seg_x + seg_y * seg_y or 1.0
+            for e in self.enemies:
+                if not e.alive:
+                    continue
+                t = max(0.0, min(1.0, ((e.x - ax) * seg_x + (e.y - ay) * seg_y) / seg_len2))
+                if math.hypot(e.x - (ax + seg_x * t), e.y - (ay + seg_y * t)) <= width:
+                    self._hit(tower, e, damage)
+        elif kind == "chain_lightning_projectile":
+            hit = {id(target)}
+            cx, cy = target.x, target.y
+            self._hit(tower, target, damage)
+            current = damage
+            for _ in range(tower.chain_targets):
+                current *= tower.chain_falloff
+                nearest, nearest_d = None, CHAIN_RADIUS * CHAIN_RADIUS
+                for e in self.enemies:
+                    if e.alive and id(e) not in hit:
+                        d = (e.x - cx) ** 2 + (e.y - cy) ** 2
+                        if d <= nearest_d:
+                            nearest, nearest_d = e, d
+                if nearest is None:
+                    break
+                hit.add(id(nearest))
+                cx, cy = nearest.x, nearest.y
+                self._hit(tower, nearest, current)
+        elif kind == "tear_gas_projectile":
+            x, y = target.x, target.y
+            if tower.aoe > 0.0:
+                for e in self._in_radius(x, y, tower.aoe * UNIT_PX):
+                    self._hit(tower, e, damage)
+            self.clouds.append([x, y, damage * CLOUD_RATIO, CLOUD_DURATION, CLOUD_INTERVAL, tower])
+        else:
+            if tower.aoe > 0.0:
+                for e in self._in_radius(target.x, target.y, tower.aoe * UNIT_PX):
+                    self._hit(tower, e, damage)
+            else:
+                self._hit(tower, target, damage)
+
+    # -- Stepping --
+
+    def _move(self, e: _Enemy, dt: float) -> bool:
+        """Advance one enemy; returns True when it reached the goal."""
+        budget = e.speed * self._slow_factor(e) * UNIT_PX * dt
+        px, py = e.x, e.y
+        path = e.path
+        while budget > 0.0 and e.wp < len(path):
+            tx, ty = path[e.wp]
+            dist = math.hypot(tx - e.x, ty - e.y)
+            if dist <= budget:
+                e.x, e.y = tx, ty
+                budget -= dist
+                e.traveled += dist
+                e.wp += 1
+            else:
+                e.x += (tx - e.x) / dist * budget
+                e.y += (ty - e.y) / dist * budget
+                e.traveled += budget
+                budget = 0.0
+        e.vx, e.vy = e.x - px, e.y - py
+        return e.wp >= len(path)
+
+    def _tick_effects(self, e: _Enemy, dt: float) -> None:
+        dps = 0.0
+        for effect_type in list(e.effects):
+            stacks = e.effects[effect_type]
+            if effect_type in (POISON, BURN):
+                dps += sum(p for _, p in stacks)
+            for stack in stacks:
+                stack[0] -= dt
+            stacks[:] = [s for s in stacks if s[0] > 0.0]
+            if not stacks:
+                del e.effects[effect_type]
+        if dps > 0.0:
+            dealt = min(dps * dt, e.hp)
+            e.hp -= dealt
+            self._damage_this_wave += dealt
+            if e.hp <= 0.0:
+                e.alive = False
+
+    def _tick_clouds(self, dt: float) -> None:
+        for cloud in self.clouds:
+            cloud[3] -= dt
+            cloud[4] -= dt
+            if cloud[4] <= 0.0:
+                cloud[4] += CLOUD_INTERVAL
+                x, y, damage, _, _, tower = cloud
+                for e in self._in_radius(x, y, CLOUD_RADIUS):
+                    self._hit(tower, e, damage)
+        self.clouds = [c for c in self.clouds if c[3] > 0.0]
+
+    def run_wave(self, wave_index: int, stop_on_leak: bool = True) -> WaveReport:
+        timeline = self._timeline(wave_index)
+        total_hp = sum(entry[1].hp * entry[2] for entry in timeline)
+        self._damage_this_wave = 0.0
+        self.enemies = []
+        self.clouds = []
+        leaked = 0
+        elapsed = 0.0
+        next_spawn = 0
+        dt = self.dt
+
+        while next_spawn < len(timeline) or self.enemies:
+            elapsed += dt
+            while next_spawn < len(timeline) and timeline[next_spawn][0] <= elapsed:
+                self._spawn(*timeline[next_spawn][1:])
+                next_spawn += 1
+
+            for e in self.enemies:
+                if e.alive and self._move(e, dt):
+                    e.alive = False
+                    leaked += e.type.lives_cost
+                if e.alive:
+                    self._tick_effects(e, dt)
+            if leaked and stop_on_leak:
+                break
+
+            for tower in self.towers:
+                tower.timer -= dt
+                if tower.timer <= 0.0:
+                    tower.timer += tower.interval
+                    self._fire(tower)
+            self._tick_clouds(dt)
+            self.enemies = [e for e in self.enemies if e.alive]
+
+        return WaveReport(self.data.waves[wave_index].number, round(total_hp, 1), round(self._damage_this_wave, 1), leaked)
+
+    def run(self, first_wave: int, last_wave: int, stop_on_leak: bool = True) -> SimResult:
+        """Play waves first_wave..last_wave (1-based, inclusive)."""
+        reports = []
+        cleared = 0
+        lives_lost = 0
+        first_leak = None
+        score = 0.0
+        for index in range(first_wave - 1, min(last_wave, len(self.data.waves))):
+            report = self.run_wave(index, stop_on_leak)
+            reports.append(report)
+            if report.leaked:
+                lives_lost += report.leaked
+                if first_leak is None:
+                    first_leak = report.wave
+                # Partial credit: share of the failing wave's HP removed
+                score += min(report.damage / report.total_hp, 1.0) if report.total_hp else 0.0
+                if stop_on_leak:
+                    break
+            else:
+                cleared += 1
+                score += 1.0
+        return SimResult(cleared, len(reports), lives_lost, first_leak, score, reports)
+
+
+def simulate(
+    data: GameData,
+    game_map: GameMap,
+    layout: list[dict],
+    waves: tuple[int, int],
+    seed: int,
+    stop_on_leak: bool = True,
+) -> SimResult:
+    return Simulator(data, game_map, layout, seed).run(waves[0], waves[1], stop_on_leak)
+
+
+def parse_wave_range(text: str) -> tuple[int, int]:
+    first, _, last = text.partition("-")
+    return int(first), int(last or first)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulate a tower layout headlessly")
+    parser.add_argument("layout", type=Path, help="Layout JSON, or a layout_search.py results file")
+    parser.add_argument("--rank", type=int, default=1, help="Result rank to replay from a results file")
+    parser.add_argument("--waves", default=None, help="Wave range, e.g. 1-10 (default: all, or the search range)")
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed (default: 0, or every recorded seed)")
+    parser.add_argument("--no-stop", action="store_true", help="Keep playing after the first leak")
+    args = parser.parse_args()
+
+    doc = json.loads(args.layout.read_text())
+    waves = None
+    seeds = [0]
+    if isinstance(doc, dict):
+        entry = doc["results"][args.rank - 1]
+        layout = entry["layout"]
+        seeds = entry["seeds"]
+        waves = tuple(doc["config"]["waves"])
+    else:
+        layout = doc
+
+    data = load_game_data()
+    game_map = build_map()
+    error = validate_layout(data, game_map, layout)
+    if error:
+        print(f"ERROR: {error}")
+        sys.exit(1)
+
+    if args.waves:
+        waves = parse_wave_range(args.waves)
+    if waves is None:
+        waves = (1, len(data.waves))
+    if args.seed is not None:
+        seeds = [args.seed]
+
+    print(f"Layout: {len(layout)} towers, cost {layout_cost(data, layout)}")
+    results = []
+    for seed in seeds:
+        result = simulate(data, game_map, layout, waves, seed, stop_on_leak=not args.no_stop)
+        results.append(result)
+        print(f"Seed {seed}:")
+        for report in result.reports:
+            status = f"LEAK x{report.leaked}" if report.leaked else "clear"
+            print(f"  Wave {report.wave:2d}: {report.damage:8.0f} / {report.total_hp:8.0f} HP  {status}")
+        print(f"  Cleared {result.waves_cleared}/{result.waves_played} waves, score {result.score:.3f}")
+
+    if len(results) > 1:
+        # Same aggregate layout_search.py ranks by
+        mean = sum(r.score for r in results) / len(results)
+        worst = min(r.waves_cleared for r in results)
+        print(f"Over {len(results)} seeds: mean score {mean:.3f}, worst {worst} waves cleared")
+
+
+if __name__ == "__main__":
+    main()
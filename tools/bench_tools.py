@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""Benchmark the asset pipeline's hot paths and gate on regressions.
+
+Times background/stain removal, rotation autofix, the sync_assets scanner,
+checklist and overview sheets, and the building damage passes (both the
+original gen_govt_damage effects and the vectorized tier engine) against
+fixed fixtures at our real sprite sizes: 32x32 walk frames, 64x64
+turrets and 256x256 buildings. Synthetic fixtures are generated from a
+fixed seed; real fixtures are read from assets/sprites/ when present.
+The scanner and overview sheets run on a scratch sprite tree, so nothing
+under assets/ is written.
+
+Results are throughput (ops/sec, best of N rounds). A run exits non-zero
+when any benchmark drops more than --threshold below its baseline. The
+committed baseline, tools/bench_baseline.json, was recorded on the machine
+named in its "machine" field. Throughput is machine-specific, so a CI runner
+or a different dev box should first record its own baseline from the same
+commit (--save --baseline=PATH) and then gate against it with
+--baseline=PATH. Re-save the committed file whenever an intended change
+moves the numbers.
+
+Usage:
+    python3 tools/bench_tools.py --save              # record baselines
+    python3 tools/bench_tools.py                     # compare, exit 1 on regression
+    python3 tools/bench_tools.py --filter damage --threshold 0.15
+    python3 tools/bench_tools.py --baseline=/tmp/ci_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    print("ERROR: numpy and Pillow required. Run: pip install numpy Pillow")
+    sys.exit(1)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SPRITES_DIR = PROJECT_ROOT / "assets" / "sprites"
+BASELINE_PATH = PROJECT_ROOT / "tools" / "bench_baseline.json"
+
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+
+FIXTURE_SEED = 1234
+
+# Real sprites used as fixtures, keyed by size label
+REAL_SPRITES = {
+    "walk32": SPRITES_DIR / "enemies" / "rioter" / "walk_se_01.png",
+    "turret64": SPRITES_DIR / "towers" / "water_cannon" / "turret_se.png",
+    "building": SPRITES_DIR / "buildings" / "building_government_dome.png",
+}
+SYNTHETIC_SIZES = {"walk32": 32, "turret64": 64, "building": 256}
+ROTATION_DIRS = ("s", "se", "e", "ne", "n", "nw", "w", "sw")
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def synthetic_sprite(size: int, seed: int = FIXTURE_SEED) -> np.ndarray:
+    """Opaque RGBA sprite: flat background, noisy ellipse body, red foot stain.
+
+    Mimics a raw API response, so background removal walks the full border
+    and the stain filter finds pixels to erase.
+    """
+    rng = np.random.default_rng(seed + size)
+    arr = np.empty((size, size, 4), dtype=np.uint8)
+    arr[:, :] = (180, 200, 190, 255)
+
+    yy, xx = np.mgrid[0:size, 0:size]
+    cx = cy = size / 2
+    body = ((xx - cx) / (size * 0.3)) ** 2 + ((yy - cy) / (size * 0.4)) ** 2 <= 1.0
+    shade = rng.integers(20, 90, size=(size, size, 3), dtype=np.uint8)
+    arr[body, :3] = shade[body]
+
+    feet = ((xx - cx) / (size * 0.25)) ** 2 + ((yy - size * 0.88) / (size * 0.06)) ** 2 <= 1.0
+    arr[feet & ~body, :3] = (200, 60, 50)
+    return arr
+
+
+def real_sprite(label: str, opaque_bg: bool = False) -> np.ndarray | None:
+    path = REAL_SPRITES[label]
+    if not path.exists():
+        return None
+    img = Image.open(path).convert("RGBA")
+    if opaque_bg:
+        # Real sprites are already cut out; flatten onto a solid background
+        # so remove_background has work to do.
+        bg = Image.new("RGBA", img.size, (180, 200, 190, 255))
+        img = Image.alpha_composite(bg, img)
+    return np.array(img)
+
+
+def png_bytes(arr: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    Image.fromarray(arr).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def fixtures(opaque_bg: bool = False) -> dict[str, np.ndarray]:
+    """All fixtures for one benchmark family, keyed e.g. 'synthetic_walk32'."""
+    out = {f"synthetic_{label}": synthetic_sprite(size) for label, size in SYNTHETIC_SIZES.items()}
+    for label in REAL_SPRITES:
+        arr = real_sprite(label, opaque_bg)
+        if arr is not None:
+            out[f"real_{label}"] = arr
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+class Bench(NamedTuple):
+    name: str
+    fn: Callable[[], object]
+
+
+def _quiet(fn: Callable, *args, **kwargs) -> Callable[[], object]:
+    """Wrap a call so progress prints don't pollute the timing output."""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn(*args, **kwargs)
+    return run
+
+
+def bench_generate_assets(tmp: Path) -> list[Bench]:
+    import generate_assets as ga
+
+    benches = []
+    for key, arr in fixtures(opaque_bg=True).items():
+        benches.append(Bench(f"remove_background[{key}]", _quiet(ga.remove_background, png_bytes(arr))))
+    for key, arr in fixtures().items():
+        benches.append(Bench(f"remove_ground_stain[{key}]", _quiet(ga.remove_ground_stain, png_bytes(arr))))
+
+    for label in ("walk32", "turret64"):
+        sprite_dir = tmp / f"rotations_{label}"
+        sprite_dir.mkdir()
+        base = real_sprite(label)
+        if base is None:
+            base = synthetic_sprite(SYNTHETIC_SIZES[label])
+        for i, direction in enumerate(ROTATION_DIRS):
+            # Shift each direction so east/west pairs have distinct centroids
+            Image.fromarray(np.roll(base, i - 4, axis=1)).save(sprite_dir / f"rot_{direction}.png")
+        benches.append(Bench(f"autofix_rotation_swaps[{label}]", _quiet(ga._autofix_rotation_swaps, sprite_dir, "rot")))
+    return benches
+
+
+def build_sprite_tree(root: Path) -> None:
+    """Fixed sprite tree for the scanner/overview benchmarks.
+
+    The live assets/ tree keeps growing, which would move the baseline on
+    every art drop; this copies a stable subset and pads it with synthetic
+    sprites at each real size.
+    """
+    for category, label, count in (("enemies", "walk32", 24), ("towers", "turret64", 16), ("buildings", "building", 6)):
+        size = SYNTHETIC_SIZES[label]
+        for i in range(count):
+            sub = root / category / f"fixture_{i // 8}"
+            sub.mkdir(parents=True, exist_ok=True)
+            Image.fromarray(synthetic_sprite(size, seed=FIXTURE_SEED + i)).save(sub / f"sprite_{i % 8}.png")
+        real = REAL_SPRITES[label]
+        if real.exists():
+            shutil.copy(real, root / category / f"real_{real.name}")
+
+
+def bench_sync_assets(tmp: Path) -> list[Bench]:
+    import sync_assets as sa
+
+    # Scan and write overview sheets in a scratch tree, never in assets/
+    sa.SPRITES_DIR = tmp / "sprites"
+    sa.OVERVIEW_DIR = sa.SPRITES_DIR / "_overview"
+    build_sprite_tree(sa.SPRITES_DIR)
+    disk = sa.scan_sprites()
+    return [
+        Bench("scan_sprites", sa.scan_sprites),
+        Bench("generate_checklist", lambda: sa.generate_checklist(disk)),
+        Bench("generate_overview[towers]", lambda: sa.generate_overview("towers", disk)),
+        Bench("generate_overview[buildings]", lambda: sa.generate_overview("buildings", disk)),
+        Bench("generate_total_overview", lambda: sa.generate_total_overview(disk)),
+    ]
+
+
+def bench_govt_damage(tmp: Path) -> list[Bench]:
+    import gen_govt_damage as gd
+
+    passes = {
+        "add_graffiti": lambda a: gd.add_graffiti(a, seed=42),
+        "add_cracks": lambda a: gd.add_cracks(a, count=20, max_len=35, seed=300),
+        "darken_dithered": lambda a: gd.darken_dithered(a, intensity=0.3, seed=302),
+        "erode_pixels": lambda a: gd.erode_pixels(a, iterations=3, seed=303),
+        "break_windows": lambda a: gd.break_windows(a, seed=301),
+        "collapse_right_half": lambda a: gd.collapse_right_half(a, seed=400),
+        "make_rubble": lambda a: gd.make_rubble(a, seed=500),
+    }
+    sources = {"synthetic_building": synthetic_sprite(SYNTHETIC_SIZES["building"])}
+    dome = real_sprite("building")
+    if dome is not None:
+        sources["real_building"] = dome
+
+    benches = []
+    for key, arr in sources.items():
+        for name, fn in passes.items():
+            benches.append(Bench(f"damage.{name}[{key}]", lambda fn=fn, arr=arr: fn(arr.copy())))
+    return benches
+
+
+def bench_building_damage(tmp: Path) -> list[Bench]:
+    import gen_building_damage as bd
+
+    sources = {"synthetic_building": synthetic_sprite(SYNTHETIC_SIZES["building"])}
+    dome = real_sprite("building")
+    if dome is not None:
+        sources["real_building"] = dome
+
+    benches = []
+    for key, arr in sources.items():
+        for tier in range(1, 6):
+            benches.append(Bench(
+                f"building_damage.tier{tier}[{key}]",
+                lambda arr=arr, key=key, tier=tier: bd.damage_tier(arr, tier, 5, bd.tier_rng(42, key, tier)),
+            ))
+    return benches
+
+
+SUITES = {
+    "generate_assets": bench_generate_assets,
+    "sync_assets": bench_sync_assets,
+    "damage": bench_govt_damage,
+    "building_damage": bench_building_damage,
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def measure(fn: Callable[[], object], rounds: int, min_time: float) -> float:
+    """Best-of-rounds throughput in ops/sec; each round runs >= min_time."""
+    fn()  # warm-up (imports, caches)
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 16:
+            break
+        loops *= 2
+
+    best = elapsed / loops
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return 1.0 / best if best > 0 else float("inf")
+
+
+def load_baseline(path: Path) -> dict:
+    if path.exists():
+        return json.loads(path.read_text())
+    return {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark tools hot paths with regression gates")
+    parser.add_argument("--save", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--suite", choices=sorted(SUITES), action="append",
+                        help="Suite(s) to run (default: all)")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed throughput drop vs baseline (default: 0.2 = 20%%)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH,
+                        help="Baseline file to compare against / save to (default: tools/bench_baseline.json)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timing rounds per benchmark (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Min seconds per round (default: 0.2)")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.baseline)
+    base_results = baseline.get("results", {})
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+
+    print(f"=== Goligee Tools Benchmarks (threshold {args.threshold:.0%}) ===")
+    with tempfile.TemporaryDirectory(prefix="goligee_bench_") as tmp_str:
+        tmp = Path(tmp_str)
+        for suite in args.suite or SUITES:
+            suite_tmp = tmp / suite
+            suite_tmp.mkdir()
+            benches = [b for b in SUITES[suite](suite_tmp) if args.filter in b.name]
+            if benches:
+                print(f"\n[{suite}]")
+            for bench in benches:
+                ops = measure(bench.fn, args.rounds, args.min_time)
+                results[bench.name] = ops
+                line = f"  {bench.name:<48} {ops:>10.1f} ops/s"
+                if bench.name in base_results:
+                    ratio = ops / base_results[bench.name]
+                    line += f"  ({ratio - 1.0:+.1%} vs baseline)"
+                    if ratio < 1.0 - args.threshold:
+                        line += "  REGRESSION"
+                        regressions.append(bench.name)
+                print(line)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    if args.save:
+        merged = {**base_results, **results}
+        args.baseline.write_text(json.dumps({
+            "machine": platform.platform(),
+            "python": platform.python_version(),
+            "saved": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "results": {k: round(v, 3) for k, v in sorted(merged.items())},
+        }, indent=2) + "\n")
+        print(f"\nSaved baseline: {args.baseline}")
+    elif not base_results:
+        print("\nNo baseline yet. Run with --save to record one.")
+
+    if regressions and not args.save:
+        print(f"\nFAILED: {len(regressions)} benchmark(s) regressed past {args.threshold:.0%}:")
+        for name in regressions:
+            print(f"  - {name}")
+        sys.exit(1)
+    print("\nDone.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Generate damage-state variants for every city building sprite.
+
+Generalizes gen_govt_damage.py: the same pixel-art damage effects
+(graffiti, cracks, dithered soot, edge erosion, broken windows, collapse,
+rubble) rewritten as vectorized NumPy/SciPy passes driven by seeded
+np.random.Generator streams. Damage is parametric -- tier k of N maps to
+severity k/N -- so any number of tiers can be produced, and every building
+is processed in parallel across all cores.
+
+Each (building, tier) pair gets its own RNG stream derived from --seed,
+the building name and the tier, so output is reproducible and independent
+of worker scheduling.
+
+Output: assets/sprites/buildings/building_<name>_dmg<k>.png
+
+Usage:
+    python3 tools/gen_building_damage.py                     # all buildings, 5 tiers
+    python3 tools/gen_building_damage.py --tiers 3 --force
+    python3 tools/gen_building_damage.py --only factory,ministry --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+    from scipy import ndimage
+except ImportError:
+    print("ERROR: numpy, Pillow and scipy required. Run: pip install numpy Pillow scipy")
+    sys.exit(1)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SPRITES_DIR = PROJECT_ROOT / "assets" / "sprites"
+BUILDINGS_DIR = SPRITES_DIR / "buildings"
+
+# Effect counts/lengths were tuned on the 192x192 government dome
+REFERENCE_SIZE = 192
+
+DMG_SUFFIX_RE = re.compile(r"_dmg\d+$")
+
+GRAFFITI_COLORS = np.array([
+    (180, 40, 40),   # red
+    (40, 160, 40),   # green
+    (200, 170, 30),  # yellow
+    (40, 40, 180),   # blue
+    (180, 80, 30),   # orange
+], dtype=np.uint8)
+
+# Crack walk steps (dx, dy): down-biased, pixel-grid aligned
+CRACK_STEPS = np.array([
+    (0, 1), (0, 1), (0, 1),   # down (most common)
+    (1, 1), (-1, 1),          # diagonal down
+    (1, 0), (-1, 0),          # horizontal
+], dtype=np.int32)
+CRACK_COLOR = np.array([25, 20, 18, 230], dtype=np.uint8)
+WINDOW_COLOR = np.array([20, 18, 25], dtype=np.uint8)
+
+
+def opaque(arr: np.ndarray) -> np.ndarray:
+    """Boolean mask of opaque pixels."""
+    return arr[:, :, 3] > 10
+
+
+def edge_of(mask: np.ndarray) -> np.ndarray:
+    """Pixels on the edge of the opaque region."""
+    return mask & ~ndimage.binary_erosion(mask)
+
+
+# -- Damage effects ----------------------------------------------------------
+
+def add_graffiti(arr: np.ndarray, rng: np.random.Generator, count: int = 18) -> np.ndarray:
+    """Small rectangular colour blocks on the wall band (skips roof and base)."""
+    result = arr.copy()
+    mask = opaque(arr)
+    h, w = mask.shape
+    ys, xs = np.nonzero(mask)
+    if len(xs) == 0 or count <= 0:
+        return result
+
+    y_min, y_max = ys.min(), ys.max()
+    y_range = y_max - y_min
+    band = (ys >= y_min + int(y_range * 0.35)) & (ys <= y_max - int(y_range * 0.12))
+    if band.any():
+        ys, xs = ys[band], xs[band]
+
+    idx = rng.integers(0, len(xs), size=count)
+    colors = GRAFFITI_COLORS[rng.integers(0, len(GRAFFITI_COLORS), size=count)]
+    bw = rng.choice([2, 3, 4], size=count)
+    bh = rng.choice([2, 3], size=count)
+
+    dy, dx = np.mgrid[0:3, 0:4]
+    py = ys[idx][:, None, None] + dy
+    px = xs[idx][:, None, None] + dx
+    keep = (dx < bw[:, None, None]) & (dy < bh[:, None, None]) & (py < h) & (px < w)
+    py, px = py[keep], px[keep]
+    block_colors = np.broadcast_to(colors[:, None, None, :], (count, 3, 4, 3))[keep]
+    on = mask[py, px]
+    result[py[on], px[on], :3] = block_colors[on]
+    result[py[on], px[on], 3] = 220
+    return result
+
+
+def add_cracks(arr: np.ndarray, rng: np.random.Generator, count: int = 8, max_len: int = 25) -> np.ndarray:
+    """Jagged dark cracks as random walks, all walks stepped at once."""
+    result = arr.copy()
+    mask = opaque(arr)
+    h, w = mask.shape
+    ys, xs = np.nonzero(mask)
+    if len(xs) == 0 or count <= 0 or max_len <= 0:
+        return result
+
+    start = rng.integers(0, len(xs), size=count)
+    steps = CRACK_STEPS[rng.integers(0, len(CRACK_STEPS), size=(count, max_len - 1))]
+    cx = np.concatenate([xs[start][:, None], xs[start][:, None] + np.cumsum(steps[:, :, 0], axis=1)], axis=1)
+    cy = np.concatenate([ys[start][:, None], ys[start][:, None] + np.cumsum(steps[:, :, 1], axis=1)], axis=1)
+
+    inside = (cx >= 0) & (cx < w) & (cy >= 0) & (cy < h)
+    hit = inside.copy()
+    hit[inside] = mask[cy[inside], cx[inside]]
+    result[cy[hit], cx[hit]] = CRACK_COLOR
+
+    # Widen ~half the crack pixels to 2px
+    wide = hit & (rng.random(hit.shape) > 0.5) & (cx + 1 < w)
+    wide[wide] = mask[cy[wide], cx[wide] + 1]
+    result[cy[wide], cx[wide] + 1] = CRACK_COLOR
+    return result
+
+
+def darken_dithered(arr: np.ndarray, rng: np.random.Generator, intensity: float = 0.3) -> np.ndarray:
+    """Darken opaque pixels on a checkerboard with random per-pixel amount."""
+    h, w = arr.shape[:2]
+    checker = np.indices((h, w)).sum(axis=0) % 2 == 0
+    amount = rng.uniform(1.0 - intensity, 1.0, size=(h, w))
+    factor = np.where(opaque(arr) & checker, amount, 1.0)
+    result = arr.copy()
+    result[:, :, :3] = np.clip(arr[:, :, :3] * factor[:, :, None], 0, 255).astype(np.uint8)
+    return result
+
+
+def erode_pixels(arr: np.ndarray, rng: np.random.Generator, iterations: int = 2) -> np.ndarray:
+    """Knock random pixels off the silhouette edge, then off the new edge."""
+    result = arr.copy()
+    passes = [0.4 * iterations] + ([0.25 * (iterations - 1)] if iterations > 1 else [])
+    for fraction in passes:
+        ey, ex = np.nonzero(edge_of(opaque(result)))
+        n = min(int(len(ex) * fraction), len(ex))
+        if n > 0:
+            pick = rng.choice(len(ex), size=n, replace=False)
+            result[ey[pick], ex[pick], 3] = 0
+    return result
+
+
+def break_windows(arr: np.ndarray, rng: np.random.Generator, fraction: float = 0.3) -> np.ndarray:
+    """Darken a share of the bright interior pixels (broken windows)."""
+    result = arr.copy()
+    bright = opaque(arr) & (arr[:, :, :3].mean(axis=2) > 120)
+    ys, xs = np.nonzero(bright)
+    n = min(int(len(xs) * fraction), len(xs))
+    if n > 0:
+        pick = rng.choice(len(xs), size=n, replace=False)
+        result[ys[pick], xs[pick], :3] = WINDOW_COLOR
+    return result
+
+
+def collapse_right_half(arr: np.ndarray, rng: np.random.Generator, debris: int = 40) -> np.ndarray:
+    """Remove the right portion along a jagged cut, scorch the exposed edge."""
+    result = arr.copy()
+    mask = opaque(arr)
+    h, w = mask.shape
+    ys, xs = np.nonzero(mask)
+    if len(xs) == 0:
+        return result
+
+    x_min, x_max = xs.min(), xs.max()
+    x_mid = x_min + int((x_max - x_min) * 0.55)
+    cut = x_mid + rng.integers(-6, 7, size=h)
+
+    d = np.arange(w)[None, :] - cut[:, None]
+    result[:, :, 3][d >= 0] = 0
+
+    # Exposed interior: darker closer to the cut
+    band = (d >= -8) & (d < 0) & (result[:, :, 3] > 10)
+    factor = 0.4 + 0.06 * np.abs(d[band])
+    result[band, :3] = np.clip(result[band, :3] * factor[:, None], 0, 255).astype(np.uint8)
+
+    spread = max(1, round(15 * w / REFERENCE_SIZE))
+    rx = x_mid + rng.integers(-spread, spread + 1, size=debris)
+    ry = ys.max() - rng.integers(0, 7, size=debris) + rng.integers(-3, 6, size=debris)
+    ok = (rx >= 0) & (rx < w) & (ry >= 0) & (ry < h)
+    rx, ry = rx[ok], ry[ok]
+    empty = result[ry, rx, 3] == 0
+    rx, ry = rx[empty], ry[empty]
+    gray = rng.integers(50, 91, size=len(rx))
+    result[ry, rx] = np.stack([gray, gray - 3, gray - 8, np.full_like(gray, 200)], axis=1)
+    return result
+
+
+def make_rubble(arr: np.ndarray, rng: np.random.Generator, debris: int = 80) -> np.ndarray:
+    """Keep a jagged bottom quarter, darken and noise it, scatter debris."""
+    result = arr.copy()
+    mask = opaque(arr)
+    h, w = mask.shape
+    ys, xs = np.nonzero(mask)
+    if len(xs) == 0:
+        return result
+
+    y_min, y_max = ys.min(), ys.max()
+    y_cut = y_max - int((y_max - y_min) * 0.25)
+    top = np.maximum(y_cut, y_cut + rng.integers(-4, 5, size=w))
+    result[:, :, 3][np.arange(h)[:, None] < top[None, :]] = 0
+
+    remaining = result[:, :, 3] > 10
+    noise = rng.integers(-15, 15, size=(h, w, 3))
+    darkened = result[:, :, :3].astype(np.int32) * 0.45
+    result[remaining, :3] = np.clip(darkened[remaining].astype(np.int32) + noise[remaining], 0, 255).astype(np.uint8)
+
+    x_mid = (xs.min() + xs.max()) // 2
+    spread = max(1, round(30 * w / REFERENCE_SIZE))
+    rx = x_mid + rng.integers(-spread, spread, size=debris)
+    ry = y_max + rng.integers(-8, 4, size=debris)
+    ok = (rx >= 0) & (rx < w) & (ry >= 0) & (ry < h)
+    rx, ry = rx[ok], ry[ok]
+    gray = rng.integers(35, 80, size=len(rx))
+    alpha = 180 + rng.integers(0, 50, size=len(rx))
+    result[ry, rx] = np.stack([gray, gray - 3, gray - 7, alpha], axis=1)
+    return result
+
+
+# -- Tier recipes ------------------------------------------------------------
+
+def damage_recipe(tier: int, tiers: int, size: tuple[int, int]) -> list[tuple[str, dict]]:
+    """Effect chain for tier k of N (1-based), scaled to the sprite size.
+
+    With 5 tiers this follows gen_govt_damage.py's dmg1..dmg5 stages:
+    graffiti, cracks, heavy damage, half collapsed, rubble.
+    """
+    s = tier / tiers
+    h, w = size
+    area = (h * w) / (REFERENCE_SIZE * REFERENCE_SIZE)
+    length = max(h, w) / REFERENCE_SIZE
+
+    if tier >= tiers:
+        return [("make_rubble", {"debris": max(1, round(80 * area))})]
+
+    steps: list[tuple[str, dict]] = []
+    if s >= 0.75:
+        steps.append(("collapse_right_half", {"debris": max(1, round(40 * area))}))
+    if s <= 0.25:
+        steps.append(("add_graffiti", {"count": max(1, round(18 * area))}))
+    steps.append(("add_cracks", {
+        "count": max(1, round((3 + 20 * s) * area)),
+        "max_len": max(2, round((12 + 25 * s) * length)),
+    }))
+    if s >= 0.3:
+        steps.append(("break_windows", {"fraction": 0.3}))
+        steps.append(("darken_dithered", {"intensity": min(0.1 + 0.35 * s, 0.4)}))
+        steps.append(("erode_pixels", {"iterations": max(1, round(5 * s - 1))}))
+    return steps
+
+
+EFFECTS = {
+    "add_graffiti": add_graffiti,
+    "add_cracks": add_cracks,
+    "darken_dithered": darken_dithered,
+    "erode_pixels": erode_pixels,
+    "break_windows": break_windows,
+    "collapse_right_half": collapse_right_half,
+    "make_rubble": make_rubble,
+}
+
+
+def damage_tier(arr: np.ndarray, tier: int, tiers: int, rng: np.random.Generator) -> np.ndarray:
+    """Apply the tier's effect chain to a pristine RGBA array."""
+    result = arr
+    for name, params in damage_recipe(tier, tiers, arr.shape[:2]):
+        result = EFFECTS[name](result, rng, **params)
+    return result
+
+
+def tier_rng(seed: int, name: str, tier: int) -> np.random.Generator:
+    """Independent stream per (seed, building, tier)."""
+    return np.random.default_rng([seed, zlib.crc32(name.encode()), tier])
+
+
+# -- Pipeline ----------------------------------------------------------------
+
+def find_buildings(only: list[str] | None = None) -> list[Path]:
+    """Pristine building sprites (skips existing _dmgN variants)."""
+    sources = []
+    for path in sorted(BUILDINGS_DIR.glob("building_*.png")):
+        if DMG_SUFFIX_RE.search(path.stem):
+            continue
+        name = path.stem.removeprefix("building_")
+        if only and name not in only:
+            continue
+        sources.append(path)
+    return sources
+
+
+def process_building(job: tuple[Path, Path, int, int, bool]) -> tuple[str, int]:
+    """Generate every tier for one building; returns (name, tiers written)."""
+    src, out_dir, tiers, seed, force = job
+    outputs = [out_dir / f"{src.stem}_dmg{k}.png" for k in range(1, tiers + 1)]
+    if not force and all(p.exists() for p in outputs):
+        return src.stem, 0
+
+    arr = np.array(Image.open(src).convert("RGBA"))
+    written = 0
+    for tier, out in enumerate(outputs, start=1):
+        if out.exists() and not force:
+            continue
+        result = damage_tier(arr, tier, tiers, tier_rng(seed, src.stem, tier))
+        Image.fromarray(result).save(out)
+        written += 1
+    return src.stem, written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate building damage-state variants")
+    parser.add_argument("--tiers", type=int, default=5, help="Damage tiers per building (default: 5)")
+    parser.add_argument("--only", default="", help="Comma-separated building names (without building_ prefix)")
+    parser.add_argument("--seed", type=int, default=42, help="Base RNG seed (default: 42)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    parser.add_argument("--out-dir", type=Path, default=BUILDINGS_DIR, help="Output directory")
+    parser.add_argument("--force", action="store_true", help="Overwrite existing variants")
+    args = parser.parse_args()
+
+    only = [s.strip() for s in args.only.split(",") if s.strip()] or None
+    sources = find_buildings(only)
+    if not sources:
+        print("No building sprites found.")
+        return
+
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+    print(f"\n=== BUILDING DAMAGE VARIANTS ({len(sources)} buildings x {args.tiers} tiers) ===\n")
+    start = time.time()
+    jobs = [(src, args.out_dir, args.tiers, args.seed, args.force) for src in sources]
+    total = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for name, written in pool.map(process_building, jobs):
+            total += written
+            status = f"{written} tiers" if written else "skipped (exists)"
+            print(f"  {name}: {status}")
+
+    print(f"\n  Wrote {total} sprites in {time.time() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
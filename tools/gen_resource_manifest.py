@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Generate the startup resource manifest for AssetPreloader.
+
+The game scene's _ready() used to load() every wave, ability, tower and
+theme resource synchronously, and ThemeManager then loaded every walk
+frame, turret and fire texture one by one from DirAccess listings. This
+script finds those resources ahead of time and writes them to a
+manifest. At runtime AssetPreloader streams the manifest in through
+ResourceLoader.load_threaded_request() while the start screen is up, so
+the game scene's own load() calls hit the resource cache.
+
+Resources come from three places:
+  * string literals "res://..." in scripts/ -- format strings such as
+    "res://assets/sprites/towers/%s/base.png" become globs;
+  * the ext_resource dependencies of every scene and .tres found that way
+    (followed recursively);
+  * EXTRA_GLOBS, for paths assembled from pieces (enemy walk frames).
+
+Each path is placed in a group. "game" is loaded while the start screen is
+shown. "late" (LATE_PATTERNS: tier 5 skins, portraits, banners) is loaded
+after the game scene is up. Start-screen assets are skipped, because the
+start screen loads them itself.
+
+Output:
+    data/resource_manifest.json
+
+Usage:
+    python3 tools/gen_resource_manifest.py            # write the manifest
+    python3 tools/gen_resource_manifest.py --check    # exit 1 if stale
+    python3 tools/gen_resource_manifest.py --list     # print paths by group
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import re
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+MANIFEST_PATH = PROJECT_ROOT / "data" / "resource_manifest.json"
+
+MANIFEST_VERSION = 1
+
+# Resource files Godot loads without an .import sidecar
+NATIVE_EXTS = {".tres", ".tscn", ".res", ".gdshader"}
+
+# Dynamic paths that no single literal spells out
+EXTRA_GLOBS = [
+    "assets/sprites/enemies/*/walk_*.png",  # ThemeManager._load_enemy_skin_from_assets
+]
+
+# Group assignment (first match wins); anything else goes to "game"
+LATE_PATTERNS = [
+    "assets/sprites/towers/*/tier5*",
+    "assets/sprites/ui/wave_portrait_*",
+    "assets/sprites/ui/victory_banner*",
+    "assets/sprites/ui/intro_comic*",
+]
+SKIP_PATTERNS = [
+    "scenes/ui/start_screen.tscn",
+    "assets/ui/start_bg*",
+    "assets/ui/title*",
+    "assets/audio/music/theme_song*",
+    "assets/sprites/_archive/*",
+    "assets/sprites/_debug/*",
+    "assets/sprites/_overview/*",
+]
+# Only headless runs use these
+SKIP_SCRIPTS = {"headless_sim.gd", "replay_player.gd", "sim_runner.gd"}
+
+GROUPS = ["game", "late"]
+
+RES_LITERAL = re.compile(r'"res://([^"]+)"')
+EXT_RESOURCE = re.compile(r'\[ext_resource[^\]]*path="res://([^"]+)"')
+FORMAT_SPEC = re.compile(r"%(?:0?\d+)?[sd]")
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+def is_loadable(rel: str) -> bool:
+    path = PROJECT_ROOT / rel
+    if not path.is_file():
+        return False
+    return path.suffix in NATIVE_EXTS or path.with_name(path.name + ".import").exists()
+
+
+def expand(rel: str) -> list[str]:
+    """A literal path, or every file a format-string path can produce."""
+    if rel.endswith("/"):
+        return []
+    if "%" not in rel:
+        return [rel] if is_loadable(rel) else []
+    return glob(FORMAT_SPEC.sub("*", rel))
+
+
+def glob(pattern: str) -> list[str]:
+    rels = (p.relative_to(PROJECT_ROOT).as_posix() for p in PROJECT_ROOT.glob(pattern))
+    return sorted(rel for rel in rels if is_loadable(rel))
+
+
+def script_literals() -> set[str]:
+    found: set[str] = set()
+    for script in sorted(SCRIPTS_DIR.rglob("*.gd")):
+        if script.name in SKIP_SCRIPTS:
+            continue
+        for rel in RES_LITERAL.findall(script.read_text(encoding="utf-8")):
+            found.update(expand(rel))
+    for pattern in EXTRA_GLOBS:
+        found.update(glob(pattern))
+    return found
+
+
+def with_dependencies(paths: set[str]) -> set[str]:
+    """Follow ext_resource entries of text scenes/resources (not scripts)."""
+    result = set(paths)
+    queue = [p for p in paths if p.endswith((".tscn", ".tres"))]
+    while queue:
+        rel = queue.pop()
+        text = (PROJECT_ROOT / rel).read_text(encoding="utf-8", errors="replace")
+        for dep in EXT_RESOURCE.findall(text):
+            if dep in result or dep.endswith(".gd") or not is_loadable(dep):
+                continue
+            result.add(dep)
+            if dep.endswith((".tscn", ".tres")):
+                queue.append(dep)
+    return result
+
+
+def group_of(rel: str) -> str | None:
+    if any(fnmatch.fnmatch(rel, p) for p in SKIP_PATTERNS):
+        return None
+    if any(fnmatch.fnmatch(rel, p) for p in LATE_PATTERNS):
+        return "late"
+    return "game"
+
+
+def collect() -> dict[str, list[str]]:
+    seeds = script_literals()
+    seeds.update(
+        p.relative_to(PROJECT_ROOT).as_posix()
+        for p in (PROJECT_ROOT / "scenes").rglob("*.tscn")
+    )
+    groups: dict[str, list[str]] = {name: [] for name in GROUPS}
+    for rel in sorted(with_dependencies(seeds)):
+        group = group_of(rel)
+        if group:
+            groups[group].append("res://" + rel)
+    return groups
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def group_bytes(paths: list[str]) -> int:
+    return sum((PROJECT_ROOT / p.removeprefix("res://")).stat().st_size for p in paths)
+
+
+def write() -> dict:
+    groups = collect()
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "groups": groups,
+        "bytes": {name: group_bytes(paths) for name, paths in groups.items()},
+    }
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=1) + "\n")
+    return manifest
+
+
+def check() -> int:
+    rel = MANIFEST_PATH.relative_to(PROJECT_ROOT)
+    if not MANIFEST_PATH.exists():
+        print(f"MISSING: {rel} -- run tools/gen_resource_manifest.py")
+        return 1
+    manifest = json.loads(MANIFEST_PATH.read_text())
+    stale = []
+    if manifest.get("version") != MANIFEST_VERSION:
+        stale.append("manifest version")
+    current = collect()
+    for name in GROUPS:
+        old = set(manifest.get("groups", {}).get(name, []))
+        new = set(current[name])
+        if old != new:
+            stale.append(f"{name}: +{len(new - old)}/-{len(old - new)}")
+    if stale:
+        print(f"STALE: {', '.join(stale)} -- run tools/gen_resource_manifest.py")
+        return 1
+    print(f"OK: {sum(len(p) for p in current.values())} resources listed")
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate the startup resource manifest")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the manifest is missing or stale")
+    parser.add_argument("--list", action="store_true", help="Print the resources of each group")
+    args = parser.parse_args()
+
+    if args.check:
+        return check()
+    if args.list:
+        for name, paths in collect().items():
+            print(f"[{name}]")
+            for path in paths:
+                print(f"  {path}")
+        return 0
+
+    manifest = write()
+    for name, paths in manifest["groups"].items():
+        print(f"  {name:<5} {len(paths):4d} resources  {manifest['bytes'][name] / 1048576:6.1f} MB")
+    print(f"  {MANIFEST_PATH.relative_to(PROJECT_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""goligee-tools -- single entry point for the asset and balance tools.
+
+Each subcommand maps to one script in tools/ and forwards the remaining
+arguments to that script's main(). Nothing is imported until a subcommand
+is chosen, so --help and light commands like `sync --check` don't pay for
+PIL, requests, NumPy or the prompt tables in generate_assets.py.
+
+Usage:
+    python3 tools/goligee_tools.py --help
+    python3 tools/goligee_tools.py sync --check
+    python3 tools/goligee_tools.py generate --phase turrets
+    python3 tools/goligee_tools.py <command> --help
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import NamedTuple
+
+
+class Command(NamedTuple):
+    module: str
+    help: str
+
+
+# Subcommand -> tools/ module. Modules are imported lazily by dispatch().
+COMMANDS: dict[str, Command] = {
+    "generate": Command("generate_assets", "Batch-generate sprites via PixelLab / Retro Diffusion"),
+    "sync": Command("sync_assets", "Update ASSET_CHECKLIST.md and overview sheets"),
+    "damage": Command("gen_govt_damage", "Generate government building damage variants"),
+    "damage-all": Command("gen_building_damage", "Generate damage tiers for every building (vectorized)"),
+    "icons": Command("gen_tower_icons", "Generate tower UI selection icons"),
+    "symbolic-icons": Command("generate_symbolic_icons", "Generate symbolic tower icon cards"),
+    "portraits": Command("gen_wave_portraits", "Generate wave leader bust portraits"),
+    "abilities": Command("generate_ability_sprites", "Generate ability vehicle sprites"),
+    "rotate": Command("rotate_ability_sprites", "Generate 8-direction ability sprite rotations"),
+    "bake": Command("bake_sprites", "Bake procedural fallback sprites into an atlas"),
+    "manifest": Command("gen_resource_manifest", "Generate the startup resource preload manifest"),
+    "map": Command("bake_map", "Bake the tile atlas, TileSet and painted map data"),
+    "simulate": Command("balance_sim", "Simulate a tower layout headlessly"),
+    "layouts": Command("layout_search", "Search tower layouts for balance outliers"),
+    "bench": Command("bench_tools", "Benchmark tools hot paths against baselines"),
+}
+
+
+def print_help() -> None:
+    print("usage: goligee-tools <command> [args...]\n")
+    print("commands:")
+    width = max(len(name) for name in COMMANDS)
+    for name, cmd in COMMANDS.items():
+        print(f"  {name:<{width}}  {cmd.help}")
+    print("\nRun 'goligee-tools <command> --help' for command options.")
+
+
+def dispatch(argv: list[str]) -> int:
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print_help()
+        return 0
+
+    name, rest = argv[0], argv[1:]
+    cmd = COMMANDS.get(name)
+    if cmd is None:
+        print(f"ERROR: unknown command '{name}'\n")
+        print_help()
+        return 2
+
+    module = importlib.import_module(cmd.module)
+    # Subcommand scripts parse sys.argv themselves
+    sys.argv = [f"goligee-tools {name}", *rest]
+    result = module.main()
+    return result if isinstance(result, int) else 0
+
+
+def main() -> None:
+    sys.exit(dispatch(sys.argv[1:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""Beam search over tower layouts to surface balance outliers.
+
+Grows layouts one move at a time (build, upgrade, relocate, swap type)
+under a gold budget, scores every candidate with the headless simulator in
+balance_sim.py and keeps the best (or, with --mode weak, the worst fully
+funded) layouts at each depth. Candidates are evaluated in parallel in a
+process pool; a simulation stops at the first leak, so weak candidates
+are cheap to reject.
+
+Placement follows PathfindingManager (buildable tile, spawn-goal path stays
+open), upgrades follow the UpgradeComponent crosspath rules, and synergies
+come from SynergyManager.SYNERGIES. Every result records the seeds it was
+scored with, so it can be replayed exactly:
+
+    python3 tools/balance_sim.py layout_search.json --rank 1
+
+Usage:
+    python3 tools/layout_search.py [--waves 1-10] [--budget 60] [--seed 1]
+    python3 tools/layout_search.py --mode weak --out weak_layouts.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import balance_sim as sim  # noqa: E402
+
+# Fraction of the budget a layout must spend to count in --mode weak
+WEAK_MIN_SPEND = 0.8
+
+# Chance that a new tower is placed next to an existing one (synergy bias)
+NEIGHBOR_BIAS = 0.5
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_DATA: sim.GameData | None = None
+_MAP: sim.GameMap | None = None
+
+
+def _init_worker() -> None:
+    global _DATA, _MAP
+    _DATA = sim.load_game_data()
+    _MAP = sim.build_map()
+
+
+def _evaluate(job: tuple[list[dict], tuple[int, int], list[int]]) -> dict:
+    """Score one layout over all its seeds (runs in a worker process)."""
+    layout, waves, seeds = job
+    results = [sim.simulate(_DATA, _MAP, layout, waves, seed) for seed in seeds]
+    worst = min(results, key=lambda r: r.score)
+    return {
+        "score": sum(r.score for r in results) / len(results),
+        "waves_cleared": min(r.waves_cleared for r in results),
+        "first_leak_wave": worst.first_leak_wave,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Candidate generation
+# ---------------------------------------------------------------------------
+
+def derive_seeds(master_seed: int, layout: list[dict], trials: int) -> list[int]:
+    """Stable per-layout simulation seeds, independent of search order."""
+    key = f"{master_seed}:{sim.layout_key(layout)}"
+    return [
+        int.from_bytes(hashlib.sha256(f"{key}:{i}".encode()).digest()[:4], "little")
+        for i in range(trials)
+    ]
+
+
+def _free_tiles(game_map: sim.GameMap, layout: list[dict], rng: random.Random, near: bool) -> list[tuple[int, int]]:
+    occupied = {tuple(p["tile"]) for p in layout}
+    if near and layout:
+        ax, ay = rng.choice(layout)["tile"]
+        r = sim.SYNERGY_RANGE
+        tiles = [(ax + dx, ay + dy) for dx in range(-r, r + 1) for dy in range(-r, r + 1)]
+    else:
+        tiles = list(game_map.buildable)
+    tiles = [t for t in tiles if t in game_map.buildable and t not in occupied]
+    rng.shuffle(tiles)
+    return tiles
+
+
+def _place(data, game_map, layout, rng, tower_id: str, budget: int) -> list[dict] | None:
+    if sim.layout_cost(data, layout) + data.towers[tower_id].cost > budget:
+        return None
+    occupied = {tuple(p["tile"]) for p in layout}
+    tower = data.towers[tower_id]
+    for tile in _free_tiles(game_map, layout, rng, rng.random() < NEIGHBOR_BIAS):
+        if sim.can_place(game_map, occupied, tile):
+            tiers = [0] * len(tower.paths)
+            return layout + [{"tower": tower_id, "tile": list(tile), "tiers": tiers}]
+    return None
+
+
+def _upgrade(data, layout, rng, budget: int) -> list[dict] | None:
+    if not layout:
+        return None
+    index = rng.randrange(len(layout))
+    placement = layout[index]
+    tower = data.towers[placement["tower"]]
+    options = []
+    for path_i in range(len(tower.paths)):
+        tiers = list(placement["tiers"])
+        tiers[path_i] += 1
+        if sim.tiers_valid(tower, tiers):
+            options.append(tiers)
+    if not options:
+        return None
+    tiers = rng.choice(options)
+    extra = sim.placement_cost(tower, tiers) - sim.placement_cost(tower, placement["tiers"])
+    if sim.layout_cost(data, layout) + extra > budget:
+        return None
+    out = list(layout)
+    out[index] = {**placement, "tiers": tiers}
+    return out
+
+
+def _relocate(data, game_map, layout, rng) -> list[dict] | None:
+    if not layout:
+        return None
+    index = rng.randrange(len(layout))
+    rest = layout[:index] + layout[index + 1:]
+    occupied = {tuple(p["tile"]) for p in rest}
+    for tile in _free_tiles(game_map, rest, rng, rng.random() < NEIGHBOR_BIAS):
+        if sim.can_place(game_map, occupied, tile):
+            out = list(layout)
+            out[index] = {**layout[index], "tile": list(tile)}
+            return out
+    return None
+
+
+def _swap(data, layout, rng, budget: int) -> list[dict] | None:
+    if not layout:
+        return None
+    index = rng.randrange(len(layout))
+    tower_id = rng.choice([t for t in data.towers if t != layout[index]["tower"]])
+    tower = data.towers[tower_id]
+    out = list(layout)
+    out[index] = {"tower": tower_id, "tile": layout[index]["tile"], "tiers": [0] * len(tower.paths)}
+    return out if sim.layout_cost(data, out) <= budget else None
+
+
+def mutate(data, game_map, layout, rng, budget: int) -> list[dict] | None:
+    """Apply one random move to a layout; None when the move is not legal."""
+    roll = rng.random()
+    if roll < 0.5 or not layout:
+        return _place(data, game_map, layout, rng, rng.choice(list(data.towers)), budget)
+    if roll < 0.75:
+        return _upgrade(data, layout, rng, budget)
+    if roll < 0.9:
+        return _relocate(data, game_map, layout, rng)
+    return _swap(data, layout, rng, budget)
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+def _rank_key(entry: dict, mode: str, budget: int):
+    if mode == "strong":
+        return (-entry["score"], entry["cost"])
+    # Weak: among layouts that actually spend the money, lowest score first
+    underspent = entry["cost"] < budget * WEAK_MIN_SPEND
+    return (underspent, entry["score"], -entry["cost"])
+
+
+def search(args: argparse.Namespace) -> list[dict]:
+    data = sim.load_game_data()
+    game_map = sim.build_map()
+    rng = random.Random(args.seed)
+    waves = sim.parse_wave_range(args.waves)
+    seen: dict[str, dict] = {}
+    beam: list[list[dict]] = [[]]
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        for depth in range(1, args.depth + 1):
+            candidates: dict[str, list[dict]] = {}
+            for layout in beam:
+                children = 0
+                for _ in range(args.expand * 4):
+                    if children >= args.expand:
+                        break
+                    child = mutate(data, game_map, layout, rng, args.budget)
+                    if child is None:
+                        continue
+                    key = sim.layout_key(child)
+                    if key not in seen and key not in candidates:
+                        candidates[key] = child
+                        children += 1
+
+            if not candidates:
+                break
+
+            keys = list(candidates)
+            jobs = [
+                (candidates[k], waves, derive_seeds(args.seed, candidates[k], args.trials))
+                for k in keys
+            ]
+            for key, job, score in zip(keys, jobs, pool.map(_evaluate, jobs, chunksize=4)):
+                layout = job[0]
+                seen[key] = {
+                    **score,
+                    "cost": sim.layout_cost(data, layout),
+                    "towers": len(layout),
+                    "synergies": sorted({n for *_, names in sim.synergy_multipliers(data, layout) for n in names}),
+                    "seeds": job[2],
+                    "layout": layout,
+                }
+
+            # Parents compete with their children so the beam never regresses
+            pool_keys = set(keys) | {sim.layout_key(b) for b in beam if b}
+            ranked = sorted(
+                (seen[k] for k in pool_keys),
+                key=lambda e: _rank_key(e, args.mode, args.budget),
+            )
+            beam = [e["layout"] for e in ranked[:args.beam]]
+            best = ranked[0]
+            print(f"  Depth {depth:2d}: {len(keys):4d} candidates, best score {best['score']:.3f} "
+                  f"({best['towers']} towers, cost {best['cost']})")
+
+    return sorted(seen.values(), key=lambda e: _rank_key(e, args.mode, args.budget))
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Search tower layouts for balance outliers")
+    parser.add_argument("--waves", default="1-10", help="Wave range to simulate (default: 1-10)")
+    parser.add_argument("--budget", type=int, default=60, help="Gold budget in data units (default: 60)")
+    parser.add_argument("--mode", choices=["strong", "weak"], default="strong",
+                        help="Rank strongest layouts, or weakest fully funded ones")
+    parser.add_argument("--beam", type=int, default=8, help="Layouts kept per depth (default: 8)")
+    parser.add_argument("--expand", type=int, default=12, help="Children per beam layout (default: 12)")
+    parser.add_argument("--depth", type=int, default=16, help="Max search moves (default: 16)")
+    parser.add_argument("--trials", type=int, default=2, help="Seeds per layout (default: 2)")
+    parser.add_argument("--seed", type=int, default=1, help="Master seed (default: 1)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: all cores)")
+    parser.add_argument("--top", type=int, default=20, help="Results to write (default: 20)")
+    parser.add_argument("--out", type=Path, default=Path("layout_search.json"), help="Output JSON path")
+    args = parser.parse_args()
+
+    print(f"Searching {args.mode} layouts: waves {args.waves}, budget {args.budget}, "
+          f"{args.workers} workers, seed {args.seed}")
+    start = time.time()
+    ranked = search(args)
+    elapsed = time.time() - start
+
+    results = [{"rank": i + 1, **entry} for i, entry in enumerate(ranked[:args.top])]
+    args.out.write_text(json.dumps({
+        "config": {
+            "mode": args.mode,
+            "waves": list(sim.parse_wave_range(args.waves)),
+            "budget": args.budget,
+            "beam": args.beam,
+            "expand": args.expand,
+            "depth": args.depth,
+            "trials": args.trials,
+            "seed": args.seed,
+        },
+        "evaluated": len(ranked),
+        "elapsed_sec": round(elapsed, 1),
+        "results": results,
+    }, indent=2) + "\n")
+
+    print(f"\n{len(ranked)} layouts evaluated in {elapsed:.1f}s")
+    for entry in results[:5]:
+        print(f"  #{entry['rank']}: score {entry['score']:.3f}, cleared {entry['waves_cleared']}, "
+              f"cost {entry['cost']}, {entry['towers']} towers, synergies {entry['synergies'] or '-'}")
+    print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,13 +18,10 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
-from typing import NamedTuple
+from typing import TYPE_CHECKING, NamedTuple
 
-try:
+if TYPE_CHECKING:
     from PIL import Image, ImageDraw, ImageFont
-except ImportError:
-    print("ERROR: Pillow required. Run: pip install Pillow")
-    sys.exit(1)
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -687,7 +684,18 @@ FONT_SIZE = 10 * SCALE
 HEADER_FONT_SIZE = 14 * SCALE
 
 
+def _require_pil():
+    """Import Pillow on first use -- scanning and --check never need it."""
+    try:
+        from PIL import Image, ImageDraw, ImageFont
+    except ImportError:
+        print("ERROR: Pillow required. Run: pip install Pillow")
+        sys.exit(1)
+    return Image, ImageDraw, ImageFont
+
+
 def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    _, _, ImageFont = _require_pil()
     for path in [
         "/System/Library/Fonts/Menlo.ttc",
         "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
@@ -700,6 +708,7 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont:
 
 
 def _load_category_entries(category: str, disk: dict[str, set[str]]) -> list[tuple[str, Image.Image]]:
+    Image, _, _ = _require_pil()
     cat_dir = SPRITES_DIR / category
     if not cat_dir.is_dir():
         return []
@@ -764,6 +773,7 @@ def _draw_grid(
 
 
 def generate_overview(category: str, disk: dict[str, set[str]]) -> Path | None:
+    Image, ImageDraw, _ = _require_pil()
     entries = _load_category_entries(category, disk)
     if not entries:
         return None
@@ -793,6 +803,7 @@ def generate_overview(category: str, disk: dict[str, set[str]]) -> Path | None:
 
 
 def generate_total_overview(disk: dict[str, set[str]]) -> Path | None:
+    Image, ImageDraw, _ = _require_pil()
     category_order = [
         "towers", "enemies", "projectiles", "effects",
         "buildings", "animated",